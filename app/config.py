@@ -44,9 +44,14 @@ class Settings:
     FILE_UPLOAD_DIR: str = os.getenv("FILE_UPLOAD_DIR", "uploads")
     FILE_EXPIRATION_HOURS: int = int(os.getenv("FILE_EXPIRATION_HOURS", "24"))
     FILE_CLEANUP_INTERVAL_HOURS: int = int(os.getenv("FILE_CLEANUP_INTERVAL_HOURS", "6"))
+    FILE_CLEANUP_ENABLED: bool = os.getenv("FILE_CLEANUP_ENABLED", "true").lower() == "true"
+    FILE_CLEANUP_BATCH_SIZE: int = int(os.getenv("FILE_CLEANUP_BATCH_SIZE", "500"))
+    FILE_CLEANUP_BATCH_PAUSE: float = float(os.getenv("FILE_CLEANUP_BATCH_PAUSE", "0.1"))
+    FILE_CLEANUP_SCAN_EVERY: int = int(os.getenv("FILE_CLEANUP_SCAN_EVERY", "4"))  # Runs between walks for unindexed files
     FILE_MAX_SIZE_AUDIO: int = int(os.getenv("FILE_MAX_SIZE_AUDIO", "52428800"))  # 50MB
     FILE_MAX_SIZE_DOCUMENT: int = int(os.getenv("FILE_MAX_SIZE_DOCUMENT", "10485760"))  # 10MB
     FILE_MAX_SIZE_IMAGE: int = int(os.getenv("FILE_MAX_SIZE_IMAGE", "5242880"))  # 5MB
+    FILE_STREAM_CHUNK_SIZE: int = int(os.getenv("FILE_STREAM_CHUNK_SIZE", "65536"))  # 64KB
     FILE_ALLOWED_AUDIO_TYPES: List[str] = os.getenv("FILE_ALLOWED_AUDIO_TYPES", "audio/mpeg,audio/wav,audio/mp4,audio/ogg,audio/flac").split(",")
     FILE_ALLOWED_DOCUMENT_TYPES: List[str] = os.getenv("FILE_ALLOWED_DOCUMENT_TYPES", "application/pdf,application/msword,application/vnd.openxmlformats-officedocument.wordprocessingml.document").split(",")
     FILE_ALLOWED_IMAGE_TYPES: List[str] = os.getenv("FILE_ALLOWED_IMAGE_TYPES", "image/jpeg,image/png,image/gif,image/webp").split(",")
@@ -54,6 +59,9 @@ class Settings:
     FILE_CLOUD_STORAGE_ENABLED: bool = os.getenv("FILE_CLOUD_STORAGE_ENABLED", "false").lower() == "true"
     FILE_CLOUD_STORAGE_BUCKET: str = os.getenv("FILE_CLOUD_STORAGE_BUCKET", "")
     FILE_CLOUD_STORAGE_REGION: str = os.getenv("FILE_CLOUD_STORAGE_REGION", "us-east-1")
+    # Persistent file_id index (stored_files table); rebuild with scripts/rebuild_file_index.py
+    FILE_INDEX_ENABLED: bool = os.getenv("FILE_INDEX_ENABLED", "true").lower() == "true"
+    FILE_INDEX_SCAN_ON_MISS: bool = os.getenv("FILE_INDEX_SCAN_ON_MISS", "true").lower() == "true"
 
     
     # Note: Direct AI service settings removed - using AI service microservice only
@@ -62,7 +70,15 @@ class Settings:
     AI_SERVICE_URL: str = os.getenv("AI_SERVICE_URL", "http://localhost:8001")
     AI_SERVICE_TIMEOUT: float = float(os.getenv("AI_SERVICE_TIMEOUT", "30.0"))
     AI_SERVICE_RETRY_ATTEMPTS: int = int(os.getenv("AI_SERVICE_RETRY_ATTEMPTS", "3"))
-    
+
+    # AI Service Request Hedging (answer scoring)
+    AI_SERVICE_HEDGING_ENABLED: bool = os.getenv("AI_SERVICE_HEDGING_ENABLED", "false").lower() == "true"
+    AI_SERVICE_HEDGE_PERCENTILE: float = float(os.getenv("AI_SERVICE_HEDGE_PERCENTILE", "95.0"))
+    AI_SERVICE_HEDGE_MIN_SAMPLES: int = int(os.getenv("AI_SERVICE_HEDGE_MIN_SAMPLES", "20"))
+    AI_SERVICE_HEDGE_MIN_DELAY: float = float(os.getenv("AI_SERVICE_HEDGE_MIN_DELAY", "0.05"))  # seconds
+    AI_SERVICE_HEDGE_BUDGET_RATIO: float = float(os.getenv("AI_SERVICE_HEDGE_BUDGET_RATIO", "0.1"))  # hedges per request
+    AI_SERVICE_HEDGE_BUDGET_MAX_TOKENS: float = float(os.getenv("AI_SERVICE_HEDGE_BUDGET_MAX_TOKENS", "10"))
+
     # Application Settings
     MAX_TOKENS: int = 2000
     TEMPERATURE: float = 0.7
@@ -78,6 +94,22 @@ class Settings:
     CACHE_ENABLED: bool = os.getenv("CACHE_ENABLED", "true").lower() == "true"
     CACHE_BACKEND: str = os.getenv("CACHE_BACKEND", "memory")  # "memory" or "redis"
     REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6379")
+    REDIS_MAX_CONNECTIONS: int = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))  # Shared async cache pool size
+    REDIS_SOCKET_TIMEOUT: float = float(os.getenv("REDIS_SOCKET_TIMEOUT", "5"))  # seconds
+    REDIS_SOCKET_CONNECT_TIMEOUT: float = float(os.getenv("REDIS_SOCKET_CONNECT_TIMEOUT", "5"))  # seconds
+    CACHE_MEMORY_MAX_ENTRIES: int = int(os.getenv("CACHE_MEMORY_MAX_ENTRIES", "10000"))  # LRU entry limit (memory backend)
+    CACHE_MEMORY_MAX_BYTES: int = int(os.getenv("CACHE_MEMORY_MAX_BYTES", str(100 * 1024 * 1024)))  # 100MB (memory backend)
+    CACHE_L1_ENABLED: bool = os.getenv("CACHE_L1_ENABLED", "true").lower() == "true"  # Per-process cache in front of Redis
+    CACHE_L1_TTL: int = int(os.getenv("CACHE_L1_TTL", "5"))  # seconds
+    CACHE_L1_MAX_ENTRIES: int = int(os.getenv("CACHE_L1_MAX_ENTRIES", "1000"))
+    CACHE_L1_MAX_BYTES: int = int(os.getenv("CACHE_L1_MAX_BYTES", str(16 * 1024 * 1024)))  # 16MB
+    CACHE_INVALIDATION_CHANNEL: str = os.getenv("CACHE_INVALIDATION_CHANNEL", "cache:invalidate")
+    CACHE_NAMESPACE_REFRESH_INTERVAL: float = float(os.getenv("CACHE_NAMESPACE_REFRESH_INTERVAL", "1.0"))  # seconds between generation re-reads
+    CACHE_SCAN_BATCH_SIZE: int = int(os.getenv("CACHE_SCAN_BATCH_SIZE", "500"))  # keys per SCAN/UNLINK batch when purging
+    CACHE_SERIALIZER: str = os.getenv("CACHE_SERIALIZER", "msgpack")  # "msgpack" or "json" (Redis backend)
+    CACHE_COMPRESSION: str = os.getenv("CACHE_COMPRESSION", "zstd")  # "zstd", "zlib" or "none"
+    CACHE_COMPRESSION_THRESHOLD: int = int(os.getenv("CACHE_COMPRESSION_THRESHOLD", "1024"))  # bytes
+    CACHE_COMPRESSION_LEVEL: int = int(os.getenv("CACHE_COMPRESSION_LEVEL", "3"))
     
     # Cache TTL settings (in seconds)
     CACHE_TTL_QUESTION_GENERATION: int = int(os.getenv("CACHE_TTL_QUESTION_GENERATION", "3600"))  # 1 hour
@@ -87,6 +119,18 @@ class Settings:
     CACHE_TTL_SERVICE_STATUS: int = int(os.getenv("CACHE_TTL_SERVICE_STATUS", "300"))  # 5 minutes
     CACHE_TTL_DEFAULT: int = int(os.getenv("CACHE_TTL_DEFAULT", "3600"))  # 1 hour
     
+    # Question generation coalescing (identical concurrent requests share one generation)
+    QUESTION_GENERATION_COALESCING_ENABLED: bool = os.getenv("QUESTION_GENERATION_COALESCING_ENABLED", "true").lower() == "true"
+    QUESTION_GENERATION_RESULT_CACHE_TTL: int = int(os.getenv("QUESTION_GENERATION_RESULT_CACHE_TTL", "30"))  # seconds, 0 disables
+    
+    # Batch answer analysis
+    ANSWER_ANALYSIS_BATCH_CONCURRENCY: int = int(os.getenv("ANSWER_ANALYSIS_BATCH_CONCURRENCY", "5"))
+    ANSWER_ANALYSIS_BATCH_MAX_ITEMS: int = int(os.getenv("ANSWER_ANALYSIS_BATCH_MAX_ITEMS", "50"))
+    
+    # Answer analysis result cache (TTL: CACHE_TTL_ANSWER_ANALYSIS)
+    ANSWER_ANALYSIS_CACHE_ENABLED: bool = os.getenv("ANSWER_ANALYSIS_CACHE_ENABLED", "true").lower() == "true"
+    ANSWER_ANALYSIS_SCORING_VERSION: str = os.getenv("ANSWER_ANALYSIS_SCORING_VERSION", "1")  # bump to invalidate cached scores
+    
     # Monitoring and Metrics Settings
     MONITORING_ENABLED: bool = os.getenv("MONITORING_ENABLED", "true").lower() == "true"
     PROMETHEUS_PORT: int = int(os.getenv("PROMETHEUS_PORT", "8001"))
@@ -108,9 +152,41 @@ class Settings:
     TTS_DEFAULT_VOICE_ID: str = os.getenv("TTS_DEFAULT_VOICE_ID", "confida-default-en")
     TTS_DEFAULT_FORMAT: str = os.getenv("TTS_DEFAULT_FORMAT", "mp3")
     TTS_CACHE_TTL: int = int(os.getenv("TTS_CACHE_TTL", "604800"))  # 7 days in seconds
+    TTS_BLOB_STORE_ENABLED: bool = os.getenv("TTS_BLOB_STORE_ENABLED", "true").lower() == "true"  # Cache audio on disk, not base64 in cache values
+    TTS_BLOB_STORE_DIR: str = os.getenv("TTS_BLOB_STORE_DIR", os.path.join(os.getenv("FILE_UPLOAD_DIR", "uploads"), "tts_blobs"))
+    TTS_BLOB_STORE_MAX_BYTES: int = int(os.getenv("TTS_BLOB_STORE_MAX_BYTES", str(1024 * 1024 * 1024)))  # 1GB, LRU eviction
+    TTS_BLOB_STORE_RESCAN_INTERVAL: float = float(os.getenv("TTS_BLOB_STORE_RESCAN_INTERVAL", "300"))  # Seconds between disk usage re-scans
     TTS_TIMEOUT: int = int(os.getenv("TTS_TIMEOUT", "30"))  # seconds
     TTS_RETRY_ATTEMPTS: int = int(os.getenv("TTS_RETRY_ATTEMPTS", "3"))
-    TTS_MAX_CONCURRENT: int = int(os.getenv("TTS_MAX_CONCURRENT", "5"))
+    TTS_MAX_CONCURRENT: int = int(os.getenv("TTS_MAX_CONCURRENT", "5"))  # Concurrent synthesis calls per provider
+    TTS_HTTP_MAX_CONNECTIONS: int = int(os.getenv("TTS_HTTP_MAX_CONNECTIONS", "20"))  # Per provider
+    TTS_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = int(os.getenv("TTS_HTTP_MAX_KEEPALIVE_CONNECTIONS", "10"))
+    TTS_HTTP_KEEPALIVE_EXPIRY: float = float(os.getenv("TTS_HTTP_KEEPALIVE_EXPIRY", "30"))  # seconds
+    TTS_HTTP2_ENABLED: bool = os.getenv("TTS_HTTP2_ENABLED", "true").lower() == "true"  # ElevenLabs/PlayHT, requires h2
+    TTS_CHUNKING_ENABLED: bool = os.getenv("TTS_CHUNKING_ENABLED", "true").lower() == "true"
+    TTS_CHUNK_THRESHOLD: int = int(os.getenv("TTS_CHUNK_THRESHOLD", "500"))  # Texts longer than this are split into sentences
+    TTS_CHUNK_MAX_CHARS: int = int(os.getenv("TTS_CHUNK_MAX_CHARS", "500"))  # Longer sentences are split further
+    TTS_QUESTION_TIMEOUT: float = float(os.getenv("TTS_QUESTION_TIMEOUT", "45"))  # seconds per question when generating with voice
+    TTS_DISTRIBUTED_SINGLEFLIGHT_ENABLED: bool = os.getenv("TTS_DISTRIBUTED_SINGLEFLIGHT_ENABLED", "true").lower() == "true"  # Needs CACHE_BACKEND=redis
+    TTS_SINGLEFLIGHT_LEASE: float = float(os.getenv("TTS_SINGLEFLIGHT_LEASE", "45"))  # seconds a synthesis lock is held at most
+    TTS_SINGLEFLIGHT_WAIT_TIMEOUT: float = float(os.getenv("TTS_SINGLEFLIGHT_WAIT_TIMEOUT", "60"))  # seconds to wait for another worker
+    TTS_SINGLEFLIGHT_POLL_INTERVAL: float = float(os.getenv("TTS_SINGLEFLIGHT_POLL_INTERVAL", "0.25"))
+    TTS_ROUTING_STRATEGY: str = os.getenv("TTS_ROUTING_STRATEGY", "adaptive")  # adaptive (EWMA latency/error rate) or ordered
+    TTS_ROUTING_EWMA_ALPHA: float = float(os.getenv("TTS_ROUTING_EWMA_ALPHA", "0.2"))
+    TTS_ROUTING_ERROR_PENALTY: float = float(os.getenv("TTS_ROUTING_ERROR_PENALTY", "5.0"))  # seconds added per unit of error rate
+    TTS_ROUTING_MIN_SAMPLES: int = int(os.getenv("TTS_ROUTING_MIN_SAMPLES", "5"))  # per provider before reordering
+    TTS_ROUTING_EXPLORE_RATIO: float = float(os.getenv("TTS_ROUTING_EXPLORE_RATIO", "0"))  # share of calls sent to a non-best provider (opt-in)
+    TTS_HEDGE_ENABLED: bool = os.getenv("TTS_HEDGE_ENABLED", "false").lower() == "true"
+    TTS_HEDGE_DELAY: float = float(os.getenv("TTS_HEDGE_DELAY", "2.0"))  # seconds before racing the next provider
+    TTS_HEDGE_BUDGET_RATIO: float = float(os.getenv("TTS_HEDGE_BUDGET_RATIO", "0.1"))  # hedges per synthesis
+    TTS_HEDGE_BUDGET_MAX_TOKENS: float = float(os.getenv("TTS_HEDGE_BUDGET_MAX_TOKENS", "10"))
+    TTS_PREWARM_ON_STARTUP: bool = os.getenv("TTS_PREWARM_ON_STARTUP", "false").lower() == "true"
+    TTS_PREWARM_TOP_N: int = int(os.getenv("TTS_PREWARM_TOP_N", "20"))  # Questions per group
+    TTS_PREWARM_GROUP_BY: str = os.getenv("TTS_PREWARM_GROUP_BY", "role")  # role, category or scenario
+    TTS_PREWARM_RATE: float = float(os.getenv("TTS_PREWARM_RATE", "2"))  # Synthesis requests per second
+    TTS_PREWARM_MAX_INTERVAL: float = float(os.getenv("TTS_PREWARM_MAX_INTERVAL", "60"))  # Max seconds between requests when rate limited
+    TTS_PREWARM_SCAN_LIMIT: int = int(os.getenv("TTS_PREWARM_SCAN_LIMIT", "2000"))  # Most used questions scanned for role/category grouping
+    TTS_PREWARM_STARTUP_LOCK_TTL: float = float(os.getenv("TTS_PREWARM_STARTUP_LOCK_TTL", "3600"))  # Seconds other workers skip the startup pre-warm
     
     # TTS Vendor API Keys (optional - only required if vendor provider is used)
     ELEVENLABS_API_KEY: str = os.getenv("ELEVENLABS_API_KEY", "")
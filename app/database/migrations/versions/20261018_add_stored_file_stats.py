@@ -0,0 +1,53 @@
+"""add stored_file_stats counters for upload storage
+
+Revision ID: f6a7b8c9d0e1
+Revises: e5f6a7b8c9d0
+Create Date: 2026-10-18 12:00:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+revision: str = "f6a7b8c9d0e1"
+down_revision: Union[str, None] = "e5f6a7b8c9d0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = inspect(conn)
+    tables = inspector.get_table_names()
+
+    if "stored_file_stats" not in tables:
+        op.create_table(
+            "stored_file_stats",
+            sa.Column("file_type", sa.String(length=20), nullable=False),
+            sa.Column("file_count", sa.BigInteger(), nullable=False, server_default="0"),
+            sa.Column("total_bytes", sa.BigInteger(), nullable=False, server_default="0"),
+            sa.PrimaryKeyConstraint("file_type"),
+        )
+        # Seed a row per file type from files indexed so far, so counter
+        # writes only ever update an existing row
+        op.execute(
+            """
+            INSERT INTO stored_file_stats (file_type, file_count, total_bytes)
+            SELECT t.file_type, COUNT(f.file_id), COALESCE(SUM(f.file_size), 0)
+            FROM (VALUES ('audio'), ('document'), ('image')) AS t(file_type)
+            LEFT JOIN stored_files f ON f.file_type = t.file_type
+            GROUP BY t.file_type
+            """
+        )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    inspector = inspect(conn)
+    tables = inspector.get_table_names()
+
+    if "stored_file_stats" in tables:
+        op.drop_table("stored_file_stats")
@@ -0,0 +1,60 @@
+"""add stored_files index of upload storage
+
+Revision ID: e5f6a7b8c9d0
+Revises: d4e5f6a7b8c9
+Create Date: 2026-10-18 10:00:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+revision: str = "e5f6a7b8c9d0"
+down_revision: Union[str, None] = "d4e5f6a7b8c9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = inspect(conn)
+    tables = inspector.get_table_names()
+
+    if "stored_files" not in tables:
+        op.create_table(
+            "stored_files",
+            sa.Column("file_id", sa.String(length=64), nullable=False),
+            sa.Column("file_type", sa.String(length=20), nullable=False),
+            sa.Column("file_path", sa.Text(), nullable=False),
+            sa.Column("filename", sa.String(length=255), nullable=False),
+            sa.Column("file_size", sa.BigInteger(), nullable=False, server_default="0"),
+            sa.Column("mime_type", sa.String(length=100), nullable=False),
+            sa.Column("checksum", sa.String(length=64), nullable=True),
+            sa.Column(
+                "created_at",
+                sa.DateTime(timezone=True),
+                server_default=sa.text("now()"),
+                nullable=False,
+            ),
+            sa.PrimaryKeyConstraint("file_id"),
+        )
+        op.create_index("ix_stored_files_file_type", "stored_files", ["file_type"])
+        op.create_index("ix_stored_files_file_path", "stored_files", ["file_path"])
+        op.create_index("ix_stored_files_created_at", "stored_files", ["created_at"])
+        op.create_index("idx_stored_files_type_created", "stored_files", ["file_type", "created_at"])
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    inspector = inspect(conn)
+    tables = inspector.get_table_names()
+
+    if "stored_files" in tables:
+        op.drop_index("idx_stored_files_type_created", table_name="stored_files")
+        op.drop_index("ix_stored_files_created_at", table_name="stored_files")
+        op.drop_index("ix_stored_files_file_path", table_name="stored_files")
+        op.drop_index("ix_stored_files_file_type", table_name="stored_files")
+        op.drop_table("stored_files")
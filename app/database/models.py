@@ -1,7 +1,7 @@
 """
 SQLAlchemy models for Confida database schema.
 """
-from sqlalchemy import Column, String, Text, Integer, Boolean, DateTime, Float, ForeignKey, Index, UniqueConstraint
+from sqlalchemy import Column, String, Text, Integer, BigInteger, Boolean, DateTime, Float, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -389,6 +389,35 @@ class DataAccessLog(Base):
         return f"<DataAccessLog(id={self.id}, user_id={self.user_id}, resource_type={self.resource_type}, action={self.action})>"
 
 
+class StoredFile(Base):
+    """Index of files in upload storage keyed by file_id, so lookups need no directory scans."""
+    __tablename__ = "stored_files"
+
+    file_id = Column(String(64), primary_key=True)
+    file_type = Column(String(20), nullable=False, index=True)  # audio, document, image, video
+    file_path = Column(Text, nullable=False, index=True)  # Relative to FILE_UPLOAD_DIR
+    filename = Column(String(255), nullable=False)
+    file_size = Column(BigInteger, nullable=False, default=0)
+    mime_type = Column(String(100), nullable=False)
+    checksum = Column(String(64), nullable=True)  # SHA-256 hex digest
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
+
+    def __repr__(self):
+        return f"<StoredFile(file_id={self.file_id}, file_type={self.file_type}, file_path={self.file_path})>"
+
+
+class StoredFileStats(Base):
+    """Running file count and total size per type in stored_files, updated with each index write."""
+    __tablename__ = "stored_file_stats"
+
+    file_type = Column(String(20), primary_key=True)
+    file_count = Column(BigInteger, nullable=False, default=0)
+    total_bytes = Column(BigInteger, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<StoredFileStats(file_type={self.file_type}, file_count={self.file_count}, total_bytes={self.total_bytes})>"
+
+
 # Create indexes for performance optimization
 Index('idx_users_email', User.email)
 Index('idx_sessions_user_id', InterviewSession.user_id)
@@ -437,5 +466,8 @@ Index('idx_data_access_log_user_id', DataAccessLog.user_id)
 Index('idx_data_access_log_created_at', DataAccessLog.created_at)
 Index('idx_data_access_log_resource_type', DataAccessLog.resource_type)
 
+# File storage index
+Index('idx_stored_files_type_created', StoredFile.file_type, StoredFile.created_at)
+
 # JSONB indexes for flexible queries (PostgreSQL only)
 # These will be created in migration scripts
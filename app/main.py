@@ -1,3 +1,4 @@
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
@@ -32,6 +33,21 @@ async def lifespan(app: FastAPI):
             logger.info("✅ Async database initialized successfully")
         except Exception as e:
             logger.warning(f"⚠️ Async database init failed: {e}. App will run with sync DB only.")
+    if settings.CACHE_ENABLED and settings.CACHE_BACKEND == "redis":
+        from app.utils.cache import cache_manager
+        await cache_manager.connect()
+    try:
+        from app.services.tts.service import get_tts_service
+        await get_tts_service().start()
+    except Exception as e:
+        logger.warning(f"⚠️ TTS service init failed: {e}. Voice synthesis will be unavailable.")
+    prewarm_task = None
+    if settings.TTS_PREWARM_ON_STARTUP:
+        from app.services.tts.prewarm import run_startup_tts_prewarm
+        prewarm_task = asyncio.create_task(run_startup_tts_prewarm())
+    if settings.FILE_CLEANUP_ENABLED:
+        from app.services.file_cleanup import get_file_cleanup_worker
+        get_file_cleanup_worker().start()
     if settings.MONITORING_ENABLED:
         try:
             from app.utils.metrics import start_metrics_server
@@ -40,6 +56,20 @@ async def lifespan(app: FastAPI):
             logger.error(f"❌ Failed to start monitoring server: {e}")
     yield
     # Shutdown
+    if prewarm_task and not prewarm_task.done():
+        prewarm_task.cancel()
+        try:
+            await prewarm_task
+        except asyncio.CancelledError:
+            pass
+    if settings.FILE_CLEANUP_ENABLED:
+        from app.services.file_cleanup import get_file_cleanup_worker
+        await get_file_cleanup_worker().stop()
+    from app.services.tts.service import close_tts_service
+    await close_tts_service()
+    if settings.CACHE_ENABLED and settings.CACHE_BACKEND == "redis":
+        from app.utils.cache import cache_manager
+        await cache_manager.close()
     if settings.ASYNC_DATABASE_ENABLED:
         try:
             from app.services.async_database_monitor import async_db_monitor
@@ -203,33 +203,6 @@ class FileUploadMonitoringMiddleware(BaseHTTPMiddleware):
             )
         }
 
-class FileUploadCleanupMiddleware(BaseHTTPMiddleware):
-    """Middleware for periodic file cleanup."""
-    
-    def __init__(self, app, cleanup_interval: int = 3600):  # 1 hour default
-        super().__init__(app)
-        self.cleanup_interval = cleanup_interval
-        self.last_cleanup = time.time()
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """Check if cleanup is needed."""
-        
-        current_time = time.time()
-        if current_time - self.last_cleanup > self.cleanup_interval:
-            await self._perform_cleanup()
-            self.last_cleanup = current_time
-        
-        return await call_next(request)
-    
-    async def _perform_cleanup(self) -> None:
-        """Perform file cleanup."""
-        try:
-            # This would integrate with the FileService cleanup method
-            logger.info("Performing file cleanup...")
-            # In a real implementation, you'd call file_service.cleanup_expired_files()
-        except Exception as e:
-            logger.error(f"File cleanup error: {e}")
-
 def create_file_upload_middleware_stack(app):
     """Create the complete file upload middleware stack."""
     # Add security middleware
@@ -238,7 +211,6 @@ def create_file_upload_middleware_stack(app):
     # Add monitoring middleware
     app.add_middleware(FileUploadMonitoringMiddleware)
     
-    # Add cleanup middleware
-    app.add_middleware(FileUploadCleanupMiddleware, cleanup_interval=settings.FILE_CLEANUP_INTERVAL_HOURS * 3600)
+    # Expired files are removed by the background FileCleanupWorker (app.services.file_cleanup)
     
     return app
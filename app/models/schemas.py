@@ -67,6 +67,46 @@ class AnalyzeAnswerResponse(BaseModel):
     service_used: str = Field(..., description="AI service used for analysis")
     multi_agent_analysis: Optional[Dict[str, Any]] = Field(None, description="Full multi-agent analysis data")
 
+class BatchAnswerItem(BaseModel):
+    """A single answer within a batch analysis request."""
+    question_id: str = Field(..., description="Question ID or session question ID (UUID)")
+    answer: str = Field(..., min_length=1, max_length=5000, description="The candidate's answer")
+    audio_file_id: Optional[str] = Field(None, description="File ID of the user's answer audio recording")
+    
+    @field_validator('answer')
+    @classmethod
+    def validate_answer(cls, v):
+        if not v or not v.strip():
+            raise ValueError('Field cannot be empty')
+        return v.strip()
+
+class BatchAnalyzeAnswerRequest(BaseModel):
+    """Analyze all answers for a session in one request."""
+    session_id: str = Field(..., description="Interview session ID (UUID); every answer must belong to this session")
+    jobDescription: str = Field(..., min_length=10, max_length=10000, description="The job description")
+    answers: List[BatchAnswerItem] = Field(..., min_length=1, description="Answers to analyze")
+    
+    @field_validator('jobDescription')
+    @classmethod
+    def validate_job_description(cls, v):
+        if not v or not v.strip():
+            raise ValueError('Field cannot be empty')
+        return v.strip()
+
+class BatchAnalyzeAnswerResult(BaseModel):
+    """Per-item result of a batch analysis (either result or error is set)."""
+    question_id: str = Field(..., description="Question ID as supplied in the request")
+    success: bool = Field(..., description="Whether the answer was analyzed and stored")
+    result: Optional[AnalyzeAnswerResponse] = Field(None, description="Analysis result")
+    error: Optional[str] = Field(None, description="Error message if the item failed")
+    status_code: Optional[int] = Field(None, description="HTTP-equivalent status code for a failed item")
+
+class BatchAnalyzeAnswerResponse(BaseModel):
+    results: List[BatchAnalyzeAnswerResult] = Field(..., description="Per-item results in request order")
+    total: int = Field(..., description="Number of answers submitted")
+    succeeded: int = Field(..., description="Number of answers analyzed and stored")
+    failed: int = Field(..., description="Number of answers that failed")
+
 # Database response models for interview data
 class QuestionResponse(BaseModel):
     id: str  # UUID as string
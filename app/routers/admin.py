@@ -16,6 +16,7 @@ from app.models.enterprise_schemas import (
 )
 from app.dependencies import get_ai_client_dependency
 from app.middleware.enhanced_rate_limiter import EnhancedRateLimiter
+from app.utils.hedging import get_request_hedger
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -131,8 +132,10 @@ async def get_services_status(ai_client=Depends(get_ai_client_dependency)):
             "configuration": {
                 "ai_service_url": settings.AI_SERVICE_URL,
                 "ai_service_timeout": settings.AI_SERVICE_TIMEOUT,
-                "ai_service_retry_attempts": settings.AI_SERVICE_RETRY_ATTEMPTS
-            }
+                "ai_service_retry_attempts": settings.AI_SERVICE_RETRY_ATTEMPTS,
+                "ai_service_hedging_enabled": settings.AI_SERVICE_HEDGING_ENABLED
+            },
+            "hedging": get_request_hedger().get_stats()
         }
     except Exception as e:
         logger.error(f"Error getting service status: {e}")
@@ -62,33 +62,36 @@ async def clear_cache(pattern: str = "*"):
         "message": f"Cleared {cleared_count} cache entries matching pattern: {pattern}"
     }
 
-@router.post("/clear/question-generation")
-@require_cache_enabled
-@handle_cache_errors
-async def clear_question_generation_cache():
-    """Clear question generation cache entries."""
-    pattern = "ai_cache:*:question_generation:*"
-    cleared_count = await cache_manager.clear_pattern(pattern)
+async def _invalidate_operation(operation: str, purge: bool) -> Dict[str, Any]:
+    """Invalidate an operation's cache namespace, optionally purging old entries now."""
+    generation = await cache_manager.invalidate_namespace(operation)
+    cleared_count = 0
+    if purge:
+        cleared_count = await cache_manager.clear_pattern(f"ai_cache:*:{operation}:*")
     return {
         "success": True,
-        "operation": "question_generation",
-        "cleared_entries": cleared_count,
-        "message": f"Cleared {cleared_count} question generation cache entries"
+        "operation": operation,
+        "generation": generation,
+        "cleared_entries": cleared_count
     }
 
+@router.post("/clear/question-generation")
+@require_cache_enabled
+@handle_cache_errors
+async def clear_question_generation_cache(purge: bool = False):
+    """Invalidate question generation cache entries (purge=true also deletes them now)."""
+    result = await _invalidate_operation("question_generation", purge)
+    result["message"] = f"Invalidated question generation cache (generation {result['generation']}, purged {result['cleared_entries']} entries)"
+    return result
+
 @router.post("/clear/answer-analysis")
 @require_cache_enabled
 @handle_cache_errors
-async def clear_answer_analysis_cache():
-    """Clear answer analysis cache entries."""
-    pattern = "ai_cache:*:answer_analysis:*"
-    cleared_count = await cache_manager.clear_pattern(pattern)
-    return {
-        "success": True,
-        "operation": "answer_analysis",
-        "cleared_entries": cleared_count,
-        "message": f"Cleared {cleared_count} answer analysis cache entries"
-    }
+async def clear_answer_analysis_cache(purge: bool = False):
+    """Invalidate answer analysis cache entries (purge=true also deletes them now)."""
+    result = await _invalidate_operation("answer_analysis", purge)
+    result["message"] = f"Invalidated answer analysis cache (generation {result['generation']}, purged {result['cleared_entries']} entries)"
+    return result
 
 @router.post("/reset-metrics")
 @handle_cache_errors
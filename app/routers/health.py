@@ -258,6 +258,24 @@ def _calculate_performance_indicators(stats: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+@router.get("/tts", response_model=Dict[str, Any])
+async def get_tts_stats():
+    """Get TTS provider connection reuse, circuit breaker and voice cache statistics."""
+    try:
+        from app.services.tts.service import get_tts_service
+        return get_tts_service().get_stats()
+    except Exception as e:
+        logger.error(f"Error getting TTS stats: {e}")
+        raise HTTPException(status_code=500, detail="Failed to get TTS statistics")
+
+
+@router.get("/file-cleanup", response_model=Dict[str, Any])
+async def get_file_cleanup_stats():
+    """Get expired file cleanup worker progress statistics."""
+    from app.services.file_cleanup import get_file_cleanup_worker
+    return get_file_cleanup_worker().get_stats()
+
+
 # AI Service Health Endpoints
 @router.get("/ai-services", response_model=None)
 async def get_ai_service_health(ai_client = Depends(get_ai_client_dependency)):
@@ -1,9 +1,12 @@
+import asyncio
+import hashlib
 from fastapi import APIRouter, HTTPException, Query, Depends
 # SQLAlchemy imports removed as they were unused
 from typing import Optional, List, Dict
 from app.models.schemas import (
     ParseJDRequest, ParseJDResponse, AnalyzeAnswerRequest, AnalyzeAnswerResponse,
-    JobRequest, StructuredQuestionResponse
+    JobRequest, StructuredQuestionResponse, BatchAnalyzeAnswerRequest, BatchAnalyzeAnswerResponse,
+    BatchAnalyzeAnswerResult
 )
 # handle_service_errors import removed as it was unused
 from app.utils.validators import InputValidator, create_service_query_param
@@ -14,9 +17,15 @@ from app.middleware.auth_middleware import get_current_user_required
 from app.dependencies import get_ai_client_dependency
 from app.services.ai_client import AIServiceUnavailableError
 from app.utils.fallback import get_fallback_response
+from app.utils.cache import cache_manager, cache_metrics, normalize_cache_text
+from app.utils.singleflight import SingleFlight
+from app.config import get_settings
 
 router = APIRouter(prefix="/api/v1", tags=["interview"])
 
+# Coalesces identical concurrent question generation requests
+_question_generation_flight = SingleFlight("question_generation")
+
 def _map_embedding_vectors(questions_data, persisted_questions, embedding_vectors):
     """
     Maps embeddings from AI service question IDs to persisted DB IDs.
@@ -76,6 +85,175 @@ async def _persist_and_sync_questions(
         except StopAsyncIteration:
             pass
 
+def _question_generation_key(role_name: str, job_description: str, resume: Optional[str] = None) -> str:
+    """
+    Build the coalescing key for a question generation request.
+    
+    Inputs are normalized (case-folded, whitespace collapsed) so that pasted
+    copies of the same job description map to the same key.
+    
+    Args:
+        role_name: Job role/title
+        job_description: Job description text
+        resume: Optional resume text
+        
+    Returns:
+        str: Cache key for the request
+    """
+    request_hash = hashlib.sha256(
+        "|".join(normalize_cache_text(v) for v in (role_name, job_description, resume)).encode()
+    ).hexdigest()
+    return cache_manager.get_cache_key("interview", "question_generation", request_hash=request_hash)
+
+async def _generate_and_persist_questions(request: JobRequest, ai_client, db) -> Dict:
+    """
+    Generate questions via the AI service (or fallback) and persist/sync them.
+    
+    Args:
+        request: Question generation request
+        ai_client: AI service client
+        db: Async database dependency used for the fallback path
+        
+    Returns:
+        Dict with questions, identifiers, embedding_vectors, persisted question_ids
+        and whether the fallback was used
+    """
+    from app.utils.logger import get_logger
+    logger = get_logger(__name__)
+    
+    # Step 1: Call AI service for structured question generation
+    used_fallback = False
+    try:
+        ai_response = await ai_client.generate_questions_structured(
+            role_name=request.role_name,
+            job_description=request.job_description,
+            resume=request.resume
+        )
+    except AIServiceUnavailableError as e:
+        logger.warning(f"AI service unavailable, using enhanced fallback: {e}")
+        used_fallback = True
+        # Use enhanced fallback that queries database
+        db_session = await db.__anext__()
+        try:
+            fallback_response = await get_fallback_response(
+                operation="question_generation",
+                role=request.role_name,
+                count=10,
+                db_session=db_session,
+                job_description=request.job_description
+            )
+            ai_response = {
+                "questions": fallback_response.get("questions", []),
+                "identifiers": {
+                    "role": request.role_name,
+                    "difficulty": "medium",
+                    "category": "general"
+                },
+                "embedding_vectors": {}
+            }
+            logger.info(f"Using fallback questions: {fallback_response.get('metadata', {}).get('source', 'unknown')}")
+        finally:
+            try:
+                await db.__anext__()
+            except StopAsyncIteration:
+                pass
+
+    # Validate AI service response structure
+    if not isinstance(ai_response, dict):
+        raise HTTPException(
+            status_code=422,
+            detail="Invalid AI service response: expected JSON object"
+        )
+
+    # Validate required fields
+    required_fields = ["questions", "identifiers"]
+    missing_required = [f for f in required_fields if f not in ai_response]
+    if missing_required:
+        raise HTTPException(
+            status_code=422,
+            detail=f"AI response missing required fields: {', '.join(missing_required)}"
+        )
+
+    # Check for optional fields (preferred but not required)
+    if "embedding_vectors" not in ai_response:
+        logger.warning(
+            "AI response missing embedding_vectors (optional but preferred). "
+            "Will generate embeddings via ai-service as needed."
+        )
+
+    # Extract questions and identifiers
+    questions_data = ai_response.get("questions", [])
+    identifiers = ai_response.get("identifiers", {})
+    embedding_vectors = ai_response.get("embedding_vectors", {})
+
+    if not questions_data:
+        raise HTTPException(
+            status_code=422,
+            detail="AI service returned no questions"
+        )
+
+    # Validate identifiers shape (warn only - not strict requirement)
+    expected_keys = ["skills", "focus_areas", "difficulty", "tone"]
+    missing_keys = [k for k in expected_keys if k not in identifiers]
+    if missing_keys:
+        logger.warning(f"AI identifiers missing expected fields: {missing_keys}")
+
+    logger.debug(f"AI response valid with {len(questions_data)} questions")
+
+    # Step 2: Persist questions to PostgreSQL and sync to Qdrant (consolidated)
+    persisted_questions = await _persist_and_sync_questions(
+        questions_data=questions_data,
+        embedding_vectors=embedding_vectors,
+        session_id=None
+    )
+    
+    return {
+        "questions": questions_data,
+        "identifiers": identifiers,
+        "embedding_vectors": embedding_vectors,
+        "question_ids": [str(q.id) for q in persisted_questions],
+        "fallback": used_fallback
+    }
+
+async def _coalesced_generate_and_persist(request: JobRequest, ai_client, db) -> Dict:
+    """
+    Generate and persist questions, coalescing identical requests.
+    
+    Concurrent requests with the same normalized (role_name, job_description, resume)
+    await a single in-flight generation, and successful results are kept in a
+    short-TTL cache to absorb near-simultaneous repeats. Fallback results are
+    never cached.
+    
+    Args:
+        request: Question generation request
+        ai_client: AI service client
+        db: Async database dependency used for the fallback path
+        
+    Returns:
+        Dict as returned by _generate_and_persist_questions
+    """
+    settings = get_settings()
+    if not settings.QUESTION_GENERATION_COALESCING_ENABLED:
+        return await _generate_and_persist_questions(request, ai_client, db)
+    
+    cache_key = _question_generation_key(request.role_name, request.job_description, request.resume)
+    cache_ttl = settings.QUESTION_GENERATION_RESULT_CACHE_TTL
+    use_cache = settings.CACHE_ENABLED and cache_ttl > 0
+    
+    if use_cache:
+        cached_result = await cache_manager.get(cache_key)
+        cache_metrics.record_request("question_generation", hit=cached_result is not None)
+        if cached_result is not None:
+            return cached_result
+    
+    async def _generate() -> Dict:
+        result = await _generate_and_persist_questions(request, ai_client, db)
+        if use_cache and not result.get("fallback"):
+            await cache_manager.set(cache_key, result, ttl=cache_ttl)
+        return result
+    
+    return await _question_generation_flight.do(cache_key, _generate)
+
 @router.post("/questions/generate", response_model=StructuredQuestionResponse)
 async def generate_questions(
     request: JobRequest,
@@ -99,89 +277,13 @@ async def generate_questions(
         from app.utils.logger import get_logger
         logger = get_logger(__name__)
         
-        # Step 1: Call AI service for structured question generation
-        try:
-            ai_response = await ai_client.generate_questions_structured(
-                role_name=request.role_name,
-                job_description=request.job_description,
-                resume=request.resume
-            )
-        except AIServiceUnavailableError as e:
-            logger.warning(f"AI service unavailable, using enhanced fallback: {e}")
-            # Use enhanced fallback that queries database
-            db_session = await db.__anext__()
-            try:
-                fallback_response = await get_fallback_response(
-                    operation="question_generation",
-                    role=request.role_name,
-                    count=10,
-                    db_session=db_session,
-                    job_description=request.job_description
-                )
-                ai_response = {
-                    "questions": fallback_response.get("questions", []),
-                    "identifiers": {
-                        "role": request.role_name,
-                        "difficulty": "medium",
-                        "category": "general"
-                    },
-                    "embedding_vectors": {}
-                }
-                logger.info(f"Using fallback questions: {fallback_response.get('metadata', {}).get('source', 'unknown')}")
-            finally:
-                try:
-                    await db.__anext__()
-                except StopAsyncIteration:
-                    pass
-        
-        # Validate AI service response structure
-        if not isinstance(ai_response, dict):
-            raise HTTPException(
-                status_code=422,
-                detail="Invalid AI service response: expected JSON object"
-            )
-        
-        # Validate required fields
-        required_fields = ["questions", "identifiers"]
-        missing_required = [f for f in required_fields if f not in ai_response]
-        if missing_required:
-            raise HTTPException(
-                status_code=422,
-                detail=f"AI response missing required fields: {', '.join(missing_required)}"
-            )
-        
-        # Check for optional fields (preferred but not required)
-        if "embedding_vectors" not in ai_response:
-            logger.warning(
-                "AI response missing embedding_vectors (optional but preferred). "
-                "Will generate embeddings via ai-service as needed."
-            )
-        
-        # Extract questions and identifiers
-        questions_data = ai_response.get("questions", [])
-        identifiers = ai_response.get("identifiers", {})
-        embedding_vectors = ai_response.get("embedding_vectors", {})
-        
-        if not questions_data:
-            raise HTTPException(
-                status_code=422,
-                detail="AI service returned no questions"
-            )
-        
-        # Validate identifiers shape (warn only - not strict requirement)
-        expected_keys = ["skills", "focus_areas", "difficulty", "tone"]
-        missing_keys = [k for k in expected_keys if k not in identifiers]
-        if missing_keys:
-            logger.warning(f"AI identifiers missing expected fields: {missing_keys}")
-        
-        logger.debug(f"AI response valid with {len(questions_data)} questions")
-        
-        # Step 2: Persist questions to PostgreSQL and sync to Qdrant (consolidated)
-        persisted_questions = await _persist_and_sync_questions(
-            questions_data=questions_data,
-            embedding_vectors=embedding_vectors,
-            session_id=None
-        )
+        # Steps 1-2: Generate questions, persist to PostgreSQL and sync to Qdrant
+        # (identical concurrent requests share a single generation)
+        generation = await _coalesced_generate_and_persist(request, ai_client, db)
+        questions_data = generation["questions"]
+        identifiers = generation["identifiers"]
+        embedding_vectors = generation["embedding_vectors"]
+        question_ids = generation["question_ids"]
         
         # Step 3: Build final structured response with optional voice synthesis
         from app.models.schemas import StructuredQuestion, QuestionIdentifier
@@ -192,19 +294,35 @@ async def generate_questions(
         
         structured_questions = []
         # Ensure we have matching counts
-        if len(questions_data) != len(persisted_questions):
-            logger.warning(f"Mismatch: {len(questions_data)} questions_data vs {len(persisted_questions)} persisted")
+        if len(questions_data) != len(question_ids):
+            logger.warning(f"Mismatch: {len(questions_data)} questions_data vs {len(question_ids)} persisted")
         
         # Get file service for saving audio files (use sync session for FileService)
         sync_db = next(get_db())
         try:
             file_service = FileService(sync_db)
             
-            for q_data, persisted_q in zip(questions_data, persisted_questions):
+            prepared = []
+            for q_data, question_id in zip(questions_data, question_ids):
                 question_text = q_data.get("text") or q_data.get("question_text", "")
                 if not question_text:
                     continue
+                prepared.append((q_data, question_id, question_text))
+            
+            # Synthesize voices concurrently if requested (results keep question order)
+            voice_payloads = [None] * len(prepared)
+            if request.include_voice and prepared:
+                from app.utils.tts_helper import synthesize_and_save_voices
                 
+                voice_payloads = await synthesize_and_save_voices(
+                    questions=[(question_text, question_id) for _, question_id, question_text in prepared],
+                    voice_id=request.voice_id or settings.TTS_DEFAULT_VOICE_ID,
+                    audio_format=request.format or settings.TTS_DEFAULT_FORMAT,
+                    file_service=file_service,
+                    settings=settings
+                )
+            
+            for (q_data, question_id, question_text), voice_payload in zip(prepared, voice_payloads):
                 # Extract identifiers
                 identifiers_data = q_data.get("identifiers", {})
                 question_identifier = (
@@ -219,31 +337,6 @@ async def generate_questions(
                 if source not in valid_sources:
                     source = "newly_generated"
                 
-                # Always use persisted question ID - guaranteed to exist
-                question_id = str(persisted_q.id)
-                
-                # Synthesize voice if requested
-                voice_payload = None
-                if request.include_voice:
-                    from app.utils.tts_helper import synthesize_and_save_voice
-                    
-                    voice_id = request.voice_id or settings.TTS_DEFAULT_VOICE_ID
-                    audio_format = request.format or settings.TTS_DEFAULT_FORMAT
-                    
-                    voice_payload = await synthesize_and_save_voice(
-                        question_text=question_text,
-                        question_id=question_id,
-                        voice_id=voice_id,
-                        audio_format=audio_format,
-                        file_service=file_service,
-                        settings=settings
-                    )
-                    
-                    if voice_payload:
-                        logger.info(f"Voice synthesized for question {question_id}")
-                    else:
-                        logger.warning(f"Voice synthesis failed for question {question_id}, returning text-only")
-                
                 structured_questions.append(StructuredQuestion(
                     text=question_text,
                     source=source,
@@ -356,6 +449,62 @@ async def parse_job_description(
         logger.error(f"Failed to generate questions: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to generate questions: {str(e)}")
 
+def _build_answer_row(enc, uid: str, answer_text: str, response: Dict, question_uuid, session_id, audio_file_id: Optional[str]):
+    """
+    Build an (encrypted) Answer row from an AI analysis response.
+    
+    Args:
+        enc: Encryption service
+        uid: User ID used as the encryption context
+        answer_text: Candidate's answer
+        response: AI service analysis response
+        question_uuid: Question ID
+        session_id: Interview session ID
+        audio_file_id: Optional answer audio file ID
+        
+    Returns:
+        Answer: Unsaved Answer model instance
+    """
+    from app.database.models import Answer
+    
+    enc_answer = enc.encrypt(answer_text, uid) or answer_text
+    enc_analysis = enc.encrypt(response, uid) if enc.is_enabled() else response
+    score_val = {"clarity": response.get("score", {}).get("clarity", 0),
+                "confidence": response.get("score", {}).get("confidence", 0)}
+    enc_score = enc.encrypt(score_val, uid) if enc.is_enabled() else score_val
+    enc_multi = enc.encrypt(response.get("multi_agent_analysis"), uid) if enc.is_enabled() and response.get("multi_agent_analysis") else response.get("multi_agent_analysis")
+    
+    return Answer(
+        question_id=question_uuid,
+        session_id=session_id,
+        answer_text=enc_answer,
+        analysis_result=enc_analysis,
+        score=enc_score,
+        multi_agent_scores=enc_multi,
+        audio_file_id=audio_file_id
+    )
+
+def _build_analyze_answer_response(
+    response: Dict,
+    job_description: str,
+    answer_text: str,
+    validated_service: Optional[str]
+) -> AnalyzeAnswerResponse:
+    """Build the API response for an analyzed answer, including the enhanced scoring rubric."""
+    from app.routers.analysis_helpers import extract_enhanced_score
+    enhanced_score = extract_enhanced_score(response)
+    
+    return AnalyzeAnswerResponse(
+        analysis=response.get("analysis", ""),
+        score=response.get("score", {}),
+        enhanced_score=enhanced_score,
+        suggestions=response.get("suggestions", []),
+        jobDescription=job_description,
+        answer=answer_text,
+        service_used=validated_service or "openai",
+        multi_agent_analysis=response.get("multi_agent_analysis")
+    )
+
 @router.post("/analyze-answer", response_model=AnalyzeAnswerResponse)
 async def analyze_answer(
     request: AnalyzeAnswerRequest,
@@ -373,7 +522,7 @@ async def analyze_answer(
     
     try:
         from uuid import UUID
-        from app.database.models import Question, InterviewSession, Answer, SessionQuestion
+        from app.database.models import Question, InterviewSession, SessionQuestion
         from app.services.encryption_service import get_encryption_service
         from app.services.audit_service import log_data_access
 
@@ -413,21 +562,8 @@ async def analyze_answer(
 
         enc = get_encryption_service()
         uid = str(current_user["id"])
-        enc_answer = enc.encrypt(request.answer, uid) or request.answer
-        enc_analysis = enc.encrypt(response, uid) if enc.is_enabled() else response
-        score_val = {"clarity": response.get("score", {}).get("clarity", 0),
-                    "confidence": response.get("score", {}).get("confidence", 0)}
-        enc_score = enc.encrypt(score_val, uid) if enc.is_enabled() else score_val
-        enc_multi = enc.encrypt(response.get("multi_agent_analysis"), uid) if enc.is_enabled() and response.get("multi_agent_analysis") else response.get("multi_agent_analysis")
-
-        answer = Answer(
-            question_id=question_uuid,
-            session_id=session_id,
-            answer_text=enc_answer,
-            analysis_result=enc_analysis,
-            score=enc_score,
-            multi_agent_scores=enc_multi,
-            audio_file_id=request.audio_file_id
+        answer = _build_answer_row(
+            enc, uid, request.answer, response, question_uuid, session_id, request.audio_file_id
         )
         db.add(answer)
         log_data_access(db, uid, "answer", "write", str(question_uuid))
@@ -445,19 +581,8 @@ async def analyze_answer(
         
         db.commit()
         
-        # Extract enhanced scoring rubric
-        from app.routers.analysis_helpers import extract_enhanced_score
-        enhanced_score = extract_enhanced_score(response)
-        
-        return AnalyzeAnswerResponse(
-            analysis=response.get("analysis", ""),
-            score=response.get("score", {}),
-            enhanced_score=enhanced_score,
-            suggestions=response.get("suggestions", []),
-            jobDescription=request.jobDescription,
-            answer=request.answer,
-            service_used=validated_service or "openai",
-            multi_agent_analysis=response.get("multi_agent_analysis")
+        return _build_analyze_answer_response(
+            response, request.jobDescription, request.answer, validated_service
         )
         
     except HTTPException:
@@ -468,6 +593,208 @@ async def analyze_answer(
         logger.error(f"Failed to analyze answer: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to analyze answer: {str(e)}")
 
+def _resolve_session_questions(db, question_uuids: List, user_id, session_id) -> Dict:
+    """
+    Resolve question IDs to SessionQuestions of one of the user's sessions with a single query.
+    
+    Each ID may be either a SessionQuestion ID or a Question ID (matching the
+    single-answer endpoint). Questions outside the session are not resolved.
+    Questions are eager-loaded.
+    
+    Args:
+        db: Database session
+        question_uuids: Question or session question UUIDs
+        user_id: Current user ID (ownership check)
+        session_id: Interview session UUID the questions must belong to
+        
+    Returns:
+        Dict mapping each resolvable UUID to its SessionQuestion
+    """
+    from sqlalchemy import or_
+    from sqlalchemy.orm import joinedload
+    from app.database.models import InterviewSession, SessionQuestion
+    
+    if not question_uuids:
+        return {}
+    
+    session_questions = db.query(SessionQuestion).join(
+        InterviewSession, SessionQuestion.session_id == InterviewSession.id
+    ).options(
+        joinedload(SessionQuestion.question)
+    ).filter(
+        InterviewSession.user_id == user_id,
+        SessionQuestion.session_id == session_id,
+        or_(
+            SessionQuestion.id.in_(question_uuids),
+            SessionQuestion.question_id.in_(question_uuids)
+        )
+    ).all()
+    
+    by_session_question_id = {sq.id: sq for sq in session_questions}
+    by_question_id = {}
+    for sq in session_questions:
+        by_question_id.setdefault(sq.question_id, sq)
+    
+    resolved = {}
+    for question_uuid in question_uuids:
+        sq = by_session_question_id.get(question_uuid) or by_question_id.get(question_uuid)
+        if sq:
+            resolved[question_uuid] = sq
+    return resolved
+
+@router.post("/analyze-answers/batch", response_model=BatchAnalyzeAnswerResponse)
+async def analyze_answers_batch(
+    request: BatchAnalyzeAnswerRequest,
+    service: Optional[str] = create_service_query_param(),
+    current_user: dict = Depends(get_current_user_required),
+    ai_client = Depends(get_ai_client_dependency),
+    db = Depends(get_db)
+):
+    """
+    Analyze multiple answers (e.g. a completed session) in one request.
+    
+    Every answer must belong to the given session; questions from other
+    sessions fail per item with 404. Question access is validated with a
+    single query, AI analysis calls run
+    concurrently (bounded by ANSWER_ANALYSIS_BATCH_CONCURRENCY), and all Answer
+    rows are stored in one transaction. Failures are reported per item.
+    """
+    validated_service = InputValidator.validate_service(service)
+    
+    if not ai_client:
+        raise HTTPException(status_code=503, detail="AI service unavailable")
+    
+    settings = get_settings()
+    if len(request.answers) > settings.ANSWER_ANALYSIS_BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Batch exceeds maximum of {settings.ANSWER_ANALYSIS_BATCH_MAX_ITEMS} answers"
+        )
+    
+    from uuid import UUID
+    from app.database.models import InterviewSession
+    from app.services.encryption_service import get_encryption_service
+    from app.services.audit_service import log_data_access
+    from app.utils.logger import get_logger
+    logger = get_logger(__name__)
+    
+    try:
+        session_uuid = UUID(request.session_id)
+    except ValueError:
+        raise HTTPException(status_code=422, detail="Invalid session ID")
+    
+    session = db.query(InterviewSession).filter(
+        InterviewSession.id == session_uuid,
+        InterviewSession.user_id == current_user["id"]
+    ).first()
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
+    
+    results: List[Optional[BatchAnalyzeAnswerResult]] = [None] * len(request.answers)
+    
+    def _fail(index: int, status_code: int, error: str):
+        results[index] = BatchAnalyzeAnswerResult(
+            question_id=request.answers[index].question_id,
+            success=False,
+            error=error,
+            status_code=status_code
+        )
+    
+    # Step 1: Validate question access for all items with one query
+    item_uuids = {}
+    for index, item in enumerate(request.answers):
+        try:
+            item_uuids[index] = UUID(item.question_id)
+        except ValueError:
+            _fail(index, 422, "Invalid question ID")
+    
+    try:
+        session_questions = _resolve_session_questions(
+            db, list(set(item_uuids.values())), current_user["id"], session_uuid
+        )
+    except Exception as e:
+        logger.error(f"Failed to validate batch question access: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to analyze answers: {str(e)}")
+    
+    pending = []
+    for index, question_uuid in item_uuids.items():
+        session_question = session_questions.get(question_uuid)
+        if session_question is None:
+            _fail(index, 404, "Question not found in session")
+        else:
+            pending.append((index, session_question))
+    
+    # Step 2: Fan out AI analysis under a bounded semaphore
+    semaphore = asyncio.Semaphore(max(1, settings.ANSWER_ANALYSIS_BATCH_CONCURRENCY))
+    
+    async def _analyze(index: int, session_question) -> Dict:
+        question = session_question.question
+        question_text = question.question_text if hasattr(question, 'question_text') else "Interview question"
+        role = getattr(question, 'role', '') if hasattr(question, 'role') else ""
+        async with semaphore:
+            return await ai_client.analyze_answer(
+                job_description=request.jobDescription,
+                question=question_text,
+                answer=request.answers[index].answer,
+                role=role
+            )
+    
+    outcomes = await asyncio.gather(
+        *[_analyze(index, sq) for index, sq in pending],
+        return_exceptions=True
+    )
+    
+    # Step 3: Persist all successful analyses in a single transaction
+    enc = get_encryption_service()
+    uid = str(current_user["id"])
+    analyzed = []
+    try:
+        for (index, session_question), outcome in zip(pending, outcomes):
+            if isinstance(outcome, BaseException):
+                status_code = 503 if isinstance(outcome, AIServiceUnavailableError) else 500
+                logger.warning(f"Batch answer analysis failed for item {index}: {outcome}")
+                _fail(index, status_code, f"Failed to analyze answer: {str(outcome)}")
+                continue
+            
+            item = request.answers[index]
+            db.add(_build_answer_row(
+                enc, uid, item.answer, outcome,
+                session_question.question_id, session_question.session_id, item.audio_file_id
+            ))
+            log_data_access(db, uid, "answer", "write", str(session_question.question_id), commit=False)
+            
+            if item.audio_file_id:
+                context = session_question.session_specific_context
+                context = dict(context) if isinstance(context, dict) else {}
+                context["answer_audio_file_id"] = item.audio_file_id
+                session_question.session_specific_context = context
+            
+            analyzed.append((index, outcome))
+        
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Failed to store batch answers: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to store answers: {str(e)}")
+    
+    for index, outcome in analyzed:
+        item = request.answers[index]
+        results[index] = BatchAnalyzeAnswerResult(
+            question_id=item.question_id,
+            success=True,
+            result=_build_analyze_answer_response(
+                outcome, request.jobDescription, item.answer, validated_service
+            )
+        )
+    
+    succeeded = len(analyzed)
+    return BatchAnalyzeAnswerResponse(
+        results=results,
+        total=len(results),
+        succeeded=succeeded,
+        failed=len(results) - succeeded
+    )
+
 @router.get("/services")
 async def get_available_services(ai_client = Depends(get_ai_client_dependency)):
     """
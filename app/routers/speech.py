@@ -1,6 +1,8 @@
 from fastapi import APIRouter, File, UploadFile, HTTPException, Depends, Query, Request
-from typing import List
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, List
 from sqlalchemy.orm import Session
+import asyncio
 import base64
 from app.models.schemas import (
     TranscribeResponse,
@@ -18,6 +20,7 @@ from app.services.database_service import get_db
 from app.models.schemas import FileType
 from app.utils.validation import ValidationService
 from app.utils.logger import get_logger
+from app.config import get_settings
 from app.dependencies import get_ai_client_dependency, get_file_service, get_validation_service, get_tts_service
 from app.services.tts.service import TTSService
 from app.services.tts.base import TTSProviderError, TTSProviderRateLimitError
@@ -25,6 +28,7 @@ from app.services.speech_analyzer import SpeechAnalyzer
 from app.services.audit_service import log_data_access
 
 logger = get_logger(__name__)
+settings = get_settings()
 speech_analyzer = SpeechAnalyzer()
 
 router = APIRouter(prefix="/api/v1/speech", tags=["speech"])
@@ -57,25 +61,42 @@ async def transcribe_audio_endpoint(
             raise HTTPException(status_code=503, detail="AI service unavailable")
         
         filename = audio_file.filename
-        mime_type = "audio/wav"  # Default for speech recognition
         
-        # Read audio data
-        audio_data = await audio_file.read()
+        # Optionally tee the upload to disk while it streams to the AI service
+        writer = None
+        file_id = None
+        if save_file:
+            file_id = file_service.generate_file_id()
+            writer = file_service.open_stream_writer(
+                file_type=FileType.AUDIO,
+                file_id=file_id,
+                filename=filename,
+                metadata={
+                    "uploaded_by": current_user["id"],
+                    "description": f"Transcribed audio: {filename}"
+                }
+            )
         
-        # Save file temporarily for AI service
-        import tempfile
-        import os
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as temp_file:
-            temp_file.write(audio_data)
-            temp_file_path = temp_file.name
+        async def _upload_chunks():
+            await audio_file.seek(0)
+            while True:
+                chunk = await audio_file.read(settings.FILE_STREAM_CHUNK_SIZE)
+                if not chunk:
+                    break
+                if writer:
+                    await asyncio.to_thread(writer.write, chunk)
+                yield chunk
         
+        upload = _upload_chunks()
         try:
-            # Use AI service microservice for transcription
+            # Stream the upload to the AI service microservice for transcription
             session_id = f"transcription_{current_user['id']}_{filename}"
-            result = await ai_client.transcribe_audio(
-                audio_file_path=temp_file_path,
+            result = await ai_client.transcribe_audio_stream(
+                chunks=upload,
+                filename=filename,
                 session_id=session_id,
-                language=language
+                language=language,
+                content_type=audio_file.content_type
             )
             
             # Extract transcription from result
@@ -91,21 +112,11 @@ async def transcribe_audio_endpoint(
                     detail="Unexpected response format from AI service"
                 )
             
-            # Save file if requested
-            if save_file:
-                file_id = file_service.generate_file_id()
-                saved_file_info = file_service.save_file_from_bytes(
-                    content=audio_data,
-                    file_type=FileType.AUDIO,
-                    file_id=file_id,
-                    filename=filename,
-                    metadata={
-                        "uploaded_by": current_user["id"],
-                        "description": f"Transcribed audio: {filename}"
-                    }
-                )
-            else:
-                file_id = None
+            # Save file if requested (finish teeing anything the AI service did not consume)
+            if writer:
+                async for _ in upload:
+                    pass
+                await asyncio.to_thread(writer.commit)
             
             return TranscribeResponse(
                 transcription=transcript,
@@ -118,9 +129,9 @@ async def transcribe_audio_endpoint(
             )
             
         finally:
-            # Clean up temporary file
-            if os.path.exists(temp_file_path):
-                os.unlink(temp_file_path)
+            # Remove a partially saved file if transcription failed
+            if writer and not writer.closed:
+                await asyncio.to_thread(writer.abort)
         
     except HTTPException:
         raise
@@ -161,53 +172,37 @@ async def transcribe_saved_audio(
                 detail="File is not an audio file"
             )
         
-        # Read audio data from saved file
-        import tempfile
-        import os
-        with open(file_info["file_path"], "rb") as f:
-            audio_data = f.read()
-        
-        # Save file temporarily for AI service
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as temp_file:
-            temp_file.write(audio_data)
-            temp_file_path = temp_file.name
+        # Use AI service microservice for transcription (streams the saved file)
+        session_id = f"transcription_{current_user['id']}_{file_id}"
+        result = await ai_client.transcribe_audio(
+            audio_file_path=file_info["file_path"],
+            session_id=session_id,
+            language=language
+        )
         
-        try:
-            # Use AI service microservice for transcription
-            session_id = f"transcription_{current_user['id']}_{file_id}"
-            result = await ai_client.transcribe_audio(
-                audio_file_path=temp_file_path,
-                session_id=session_id,
-                language=language
-            )
-            
-            # Extract transcription from result
-            if isinstance(result, dict) and "transcript" in result:
-                transcript = result["transcript"]
-            elif isinstance(result, dict) and "text" in result:
-                transcript = result["text"]
-            else:
-                raise HTTPException(
-                    status_code=500,
-                    detail="Unexpected response format from AI service"
-                )
-            
-            return TranscribeResponse(
-                transcription=transcript,
-                language=language,
-                confidence=result.get("confidence", 0.95) if isinstance(result, dict) else 0.95,
-                file_id=file_id,
-                metadata={
-                    "filename": file_info["filename"],
-                    "mime_type": file_info.get("mime_type"),
-                    "file_size": file_info["file_size"],
-                    "saved": True
-                }
+        # Extract transcription from result
+        if isinstance(result, dict) and "transcript" in result:
+            transcript = result["transcript"]
+        elif isinstance(result, dict) and "text" in result:
+            transcript = result["text"]
+        else:
+            raise HTTPException(
+                status_code=500,
+                detail="Unexpected response format from AI service"
             )
-        finally:
-            # Clean up temporary file
-            if os.path.exists(temp_file_path):
-                os.unlink(temp_file_path)
+        
+        return TranscribeResponse(
+            transcription=transcript,
+            language=language,
+            confidence=result.get("confidence", 0.95) if isinstance(result, dict) else 0.95,
+            file_id=file_id,
+            metadata={
+                "filename": file_info["filename"],
+                "mime_type": file_info.get("mime_type"),
+                "file_size": file_info["file_size"],
+                "saved": True
+            }
+        )
         
     except HTTPException:
         raise
@@ -419,3 +414,71 @@ async def synthesize_speech(
             status_code=500,
             detail=f"Failed to synthesize speech: {str(e)}"
         )
+
+
+AUDIO_MEDIA_TYPES = {"mp3": "audio/mpeg", "wav": "audio/wav"}
+
+
+@router.post("/synthesize/stream")
+async def synthesize_speech_stream(
+    request: SynthesizeRequest,
+    current_user: dict = Depends(get_current_admin),
+    tts_service: TTSService = Depends(get_tts_service)
+):
+    """
+    Synthesize text to speech and stream the audio bytes (Admin Tooling Endpoint).
+    
+    Unlike /synthesize, the response body is raw audio sent with chunked
+    transfer encoding: provider chunks are forwarded as they arrive and cache
+    hits are streamed from disk, so playback can start before synthesis ends.
+    Requires admin authentication.
+    """
+    audio_format = request.audio_format or tts_service.settings.TTS_DEFAULT_FORMAT
+    stream = tts_service.synthesize_stream(
+        text=request.text,
+        voice_id=request.voice_id,
+        audio_format=audio_format,
+        use_cache=request.use_cache
+    )
+    
+    # Wait for the first chunk so provider failures still map to HTTP errors
+    try:
+        first_chunk = await stream.__anext__()
+    except StopAsyncIteration:
+        first_chunk = b""
+    except TTSProviderRateLimitError as e:
+        logger.warning(f"TTS rate limit exceeded: {e}")
+        raise HTTPException(
+            status_code=429,
+            detail=f"TTS service rate limit exceeded: {str(e)}"
+        )
+    except TTSProviderError as e:
+        logger.error(f"TTS provider error: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail=f"TTS service error: {str(e)}"
+        )
+    except Exception as e:
+        logger.error(f"Error synthesizing speech: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to synthesize speech: {str(e)}"
+        )
+    
+    async def body() -> AsyncIterator[bytes]:
+        try:
+            if first_chunk:
+                yield first_chunk
+            async for chunk in stream:
+                yield chunk
+        finally:
+            await stream.aclose()
+    
+    return StreamingResponse(
+        body(),
+        media_type=AUDIO_MEDIA_TYPES.get(audio_format, "application/octet-stream"),
+        headers={
+            "X-Voice-Id": request.voice_id or tts_service.settings.TTS_DEFAULT_VOICE_ID,
+            "Cache-Control": "no-store"
+        }
+    )
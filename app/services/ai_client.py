@@ -6,10 +6,15 @@ No fallback logic - if AI service is unavailable, it returns proper errors.
 """
 
 from app.utils.logger import get_logger
+from app.utils.hedging import get_request_hedger
+from app.utils.cache import cache_manager, cache_metrics, normalize_cache_text
+from app.utils.streaming import iter_file_chunks, stream_multipart
 from app.config import get_settings
-from typing import Dict, Any, Optional
+from typing import AsyncIterator, Dict, Any, Optional
+import hashlib
 import httpx
 import json
+import os
 
 logger = get_logger(__name__)
 settings = get_settings()
@@ -33,6 +38,10 @@ class AIServiceClient:
         self.base_url = f"{raw_base_url}/api/v1"
         self.timeout = settings.AI_SERVICE_TIMEOUT
         self.retry_attempts = settings.AI_SERVICE_RETRY_ATTEMPTS
+        self.hedging_enabled = settings.AI_SERVICE_HEDGING_ENABLED
+        self.hedger = get_request_hedger()
+        self.analysis_cache_enabled = settings.CACHE_ENABLED and settings.ANSWER_ANALYSIS_CACHE_ENABLED
+        self.analysis_cache_ttl = settings.CACHE_TTL_ANSWER_ANALYSIS
         
         # HTTP client
         self.client = httpx.AsyncClient(timeout=self.timeout)
@@ -190,6 +199,15 @@ class AIServiceClient:
         try:
             logger.info(f"Analyzing answer for role: {role}")
             
+            cache_key = None
+            if self.analysis_cache_enabled:
+                cache_key = self.get_analysis_cache_key(job_description, question, answer, role)
+                cached_result = await cache_manager.get(cache_key)
+                cache_metrics.record_request("answer_analysis", hit=cached_result is not None)
+                if cached_result is not None:
+                    logger.info(f"Answer analysis cache hit for role: {role}")
+                    return cached_result
+            
             payload = {
                 "job_description": job_description,
                 "question": question,
@@ -197,18 +215,18 @@ class AIServiceClient:
                 "role": role
             }
             
-            response = await self.client.post(
-                f"{self.base_url}/score/",
-                json=payload
+            # Latency is always recorded so the hedge delay is tuned before hedging is enabled
+            result = await self.hedger.run(
+                "analyze_answer",
+                lambda: self._post_score(payload),
+                hedge=self.hedging_enabled
             )
             
-            if response.status_code == 200:
-                result = response.json()
-                logger.info(f"Answer analyzed successfully for role: {role}")
-                return result
-            else:
-                logger.error(f"Answer analysis failed: {response.status_code}")
-                raise AIServiceUnavailableError(f"Answer analysis failed: {response.status_code}")
+            if cache_key:
+                await cache_manager.set(cache_key, result, ttl=self.analysis_cache_ttl)
+            
+            logger.info(f"Answer analyzed successfully for role: {role}")
+            return result
                 
         except httpx.RequestError as e:
             logger.error(f"Failed to connect to AI service: {e}")
@@ -217,6 +235,39 @@ class AIServiceClient:
             logger.error(f"Failed to analyze answer: {e}")
             raise
     
+    @staticmethod
+    def get_analysis_cache_key(job_description: str, question: str, answer: str, role: str = "") -> str:
+        """
+        Build the content-addressed cache key for an answer analysis.
+        
+        The key hashes the normalized question, answer, role and job description
+        together with ANSWER_ANALYSIS_SCORING_VERSION, so bumping the version
+        invalidates previously cached scores.
+        
+        Returns:
+            str: Cache key
+        """
+        content = "|".join(
+            normalize_cache_text(value) for value in (question, answer, role, job_description)
+        )
+        content_hash = hashlib.sha256(
+            f"{settings.ANSWER_ANALYSIS_SCORING_VERSION}|{content}".encode()
+        ).hexdigest()
+        return cache_manager.get_cache_key("ai_service", "answer_analysis", content_hash=content_hash)
+    
+    async def _post_score(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a single scoring request to the AI service."""
+        response = await self.client.post(
+            f"{self.base_url}/score/",
+            json=payload
+        )
+        
+        if response.status_code == 200:
+            return response.json()
+        
+        logger.error(f"Answer analysis failed: {response.status_code}")
+        raise AIServiceUnavailableError(f"Answer analysis failed: {response.status_code}")
+    
     async def transcribe_audio(
         self,
         audio_file_path: str,
@@ -226,29 +277,63 @@ class AIServiceClient:
         """
         Transcribe audio file using AI service
         
+        The file is streamed from disk in chunks rather than read into memory.
+        
         Args:
             audio_file_path: Path to audio file
             session_id: Session identifier
             language: Language code
             
+        Returns:
+            Dict containing transcription results
+        """
+        return await self.transcribe_audio_stream(
+            chunks=iter_file_chunks(audio_file_path),
+            filename=os.path.basename(audio_file_path),
+            session_id=session_id,
+            language=language
+        )
+    
+    async def transcribe_audio_stream(
+        self,
+        chunks: AsyncIterator[bytes],
+        filename: str,
+        session_id: str,
+        language: str = "en",
+        content_type: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Transcribe audio by streaming it to the AI service as a chunked multipart body.
+        
+        Args:
+            chunks: Async iterator producing the audio content
+            filename: Filename reported to the AI service
+            session_id: Session identifier
+            language: Language code
+            content_type: Audio MIME type (guessed from filename if not given)
+            
         Returns:
             Dict containing transcription results
         """
         try:
             logger.info(f"Transcribing audio for session: {session_id}")
             
-            with open(audio_file_path, 'rb') as f:
-                files = {'audio_file': f}
-                data = {
+            body, multipart_content_type = stream_multipart(
+                fields={
                     'session_id': session_id,
                     'language': language
-                }
-                
-                response = await self.client.post(
-                    f"{self.base_url}/transcribe/",
-                    files=files,
-                    data=data
-                )
+                },
+                file_field='audio_file',
+                filename=filename,
+                chunks=chunks,
+                content_type=content_type
+            )
+            
+            response = await self.client.post(
+                f"{self.base_url}/transcribe/",
+                content=body,
+                headers={"Content-Type": multipart_content_type}
+            )
             
             if response.status_code == 200:
                 result = response.json()
@@ -0,0 +1,335 @@
+"""
+Audio Blob Store
+
+Content-addressed on-disk storage for synthesized audio. Each blob is stored
+once under the SHA-256 of its bytes, sharded by hash prefix
+(``ab/cd/abcd...``), so cache entries only need to carry a small reference
+instead of base64-encoded audio. Total size is capped with least-recently-used
+eviction across every worker sharing the directory.
+"""
+
+import asyncio
+import hashlib
+import os
+import re
+import time
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import AsyncIterator, Dict, Any, Optional
+from app.config import get_settings
+from app.utils.logger import get_logger
+from app.utils.streaming import iter_file_chunks
+
+try:
+    import fcntl
+except ImportError:  # Windows: evictions are not coordinated between workers
+    fcntl = None
+
+logger = get_logger(__name__)
+
+_BLOB_ID_RE = re.compile(r"^[0-9a-f]{64}$")
+
+
+class AudioBlobStore:
+    """
+    Content-addressed audio blob store with an LRU size cap.
+
+    Every read touches the blob's modification time, so recency is shared by
+    all workers using the same directory. Each worker keeps an in-memory index
+    of the blobs it knows, but the cap is enforced from disk: when its index
+    exceeds max_bytes, or every ``rescan_interval`` seconds, a worker re-scans
+    the directory under an exclusive file lock and evicts the least recently
+    modified blobs until the whole directory fits. Blobs are keyed by content
+    SHA-256 (not the cache key), so identical audio cached under several keys
+    is stored once. A blob evicted by another worker simply reads as missing.
+    """
+
+    def __init__(self, root_dir: str, max_bytes: int, rescan_interval: float = 300.0):
+        """
+        Initialize the blob store.
+
+        Args:
+            root_dir: Directory holding the sharded blobs
+            max_bytes: Total size cap for the directory; least recently used blobs are evicted beyond it
+            rescan_interval: Seconds between disk re-scans that pick up other workers' blobs
+        """
+        self.root = Path(root_dir)
+        self.max_bytes = max_bytes
+        self.rescan_interval = rescan_interval
+        # blob_id -> size in bytes, least recently used first
+        self._index: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+        self._loaded = False
+        self._last_scan = 0.0
+        self._lock = asyncio.Lock()
+        self.stats = {
+            "writes": 0,
+            "dedup_writes": 0,  # Puts of content that was already stored
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "rescans": 0
+        }
+
+    @staticmethod
+    def compute_blob_id(data: bytes) -> str:
+        """Content address (SHA-256 hex) of audio bytes."""
+        return hashlib.sha256(data).hexdigest()
+
+    def path_for(self, blob_id: str) -> Path:
+        """
+        Get the on-disk path of a blob.
+
+        Args:
+            blob_id: Blob identifier (SHA-256 hex)
+
+        Returns:
+            Path: Sharded blob path
+
+        Raises:
+            ValueError: If blob_id is not a SHA-256 hex digest
+        """
+        if not _BLOB_ID_RE.match(blob_id or ""):
+            raise ValueError(f"Invalid blob id: {blob_id!r}")
+        return self.root / blob_id[:2] / blob_id[2:4] / blob_id
+
+    async def put(self, data: bytes) -> str:
+        """
+        Store audio bytes (once per distinct content).
+
+        Args:
+            data: Audio bytes
+
+        Returns:
+            str: Blob identifier
+        """
+        blob_id = self.compute_blob_id(data)
+        path = self.path_for(blob_id)
+        await self._ensure_loaded()
+
+        if blob_id in self._index and await asyncio.to_thread(path.exists):
+            self.stats["dedup_writes"] += 1
+            self._touch(blob_id, path)
+            return blob_id
+
+        await asyncio.to_thread(self._write_atomic, path, data)
+        self.stats["writes"] += 1
+        async with self._lock:
+            self._add_to_index(blob_id, len(data))
+            due = self._total_bytes > self.max_bytes or time.monotonic() - self._last_scan >= self.rescan_interval
+        if due:
+            await self._enforce_cap(keep=blob_id)
+        return blob_id
+
+    async def get(self, blob_id: str) -> Optional[bytes]:
+        """
+        Read a blob.
+
+        Args:
+            blob_id: Blob identifier
+
+        Returns:
+            bytes or None: Audio bytes, or None if the blob is missing
+        """
+        path = await self._locate(blob_id)
+        if path is None:
+            return None
+        try:
+            return await asyncio.to_thread(path.read_bytes)
+        except FileNotFoundError:
+            self._forget(blob_id)
+            self.stats["misses"] += 1
+            return None
+
+    async def open_stream(self, blob_id: str, chunk_size: Optional[int] = None) -> Optional[AsyncIterator[bytes]]:
+        """
+        Stream a blob from disk in chunks.
+
+        Args:
+            blob_id: Blob identifier
+            chunk_size: Chunk size in bytes (defaults to FILE_STREAM_CHUNK_SIZE)
+
+        Returns:
+            Async chunk iterator, or None if the blob is missing
+        """
+        path = await self._locate(blob_id)
+        if path is None:
+            return None
+        return iter_file_chunks(str(path), chunk_size)
+
+    async def exists(self, blob_id: str) -> bool:
+        """Check whether a blob is stored."""
+        try:
+            return await asyncio.to_thread(self.path_for(blob_id).exists)
+        except ValueError:
+            return False
+
+    async def _locate(self, blob_id: str) -> Optional[Path]:
+        """Resolve an existing blob path, recording hit/miss and recency."""
+        try:
+            path = self.path_for(blob_id)
+        except ValueError:
+            self.stats["misses"] += 1
+            return None
+        await self._ensure_loaded()
+        if not await asyncio.to_thread(path.exists):
+            self._forget(blob_id)
+            self.stats["misses"] += 1
+            return None
+        self.stats["hits"] += 1
+        self._touch(blob_id, path)
+        return path
+
+    def _touch(self, blob_id: str, path: Path):
+        """Mark a blob most recently used (in the index and on disk)."""
+        if blob_id in self._index:
+            self._index.move_to_end(blob_id)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def _forget(self, blob_id: str):
+        size = self._index.pop(blob_id, None)
+        if size is not None:
+            self._total_bytes -= size
+
+    def _add_to_index(self, blob_id: str, size: int):
+        self._forget(blob_id)
+        self._index[blob_id] = size
+        self._total_bytes += size
+
+    async def _enforce_cap(self, keep: str = ""):
+        """Re-scan the directory, evict beyond max_bytes, and rebuild the index from disk."""
+        async with self._lock:
+            # Breaks ties between equal modification times by this worker's recency
+            ranks = {blob_id: rank for rank, blob_id in enumerate(self._index)}
+        entries, evicted = await asyncio.to_thread(self._rescan_and_evict, ranks, keep)
+        evicted_ids = set(evicted)
+        async with self._lock:
+            self._index.clear()
+            self._total_bytes = 0
+            for blob_id, size, _, _ in entries:
+                if blob_id not in evicted_ids:
+                    self._add_to_index(blob_id, size)
+            self._last_scan = time.monotonic()
+            self.stats["rescans"] += 1
+            self.stats["evictions"] += len(evicted)
+
+    def _rescan_and_evict(self, ranks: Dict[str, int], keep: str) -> tuple:
+        """
+        Scan the directory and, holding the eviction lock, delete least recently used blobs beyond max_bytes.
+
+        Returns:
+            (entries, evicted): scanned (blob_id, size, mtime, rank) tuples, least
+            recently used first, and the evicted blob IDs. Nothing is evicted
+            if another worker holds the lock; it is enforcing the cap already.
+        """
+        self.root.mkdir(parents=True, exist_ok=True)
+        with open(self.root / ".evict.lock", "a") as lock_file:
+            if fcntl is not None:
+                try:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    return self._scan_ordered(ranks), []
+            entries = self._scan_ordered(ranks)
+            total = sum(size for _, size, _, _ in entries)
+            evicted = []
+            for blob_id, size, _, _ in entries:
+                if total <= self.max_bytes or len(entries) - len(evicted) <= 1:
+                    break
+                if blob_id == keep:
+                    continue
+                evicted.append(blob_id)
+                total -= size
+            if evicted:
+                self._delete_blobs(evicted)
+            return entries, evicted
+
+    def _scan_ordered(self, ranks: Dict[str, int]) -> list:
+        """Scan the directory, least recently used first."""
+        return sorted(
+            ((blob_id, size, mtime, ranks.get(blob_id, -1)) for blob_id, size, mtime in self._scan()),
+            key=lambda entry: (entry[2], entry[3])
+        )
+
+    def _write_atomic(self, path: Path, data: bytes):
+        """Write via a temp file and rename so readers never see partial blobs."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+    def _delete_blobs(self, blob_ids: list):
+        for blob_id in blob_ids:
+            try:
+                self.path_for(blob_id).unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Failed to evict audio blob {blob_id[:12]}: {e}")
+        logger.debug(f"Evicted {len(blob_ids)} audio blobs")
+
+    async def _ensure_loaded(self):
+        """Seed the LRU index from disk (oldest modification time first) on first use."""
+        if self._loaded:
+            return
+        self._loaded = True
+        await self._enforce_cap()
+
+    def _scan(self) -> list:
+        entries = []
+        if not self.root.exists():
+            return entries
+        for path in self.root.glob("*/*/*"):
+            if _BLOB_ID_RE.match(path.name):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((path.name, stat.st_size, stat.st_mtime))
+        return entries
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get blob store statistics.
+
+        Returns:
+            Dict with blob count, resident bytes, size cap and hit/write/eviction counters
+        """
+        return {
+            "root": str(self.root),
+            "blobs": len(self._index),
+            "total_bytes": self._total_bytes,
+            "max_bytes": self.max_bytes,
+            "rescan_interval": self.rescan_interval,
+            **self.stats
+        }
+
+
+# Global audio blob store instance
+_audio_blob_store: Optional[AudioBlobStore] = None
+
+
+def get_audio_blob_store() -> AudioBlobStore:
+    """
+    Get the global audio blob store instance.
+
+    Returns:
+        AudioBlobStore: Audio blob store instance
+    """
+    global _audio_blob_store
+    if _audio_blob_store is None:
+        settings = get_settings()
+        _audio_blob_store = AudioBlobStore(
+            root_dir=settings.TTS_BLOB_STORE_DIR,
+            max_bytes=settings.TTS_BLOB_STORE_MAX_BYTES,
+            rescan_interval=settings.TTS_BLOB_STORE_RESCAN_INTERVAL
+        )
+    return _audio_blob_store
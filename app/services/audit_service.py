@@ -29,8 +29,13 @@ def log_data_access(
     action: str,
     resource_id: Optional[str] = None,
     ip_address: Optional[str] = None,
+    commit: bool = True,
 ) -> None:
-    """Log a data access event for audit trail."""
+    """Log a data access event for audit trail.
+
+    Pass ``commit=False`` to add the entry to the caller's transaction instead
+    of committing immediately.
+    """
     try:
         uid = to_uuid(user_id) if user_id else None
         log_entry = DataAccessLog(
@@ -41,10 +46,12 @@ def log_data_access(
             ip_address=ip_address,
         )
         db.add(log_entry)
-        db.commit()
+        if commit:
+            db.commit()
     except Exception as e:
         logger.warning(f"Failed to log data access: {e}")
-        db.rollback()
+        if commit:
+            db.rollback()
 
 
 def get_data_access_logs(
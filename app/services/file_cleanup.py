@@ -0,0 +1,223 @@
+"""
+File Expiry Cleanup
+
+Background task that deletes expired upload files. Expired files are found
+through the file index (oldest first) or an os.scandir walk of the type
+directories, and deleted in bounded batches in a worker thread, so cleanup
+never blocks the event loop or runs inside request handling. Every worker
+process runs the task; a Redis lease lets only one of them sweep per interval.
+"""
+
+import asyncio
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+from app.config import get_settings
+from app.utils.logger import get_logger
+from app.utils.metrics import metrics
+
+logger = get_logger(__name__)
+
+SWEEP_LOCK_KEY = "file_cleanup:sweep_lock"
+
+
+class FileCleanupWorker:
+    """
+    Periodically deletes upload files older than FILE_EXPIRATION_HOURS.
+
+    Each run deletes FILE_CLEANUP_BATCH_SIZE files per batch via
+    ``FileService.delete_expired_batch`` in a thread, pausing
+    FILE_CLEANUP_BATCH_PAUSE seconds between batches to bound its share of
+    disk and database load. Progress is exported as Prometheus metrics and
+    through get_stats().
+
+    Each run first claims a Redis lease (``SET NX``) for one interval, so with
+    several workers only one sweeps and the others skip that run. Without the
+    Redis cache backend each worker sweeps. With the file index enabled, every
+    FILE_CLEANUP_SCAN_EVERY runs the type directories are also walked for
+    expired files the index does not know.
+    """
+
+    def __init__(
+        self,
+        interval: Optional[float] = None,
+        batch_size: Optional[int] = None,
+        batch_pause: Optional[float] = None,
+        expiration_hours: Optional[float] = None,
+        scan_every: Optional[int] = None,
+        file_service=None
+    ):
+        """
+        Initialize the cleanup worker.
+
+        Args:
+            interval: Seconds between runs (default: FILE_CLEANUP_INTERVAL_HOURS)
+            batch_size: Files deleted per batch (default: FILE_CLEANUP_BATCH_SIZE)
+            batch_pause: Seconds to pause between batches (default: FILE_CLEANUP_BATCH_PAUSE)
+            expiration_hours: File age after which files expire (default: FILE_EXPIRATION_HOURS)
+            scan_every: Walk storage for unindexed files every this many runs, 0 never
+                (default: FILE_CLEANUP_SCAN_EVERY)
+            file_service: Optional FileService to use (a session is opened per run if not provided)
+        """
+        settings = get_settings()
+        self.interval = settings.FILE_CLEANUP_INTERVAL_HOURS * 3600 if interval is None else interval
+        self.batch_size = settings.FILE_CLEANUP_BATCH_SIZE if batch_size is None else batch_size
+        self.batch_pause = settings.FILE_CLEANUP_BATCH_PAUSE if batch_pause is None else batch_pause
+        self.expiration_hours = settings.FILE_EXPIRATION_HOURS if expiration_hours is None else expiration_hours
+        self.scan_every = settings.FILE_CLEANUP_SCAN_EVERY if scan_every is None else scan_every
+        self.file_service = file_service
+        self._task: Optional[asyncio.Task] = None
+        self.running = False
+        self.stats = {
+            "runs": 0,
+            "runs_skipped": 0,
+            "batches": 0,
+            "files_deleted": 0,
+            "files_failed": 0,
+            "bytes_freed": 0,
+            "last_run_at": None,
+            "last_run_duration": None,
+            "last_run_deleted": 0,
+            "last_error": None
+        }
+
+    def start(self) -> None:
+        """Start the periodic cleanup task, if not already running."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run_forever())
+            logger.info(f"File cleanup worker started (every {self.interval}s, batches of {self.batch_size})")
+
+    async def stop(self) -> None:
+        """Cancel the cleanup task and wait for it to finish."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    async def _run_forever(self) -> None:
+        """Run cleanup every interval seconds until cancelled."""
+        while True:
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.stats["last_error"] = str(e)
+                logger.error(f"File cleanup run failed: {e}")
+            await asyncio.sleep(self.interval)
+
+    async def _claim_sweep(self) -> bool:
+        """Claim this interval's sweep; False if another worker holds the lease."""
+        from app.utils.cache import cache_manager
+
+        redis_client = cache_manager.redis_client
+        if redis_client is None:
+            return True
+        try:
+            # Not released: the lease expires after one interval, when the next sweep is due
+            return bool(await redis_client.set(
+                SWEEP_LOCK_KEY, str(os.getpid()), nx=True, ex=max(1, int(self.interval))
+            ))
+        except Exception as e:
+            logger.warning(f"File cleanup: sweep lease unavailable, skipping run: {e}")
+            return False
+
+    async def run_once(self) -> Dict[str, int]:
+        """
+        Delete all currently expired files in bounded batches.
+
+        Returns:
+            Dict with deleted, failed, bytes_freed and batches counts for this run
+            (all zero if another worker holds this interval's sweep)
+        """
+        from app.services.database_service import database_service
+        from app.services.file_service import FileService
+
+        run = {"deleted": 0, "failed": 0, "bytes_freed": 0, "batches": 0}
+        if not await self._claim_sweep():
+            self.stats["runs_skipped"] += 1
+            logger.debug("File cleanup: another worker is sweeping, skipping run")
+            return run
+
+        started = time.monotonic()
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=self.expiration_hours)
+        scan_storage = self.scan_every > 0 and self.stats["runs"] % self.scan_every == 0
+        self.running = True
+
+        db = None
+        file_service = self.file_service
+        if file_service is None:
+            db = database_service.get_sync_session()
+            file_service = FileService(db)
+        try:
+            expired = file_service.iter_expired_files(cutoff, scan_storage=scan_storage)
+            while True:
+                batch_started = time.monotonic()
+                batch = await asyncio.to_thread(file_service.delete_expired_batch, expired, self.batch_size)
+                metrics.record_file_cleanup_batch(
+                    batch["deleted"], batch["failed"], batch["bytes_freed"], time.monotonic() - batch_started
+                )
+                run["batches"] += 1
+                for key in ("deleted", "failed", "bytes_freed"):
+                    run[key] += batch[key]
+                self.stats["batches"] += 1
+                self.stats["files_deleted"] += batch["deleted"]
+                self.stats["files_failed"] += batch["failed"]
+                self.stats["bytes_freed"] += batch["bytes_freed"]
+
+                if batch["processed"] < self.batch_size:
+                    break
+                logger.info(f"File cleanup progress: {run['deleted']} files deleted, {run['bytes_freed']} bytes freed")
+                await asyncio.sleep(self.batch_pause)
+        finally:
+            self.running = False
+            if db is not None:
+                db.close()
+
+        duration = time.monotonic() - started
+        self.stats["runs"] += 1
+        self.stats["last_run_at"] = datetime.now().isoformat()
+        self.stats["last_run_duration"] = round(duration, 3)
+        self.stats["last_run_deleted"] = run["deleted"]
+        self.stats["last_error"] = None
+        metrics.record_file_cleanup_run()
+        if run["deleted"] or run["failed"]:
+            logger.info(
+                f"File cleanup finished in {duration:.2f}s: {run['deleted']} deleted, "
+                f"{run['failed']} failed, {run['bytes_freed']} bytes freed"
+            )
+        return run
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cleanup worker configuration and progress statistics."""
+        return {
+            **self.stats,
+            "running": self.running,
+            "scheduled": self._task is not None and not self._task.done(),
+            "interval_seconds": self.interval,
+            "batch_size": self.batch_size,
+            "expiration_hours": self.expiration_hours,
+            "scan_every": self.scan_every
+        }
+
+
+# Global file cleanup worker
+_file_cleanup_worker: Optional[FileCleanupWorker] = None
+
+
+def get_file_cleanup_worker() -> FileCleanupWorker:
+    """
+    Get the global file cleanup worker.
+
+    Returns:
+        FileCleanupWorker: File cleanup worker instance
+    """
+    global _file_cleanup_worker
+    if _file_cleanup_worker is None:
+        _file_cleanup_worker = FileCleanupWorker()
+    return _file_cleanup_worker
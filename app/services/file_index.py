@@ -0,0 +1,410 @@
+"""
+Persistent File Index
+
+Maps file_id to the stored file's path, type, size, MIME type and checksum in
+the stored_files table, so FileService resolves files with a primary-key
+lookup instead of globbing every type directory and opening voice metadata
+sidecars. Per-type file counts and sizes are kept in stored_file_stats and
+updated with every index write, so listings and storage stats never scan.
+"""
+
+import functools
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.database.models import StoredFile, StoredFileStats
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Dialects whose INSERT supports ON CONFLICT DO UPDATE, used for counter upserts
+_UPSERT_INSERTS = {"postgresql": postgresql_insert, "sqlite": sqlite_insert}
+
+
+def _locked(method):
+    """Run a FileIndex method under its lock; saves may call it from worker threads."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class FileIndex:
+    """file_id → stored file index backed by the stored_files table.
+
+    Index failures are logged and swallowed: the files on disk remain the
+    source of truth, and callers fall back to scanning storage.
+
+    The index works in its own session on the caller's bind, so its commits
+    and rollbacks never commit or discard changes the caller has pending in
+    the request session. Writes made with commit=False stay open in that
+    session until commit(). Calls are serialized with a lock, so one index
+    can be used from several worker threads.
+    """
+
+    def __init__(self, db: Session, upload_dir: Path):
+        self.db = Session(bind=db.get_bind())
+        self.upload_dir = upload_dir
+        self._pending = False
+        self._lock = threading.RLock()
+
+    def _relative_path(self, file_path: Path) -> str:
+        """Path stored in the index, relative to the upload directory."""
+        try:
+            return file_path.relative_to(self.upload_dir).as_posix()
+        except ValueError:
+            return str(file_path)
+
+    def resolve(self, entry: StoredFile) -> Path:
+        """Absolute path of an indexed file."""
+        return self.upload_dir / entry.file_path
+
+    @_locked
+    def get(self, file_id: str) -> Optional[StoredFile]:
+        """
+        Look up a file by ID.
+
+        Args:
+            file_id: Unique file identifier
+
+        Returns:
+            Index entry, or None if the file is not indexed or the lookup failed
+        """
+        try:
+            return self.db.get(StoredFile, file_id)
+        except SQLAlchemyError as e:
+            self._rollback(f"look up file {file_id}", e)
+            return None
+        finally:
+            self._end_read()
+
+    @_locked
+    def add(
+        self,
+        file_id: str,
+        file_type: str,
+        file_path: Path,
+        filename: str,
+        file_size: int,
+        mime_type: str,
+        checksum: Optional[str] = None,
+        created_at: Optional[datetime] = None,
+        commit: bool = True
+    ) -> bool:
+        """
+        Add or replace the index entry for a file.
+
+        An entry of another file_id at the same path (a voice file overwritten
+        under the same question, voice and version) is removed, since that
+        file no longer exists.
+
+        Args:
+            file_id: Unique file identifier
+            file_type: File type value (audio, document, image, video)
+            file_path: Absolute path of the stored file
+            filename: Original filename
+            file_size: Size in bytes
+            mime_type: MIME type
+            checksum: SHA-256 hex digest of the content
+            created_at: Creation time (defaults to now)
+            commit: Commit immediately; pass False to batch several writes
+
+        Returns:
+            bool: True if the entry was written
+        """
+        relative_path = self._relative_path(file_path)
+        try:
+            replaced = self.db.query(StoredFile).filter(
+                StoredFile.file_path == relative_path,
+                StoredFile.file_id != file_id
+            ).all()
+            existing = self.db.get(StoredFile, file_id)
+            for entry in replaced + ([existing] if existing else []):
+                self._count(entry.file_type, -1, -entry.file_size)
+            for entry in replaced:
+                self.db.delete(entry)
+            self._count(file_type, 1, file_size)
+            self.db.merge(StoredFile(
+                file_id=file_id,
+                file_type=file_type,
+                file_path=relative_path,
+                filename=filename,
+                file_size=file_size,
+                mime_type=mime_type,
+                checksum=checksum,
+                created_at=created_at or datetime.now(timezone.utc)
+            ))
+            self._finish_write(commit)
+            return True
+        except SQLAlchemyError as e:
+            self._rollback(f"index file {file_id}", e)
+            return False
+
+    @_locked
+    def remove(self, file_id: str, commit: bool = True) -> bool:
+        """
+        Remove a file from the index.
+
+        Args:
+            file_id: Unique file identifier
+            commit: Commit immediately; pass False to batch several writes
+
+        Returns:
+            bool: True if an entry was removed
+        """
+        try:
+            entry = self.db.get(StoredFile, file_id)
+            if not entry:
+                self._end_read()
+                return False
+            self._count(entry.file_type, -1, -entry.file_size)
+            self.db.delete(entry)
+            self._finish_write(commit)
+            return True
+        except SQLAlchemyError as e:
+            self._rollback(f"remove file {file_id} from index", e)
+            return False
+
+    @_locked
+    def commit(self) -> bool:
+        """
+        Commit index writes made with commit=False.
+
+        Returns:
+            bool: True if the commit succeeded
+        """
+        try:
+            self.db.commit()
+            self._pending = False
+            return True
+        except SQLAlchemyError as e:
+            self._rollback("commit index writes", e)
+            return False
+
+    @_locked
+    def file_ids(self) -> Set[str]:
+        """All indexed file IDs."""
+        try:
+            return {file_id for (file_id,) in self.db.query(StoredFile.file_id)}
+        finally:
+            self._end_read()
+
+    @_locked
+    def remove_many(self, file_ids: Iterable[str]) -> int:
+        """
+        Remove several files from the index without committing.
+
+        IDs that are not indexed (already removed elsewhere) are ignored.
+
+        Args:
+            file_ids: File identifiers to remove
+
+        Returns:
+            int: Number of entries removed (0 if the removal failed)
+        """
+        file_ids = list(file_ids)
+        removed = 0
+        try:
+            # Bounded IN lists keep the statement size reasonable for large prunes
+            for start in range(0, len(file_ids), 500):
+                batch = StoredFile.file_id.in_(file_ids[start:start + 500])
+                totals = self.db.query(
+                    StoredFile.file_type, func.count(StoredFile.file_id), func.coalesce(func.sum(StoredFile.file_size), 0)
+                ).filter(batch).group_by(StoredFile.file_type).all()
+                for file_type, count, size in totals:
+                    self._count(file_type, -count, -size)
+                removed += self.db.query(StoredFile).filter(batch).delete(synchronize_session=False)
+        except SQLAlchemyError as e:
+            self._rollback(f"remove {len(file_ids)} files from index", e)
+            return 0
+        self._pending = True
+        return removed
+
+    @_locked
+    def list_page(self, file_type: Optional[str], offset: int, limit: int) -> Optional[List[StoredFile]]:
+        """
+        List indexed files, newest first.
+
+        Args:
+            file_type: Only list files of this type
+            offset: Entries to skip
+            limit: Maximum entries to return
+
+        Returns:
+            Index entries ordered by creation time, or None if the query failed
+        """
+        try:
+            query = self.db.query(StoredFile)
+            if file_type:
+                query = query.filter(StoredFile.file_type == file_type)
+            return query.order_by(
+                StoredFile.created_at.desc(), StoredFile.file_id.desc()
+            ).offset(offset).limit(limit).all()
+        except SQLAlchemyError as e:
+            self._rollback("list files", e)
+            return None
+        finally:
+            self._end_read()
+
+    @_locked
+    def created_before(
+        self,
+        cutoff: datetime,
+        limit: int,
+        after: Optional[Tuple[datetime, str]] = None,
+        exclude_prefix: Optional[str] = None
+    ) -> List[StoredFile]:
+        """
+        List files created before a cutoff, oldest first.
+
+        Pages by (created_at, file_id) keyset so each call reads only its
+        page from the created_at index, even while earlier pages are deleted.
+
+        Args:
+            cutoff: Only files created before this time
+            limit: Maximum entries to return
+            after: (created_at, file_id) of the last entry of the previous page
+            exclude_prefix: Skip files whose path starts with this prefix
+
+        Returns:
+            Index entries ordered by creation time
+        """
+        query = self.db.query(StoredFile).filter(StoredFile.created_at < cutoff)
+        if after:
+            created_at, file_id = after
+            query = query.filter(
+                (StoredFile.created_at > created_at)
+                | ((StoredFile.created_at == created_at) & (StoredFile.file_id > file_id))
+            )
+        if exclude_prefix:
+            query = query.filter(~StoredFile.file_path.startswith(exclude_prefix))
+        try:
+            return query.order_by(StoredFile.created_at, StoredFile.file_id).limit(limit).all()
+        finally:
+            self._end_read()
+
+    @_locked
+    def counts(self) -> Optional[Dict[str, Dict[str, int]]]:
+        """
+        Per-type file count and total size.
+
+        Returns:
+            Dict of file type to {"count", "total_size"}, or None if the query failed
+        """
+        try:
+            return {
+                row.file_type: {"count": row.file_count, "total_size": row.total_bytes}
+                for row in self.db.query(StoredFileStats)
+            }
+        except SQLAlchemyError as e:
+            self._rollback("read file counters", e)
+            return None
+        finally:
+            self._end_read()
+
+    @_locked
+    def stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Storage statistics from the counters and the created_at index.
+
+        Returns:
+            Dict with total_files, total_size, files_by_type, oldest_file and
+            newest_file, or None if the query failed
+        """
+        counts = self.counts()
+        if counts is None:
+            return None
+        try:
+            oldest, newest = self.db.query(func.min(StoredFile.created_at), func.max(StoredFile.created_at)).one()
+        except SQLAlchemyError as e:
+            self._rollback("read file age range", e)
+            return None
+        finally:
+            self._end_read()
+        return {
+            "total_files": sum(c["count"] for c in counts.values()),
+            "total_size": sum(c["total_size"] for c in counts.values()),
+            "files_by_type": counts,
+            "oldest_file": oldest,
+            "newest_file": newest
+        }
+
+    @_locked
+    def recount(self) -> None:
+        """Recompute the per-type counters from stored_files without committing."""
+        # Totals must include index writes still pending in the session
+        self.db.flush()
+        # Zero rather than delete, so the seeded counter rows are never missing
+        self.db.query(StoredFileStats).update(
+            {StoredFileStats.file_count: 0, StoredFileStats.total_bytes: 0}, synchronize_session=False
+        )
+        totals = self.db.query(
+            StoredFile.file_type, func.count(StoredFile.file_id), func.coalesce(func.sum(StoredFile.file_size), 0)
+        ).group_by(StoredFile.file_type).all()
+        for file_type, count, size in totals:
+            self._count(file_type, count, size)
+        self._pending = True
+
+    def _count(self, file_type: str, files: int, size: int) -> None:
+        """
+        Adjust a type's counters in the current transaction.
+
+        Uses a single INSERT ... ON CONFLICT DO UPDATE where the dialect has
+        one, so two requests saving the first file of a type cannot both
+        insert its counter row.
+        """
+        upsert = _UPSERT_INSERTS.get(self.db.get_bind().dialect.name)
+        if upsert is not None:
+            statement = upsert(StoredFileStats).values(file_type=file_type, file_count=files, total_bytes=size)
+            self.db.execute(statement.on_conflict_do_update(
+                index_elements=[StoredFileStats.file_type],
+                set_={
+                    "file_count": StoredFileStats.file_count + statement.excluded.file_count,
+                    "total_bytes": StoredFileStats.total_bytes + statement.excluded.total_bytes
+                }
+            ))
+            return
+
+        # Other dialects rely on the migration seeding a row per file type
+        updated = self.db.query(StoredFileStats).filter(StoredFileStats.file_type == file_type).update(
+            {
+                StoredFileStats.file_count: StoredFileStats.file_count + files,
+                StoredFileStats.total_bytes: StoredFileStats.total_bytes + size
+            },
+            synchronize_session=False
+        )
+        if not updated:
+            self.db.add(StoredFileStats(file_type=file_type, file_count=files, total_bytes=size))
+            self.db.flush()
+
+    def _finish_write(self, commit: bool) -> None:
+        """Commit a write, or keep it open for a later commit()."""
+        if commit:
+            self.db.commit()
+            self._pending = False
+        else:
+            self._pending = True
+
+    def _end_read(self) -> None:
+        """Return the index session's connection after a read, unless writes are pending."""
+        if not self._pending:
+            # Loaded entries stay usable after close; only the connection is released
+            self.db.close()
+
+    def _rollback(self, action: str, error: Exception) -> None:
+        """Roll back the failed index work; the caller's session is not affected."""
+        logger.warning(f"File index: failed to {action}: {error}")
+        self._pending = False
+        try:
+            self.db.rollback()
+        except SQLAlchemyError:
+            pass
@@ -1,14 +1,15 @@
-# os import removed as it was unused
+import os
 import uuid
-import shutil
+import itertools
 import hashlib
 import json
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, BinaryIO
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Any, BinaryIO, Iterable, Iterator, Tuple
 from pathlib import Path
 from fastapi import UploadFile, HTTPException
 from sqlalchemy.orm import Session
 from app.models.schemas import FileType, FileStatus, FileInfoResponse, FileListResponse
+from app.services.file_index import FileIndex
 from app.utils.validation import ValidationService
 from app.config import get_settings
 from app.utils.logger import get_logger
@@ -30,6 +31,9 @@ class FileService:
         
         # Initialize unified validation service
         self.validation_service = ValidationService()
+        
+        # Persistent file_id index; without it, lookups scan storage
+        self.index = FileIndex(db, self.upload_dir) if db is not None and settings.FILE_INDEX_ENABLED else None
     
     def _create_type_directories(self):
         """Create subdirectories for different file types using pathlib."""
@@ -134,47 +138,29 @@ class FileService:
     
     
     def save_file(self, file: UploadFile, file_type: FileType, file_id: str, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Save uploaded file to disk."""
+        """Save uploaded file to disk in a single streaming pass."""
         try:
             # Validate file
             is_valid, errors = self.validation_service.validate_file(file, file_type)
             if not is_valid:
                 raise HTTPException(status_code=400, detail=f"File validation failed: {', '.join(errors)}")
-            filename = file.filename
-            mime_type = self._get_mime_type_from_filename(filename)
-            
-            # Get file path (with metadata support for voice files)
-            file_path = self.get_file_path(file_id, file_type, filename, metadata)
-            
-            # Ensure directory exists
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Save file to disk
-            with open(file_path, "wb") as buffer:
-                shutil.copyfileobj(file.file, buffer)
             
-            # Calculate file hash
-            with open(file_path, "rb") as f:
-                file_hash = self.calculate_file_hash(f.read())
-            
-            # Get file size
-            file_size = file_path.stat().st_size
-            
-            # Save metadata if provided (ensure file_id is included)
-            if metadata:
-                metadata_with_id = {**metadata, "file_id": file_id}
-                self._save_metadata(file_path, metadata_with_id)
+            file.file.seek(0)
+            chunks = iter(lambda: file.file.read(settings.FILE_STREAM_CHUNK_SIZE), b"")
+            result = self.save_file_stream(chunks, file_type, file_id, file.filename, metadata)
             
             return {
-                "filename": filename,
-                "mime_type": mime_type,
-                "file_size": file_size,
-                "file_hash": file_hash,
-                "file_path": str(file_path),
+                "filename": result["filename"],
+                "mime_type": result["mime_type"],
+                "file_size": result["file_size"],
+                "file_hash": result["file_hash"],
+                "file_path": result["file_path"],
                 "status": FileStatus.COMPLETED,
-                "created_at": datetime.now()
+                "created_at": result["created_at"]
             }
             
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Error saving file {file_id}: {e}")
             raise HTTPException(
@@ -207,44 +193,9 @@ class FileService:
             Dict with file information including file_id, filename, file_path, etc.
         """
         try:
-            # Get file path (with metadata support for voice files)
-            file_path = self.get_file_path(file_id, file_type, filename, metadata)
-            
-            # Ensure directory exists
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Save file to disk
-            with open(file_path, "wb") as f:
-                f.write(content)
-            
-            # Calculate file hash
-            file_hash = self.calculate_file_hash(content)
-            
-            # Get file size
-            file_size = len(content)
-            
-            # Get MIME type
-            mime_type = self._get_mime_type_from_filename(filename)
-            
-            # Save metadata if provided (ensure file_id is included)
-            if metadata:
-                metadata_with_id = {**metadata, "file_id": file_id}
-                self._save_metadata(file_path, metadata_with_id)
-            
-            logger.info(f"Saved file from bytes: {file_id} at {file_path}")
-            
-            return {
-                "file_id": file_id,
-                "filename": filename,
-                "mime_type": mime_type,
-                "file_size": file_size,
-                "file_hash": file_hash,
-                "file_path": str(file_path),
-                "status": FileStatus.COMPLETED,
-                "created_at": datetime.now(),
-                "metadata": metadata or {}
-            }
-            
+            return self.save_file_stream([content], file_type, file_id, filename, metadata)
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Error saving file from bytes {file_id}: {e}")
             raise HTTPException(
@@ -252,7 +203,133 @@ class FileService:
                 detail=f"Failed to save file from bytes: {str(e)}"
             )
     
+    def save_file_stream(
+        self,
+        chunks: Iterable[bytes],
+        file_type: FileType,
+        file_id: str,
+        filename: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        max_size: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Save a file from an iterable of chunks in a single pass.
+        
+        Chunks are hashed as they are written to a temporary file that is
+        renamed into place once complete, so memory use is bounded by the
+        chunk size and readers never see a partially written file.
+        
+        Args:
+            chunks: File content in chunks
+            file_type: Type of file
+            file_id: Unique file identifier
+            filename: Original filename
+            metadata: Optional metadata saved alongside the file
+            max_size: Size limit in bytes (defaults to the file type's limit)
+        
+        Returns:
+            Dict with file information including file_id, filename, file_path, etc.
+        
+        Raises:
+            HTTPException: 413 if the content exceeds the size limit (nothing is saved)
+        """
+        writer = self.open_stream_writer(file_type, file_id, filename, metadata, max_size=max_size)
+        try:
+            for chunk in chunks:
+                writer.write(chunk)
+            return writer.commit()
+        finally:
+            if not writer.closed:
+                writer.abort()
+    
+    def open_stream_writer(
+        self,
+        file_type: FileType,
+        file_id: str,
+        filename: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        max_size: Optional[int] = None
+    ) -> "FileStreamWriter":
+        """
+        Open a writer that saves a file incrementally as chunks arrive.
+        
+        Used to tee a streamed upload to disk while it is forwarded elsewhere,
+        without buffering the whole file in memory.
+        
+        Args:
+            file_type: Type of file
+            file_id: Unique file identifier
+            filename: Original filename
+            metadata: Optional metadata saved alongside the file on commit
+            max_size: Size limit in bytes (defaults to the file type's limit)
+        
+        Returns:
+            FileStreamWriter: Call write() per chunk, then commit() or abort()
+        """
+        file_path = self.get_file_path(file_id, file_type, filename, metadata)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        if max_size is None:
+            max_size = self.validation_service.FILE_SIZE_LIMITS.get(file_type)
+        return FileStreamWriter(self, file_path, file_id, filename, metadata, file_type=file_type, max_size=max_size)
+    
+    def _index_file(
+        self,
+        file_id: str,
+        file_type: FileType,
+        file_path: Path,
+        filename: str,
+        file_size: int,
+        mime_type: str,
+        file_hash: Optional[str]
+    ) -> None:
+        """Record a saved file in the persistent index."""
+        if self.index:
+            self.index.add(file_id, FileType(file_type).value, file_path, filename, file_size, mime_type, file_hash)
+    
+    def _index_existing_file(self, file_id: str, file_path: Path, commit: bool = True) -> bool:
+        """Record a file found in storage (not saved through this service) in the index."""
+        stat = file_path.stat()
+        return self.index.add(
+            file_id,
+            file_path.relative_to(self.upload_dir).parts[0],
+            file_path,
+            file_path.name,
+            stat.st_size,
+            self._get_mime_type(file_path),
+            self._calculate_path_hash(file_path),
+            created_at=datetime.fromtimestamp(stat.st_ctime, timezone.utc),
+            commit=commit
+        )
+    
+    @staticmethod
+    def _calculate_path_hash(file_path: Path) -> str:
+        """Calculate SHA-256 hash of a stored file without reading it into memory at once."""
+        hasher = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                hasher.update(block)
+        return hasher.hexdigest()
+    
     def _find_file_by_id(self, file_id: str) -> Optional[Path]:
+        """Find file by ID: a primary-key lookup in the index, falling back to scanning storage."""
+        if self.index:
+            entry = self.index.get(file_id)
+            if entry:
+                file_path = self.index.resolve(entry)
+                if file_path.is_file():
+                    return file_path
+                # Removed outside this service
+                self.index.remove(file_id)
+            if not settings.FILE_INDEX_SCAN_ON_MISS:
+                return None
+        
+        file_path = self._scan_for_file(file_id)
+        if file_path and self.index:
+            # Files saved before the index existed are indexed on first access
+            self._index_existing_file(file_id, file_path)
+        return file_path
+    
+    def _scan_for_file(self, file_id: str) -> Optional[Path]:
         """Find file by ID across all type directories, including nested voice file structure."""
         # Try flat structure first (most common case)
         flat_result = self._find_in_flat_structure(file_id)
@@ -356,6 +433,8 @@ class FileService:
             file_path = self._find_file_by_id(file_id)
             if file_path:
                 file_path.unlink()
+                if self.index:
+                    self.index.remove(file_id)
                 logger.info(f"Deleted file: {file_path}")
                 return True
             return False
@@ -364,7 +443,17 @@ class FileService:
             return False
     
     def list_files(self, file_type: Optional[FileType] = None, page: int = 1, page_size: int = 20) -> FileListResponse:
-        """List files with pagination."""
+        """
+        List files with pagination, newest first.
+        
+        Served from the file index (one ordered page query plus the per-type
+        counters) when enabled; otherwise storage is scanned.
+        """
+        if self.index:
+            response = self._list_indexed_files(file_type, page, page_size)
+            if response is not None:
+                return response
+        
         files = []
         total_count = 0
         
@@ -406,28 +495,61 @@ class FileService:
         
         # Convert to response models
         file_responses = [
-            FileInfoResponse(
-                file_id=f["file_id"],
-                filename=f["filename"],
-                file_type=f["file_type"],
-                file_size=f["file_size"],
-                mime_type=f["mime_type"],
-                status=f["status"],
-                upload_url=f"/api/v1/files/{f['file_id']}",
-                created_at=f["created_at"],
-                expires_at=None,
-                metadata=None,
-                processing_result=None
+            self._file_info_response(
+                f["file_id"], f["filename"], f["file_type"], f["file_size"], f["mime_type"], f["created_at"]
             )
             for f in paginated_files
         ]
         
+        return FileListResponse(files=file_responses, total=total_count, page=page, per_page=page_size)
+    
+    def _list_indexed_files(self, file_type: Optional[FileType], page: int, page_size: int) -> Optional[FileListResponse]:
+        """List a page of files from the index, or None if the index could not be read."""
+        type_value = FileType(file_type).value if file_type else None
+        counts = self.index.counts()
+        entries = self.index.list_page(type_value, (page - 1) * page_size, page_size)
+        if counts is None or entries is None:
+            return None
+        
+        if type_value:
+            total_count = counts.get(type_value, {}).get("count", 0)
+        else:
+            total_count = sum(c["count"] for c in counts.values())
+        
         return FileListResponse(
-            files=file_responses,
-            total_count=total_count,
+            files=[
+                self._file_info_response(
+                    entry.file_id, entry.filename, entry.file_type, entry.file_size, entry.mime_type, entry.created_at
+                )
+                for entry in entries
+            ],
+            total=total_count,
             page=page,
-            page_size=page_size,
-            has_next=end_idx < total_count
+            per_page=page_size
+        )
+    
+    @staticmethod
+    def _file_info_response(
+        file_id: str,
+        filename: str,
+        file_type: str,
+        file_size: int,
+        mime_type: str,
+        created_at: Optional[datetime]
+    ) -> FileInfoResponse:
+        """Build the listing entry of a stored file."""
+        return FileInfoResponse(
+            file_id=file_id,
+            filename=filename,
+            file_type=file_type,
+            file_size=file_size,
+            mime_type=mime_type,
+            status=FileStatus.COMPLETED,
+            upload_url=f"/api/v1/files/{file_id}",
+            created_at=created_at.isoformat() if created_at else None,
+            expires_at=None,
+            metadata=None,
+            processing_result=None
         )
     
     def _normalize_audio_filename_and_mime(
@@ -478,30 +600,128 @@ class FileService:
         
         return open(file_path, "rb")
     
-    def cleanup_expired_files(self) -> int:
+    def cleanup_expired_files(self, batch_size: int = 500) -> int:
         """Clean up expired files. Returns number of files cleaned up."""
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=settings.FILE_EXPIRATION_HOURS)
+        expired = self.iter_expired_files(cutoff)
         cleaned_count = 0
-        current_time = datetime.now()
+        while True:
+            batch = self.delete_expired_batch(expired, batch_size)
+            cleaned_count += batch["deleted"]
+            if batch["processed"] < batch_size:
+                return cleaned_count
+    
+    def iter_expired_files(
+        self,
+        cutoff: datetime,
+        page_size: int = 500,
+        scan_storage: bool = False
+    ) -> Iterator[Tuple[Optional[str], Path]]:
+        """
+        Yield uploaded files created before a cutoff.
         
+        With the file index, files come oldest first from its created_at index,
+        a page at a time; otherwise each type directory is walked with
+        os.scandir. Nested question voice files are kept: they are cached
+        question audio, not uploads.
+        
+        Args:
+            cutoff: Files created before this time are expired
+            page_size: Index entries read per query
+            scan_storage: With the index, also walk the type directories for
+                expired files it does not know (stored before it existed, or
+                whose index write failed)
+        
+        Yields:
+            (file_id, path) tuples; file_id is None for files found by walking
+        """
+        if self.index:
+            after = None
+            voices_prefix = f"{FileType.AUDIO.value}/questions/"
+            while True:
+                entries = self.index.created_before(cutoff, page_size, after=after, exclude_prefix=voices_prefix)
+                for entry in entries:
+                    yield entry.file_id, self.index.resolve(entry)
+                if len(entries) < page_size:
+                    break
+                after = (entries[-1].created_at, entries[-1].file_id)
+            if not scan_storage:
+                return
+        
+        cutoff_ts = cutoff.timestamp()
         for file_type in FileType:
             type_dir = self.upload_dir / file_type.value
-            if type_dir.exists():
-                for file_path in type_dir.glob("*"):
-                    if file_path.is_file():
-                        # Check if file is older than expiration time
-                        file_age = current_time - datetime.fromtimestamp(file_path.stat().st_ctime)
-                        if file_age > timedelta(hours=settings.FILE_EXPIRATION_HOURS):
-                            try:
-                                file_path.unlink()
-                                cleaned_count += 1
-                                logger.info(f"Cleaned up expired file: {file_path}")
-                            except Exception as e:
-                                logger.error(f"Error cleaning up file {file_path}: {e}")
-        
-        return cleaned_count
+            if not type_dir.exists():
+                continue
+            with os.scandir(type_dir) as entries:
+                for entry in entries:
+                    # Sidecars are removed with their file; stale hidden temp files are expired too
+                    if not entry.is_file(follow_symlinks=False) or entry.name.endswith(".metadata.json"):
+                        continue
+                    if entry.stat(follow_symlinks=False).st_ctime >= cutoff_ts:
+                        continue
+                    file_path = Path(entry.path)
+                    if self.index:
+                        # Indexed files were yielded (and deleted) from the index above
+                        file_id = self._file_id_from_path(file_path)
+                        if file_id and self.index.get(file_id):
+                            continue
+                    yield None, file_path
+    
+    def delete_expired_batch(self, expired: Iterator[Tuple[Optional[str], Path]], batch_size: int) -> Dict[str, int]:
+        """
+        Delete up to batch_size files from an iter_expired_files iterator.
+        
+        Each file's metadata sidecar and index entry are removed with it; index
+        entries are removed with one bulk delete and committed once per batch.
+        Files and index rows already removed (by a concurrent sweep or a
+        delete request) are skipped rather than failing the batch.
+        
+        Args:
+            expired: Iterator from iter_expired_files
+            batch_size: Maximum files to take from the iterator
+        
+        Returns:
+            Dict with processed, deleted, failed and bytes_freed counts
+        """
+        stats = {"processed": 0, "deleted": 0, "failed": 0, "bytes_freed": 0}
+        removed_ids = []
+        for file_id, file_path in itertools.islice(expired, batch_size):
+            stats["processed"] += 1
+            try:
+                try:
+                    size = file_path.stat().st_size
+                    file_path.unlink()
+                except FileNotFoundError:
+                    size = 0
+                self._get_metadata_path(file_path).unlink(missing_ok=True)
+            except OSError as e:
+                logger.error(f"Error cleaning up file {file_path}: {e}")
+                stats["failed"] += 1
+                continue
+            if file_id:
+                removed_ids.append(file_id)
+            stats["deleted"] += 1
+            stats["bytes_freed"] += size
+        
+        if self.index and removed_ids:
+            # On failure the files are gone but their rows stay; the next sweep removes them
+            self.index.remove_many(removed_ids)
+            self.index.commit()
+        return stats
     
     def get_storage_stats(self) -> Dict[str, Any]:
-        """Get storage statistics."""
+        """
+        Get storage statistics.
+        
+        Served from the file index's per-type counters when enabled; otherwise
+        storage is scanned.
+        """
+        if self.index:
+            stats = self.index.stats()
+            if stats is not None:
+                return stats
+        
         stats = {
             "total_files": 0,
             "total_size": 0,
@@ -541,6 +761,167 @@ class FileService:
             stats["newest_file"] = all_files[-1]["created_at"]
         
         return stats
+    
+    def rebuild_index(self, prune: bool = True, batch_size: int = 500) -> Dict[str, int]:
+        """
+        Rebuild the file index from the files in storage.
+        
+        Indexes every stored file with its size, MIME type and checksum. Flat
+        files take their file_id from the filename prefix and nested voice files
+        from their metadata sidecar; files without a recoverable file_id are
+        skipped.
+        
+        Args:
+            prune: Remove entries whose files are no longer in storage (leave
+                this off if several hosts with separate upload dirs share the database)
+            batch_size: Entries written per commit
+        
+        Returns:
+            Dict with indexed, skipped and removed counts
+        
+        Raises:
+            RuntimeError: If the index is disabled or cannot be written
+        """
+        if not self.index:
+            raise RuntimeError("File index is disabled (FILE_INDEX_ENABLED=false)")
+        
+        stats = {"indexed": 0, "skipped": 0, "removed": 0}
+        found = set()
+        for file_path in self._iter_stored_files():
+            file_id = self._file_id_from_path(file_path)
+            if not file_id:
+                logger.warning(f"File index rebuild: no file_id for {file_path}, skipping")
+                stats["skipped"] += 1
+                continue
+            if not self._index_existing_file(file_id, file_path, commit=False):
+                raise RuntimeError(f"File index rebuild failed at {file_path}")
+            found.add(file_id)
+            stats["indexed"] += 1
+            if stats["indexed"] % batch_size == 0 and not self.index.commit():
+                raise RuntimeError(f"File index rebuild failed to commit at {file_path}")
+        
+        if not self.index.commit():
+            raise RuntimeError("File index rebuild failed to commit")
+        if prune:
+            stats["removed"] = self.index.remove_many(self.index.file_ids() - found)
+        # Counters may have drifted if index writes failed or files changed outside the service
+        self.index.recount()
+        if not self.index.commit():
+            raise RuntimeError("File index rebuild failed to commit")
+        
+        logger.info(f"Rebuilt file index: {stats}")
+        return stats
+    
+    def _iter_stored_files(self):
+        """Yield every stored file (excluding metadata sidecars) in the type directories."""
+        for file_type in FileType:
+            type_dir = self.upload_dir / file_type.value
+            if not type_dir.exists():
+                continue
+            for file_path in type_dir.rglob("*"):
+                # Hidden files are in-progress writes
+                if file_path.is_file() and not file_path.name.startswith(".") \
+                        and not file_path.name.endswith(".metadata.json"):
+                    yield file_path
+    
+    def _file_id_from_path(self, file_path: Path) -> Optional[str]:
+        """Recover a stored file's ID from its metadata sidecar or flat filename."""
+        metadata = self._load_metadata(file_path)
+        if metadata and metadata.get("file_id"):
+            return str(metadata["file_id"])
+        if file_path.parent.parent == self.upload_dir:
+            # Flat structure: {file_id}_{filename} or {file_id}.bin
+            return file_path.name.split("_", 1)[0] if "_" in file_path.name else file_path.stem
+        return None
+
+
+class FileStreamWriter:
+    """Incrementally writes a file, hashing as it goes.
+    
+    Chunks go to a hidden temporary file next to the storage path, which is
+    atomically renamed into place on commit.
+    """
+    
+    def __init__(
+        self,
+        file_service: FileService,
+        file_path: Path,
+        file_id: str,
+        filename: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        file_type: Optional[FileType] = None,
+        max_size: Optional[int] = None
+    ):
+        self.file_service = file_service
+        self.file_path = file_path
+        self.file_id = file_id
+        self.filename = filename
+        self.metadata = metadata
+        self.file_type = file_type
+        self.max_size = max_size
+        self.file_size = 0
+        self.closed = False
+        self._hasher = hashlib.sha256()
+        self._temp_path = file_path.with_name(f".{file_path.name}.{uuid.uuid4().hex}.part")
+        self._file = open(self._temp_path, "wb")
+    
+    def write(self, chunk: bytes) -> None:
+        """
+        Append a chunk to the file.
+        
+        Raises:
+            HTTPException: 413 if the chunk takes the file over max_size; the
+                partial file is removed
+        """
+        if self.max_size is not None and self.file_size + len(chunk) > self.max_size:
+            self.abort()
+            raise HTTPException(
+                status_code=413,
+                detail=f"File size exceeds limit of {self.max_size} bytes"
+            )
+        self._file.write(chunk)
+        self._hasher.update(chunk)
+        self.file_size += len(chunk)
+    
+    def commit(self) -> Dict[str, Any]:
+        """Move the file into place, save its metadata and return file information."""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        os.replace(self._temp_path, self.file_path)
+        self.closed = True
+        
+        if self.metadata:
+            self.file_service._save_metadata(self.file_path, {**self.metadata, "file_id": self.file_id})
+        
+        mime_type = self.file_service._get_mime_type_from_filename(self.filename)
+        file_hash = self._hasher.hexdigest()
+        if self.file_type:
+            self.file_service._index_file(
+                self.file_id, self.file_type, self.file_path, self.filename, self.file_size, mime_type, file_hash
+            )
+        
+        logger.info(f"Saved streamed file: {self.file_id} at {self.file_path}")
+        
+        return {
+            "file_id": self.file_id,
+            "filename": self.filename,
+            "mime_type": mime_type,
+            "file_size": self.file_size,
+            "file_hash": file_hash,
+            "file_path": str(self.file_path),
+            "status": FileStatus.COMPLETED,
+            "created_at": datetime.now(),
+            "metadata": self.metadata or {}
+        }
+    
+    def abort(self) -> None:
+        """Close and remove the partially written file."""
+        if self.closed:
+            return
+        self._file.close()
+        self.closed = True
+        self._temp_path.unlink(missing_ok=True)
 
 
 class FileOperationFactory:
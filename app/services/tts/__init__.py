@@ -22,6 +22,14 @@ from app.services.tts.service import (
     TTSService,
     get_tts_service
 )
+from app.services.tts.chunking import (
+    chunk_text,
+    concatenate_audio
+)
+from app.services.tts.prewarm import (
+    TTSPrewarmService,
+    run_tts_prewarm
+)
 from app.services.tts.coqui import CoquiTTSProvider
 from app.services.tts.elevenlabs import ElevenLabsTTSProvider
 from app.services.tts.playht import PlayHTTTSProvider
@@ -41,6 +49,14 @@ __all__ = [
     "TTSService",
     "get_tts_service",
     
+    # Chunking
+    "chunk_text",
+    "concatenate_audio",
+    
+    # Pre-warming
+    "TTSPrewarmService",
+    "run_tts_prewarm",
+    
     # Provider implementations
     "CoquiTTSProvider",
     "ElevenLabsTTSProvider",
@@ -5,9 +5,17 @@ This module defines the abstract base class that all TTS providers must implemen
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from typing import AsyncIterator, Optional, Dict, Any
+import httpx
 from app.utils.logger import get_logger
 
+# HTTP/2 requires the optional h2 package
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 logger = get_logger(__name__)
 
 
@@ -33,17 +41,92 @@ class BaseTTSProvider(ABC):
     All TTS providers must implement the synthesize method to convert text to speech audio.
     """
     
+    # Whether the provider's API can be reached over HTTP/2
+    supports_http2: bool = False
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the TTS provider.
         
         Args:
             config: Configuration dictionary containing provider-specific settings
+                (including optional http_max_connections, http_max_keepalive_connections,
+                http_keepalive_expiry and http2 client settings)
         """
         self.config = config
         self.provider_name = self.__class__.__name__
+        self._client: Optional[httpx.AsyncClient] = None
+        self.connection_stats = {
+            "requests": 0,
+            "new_connections": 0,  # TCP connections opened
+            "tls_handshakes": 0,
+            "clients_created": 0
+        }
         logger.debug(f"Initialized {self.provider_name} TTS provider")
     
+    def get_client(self) -> httpx.AsyncClient:
+        """
+        Get the provider's long-lived HTTP client, creating it on first use.
+        
+        Connections are kept alive and reused across synthesize and health_check
+        calls, so requests skip the TCP and TLS handshakes.
+        
+        Returns:
+            httpx.AsyncClient: Pooled HTTP client
+        """
+        if self._client is None or self._client.is_closed:
+            http2 = self.supports_http2 and HTTP2_AVAILABLE and self.config.get("http2", True)
+            self._client = httpx.AsyncClient(
+                timeout=self.config.get("timeout", 30),
+                limits=httpx.Limits(
+                    max_connections=self.config.get("http_max_connections", 20),
+                    max_keepalive_connections=self.config.get("http_max_keepalive_connections", 10),
+                    keepalive_expiry=self.config.get("http_keepalive_expiry", 30.0)
+                ),
+                http2=http2,
+                event_hooks={"request": [self._on_request]}
+            )
+            self.connection_stats["clients_created"] += 1
+            logger.debug(f"Created pooled HTTP client for {self.provider_name} (http2={http2})")
+        return self._client
+    
+    async def _on_request(self, request: httpx.Request):
+        """Count requests and trace connection setup to measure connection reuse."""
+        self.connection_stats["requests"] += 1
+        request.extensions["trace"] = self._trace
+    
+    async def _trace(self, event_name: str, info: Dict[str, Any]):
+        if event_name == "connection.connect_tcp.complete":
+            self.connection_stats["new_connections"] += 1
+        elif event_name == "connection.start_tls.complete":
+            self.connection_stats["tls_handshakes"] += 1
+    
+    async def start(self):
+        """Create the pooled HTTP client ahead of the first request."""
+        self.get_client()
+    
+    async def close(self):
+        """Close the pooled HTTP client and its connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    def get_connection_stats(self) -> Dict[str, Any]:
+        """
+        Get HTTP connection reuse statistics.
+        
+        Returns:
+            Dict with request and connection counts and the connection reuse rate
+        """
+        requests = self.connection_stats["requests"]
+        reused = max(0, requests - self.connection_stats["new_connections"])
+        return {
+            **self.connection_stats,
+            "reused_connections": reused,
+            "reuse_rate": round(reused / requests * 100, 2) if requests else 0.0,
+            "http2": bool(self._client and self.supports_http2 and HTTP2_AVAILABLE and self.config.get("http2", True))
+        }
+    
     @abstractmethod
     async def synthesize(
         self,
@@ -71,6 +154,33 @@ class BaseTTSProvider(ABC):
         """
         pass
     
+    async def synthesize_stream(
+        self,
+        text: str,
+        voice_id: Optional[str] = None,
+        format: str = "mp3",
+        **kwargs
+    ) -> AsyncIterator[bytes]:
+        """
+        Synthesize text to speech, yielding audio chunks as they become available.
+        
+        Providers with a streaming API override this; the default yields the
+        complete result of ``synthesize`` as a single chunk.
+        
+        Args:
+            text: Text to convert to speech
+            voice_id: Voice identifier (uses default if not provided)
+            format: Audio format (mp3, wav, ogg, m4a, aac)
+            **kwargs: Additional provider-specific parameters
+            
+        Yields:
+            Audio chunks in the specified format
+            
+        Raises:
+            TTSProviderError: If synthesis fails
+        """
+        yield await self.synthesize(text, voice_id, format, **kwargs)
+    
     @abstractmethod
     async def health_check(self) -> bool:
         """
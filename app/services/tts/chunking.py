@@ -0,0 +1,183 @@
+"""
+TTS Text Chunking
+
+Splits long texts on sentence boundaries so they can be synthesized as
+independent, concurrently processed and individually cached chunks, and joins
+the resulting audio back into a single file of the requested format.
+"""
+
+import re
+from typing import List, Tuple
+
+# Formats whose chunk audio can be joined without re-encoding
+CONCATENABLE_FORMATS = ("mp3", "wav", "ogg", "aac")
+
+# Sentence ends (., ! or ?, optionally closing a quote/bracket, then whitespace) and line breaks
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+|(?<=[.!?][\"')\]])\s+|\s*\n\s*")
+# Clause boundaries used to split sentences that exceed the chunk limit
+_CLAUSE_BOUNDARY = re.compile(r"(?<=[,;:])\s+")
+
+
+def split_sentences(text: str) -> List[str]:
+    """
+    Split text into sentences.
+
+    Args:
+        text: Text to split
+
+    Returns:
+        Non-empty sentences with surrounding whitespace removed
+    """
+    return [sentence.strip() for sentence in _SENTENCE_BOUNDARY.split(text) if sentence and sentence.strip()]
+
+
+def _split_long(text: str, max_chars: int) -> List[str]:
+    """Split text longer than max_chars at clause boundaries, then at spaces."""
+    parts: List[str] = []
+    current = ""
+    for piece in _CLAUSE_BOUNDARY.split(text):
+        for word in (piece.split() if len(piece) > max_chars else [piece]):
+            # Words longer than the limit are cut as a last resort
+            while len(word) > max_chars:
+                if current:
+                    parts.append(current)
+                    current = ""
+                parts.append(word[:max_chars])
+                word = word[max_chars:]
+            candidate = f"{current} {word}" if current else word
+            if len(candidate) <= max_chars:
+                current = candidate
+            else:
+                parts.append(current)
+                current = word
+    if current:
+        parts.append(current)
+    return parts
+
+
+def chunk_text(text: str, max_chars: int) -> List[str]:
+    """
+    Split text into chunks of one sentence each, none longer than max_chars.
+
+    One sentence per chunk keeps chunk texts (and so their cache keys) stable
+    across prompts that share sentences. Sentences longer than max_chars are
+    split at clause boundaries or, failing that, between words.
+
+    Args:
+        text: Text to split
+        max_chars: Maximum chunk length in characters
+
+    Returns:
+        List of chunks in reading order
+    """
+    chunks: List[str] = []
+    for sentence in split_sentences(text):
+        if len(sentence) <= max_chars:
+            chunks.append(sentence)
+        else:
+            chunks.extend(_split_long(sentence, max_chars))
+    return chunks
+
+
+def _id3v2_length(data: bytes) -> int:
+    """Length of a leading ID3v2 tag, or 0 if there is none."""
+    if len(data) < 10 or data[:3] != b"ID3":
+        return 0
+    size = (data[6] & 0x7F) << 21 | (data[7] & 0x7F) << 14 | (data[8] & 0x7F) << 7 | (data[9] & 0x7F)
+    footer = 10 if data[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def strip_mp3_tags(data: bytes, keep_leading: bool = False) -> bytes:
+    """
+    Remove ID3 tags from MP3 audio so frames from several files can be joined.
+
+    Args:
+        data: MP3 audio
+        keep_leading: Keep the leading ID3v2 tag (for the first chunk)
+
+    Returns:
+        MP3 audio without the trailing ID3v1 tag (and leading ID3v2 tag unless kept)
+    """
+    if not keep_leading:
+        data = data[_id3v2_length(data):]
+    if len(data) >= 128 and data[-128:-125] == b"TAG":
+        data = data[:-128]
+    return data
+
+
+def _parse_wav(data: bytes) -> Tuple[bytes, bytes]:
+    """
+    Extract the fmt chunk body and PCM data from a WAV file.
+
+    Raises:
+        ValueError: If the data is not a RIFF/WAVE file with fmt and data chunks
+    """
+    if len(data) < 12 or data[:4] != b"RIFF" or data[8:12] != b"WAVE":
+        raise ValueError("Not a RIFF/WAVE file")
+    fmt = None
+    offset = 12
+    while offset + 8 <= len(data):
+        chunk_id = data[offset:offset + 4]
+        size = int.from_bytes(data[offset + 4:offset + 8], "little")
+        body_start = offset + 8
+        if chunk_id == b"fmt ":
+            fmt = data[body_start:body_start + size]
+        elif chunk_id == b"data":
+            if fmt is None:
+                raise ValueError("WAV data chunk before fmt chunk")
+            # Streamed WAVs may carry a placeholder size; take the rest of the file
+            return fmt, data[body_start:min(body_start + size, len(data))]
+        offset = body_start + size + (size & 1)
+    raise ValueError("WAV file has no fmt/data chunks")
+
+
+def concatenate_wav(parts: List[bytes]) -> bytes:
+    """
+    Join WAV files with identical sample formats into one WAV file.
+
+    Raises:
+        ValueError: If a part is not a WAV file or sample formats differ
+    """
+    parsed = [_parse_wav(part) for part in parts]
+    fmt = parsed[0][0]
+    if any(part_fmt != fmt for part_fmt, _ in parsed):
+        raise ValueError("Cannot join WAV audio with different sample formats")
+    pcm = b"".join(part_pcm for _, part_pcm in parsed)
+    padding = b"\x00" if len(pcm) & 1 else b""
+    riff_size = 4 + (8 + len(fmt)) + (8 + len(pcm) + len(padding))
+    return b"".join([
+        b"RIFF", riff_size.to_bytes(4, "little"), b"WAVE",
+        b"fmt ", len(fmt).to_bytes(4, "little"), fmt,
+        b"data", len(pcm).to_bytes(4, "little"), pcm, padding
+    ])
+
+
+def concatenate_audio(parts: List[bytes], audio_format: str) -> bytes:
+    """
+    Join chunk audio into one file of the given format.
+
+    MP3 frames and AAC (ADTS) frames are self-delimiting and Ogg allows chained
+    streams, so those are joined as-is (minus inner MP3 tags); WAV files are
+    merged under a single header.
+
+    Args:
+        parts: Audio of each chunk in reading order
+        audio_format: Audio format of every part
+
+    Returns:
+        bytes: Joined audio
+
+    Raises:
+        ValueError: If the format cannot be joined
+    """
+    audio_format = audio_format.lower()
+    if audio_format not in CONCATENABLE_FORMATS:
+        raise ValueError(f"Cannot join audio in format '{audio_format}'")
+    if len(parts) == 1:
+        return parts[0]
+    if audio_format == "wav":
+        return concatenate_wav(parts)
+    if audio_format == "mp3":
+        return b"".join(strip_mp3_tags(part, keep_leading=index == 0) for index, part in enumerate(parts))
+    return b"".join(parts)
@@ -91,30 +91,30 @@ class CoquiTTSProvider(BaseTTSProvider):
             }
             
             # Make request to Coqui TTS service
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/synthesize",
-                    json=payload
+            client = self.get_client()
+            response = await client.post(
+                f"{self.base_url}/synthesize",
+                json=payload
+            )
+            
+            if response.status_code == 200:
+                audio_data = response.content
+                logger.info(f"Successfully synthesized {len(audio_data)} bytes of audio")
+                return audio_data
+            elif response.status_code == 408 or response.status_code == 504:
+                raise TTSProviderTimeoutError(
+                    f"Coqui TTS request timed out: {response.status_code}"
                 )
+            else:
+                error_msg = f"Coqui TTS synthesis failed: {response.status_code}"
+                try:
+                    error_detail = response.json().get("detail", "")
+                    if error_detail:
+                        error_msg += f" - {error_detail}"
+                except:
+                    error_msg += f" - {response.text[:200]}"
+                raise TTSProviderError(error_msg)
                 
-                if response.status_code == 200:
-                    audio_data = response.content
-                    logger.info(f"Successfully synthesized {len(audio_data)} bytes of audio")
-                    return audio_data
-                elif response.status_code == 408 or response.status_code == 504:
-                    raise TTSProviderTimeoutError(
-                        f"Coqui TTS request timed out: {response.status_code}"
-                    )
-                else:
-                    error_msg = f"Coqui TTS synthesis failed: {response.status_code}"
-                    try:
-                        error_detail = response.json().get("detail", "")
-                        if error_detail:
-                            error_msg += f" - {error_detail}"
-                    except:
-                        error_msg += f" - {response.text[:200]}"
-                    raise TTSProviderError(error_msg)
-                    
         except httpx.TimeoutException:
             raise TTSProviderTimeoutError("Coqui TTS request timed out")
         except httpx.RequestError as e:
@@ -131,14 +131,14 @@ class CoquiTTSProvider(BaseTTSProvider):
             bool: True if service is healthy, False otherwise
         """
         try:
-            async with httpx.AsyncClient(timeout=5) as client:
-                response = await client.get(f"{self.base_url}/health")
-                if response.status_code == 200:
-                    logger.debug("Coqui TTS service is healthy")
-                    return True
-                else:
-                    logger.warning(f"Coqui TTS health check failed: {response.status_code}")
-                    return False
+            client = self.get_client()
+            response = await client.get(f"{self.base_url}/health", timeout=5)
+            if response.status_code == 200:
+                logger.debug("Coqui TTS service is healthy")
+                return True
+            else:
+                logger.warning(f"Coqui TTS health check failed: {response.status_code}")
+                return False
         except Exception as e:
             logger.warning(f"Coqui TTS health check error: {e}")
             return False
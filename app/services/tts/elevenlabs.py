@@ -6,7 +6,7 @@ Requires API key for authentication.
 """
 
 import asyncio
-from typing import Optional, Dict, Any
+from typing import AsyncIterator, Optional, Dict, Any, Tuple
 import httpx
 from app.services.tts.base import (
     BaseTTSProvider,
@@ -26,6 +26,8 @@ class ElevenLabsTTSProvider(BaseTTSProvider):
     This provider uses the ElevenLabs API for cloud-based text-to-speech synthesis.
     """
     
+    supports_http2 = True
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize ElevenLabs TTS provider.
@@ -93,64 +95,69 @@ class ElevenLabsTTSProvider(BaseTTSProvider):
         try:
             logger.debug(f"Synthesizing text with ElevenLabs (voice: {voice}, format: {format})")
             
-            # Prepare request payload
-            payload = {
-                "text": text,
-                "model_id": kwargs.get("model_id", self.model_id),
-                "voice_settings": {
-                    "stability": kwargs.get("stability", 0.5),
-                    "similarity_boost": kwargs.get("similarity_boost", 0.75),
-                    "style": kwargs.get("style", 0.0),
-                    "use_speaker_boost": kwargs.get("use_speaker_boost", True)
-                }
-            }
+            url, payload, headers, params = self._build_request(text, voice, format, **kwargs)
+            client = self.get_client()
+            response = await client.post(url, json=payload, headers=headers, params=params)
+            self._raise_for_status(response)
+            audio_data = response.content
+            logger.info(f"Successfully synthesized {len(audio_data)} bytes of audio")
+            return audio_data
+                
+        except httpx.TimeoutException:
+            raise TTSProviderTimeoutError("ElevenLabs request timed out")
+        except TTSProviderRateLimitError:
+            raise
+        except httpx.RequestError as e:
+            raise TTSProviderError(f"ElevenLabs request failed: {str(e)}")
+        except Exception as e:
+            logger.error(f"Unexpected error in ElevenLabs synthesis: {e}")
+            raise TTSProviderError(f"ElevenLabs synthesis failed: {str(e)}")
+    
+    async def synthesize_stream(
+        self,
+        text: str,
+        voice_id: Optional[str] = None,
+        format: str = "mp3",
+        **kwargs
+    ) -> AsyncIterator[bytes]:
+        """
+        Synthesize text using the ElevenLabs streaming endpoint, yielding audio as it arrives.
+        
+        Args:
+            text: Text to convert to speech
+            voice_id: Voice identifier (uses default if not provided)
+            format: Audio format (mp3, wav, m4a, aac)
+            **kwargs: Additional parameters (see synthesize)
             
-            # Map format to ElevenLabs output format
-            output_format_map = {
-                "mp3": "mp3_44100_128",
-                "wav": "pcm_44100",
-                "m4a": "mp3_44100_192",
-                "aac": "mp3_44100_128"
-            }
-            output_format = output_format_map.get(format.lower(), "mp3_44100_128")
+        Yields:
+            Audio chunks
             
-            # Make request to ElevenLabs API
-            headers = {
-                "Accept": "audio/mpeg",
-                "xi-api-key": self.api_key,
-                "Content-Type": "application/json"
-            }
+        Raises:
+            TTSProviderError: If synthesis fails
+            TTSProviderTimeoutError: If request times out
+            TTSProviderRateLimitError: If rate limit is exceeded
+        """
+        if not self.validate_text(text):
+            raise TTSProviderError("Invalid text input")
+        
+        if not self.validate_format(format):
+            raise TTSProviderError(f"Unsupported audio format: {format}")
+        
+        voice = voice_id or self.default_voice_id
+        
+        try:
+            logger.debug(f"Streaming synthesis with ElevenLabs (voice: {voice}, format: {format})")
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/text-to-speech/{voice}",
-                    json=payload,
-                    headers=headers,
-                    params={"output_format": output_format}
-                )
+            url, payload, headers, params = self._build_request(text, voice, format, **kwargs)
+            client = self.get_client()
+            async with client.stream("POST", f"{url}/stream", json=payload, headers=headers, params=params) as response:
+                if response.status_code != 200:
+                    await response.aread()
+                    self._raise_for_status(response)
+                async for chunk in response.aiter_bytes():
+                    if chunk:
+                        yield chunk
                 
-                if response.status_code == 200:
-                    audio_data = response.content
-                    logger.info(f"Successfully synthesized {len(audio_data)} bytes of audio")
-                    return audio_data
-                elif response.status_code == 401:
-                    raise TTSProviderError("ElevenLabs API key is invalid")
-                elif response.status_code == 429:
-                    raise TTSProviderRateLimitError("ElevenLabs rate limit exceeded")
-                elif response.status_code == 408 or response.status_code == 504:
-                    raise TTSProviderTimeoutError(
-                        f"ElevenLabs request timed out: {response.status_code}"
-                    )
-                else:
-                    error_msg = f"ElevenLabs synthesis failed: {response.status_code}"
-                    try:
-                        error_detail = response.json().get("detail", {}).get("message", "")
-                        if error_detail:
-                            error_msg += f" - {error_detail}"
-                    except:
-                        error_msg += f" - {response.text[:200]}"
-                    raise TTSProviderError(error_msg)
-                    
         except httpx.TimeoutException:
             raise TTSProviderTimeoutError("ElevenLabs request timed out")
         except TTSProviderRateLimitError:
@@ -158,9 +165,62 @@ class ElevenLabsTTSProvider(BaseTTSProvider):
         except httpx.RequestError as e:
             raise TTSProviderError(f"ElevenLabs request failed: {str(e)}")
         except Exception as e:
-            logger.error(f"Unexpected error in ElevenLabs synthesis: {e}")
+            logger.error(f"Unexpected error in ElevenLabs streaming synthesis: {e}")
             raise TTSProviderError(f"ElevenLabs synthesis failed: {str(e)}")
     
+    def _build_request(self, text: str, voice: str, format: str, **kwargs) -> Tuple[str, Dict[str, Any], Dict[str, str], Dict[str, str]]:
+        """Build the text-to-speech URL, payload, headers and query parameters."""
+        # Prepare request payload
+        payload = {
+            "text": text,
+            "model_id": kwargs.get("model_id", self.model_id),
+            "voice_settings": {
+                "stability": kwargs.get("stability", 0.5),
+                "similarity_boost": kwargs.get("similarity_boost", 0.75),
+                "style": kwargs.get("style", 0.0),
+                "use_speaker_boost": kwargs.get("use_speaker_boost", True)
+            }
+        }
+        
+        # Map format to ElevenLabs output format
+        output_format_map = {
+            "mp3": "mp3_44100_128",
+            "wav": "pcm_44100",
+            "m4a": "mp3_44100_192",
+            "aac": "mp3_44100_128"
+        }
+        output_format = output_format_map.get(format.lower(), "mp3_44100_128")
+        
+        headers = {
+            "Accept": "audio/mpeg",
+            "xi-api-key": self.api_key,
+            "Content-Type": "application/json"
+        }
+        
+        return f"{self.base_url}/text-to-speech/{voice}", payload, headers, {"output_format": output_format}
+    
+    def _raise_for_status(self, response: httpx.Response):
+        """Map an unsuccessful ElevenLabs response to a provider error."""
+        if response.status_code == 200:
+            return
+        elif response.status_code == 401:
+            raise TTSProviderError("ElevenLabs API key is invalid")
+        elif response.status_code == 429:
+            raise TTSProviderRateLimitError("ElevenLabs rate limit exceeded")
+        elif response.status_code == 408 or response.status_code == 504:
+            raise TTSProviderTimeoutError(
+                f"ElevenLabs request timed out: {response.status_code}"
+            )
+        else:
+            error_msg = f"ElevenLabs synthesis failed: {response.status_code}"
+            try:
+                error_detail = response.json().get("detail", {}).get("message", "")
+                if error_detail:
+                    error_msg += f" - {error_detail}"
+            except:
+                error_msg += f" - {response.text[:200]}"
+            raise TTSProviderError(error_msg)
+    
     async def health_check(self) -> bool:
         """
         Check if ElevenLabs API is accessible.
@@ -172,18 +232,19 @@ class ElevenLabsTTSProvider(BaseTTSProvider):
             headers = {
                 "xi-api-key": self.api_key
             }
-            async with httpx.AsyncClient(timeout=5) as client:
-                # Check user info endpoint as health check
-                response = await client.get(
-                    f"{self.base_url}/user",
-                    headers=headers
-                )
-                if response.status_code == 200:
-                    logger.debug("ElevenLabs API is accessible")
-                    return True
-                else:
-                    logger.warning(f"ElevenLabs health check failed: {response.status_code}")
-                    return False
+            client = self.get_client()
+            # Check user info endpoint as health check
+            response = await client.get(
+                f"{self.base_url}/user",
+                headers=headers,
+                timeout=5
+            )
+            if response.status_code == 200:
+                logger.debug("ElevenLabs API is accessible")
+                return True
+            else:
+                logger.warning(f"ElevenLabs health check failed: {response.status_code}")
+                return False
         except Exception as e:
             logger.warning(f"ElevenLabs health check error: {e}")
             return False
@@ -85,6 +85,11 @@ class TTSProviderFactory:
             "voice_id": settings.TTS_DEFAULT_VOICE_ID,
             "voice_version": settings.TTS_VOICE_VERSION,
             "max_text_length": 5000,  # Default max text length
+            # Pooled HTTP client (see BaseTTSProvider.get_client)
+            "http_max_connections": settings.TTS_HTTP_MAX_CONNECTIONS,
+            "http_max_keepalive_connections": settings.TTS_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            "http_keepalive_expiry": settings.TTS_HTTP_KEEPALIVE_EXPIRY,
+            "http2": settings.TTS_HTTP2_ENABLED,
         }
         
         if provider_name == "coqui":
@@ -6,7 +6,7 @@ Requires API key and User ID for authentication.
 """
 
 import asyncio
-from typing import Optional, Dict, Any
+from typing import AsyncIterator, Optional, Dict, Any, Tuple
 import httpx
 from app.services.tts.base import (
     BaseTTSProvider,
@@ -26,6 +26,8 @@ class PlayHTTTSProvider(BaseTTSProvider):
     This provider uses the PlayHT API for cloud-based text-to-speech synthesis.
     """
     
+    supports_http2 = True
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize PlayHT TTS provider.
@@ -95,52 +97,73 @@ class PlayHTTTSProvider(BaseTTSProvider):
         try:
             logger.debug(f"Synthesizing text with PlayHT (voice: {voice}, format: {format})")
             
-            # Prepare request payload
-            payload = {
-                "text": text,
-                "voice": voice,
-                "output_format": format,
-                "sample_rate": kwargs.get("sample_rate", 24000),
-                "speed": kwargs.get("speed", 1.0)
-            }
+            payload, headers = self._build_request(text, voice, format, **kwargs)
+            client = self.get_client()
+            response = await client.post(
+                f"{self.base_url}/tts",
+                json=payload,
+                headers=headers
+            )
+            self._raise_for_status(response)
+            audio_data = response.content
+            logger.info(f"Successfully synthesized {len(audio_data)} bytes of audio")
+            return audio_data
+                
+        except httpx.TimeoutException:
+            raise TTSProviderTimeoutError("PlayHT request timed out")
+        except TTSProviderRateLimitError:
+            raise
+        except httpx.RequestError as e:
+            raise TTSProviderError(f"PlayHT request failed: {str(e)}")
+        except Exception as e:
+            logger.error(f"Unexpected error in PlayHT synthesis: {e}")
+            raise TTSProviderError(f"PlayHT synthesis failed: {str(e)}")
+    
+    async def synthesize_stream(
+        self,
+        text: str,
+        voice_id: Optional[str] = None,
+        format: str = "mp3",
+        **kwargs
+    ) -> AsyncIterator[bytes]:
+        """
+        Synthesize text using the PlayHT streaming endpoint, yielding audio as it arrives.
+        
+        Args:
+            text: Text to convert to speech
+            voice_id: Voice identifier (uses default if not provided)
+            format: Audio format (mp3, wav, ogg, m4a, aac)
+            **kwargs: Additional parameters (see synthesize)
             
-            # Make request to PlayHT API
-            headers = {
-                "AUTHORIZATION": f"Bearer {self.api_key}",
-                "X-USER-ID": self.user_id,
-                "Content-Type": "application/json",
-                "Accept": "audio/mpeg"
-            }
+        Yields:
+            Audio chunks
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/tts",
-                    json=payload,
-                    headers=headers
-                )
+        Raises:
+            TTSProviderError: If synthesis fails
+            TTSProviderTimeoutError: If request times out
+            TTSProviderRateLimitError: If rate limit is exceeded
+        """
+        if not self.validate_text(text):
+            raise TTSProviderError("Invalid text input")
+        
+        if not self.validate_format(format):
+            raise TTSProviderError(f"Unsupported audio format: {format}")
+        
+        voice = voice_id or self.default_voice_id
+        
+        try:
+            logger.debug(f"Streaming synthesis with PlayHT (voice: {voice}, format: {format})")
+            
+            payload, headers = self._build_request(text, voice, format, **kwargs)
+            client = self.get_client()
+            async with client.stream("POST", f"{self.base_url}/tts/stream", json=payload, headers=headers) as response:
+                if response.status_code != 200:
+                    await response.aread()
+                    self._raise_for_status(response)
+                async for chunk in response.aiter_bytes():
+                    if chunk:
+                        yield chunk
                 
-                if response.status_code == 200:
-                    audio_data = response.content
-                    logger.info(f"Successfully synthesized {len(audio_data)} bytes of audio")
-                    return audio_data
-                elif response.status_code == 401:
-                    raise TTSProviderError("PlayHT API key or User ID is invalid")
-                elif response.status_code == 429:
-                    raise TTSProviderRateLimitError("PlayHT rate limit exceeded")
-                elif response.status_code == 408 or response.status_code == 504:
-                    raise TTSProviderTimeoutError(
-                        f"PlayHT request timed out: {response.status_code}"
-                    )
-                else:
-                    error_msg = f"PlayHT synthesis failed: {response.status_code}"
-                    try:
-                        error_detail = response.json().get("error_message", "")
-                        if error_detail:
-                            error_msg += f" - {error_detail}"
-                    except:
-                        error_msg += f" - {response.text[:200]}"
-                    raise TTSProviderError(error_msg)
-                    
         except httpx.TimeoutException:
             raise TTSProviderTimeoutError("PlayHT request timed out")
         except TTSProviderRateLimitError:
@@ -148,9 +171,50 @@ class PlayHTTTSProvider(BaseTTSProvider):
         except httpx.RequestError as e:
             raise TTSProviderError(f"PlayHT request failed: {str(e)}")
         except Exception as e:
-            logger.error(f"Unexpected error in PlayHT synthesis: {e}")
+            logger.error(f"Unexpected error in PlayHT streaming synthesis: {e}")
             raise TTSProviderError(f"PlayHT synthesis failed: {str(e)}")
     
+    def _build_request(self, text: str, voice: str, format: str, **kwargs) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """Build the text-to-speech payload and headers."""
+        # Prepare request payload
+        payload = {
+            "text": text,
+            "voice": voice,
+            "output_format": format,
+            "sample_rate": kwargs.get("sample_rate", 24000),
+            "speed": kwargs.get("speed", 1.0)
+        }
+        
+        headers = {
+            "AUTHORIZATION": f"Bearer {self.api_key}",
+            "X-USER-ID": self.user_id,
+            "Content-Type": "application/json",
+            "Accept": "audio/mpeg"
+        }
+        return payload, headers
+    
+    def _raise_for_status(self, response: httpx.Response):
+        """Map an unsuccessful PlayHT response to a provider error."""
+        if response.status_code == 200:
+            return
+        elif response.status_code == 401:
+            raise TTSProviderError("PlayHT API key or User ID is invalid")
+        elif response.status_code == 429:
+            raise TTSProviderRateLimitError("PlayHT rate limit exceeded")
+        elif response.status_code == 408 or response.status_code == 504:
+            raise TTSProviderTimeoutError(
+                f"PlayHT request timed out: {response.status_code}"
+            )
+        else:
+            error_msg = f"PlayHT synthesis failed: {response.status_code}"
+            try:
+                error_detail = response.json().get("error_message", "")
+                if error_detail:
+                    error_msg += f" - {error_detail}"
+            except:
+                error_msg += f" - {response.text[:200]}"
+            raise TTSProviderError(error_msg)
+    
     async def health_check(self) -> bool:
         """
         Check if PlayHT API is accessible.
@@ -163,18 +227,19 @@ class PlayHTTTSProvider(BaseTTSProvider):
                 "AUTHORIZATION": f"Bearer {self.api_key}",
                 "X-USER-ID": self.user_id
             }
-            async with httpx.AsyncClient(timeout=5) as client:
-                # Check voices endpoint as health check
-                response = await client.get(
-                    f"{self.base_url}/voices",
-                    headers=headers
-                )
-                if response.status_code == 200:
-                    logger.debug("PlayHT API is accessible")
-                    return True
-                else:
-                    logger.warning(f"PlayHT health check failed: {response.status_code}")
-                    return False
+            client = self.get_client()
+            # Check voices endpoint as health check
+            response = await client.get(
+                f"{self.base_url}/voices",
+                headers=headers,
+                timeout=5
+            )
+            if response.status_code == 200:
+                logger.debug("PlayHT API is accessible")
+                return True
+            else:
+                logger.warning(f"PlayHT health check failed: {response.status_code}")
+                return False
         except Exception as e:
             logger.warning(f"PlayHT health check error: {e}")
             return False
@@ -0,0 +1,268 @@
+"""
+TTS Pre-warming
+
+Synthesizes the most used question-bank questions ahead of time so that
+voice-enabled sessions start with voice cache hits instead of paying the full
+synthesis latency on first view.
+"""
+
+import asyncio
+import os
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+from sqlalchemy.orm import Session
+from app.config import get_settings
+from app.database.models import Question, Scenario
+from app.services.tts.base import TTSProviderRateLimitError
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+GROUP_BY_OPTIONS = ("role", "category", "scenario")
+
+# Claimed by the worker that runs the startup pre-warm pass
+STARTUP_LOCK_KEY = "tts_prewarm:startup_lock"
+
+
+class TTSPrewarmService:
+    """
+    Pre-warms the voice cache and file storage for popular questions.
+
+    Synthesis goes through ``TTSService.synthesize`` one question at a time,
+    paced to TTS_PREWARM_RATE requests per second. When a provider reports a
+    rate limit the pace is halved and the question retried; it recovers
+    gradually after successful calls.
+    """
+
+    def __init__(self, db: Session, tts_service=None, file_service=None, rate: Optional[float] = None):
+        """
+        Initialize the pre-warm service.
+
+        Args:
+            db: Database session for reading questions and saving file records
+            tts_service: Optional TTSService instance (uses global if not provided)
+            file_service: Optional FileService instance (created from db if not provided)
+            rate: Synthesis requests per second (defaults to TTS_PREWARM_RATE)
+        """
+        from app.services.file_service import FileService
+        from app.services.tts.service import get_tts_service
+
+        self.db = db
+        self.settings = get_settings()
+        self.tts_service = tts_service or get_tts_service()
+        self.file_service = file_service or FileService(db)
+        rate = self.settings.TTS_PREWARM_RATE if rate is None else rate
+        self.base_interval = 1.0 / rate if rate > 0 else 0.0
+        self.interval = self.base_interval
+        self._last_request = 0.0
+
+    def select_questions(self, top_n: int, group_by: str = "role") -> List[Question]:
+        """
+        Select the top-N questions by usage_count for each role, category or scenario.
+
+        Args:
+            top_n: Questions per group
+            group_by: "role" (compatible_roles), "category" or "scenario" (active scenarios)
+
+        Returns:
+            List of distinct questions, most used first
+
+        Raises:
+            ValueError: If group_by is not supported
+        """
+        if group_by not in GROUP_BY_OPTIONS:
+            raise ValueError(f"Unsupported group_by '{group_by}', expected one of {GROUP_BY_OPTIONS}")
+
+        groups: Dict[str, List[Question]] = defaultdict(list)
+        if group_by == "scenario":
+            scenarios = self.db.query(Scenario).filter(Scenario.is_active.is_(True)).all()
+            for scenario in scenarios:
+                question_ids = scenario.question_ids or []
+                if not question_ids:
+                    continue
+                groups[scenario.id] = (
+                    self.db.query(Question)
+                    .filter(Question.id.in_(question_ids))
+                    .order_by(Question.usage_count.desc())
+                    .limit(top_n)
+                    .all()
+                )
+        else:
+            # Group in Python: compatible_roles is a JSON list, so scan the most used questions once
+            candidates = (
+                self.db.query(Question)
+                .filter(Question.usage_count > 0)
+                .order_by(Question.usage_count.desc())
+                .limit(self.settings.TTS_PREWARM_SCAN_LIMIT)
+                .all()
+            )
+            for question in candidates:
+                keys = (question.compatible_roles or []) if group_by == "role" else [question.category]
+                for key in keys:
+                    if len(groups[key]) < top_n:
+                        groups[key].append(question)
+
+        selected = {}
+        for questions in groups.values():
+            for question in questions:
+                selected[question.id] = question
+        return sorted(selected.values(), key=lambda q: q.usage_count or 0, reverse=True)
+
+    async def prewarm(
+        self,
+        top_n: Optional[int] = None,
+        group_by: Optional[str] = None,
+        voice_id: Optional[str] = None,
+        audio_format: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Synthesize and store voices for the selected questions.
+
+        Questions whose voice is already cached are skipped.
+
+        Args:
+            top_n: Questions per group (defaults to TTS_PREWARM_TOP_N)
+            group_by: Grouping (defaults to TTS_PREWARM_GROUP_BY)
+            voice_id: Voice identifier (defaults to TTS_DEFAULT_VOICE_ID)
+            audio_format: Audio format (defaults to TTS_DEFAULT_FORMAT)
+
+        Returns:
+            Dict with selected, synthesized, already_cached, failed and rate_limited counts
+        """
+        from app.utils.tts_helper import get_cached_voice_file_id, save_and_cache_voice
+
+        top_n = top_n or self.settings.TTS_PREWARM_TOP_N
+        group_by = group_by or self.settings.TTS_PREWARM_GROUP_BY
+        voice_id = voice_id or self.settings.TTS_DEFAULT_VOICE_ID
+        audio_format = audio_format or self.settings.TTS_DEFAULT_FORMAT
+        version = self.settings.TTS_VOICE_VERSION
+
+        questions = self.select_questions(top_n, group_by)
+        stats = {"selected": len(questions), "synthesized": 0, "already_cached": 0, "failed": 0, "rate_limited": 0}
+        logger.info(f"TTS pre-warm: {len(questions)} questions selected (top {top_n} per {group_by})")
+        start = time.monotonic()
+
+        for question in questions:
+            if await get_cached_voice_file_id(question.question_text, voice_id, audio_format, version):
+                stats["already_cached"] += 1
+                continue
+
+            audio_bytes = await self._synthesize_paced(question, voice_id, audio_format, stats)
+            if audio_bytes is None:
+                stats["failed"] += 1
+                continue
+
+            try:
+                await save_and_cache_voice(
+                    question_text=question.question_text,
+                    question_id=str(question.id),
+                    voice_id=voice_id,
+                    audio_format=audio_format,
+                    audio_bytes=audio_bytes,
+                    duration=0.0,
+                    metadata={"cached": False, "version": version},
+                    file_service=self.file_service,
+                    settings=self.settings
+                )
+                stats["synthesized"] += 1
+            except Exception as e:
+                logger.warning(f"TTS pre-warm: failed to save voice for question {question.id}: {e}")
+                stats["failed"] += 1
+
+        stats["duration_seconds"] = round(time.monotonic() - start, 2)
+        logger.info(f"TTS pre-warm completed: {stats}")
+        return stats
+
+    async def _synthesize_paced(
+        self,
+        question: Question,
+        voice_id: str,
+        audio_format: str,
+        stats: Dict[str, Any]
+    ) -> Optional[bytes]:
+        """Synthesize one question, pacing requests and backing off on rate limits."""
+        for attempt in range(self.settings.TTS_RETRY_ATTEMPTS + 1):
+            await self._wait_for_slot()
+            try:
+                audio_bytes = await self.tts_service.synthesize(
+                    text=question.question_text,
+                    voice_id=voice_id,
+                    audio_format=audio_format
+                )
+                # Recover towards the configured pace after successful calls
+                self.interval = max(self.base_interval, self.interval * 0.75)
+                return audio_bytes
+            except TTSProviderRateLimitError as e:
+                stats["rate_limited"] += 1
+                self.interval = min(max(self.interval * 2, 1.0), self.settings.TTS_PREWARM_MAX_INTERVAL)
+                logger.warning(
+                    f"TTS pre-warm rate limited (attempt {attempt + 1}): {e}. "
+                    f"Slowing to one request every {self.interval:.1f}s"
+                )
+            except Exception as e:
+                logger.warning(f"TTS pre-warm: synthesis failed for question {question.id}: {e}")
+                return None
+        return None
+
+    async def _wait_for_slot(self):
+        """Sleep until the current pacing interval has elapsed since the last request."""
+        delay = self._last_request + self.interval - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        self._last_request = time.monotonic()
+
+
+async def run_tts_prewarm(rate: Optional[float] = None, **kwargs) -> Optional[Dict[str, Any]]:
+    """
+    Run a pre-warm pass with its own database session.
+
+    Args:
+        rate: Synthesis requests per second (defaults to TTS_PREWARM_RATE)
+        **kwargs: Passed to TTSPrewarmService.prewarm
+
+    Returns:
+        Pre-warm statistics, or None if the run failed
+    """
+    from app.services.database_service import database_service
+
+    db = database_service.get_sync_session()
+    try:
+        return await TTSPrewarmService(db, rate=rate).prewarm(**kwargs)
+    except Exception as e:
+        logger.error(f"TTS pre-warm failed: {e}")
+        return None
+    finally:
+        db.close()
+
+
+async def run_startup_tts_prewarm() -> Optional[Dict[str, Any]]:
+    """
+    Run the startup pre-warm pass in one worker only.
+
+    Every worker process runs the app lifespan, so the pass is claimed with a
+    Redis lock (``SET NX``) that is kept for TTS_PREWARM_STARTUP_LOCK_TTL
+    seconds: the other workers, and workers restarted within that window,
+    skip it. Without the Redis cache backend there is nothing to coordinate
+    through and each worker runs the pass.
+
+    Returns:
+        Pre-warm statistics, or None if the run failed or another worker runs it
+    """
+    from app.utils.cache import cache_manager
+
+    settings = get_settings()
+    redis_client = cache_manager.redis_client
+    if redis_client is not None:
+        try:
+            claimed = await redis_client.set(
+                STARTUP_LOCK_KEY, str(os.getpid()), nx=True,
+                ex=max(1, int(settings.TTS_PREWARM_STARTUP_LOCK_TTL))
+            )
+        except Exception as e:
+            logger.warning(f"TTS pre-warm: startup lock unavailable, skipping: {e}")
+            return None
+        if not claimed:
+            logger.info("TTS pre-warm: startup pass already claimed by another worker, skipping")
+            return None
+    return await run_tts_prewarm()
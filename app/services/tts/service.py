@@ -1,24 +1,30 @@
 """
 TTS Service
 
-High-level service wrapper that provides fallback logic, circuit breaker pattern,
-retry logic with exponential backoff, and caching for TTS providers.
+High-level service wrapper that provides fallback logic, latency-aware provider
+routing with optional hedging, circuit breaker pattern, retry logic with
+exponential backoff, sentence-level chunking of long texts, and caching for
+TTS providers.
 """
 
 import time
 import asyncio
 import hashlib
 import base64
-from typing import Optional, Dict, Any
+import random
+import weakref
+from typing import AsyncIterator, Optional, Dict, Any, List, Tuple
 from app.services.tts.base import (
     BaseTTSProvider,
     TTSProviderError,
     TTSProviderRateLimitError
 )
 from app.services.tts.factory import TTSProviderFactory
+from app.services.tts.chunking import CONCATENABLE_FORMATS, chunk_text, concatenate_audio, strip_mp3_tags
 from app.config import get_settings
 from app.utils.logger import get_logger
 from app.utils.cache import cache_manager
+from app.utils.hedging import HedgeBudget
 from app.services.voice_cache import get_voice_cache_service, VoiceCacheService
 
 logger = get_logger(__name__)
@@ -82,6 +88,144 @@ class CircuitBreaker:
             )
 
 
+class AdaptiveProviderRouter:
+    """
+    Orders TTS providers by observed latency and error rate.
+
+    Keeps an exponentially weighted moving average (EWMA) of synthesis latency
+    and error rate per provider. Providers are ranked by
+    ``latency + error_rate * error_penalty``; until every candidate has
+    ``min_samples`` observations the configured order (primary, fallback) is kept.
+
+    A share ``explore_ratio`` of calls is routed to a provider other than the
+    best one, so providers that are not normally called (the fallback, or a
+    demoted primary) keep getting fresh samples and can be promoted again.
+    """
+
+    def __init__(
+        self,
+        alpha: float = 0.2,
+        error_penalty: float = 5.0,
+        min_samples: int = 5,
+        enabled: bool = True,
+        explore_ratio: float = 0.0
+    ):
+        """
+        Initialize the router.
+
+        Args:
+            alpha: EWMA smoothing factor (weight of the newest sample, 0-1)
+            error_penalty: Seconds of latency an error rate of 1.0 is worth
+            min_samples: Observations per provider before reordering
+            enabled: If False, rank() always keeps the configured order
+            explore_ratio: Share of calls (0-1) sent to a provider other than the best one
+        """
+        self.alpha = alpha
+        self.error_penalty = error_penalty
+        self.min_samples = min_samples
+        self.enabled = enabled
+        self.explore_ratio = explore_ratio
+        self.providers: Dict[str, Dict[str, Any]] = {}
+        self.explored_requests = 0
+        self.hedged_requests = 0
+        self.hedge_wins = 0
+        self.hedge_budget_exhausted = 0
+
+    def record(self, provider_name: str, latency: float, success: bool):
+        """
+        Record the outcome of one synthesis call.
+
+        Args:
+            provider_name: Provider that handled the call
+            latency: Call duration in seconds
+            success: Whether the call returned audio
+        """
+        stats = self.providers.get(provider_name)
+        error = 0.0 if success else 1.0
+        if stats is None:
+            self.providers[provider_name] = {"latency": latency, "error_rate": error, "samples": 1}
+            return
+        stats["latency"] += self.alpha * (latency - stats["latency"])
+        stats["error_rate"] += self.alpha * (error - stats["error_rate"])
+        stats["samples"] += 1
+
+    def record_censored(self, provider_name: str, elapsed: float):
+        """
+        Record a call that was cancelled before it finished (e.g. it lost a hedge).
+
+        The call would have taken at least ``elapsed`` seconds, so the sample
+        can only raise the latency average; the error rate is unchanged.
+
+        Args:
+            provider_name: Provider that was handling the call
+            elapsed: Seconds the call had run when it was cancelled
+        """
+        stats = self.providers.get(provider_name)
+        if stats is None:
+            self.providers[provider_name] = {"latency": elapsed, "error_rate": 0.0, "samples": 1}
+            return
+        stats["latency"] += self.alpha * max(0.0, elapsed - stats["latency"])
+        stats["samples"] += 1
+
+    def score(self, provider_name: str) -> Optional[float]:
+        """
+        Get a provider's routing score (lower is better).
+
+        Returns:
+            float or None: Score, or None if the provider has too few samples
+        """
+        stats = self.providers.get(provider_name)
+        if not stats or stats["samples"] < self.min_samples:
+            return None
+        return stats["latency"] + stats["error_rate"] * self.error_penalty
+
+    def rank(self, candidates: List[Tuple[BaseTTSProvider, str]]) -> List[Tuple[BaseTTSProvider, str]]:
+        """
+        Order providers best first (or, for an explored call, another provider first).
+
+        Args:
+            candidates: (provider, provider_name) pairs in configured order
+
+        Returns:
+            The candidates, best scoring first
+        """
+        if not self.enabled or len(candidates) < 2:
+            return list(candidates)
+        scores = [self.score(name) for _, name in candidates]
+        if any(score is None for score in scores):
+            ranked = list(candidates)
+        else:
+            # sorted() is stable, so ties keep the configured order
+            ranked = [candidates[i] for i in sorted(range(len(candidates)), key=lambda i: scores[i])]
+        if self.explore_ratio > 0 and random.random() < self.explore_ratio:
+            # Try another provider first; the best one stays next in line as its fallback
+            explored = random.choice(ranked[1:])
+            ranked.remove(explored)
+            ranked.insert(0, explored)
+            self.explored_requests += 1
+        return ranked
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-provider EWMA latency/error rate and hedging counters."""
+        return {
+            "strategy": "adaptive" if self.enabled else "ordered",
+            "explore_ratio": self.explore_ratio,
+            "providers": {
+                name: {
+                    "ewma_latency": round(stats["latency"], 4),
+                    "ewma_error_rate": round(stats["error_rate"], 4),
+                    "samples": stats["samples"],
+                    "score": self.score(name)
+                }
+                for name, stats in self.providers.items()
+            },
+            "explored_requests": self.explored_requests,
+            "hedged_requests": self.hedged_requests,
+            "hedge_wins": self.hedge_wins,
+            "hedge_budget_exhausted": self.hedge_budget_exhausted
+        }
+
+
 class TTSService:
     """
     High-level TTS service with fallback and circuit breaker support.
@@ -112,7 +256,25 @@ class TTSService:
         
         # Circuit breakers for each provider
         self.circuit_breakers: Dict[str, CircuitBreaker] = {}
-        
+
+        # Per-provider synthesis concurrency limits, per event loop (asyncio
+        # primitives must not be shared across loops, e.g. repeated asyncio.run())
+        self._provider_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+        # Latency/error-rate aware provider ordering
+        self.router = AdaptiveProviderRouter(
+            alpha=self.settings.TTS_ROUTING_EWMA_ALPHA,
+            error_penalty=self.settings.TTS_ROUTING_ERROR_PENALTY,
+            min_samples=self.settings.TTS_ROUTING_MIN_SAMPLES,
+            enabled=self.settings.TTS_ROUTING_STRATEGY == "adaptive",
+            explore_ratio=self.settings.TTS_ROUTING_EXPLORE_RATIO
+        )
+        # Caps hedged requests relative to synthesis traffic so a slow provider cannot double load
+        self.hedge_budget = HedgeBudget(
+            ratio=self.settings.TTS_HEDGE_BUDGET_RATIO,
+            max_tokens=self.settings.TTS_HEDGE_BUDGET_MAX_TOKENS
+        )
+
         # Initialize providers
         self._initialize_providers()
         
@@ -122,6 +284,15 @@ class TTSService:
             f"voice_cache_enabled={self.cache_enabled}"
         )
     
+    def _get_provider_semaphore(self, provider_name: str) -> asyncio.Semaphore:
+        """Get the semaphore bounding concurrent synthesis calls to a provider."""
+        semaphores = self._provider_semaphores.setdefault(asyncio.get_running_loop(), {})
+        semaphore = semaphores.get(provider_name)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(max(1, self.settings.TTS_MAX_CONCURRENT))
+            semaphores[provider_name] = semaphore
+        return semaphore
+    
     def _initialize_provider(self, provider_name: str, is_required: bool = False) -> Optional[BaseTTSProvider]:
         """
         Initialize a single TTS provider.
@@ -208,14 +379,22 @@ class TTSService:
             return None
         
         cache_key = self._get_cache_key(text, voice_id, audio_format, provider_name)
-        cached_audio_b64 = await self.cache.get(cache_key)
+        cached_audio = await self.cache.get(cache_key)
         
-        if not cached_audio_b64:
+        if not cached_audio:
             return None
         
         try:
+            # Plain strings are legacy base64 entries; dicts reference a stored blob
+            if isinstance(cached_audio, str):
+                audio_data = base64.b64decode(cached_audio)
+            else:
+                audio_data = await self.voice_cache.load_audio(cached_audio)
+            if audio_data is None:
+                await self.cache.delete(cache_key)
+                return None
             logger.debug("TTS cache hit")
-            return base64.b64decode(cached_audio_b64)
+            return audio_data
         except Exception as e:
             logger.warning(f"Failed to decode cached audio: {e}")
             return None
@@ -242,8 +421,12 @@ class TTSService:
             return
         
         cache_key = self._get_cache_key(text, voice_id, audio_format, provider_name)
-        audio_b64 = base64.b64encode(audio_data).decode('utf-8')
-        await self.cache.set(cache_key, audio_b64, ttl=self.cache_ttl)
+        blob_id = await self.voice_cache.store_audio(audio_data)
+        if blob_id:
+            value = {"blob_id": blob_id, "size": len(audio_data)}
+        else:
+            value = base64.b64encode(audio_data).decode('utf-8')
+        await self.cache.set(cache_key, value, ttl=self.cache_ttl)
     
     async def _synthesize_with_provider(
         self,
@@ -292,7 +475,155 @@ class TTSService:
             )
         
         return audio_data
-    
+
+    def _ranked_providers(self) -> List[Tuple[BaseTTSProvider, str]]:
+        """Get the active providers, best first according to the router."""
+        return self.router.rank(self._active_providers())
+
+    async def _synthesize_with_routing(
+        self,
+        text: str,
+        voice_id: str,
+        audio_format: str,
+        use_cache: bool,
+        **kwargs
+    ) -> Tuple[bytes, str]:
+        """
+        Synthesize with the best provider, falling back (or hedging) to the next one.
+
+        Args:
+            text: Text to synthesize
+            voice_id: Voice identifier
+            audio_format: Audio format
+            use_cache: Whether to cache the result per provider
+            **kwargs: Additional parameters
+
+        Returns:
+            Tuple of audio data and the name of the provider that produced it
+
+        Raises:
+            TTSProviderError: If all providers fail (the last provider error is re-raised)
+        """
+        candidates = self._ranked_providers()
+        if self.settings.TTS_HEDGE_ENABLED and len(candidates) > 1:
+            return await self._synthesize_hedged(
+                candidates, text, voice_id, audio_format, use_cache, **kwargs
+            )
+
+        last_error = None
+        for index, (provider, provider_name) in enumerate(candidates):
+            try:
+                if index > 0:
+                    logger.info(f"Trying fallback provider: {provider_name}")
+
+                # Use _synthesize_with_provider which includes retry logic and circuit breaker
+                audio_data = await self._synthesize_with_provider(
+                    provider, provider_name, text, voice_id, audio_format, use_cache, **kwargs
+                )
+                return audio_data, provider_name
+            except Exception as e:
+                logger.warning(f"{provider_name} provider failed: {e}")
+                last_error = e
+
+        # All providers failed - re-raise last error to preserve original exception type
+        if last_error:
+            raise last_error
+        raise TTSProviderError(
+            f"All TTS providers failed. Primary: {self.primary_provider_name}, "
+            f"Fallback: {self.fallback_provider_name or 'none'}"
+        )
+
+    async def _synthesize_hedged(
+        self,
+        candidates: List[Tuple[BaseTTSProvider, str]],
+        text: str,
+        voice_id: str,
+        audio_format: str,
+        use_cache: bool,
+        **kwargs
+    ) -> Tuple[bytes, str]:
+        """
+        Synthesize with the best provider, hedging to the next one if it is slow.
+
+        If the best provider has not answered within TTS_HEDGE_DELAY seconds the
+        next provider is started as well (within the hedge budget); the first
+        successful result wins and the other request is cancelled (and recorded
+        as a censored latency sample). A provider that fails before the delay is
+        followed by the next one immediately.
+
+        Args:
+            candidates: (provider, provider_name) pairs, best first
+            text: Text to synthesize
+            voice_id: Voice identifier
+            audio_format: Audio format
+            use_cache: Whether to cache the result per provider
+            **kwargs: Additional parameters
+
+        Returns:
+            Tuple of audio data and the name of the provider that produced it
+        """
+        def _start(provider: BaseTTSProvider, provider_name: str) -> asyncio.Task:
+            return asyncio.create_task(self._synthesize_with_provider(
+                provider, provider_name, text, voice_id, audio_format, use_cache, **kwargs
+            ))
+
+        remaining = list(candidates)
+        first_name = remaining[0][1]
+        pending: Dict[asyncio.Task, str] = {}
+        hedged = False
+        can_hedge = True
+        last_error = None
+        self.hedge_budget.deposit()
+        try:
+            provider, provider_name = remaining.pop(0)
+            pending[_start(provider, provider_name)] = provider_name
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending,
+                    timeout=self.settings.TTS_HEDGE_DELAY if remaining and can_hedge else None,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    can_hedge = False
+                    if not self.hedge_budget.try_spend():
+                        self.router.hedge_budget_exhausted += 1
+                        continue
+                    # Best provider is slow - race the next one against it
+                    provider, provider_name = remaining.pop(0)
+                    hedged = True
+                    self.router.hedged_requests += 1
+                    logger.info(
+                        f"{first_name} exceeded {self.settings.TTS_HEDGE_DELAY}s, "
+                        f"hedging with {provider_name}"
+                    )
+                    pending[_start(provider, provider_name)] = provider_name
+                    continue
+
+                for task in done:
+                    provider_name = pending.pop(task)
+                    try:
+                        audio_data = task.result()
+                    except Exception as e:
+                        logger.warning(f"{provider_name} provider failed: {e}")
+                        last_error = e
+                        continue
+                    if hedged and provider_name != first_name:
+                        self.router.hedge_wins += 1
+                    return audio_data, provider_name
+
+                if not pending and remaining:
+                    provider, provider_name = remaining.pop(0)
+                    logger.info(f"Trying fallback provider: {provider_name}")
+                    pending[_start(provider, provider_name)] = provider_name
+        finally:
+            for task in pending:
+                task.cancel()
+            # Losers record their censored latency before the call returns, and a
+            # failed loser does not log "Task exception was never retrieved"
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        raise last_error
+
     async def synthesize(
         self,
         text: str,
@@ -306,6 +637,8 @@ class TTSService:
         
         This method uses the VoiceCacheService with singleflight pattern to prevent
         duplicate synthesis requests for concurrent requests with the same text/voice.
+        Texts longer than TTS_CHUNK_THRESHOLD are split into sentences that are
+        synthesized concurrently, cached individually and joined into one file.
         
         Args:
             text: Text to convert to speech
@@ -323,6 +656,76 @@ class TTSService:
         voice = voice_id or self.settings.TTS_DEFAULT_VOICE_ID
         audio_format = audio_format or self.settings.TTS_DEFAULT_FORMAT
         
+        chunks = self._chunk_text(text, audio_format)
+        if chunks:
+            parts = await self._synthesize_chunks(chunks, voice, audio_format, use_cache, **kwargs)
+            try:
+                return concatenate_audio(parts, audio_format)
+            except ValueError as e:
+                raise TTSProviderError(f"Failed to join chunk audio: {e}")
+        return await self._synthesize_text(text, voice, audio_format, use_cache, **kwargs)
+    
+    def _chunk_text(self, text: str, audio_format: str) -> Optional[List[str]]:
+        """
+        Split a long text into sentence chunks.
+        
+        Args:
+            text: Text to synthesize
+            audio_format: Audio format (chunk audio must be joinable in this format)
+            
+        Returns:
+            List of chunks, or None if the text should be synthesized in one piece
+        """
+        if not self.settings.TTS_CHUNKING_ENABLED or len(text) <= self.settings.TTS_CHUNK_THRESHOLD:
+            return None
+        if audio_format.lower() not in CONCATENABLE_FORMATS:
+            return None
+        max_chars = self.settings.TTS_CHUNK_MAX_CHARS
+        for provider, _ in self._active_providers():
+            # Stay within every provider's validate_text limit so fallback still works
+            config = getattr(provider, "config", None)
+            if isinstance(config, dict) and config.get("max_text_length"):
+                max_chars = min(max_chars, config["max_text_length"])
+        chunks = chunk_text(text, max_chars)
+        return chunks if len(chunks) > 1 else None
+    
+    async def _synthesize_chunks(
+        self,
+        chunks: List[str],
+        voice: str,
+        audio_format: str,
+        use_cache: bool,
+        **kwargs
+    ) -> List[bytes]:
+        """
+        Synthesize chunks concurrently, each cached (and coalesced) on its own.
+        
+        Concurrency per provider is bounded by TTS_MAX_CONCURRENT.
+        
+        Returns:
+            Audio of each chunk in reading order
+        """
+        logger.debug(f"Synthesizing {len(chunks)} chunks concurrently")
+        return list(await asyncio.gather(*[
+            self._synthesize_text(chunk, voice, audio_format, use_cache, **kwargs)
+            for chunk in chunks
+        ]))
+    
+    async def _synthesize_text(
+        self,
+        text: str,
+        voice: str,
+        audio_format: str,
+        use_cache: bool,
+        **kwargs
+    ) -> bytes:
+        """Synthesize one text (a whole short text or a single chunk) through the cache."""
+        # Generate cache key for singleflight pattern
+        settings_hash = self.voice_cache.generate_settings_hash()
+        cache_key = self.voice_cache.generate_cache_key(
+            text, voice, audio_format, settings_hash
+        )
+        
         # Use voice cache service with singleflight pattern if enabled
         if use_cache and self.cache_enabled:
             # Check cache first (quick path for cache hits)
@@ -331,59 +734,40 @@ class TTSService:
             )
             
             if cached_voice:
-                # If cached data includes audio_data, return it (backward compatibility)
-                if "audio_data" in cached_voice:
+                # Audio is read from the blob store (or legacy base64 audio_data)
+                audio_data = await self.voice_cache.load_audio(cached_voice)
+                if audio_data is not None:
                     logger.debug("TTS cache hit (with audio data)")
-                    return base64.b64decode(cached_voice["audio_data"])
+                    return audio_data
+                if cached_voice.get("blob_id"):
+                    # Blob was evicted - drop the stale entry and re-synthesize
+                    logger.debug("TTS cache entry references a missing audio blob, re-synthesizing")
+                    await self.voice_cache.cache.delete(cache_key)
                 # Otherwise, we need to synthesize (metadata-only cache)
-                # This path is for when file_id is cached but we still need audio bytes
-                # For now, fall through to synthesis
         
-        # Generate cache key for singleflight pattern
-        settings_hash = self.voice_cache.generate_settings_hash()
-        cache_key = self.voice_cache.generate_cache_key(
-            text, voice, audio_format, settings_hash
-        )
+        # Audio synthesized by this call; returned directly instead of re-reading the blob
+        synthesized: Dict[str, bytes] = {}
         
         # Use singleflight pattern: concurrent requests wait for first synthesis
         async def _synthesize_internal() -> Dict:
             """Internal synthesis function for singleflight pattern."""
-            # Try providers in order: primary -> fallback
-            providers = [
-                (self.primary_provider, self.primary_provider_name, "Primary"),
-                (self.fallback_provider, self.fallback_provider_name, "Fallback")
-            ]
-            
-            last_error = None
-            for provider, provider_name, provider_type in providers:
-                if not provider:
-                    continue
-                
-                try:
-                    if provider_type == "Fallback":
-                        logger.info(f"Trying fallback provider: {provider_name}")
-                    
-                    # Use _synthesize_with_provider which includes retry logic and circuit breaker
-                    audio_data = await self._synthesize_with_provider(
-                        provider, provider_name, text, voice, audio_format, use_cache, **kwargs
-                    )
-                    
-                    # Return in format expected by voice cache
-                    return {
-                        "audio_data": base64.b64encode(audio_data).decode('utf-8'),
-                        "provider": provider_name
-                    }
-                except Exception as e:
-                    logger.warning(f"{provider_type} provider failed: {e}")
-                    last_error = e
-            
-            # All providers failed - re-raise last error to preserve original exception type
-            if last_error:
-                raise last_error
-            raise TTSProviderError(
-                f"All TTS providers failed. Primary: {self.primary_provider_name}, "
-                f"Fallback: {self.fallback_provider_name or 'none'}"
+            audio_data, provider_name = await self._synthesize_with_routing(
+                text, voice, audio_format, use_cache, **kwargs
             )
+
+            synthesized["audio"] = audio_data
+            if not (use_cache and self.cache_enabled):
+                return {"provider": provider_name}
+
+            # Return in format expected by voice cache: a blob reference when
+            # the blob store is enabled, otherwise embedded base64 audio
+            blob_id = await self.voice_cache.store_audio(audio_data)
+            if blob_id:
+                return {"blob_id": blob_id, "provider": provider_name, "size": len(audio_data)}
+            return {
+                "audio_data": base64.b64encode(audio_data).decode('utf-8'),
+                "provider": provider_name
+            }
         
         # Use singleflight pattern if cache is enabled
         if use_cache and self.cache_enabled:
@@ -391,14 +775,214 @@ class TTSService:
                 result = await self.voice_cache.get_or_synthesize(
                     cache_key, _synthesize_internal
                 )
-                return base64.b64decode(result["audio_data"])
+                if "audio" in synthesized:
+                    return synthesized["audio"]
+                audio_data = await self.voice_cache.load_audio(result)
+                if audio_data is None:
+                    # Cached blob disappeared (evicted by another worker) - synthesize again
+                    await self.voice_cache.cache.delete(cache_key)
+                    result = await self.voice_cache.get_or_synthesize(
+                        cache_key, _synthesize_internal
+                    )
+                    audio_data = synthesized.get("audio") or await self.voice_cache.load_audio(result)
+                if audio_data is None:
+                    raise TTSProviderError("Synthesized audio is no longer available")
+                return audio_data
             except Exception as e:
                 logger.error(f"Singleflight synthesis failed: {e}")
                 raise
         else:
             # No cache, synthesize directly
-            result = await _synthesize_internal()
-            return base64.b64decode(result["audio_data"])
+            await _synthesize_internal()
+            return synthesized["audio"]
+    
+    async def synthesize_stream(
+        self,
+        text: str,
+        voice_id: Optional[str] = None,
+        audio_format: Optional[str] = None,
+        use_cache: bool = True,
+        **kwargs
+    ) -> AsyncIterator[bytes]:
+        """
+        Synthesize text to speech, yielding audio chunks as soon as they are available.
+        
+        Cache hits are streamed from the audio blob store. On a miss, chunks from
+        streaming-capable providers are forwarded as they arrive, and the complete
+        audio is cached afterwards. Fallback to the next provider is only possible
+        before the first chunk is sent; streamed attempts are not retried. Long
+        texts are split into sentence chunks that are synthesized concurrently
+        and sent in order.
+        
+        Args:
+            text: Text to convert to speech
+            voice_id: Voice identifier (uses default if not provided)
+            audio_format: Audio format (uses default if not provided)
+            use_cache: Whether to use cache (default: True)
+            **kwargs: Additional provider-specific parameters
+            
+        Yields:
+            Audio chunks
+            
+        Raises:
+            TTSProviderError: If all providers fail before any audio is sent
+        """
+        voice = voice_id or self.settings.TTS_DEFAULT_VOICE_ID
+        audio_format = audio_format or self.settings.TTS_DEFAULT_FORMAT
+        
+        chunks = self._chunk_text(text, audio_format)
+        if chunks:
+            async for chunk in self._stream_chunks(chunks, voice, audio_format, use_cache, **kwargs):
+                yield chunk
+            return
+        
+        use_cache = use_cache and self.cache_enabled
+        
+        if use_cache:
+            cached_voice = await self.voice_cache.get_cached_voice(text, voice, audio_format)
+            if cached_voice:
+                stream = await self.voice_cache.open_audio_stream(cached_voice)
+                if stream is not None:
+                    logger.debug("TTS cache hit (streaming from blob store)")
+                    async for chunk in stream:
+                        yield chunk
+                    return
+                audio_data = await self.voice_cache.load_audio(cached_voice)
+                if audio_data is not None:
+                    logger.debug("TTS cache hit (with audio data)")
+                    yield audio_data
+                    return
+        
+        last_error = None
+        for index, (provider, provider_name) in enumerate(self._ranked_providers()):
+            circuit_breaker = self.circuit_breakers.get(provider_name)
+            if circuit_breaker and not circuit_breaker.can_execute():
+                last_error = TTSProviderError(
+                    f"Circuit breaker is open for {provider_name}. "
+                    f"Provider is temporarily unavailable."
+                )
+                continue
+            
+            if index > 0:
+                logger.info(f"Trying fallback provider: {provider_name}")
+            
+            chunks = []
+            started = time.monotonic()
+            first_chunk_latency = None
+            
+            def _latency() -> float:
+                # Time to first audio; later chunks are paced by the client reading the stream
+                return first_chunk_latency if first_chunk_latency is not None else time.monotonic() - started
+            
+            semaphore = self._get_provider_semaphore(provider_name)
+            stream = provider.synthesize_stream(text, voice, audio_format, **kwargs)
+            try:
+                try:
+                    while True:
+                        # The slot is held only while pulling from the provider, never
+                        # while a slow client reads the yielded chunk
+                        async with semaphore:
+                            try:
+                                chunk = await stream.__anext__()
+                            except StopAsyncIteration:
+                                break
+                        if first_chunk_latency is None:
+                            first_chunk_latency = time.monotonic() - started
+                        chunks.append(chunk)
+                        yield chunk
+                finally:
+                    await stream.aclose()
+            except TTSProviderRateLimitError as e:
+                self.router.record(provider_name, _latency(), success=False)
+                self._handle_rate_limit(provider_name, circuit_breaker, e)
+                if chunks:
+                    raise
+                last_error = e
+                continue
+            except Exception as e:
+                self.router.record(provider_name, _latency(), success=False)
+                if circuit_breaker:
+                    circuit_breaker.record_failure()
+                if chunks:
+                    # Audio was already sent; a different provider's audio cannot be appended
+                    logger.error(f"{provider_name} failed mid-stream after {len(chunks)} chunks: {e}")
+                    raise
+                logger.warning(f"{provider_name} provider failed: {e}")
+                last_error = e
+                continue
+            
+            self.router.record(provider_name, _latency(), success=True)
+            if circuit_breaker:
+                circuit_breaker.record_success()
+            if use_cache:
+                await self._cache_streamed_audio(b"".join(chunks), text, voice, audio_format, provider_name)
+            return
+        
+        if last_error:
+            raise last_error
+        raise TTSProviderError(
+            f"All TTS providers failed. Primary: {self.primary_provider_name}, "
+            f"Fallback: {self.fallback_provider_name or 'none'}"
+        )
+    
+    async def _stream_chunks(
+        self,
+        chunks: List[str],
+        voice: str,
+        audio_format: str,
+        use_cache: bool,
+        **kwargs
+    ) -> AsyncIterator[bytes]:
+        """
+        Synthesize chunks concurrently and yield their audio in reading order.
+        
+        MP3, AAC and Ogg chunk audio is sent as soon as it and every earlier chunk
+        are ready. WAV needs a single header covering all samples, so it is sent
+        once every chunk is done.
+        """
+        if audio_format.lower() == "wav":
+            yield concatenate_audio(
+                await self._synthesize_chunks(chunks, voice, audio_format, use_cache, **kwargs),
+                audio_format
+            )
+            return
+        
+        tasks = [
+            asyncio.create_task(self._synthesize_text(chunk, voice, audio_format, use_cache, **kwargs))
+            for chunk in chunks
+        ]
+        try:
+            for index, task in enumerate(tasks):
+                audio_data = await task
+                if audio_format.lower() == "mp3":
+                    audio_data = strip_mp3_tags(audio_data, keep_leading=index == 0)
+                yield audio_data
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def _cache_streamed_audio(
+        self,
+        audio_data: bytes,
+        text: str,
+        voice_id: str,
+        audio_format: str,
+        provider_name: str
+    ):
+        """Cache audio assembled from a stream in the same form as synthesize()."""
+        try:
+            cache_key = self.voice_cache.generate_cache_key(
+                text, voice_id, audio_format, self.voice_cache.generate_settings_hash()
+            )
+            blob_id = await self.voice_cache.store_audio(audio_data)
+            if blob_id:
+                value = {"blob_id": blob_id, "provider": provider_name, "size": len(audio_data)}
+            else:
+                value = {"audio_data": base64.b64encode(audio_data).decode('utf-8'), "provider": provider_name}
+            await self.voice_cache.cache.set(cache_key, value, ttl=self.cache_ttl)
+        except Exception as e:
+            logger.warning(f"Failed to cache streamed audio: {e}")
     
     async def _synthesize_with_provider_and_cache(
         self,
@@ -517,7 +1101,19 @@ class TTSService:
         
         for attempt in range(max_retries + 1):
             try:
-                audio_data = await provider.synthesize(text, voice_id, audio_format, **kwargs)
+                # Retry backoff happens outside the slot so waiting calls can proceed
+                async with self._get_provider_semaphore(provider_name):
+                    started = time.monotonic()
+                    try:
+                        audio_data = await provider.synthesize(text, voice_id, audio_format, **kwargs)
+                    except asyncio.CancelledError:
+                        # Typically a hedge won: this call was at least this slow
+                        self.router.record_censored(provider_name, time.monotonic() - started)
+                        raise
+                    except Exception:
+                        self.router.record(provider_name, time.monotonic() - started, success=False)
+                        raise
+                    self.router.record(provider_name, time.monotonic() - started, success=True)
                 self._record_success(provider_name, circuit_breaker, attempt, max_retries)
                 return audio_data
             except TTSProviderRateLimitError as e:
@@ -607,6 +1203,52 @@ class TTSService:
                 )
         
         return health_status
+    
+    def _active_providers(self) -> List[Tuple[BaseTTSProvider, str]]:
+        return [
+            (provider, provider_name)
+            for provider, provider_name in (
+                (self.primary_provider, self.primary_provider_name),
+                (self.fallback_provider, self.fallback_provider_name)
+            )
+            if provider
+        ]
+    
+    async def start(self):
+        """Open the providers' pooled HTTP clients (called from the app lifespan)."""
+        for provider, _ in self._active_providers():
+            await provider.start()
+    
+    async def close(self):
+        """Close the providers' pooled HTTP clients (called from the app lifespan)."""
+        for provider, provider_name in self._active_providers():
+            try:
+                await provider.close()
+            except Exception as e:
+                logger.warning(f"Error closing {provider_name} HTTP client: {e}")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get TTS service statistics.
+        
+        Returns:
+            Dict with per-provider connection reuse and circuit breaker state,
+            routing (EWMA latency/error rate, hedging) and voice cache stats
+        """
+        providers = {}
+        for provider, provider_name in self._active_providers():
+            circuit_breaker = self.circuit_breakers.get(provider_name)
+            providers[provider_name] = {
+                "connections": provider.get_connection_stats(),
+                "circuit_breaker": circuit_breaker.state if circuit_breaker else None
+            }
+        return {
+            "primary_provider": self.primary_provider_name,
+            "fallback_provider": self.fallback_provider_name or None,
+            "providers": providers,
+            "routing": self.router.get_stats(),
+            "voice_cache": self.voice_cache.get_stats()
+        }
 
 
 # Global TTS service instance
@@ -625,3 +1267,8 @@ def get_tts_service() -> TTSService:
         _tts_service = TTSService()
     return _tts_service
 
+
+async def close_tts_service():
+    """Close the global TTS service's provider HTTP clients, if it was created."""
+    if _tts_service is not None:
+        await _tts_service.close()
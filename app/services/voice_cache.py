@@ -7,10 +7,11 @@ with the same text/voice combination.
 """
 
 import hashlib
-import asyncio
 import base64
-from typing import Optional, Dict, Any, Callable, Awaitable
+from typing import Optional, Dict, Any, Callable, Awaitable, AsyncIterator
+from app.services.audio_blob_store import AudioBlobStore, get_audio_blob_store
 from app.utils.cache import cache_manager
+from app.utils.singleflight import DistributedSingleFlight
 from app.config import get_settings
 from app.utils.logger import get_logger
 
@@ -25,17 +26,36 @@ class VoiceCacheService:
     combination wait for the first synthesis to complete, preventing duplicate API calls.
     """
     
-    def __init__(self):
-        """Initialize voice cache service."""
+    def __init__(self, blob_store: Optional[AudioBlobStore] = None):
+        """
+        Initialize voice cache service.
+        
+        Args:
+            blob_store: Optional AudioBlobStore (uses global if TTS_BLOB_STORE_ENABLED)
+        """
         self.settings = get_settings()
         self.cache = cache_manager
         self.cache_enabled = self.settings.CACHE_ENABLED
         self.cache_ttl = self.settings.TTS_CACHE_TTL
         
-        # Singleflight pattern: track in-flight requests by cache key
-        # Maps cache_key -> future
-        self._in_flight: Dict[str, asyncio.Future] = {}
-        self._in_flight_lock = asyncio.Lock()
+        # Audio bytes live in the blob store; cache values hold a blob_id reference
+        if blob_store is None and self.settings.TTS_BLOB_STORE_ENABLED:
+            blob_store = get_audio_blob_store()
+        self.blob_store = blob_store
+        
+        # Singleflight pattern: coalesce in-flight requests by cache key, across
+        # workers too when the Redis cache backend is in use
+        get_redis = (
+            (lambda: self.cache.redis_client)
+            if self.settings.TTS_DISTRIBUTED_SINGLEFLIGHT_ENABLED else None
+        )
+        self._singleflight = DistributedSingleFlight(
+            "voice_cache",
+            get_redis=get_redis,
+            lease=self.settings.TTS_SINGLEFLIGHT_LEASE,
+            wait_timeout=self.settings.TTS_SINGLEFLIGHT_WAIT_TIMEOUT,
+            poll_interval=self.settings.TTS_SINGLEFLIGHT_POLL_INTERVAL
+        )
         
         # Cache statistics
         self.stats = {
@@ -80,7 +100,8 @@ class VoiceCacheService:
         question_id: Optional[str],
         version: int,
         settings_hash: str,
-        audio_data: Optional[bytes] = None
+        audio_data: Optional[bytes] = None,
+        blob_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Build cache value dictionary.
@@ -93,7 +114,8 @@ class VoiceCacheService:
             question_id: Optional question ID
             version: Voice version number
             settings_hash: Settings hash
-            audio_data: Optional raw audio bytes
+            audio_data: Optional raw audio bytes (embedded as base64 when there is no blob_id)
+            blob_id: Optional audio blob reference
             
         Returns:
             Dict with cache value
@@ -107,10 +129,64 @@ class VoiceCacheService:
             "format": format,
             "settings_hash": settings_hash
         }
-        if audio_data:
+        if blob_id:
+            cache_value["blob_id"] = blob_id
+            cache_value["audio_size"] = len(audio_data) if audio_data else None
+        elif audio_data:
             cache_value["audio_data"] = base64.b64encode(audio_data).decode('utf-8')
         return cache_value
     
+    async def store_audio(self, audio_data: bytes) -> Optional[str]:
+        """
+        Store audio bytes in the blob store.
+        
+        Args:
+            audio_data: Audio bytes
+            
+        Returns:
+            str or None: Blob identifier, or None if the blob store is disabled or failed
+        """
+        if not (self.blob_store and audio_data):
+            return None
+        try:
+            return await self.blob_store.put(audio_data)
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning(f"Failed to store audio blob: {e}")
+            return None
+    
+    async def load_audio(self, cached_value: Optional[Dict[str, Any]]) -> Optional[bytes]:
+        """
+        Load audio bytes referenced by a cache value.
+        
+        Args:
+            cached_value: Cache value with a ``blob_id`` or legacy base64 ``audio_data``
+            
+        Returns:
+            bytes or None: Audio bytes, or None if the value carries no audio or the blob is gone
+        """
+        if not cached_value:
+            return None
+        if cached_value.get("blob_id") and self.blob_store:
+            return await self.blob_store.get(cached_value["blob_id"])
+        if cached_value.get("audio_data"):
+            return base64.b64decode(cached_value["audio_data"])
+        return None
+    
+    async def open_audio_stream(self, cached_value: Optional[Dict[str, Any]]) -> Optional[AsyncIterator[bytes]]:
+        """
+        Stream audio referenced by a cache value from disk, without base64 decoding.
+        
+        Args:
+            cached_value: Cache value with a ``blob_id``
+            
+        Returns:
+            Async chunk iterator, or None if the value has no stored blob
+        """
+        if cached_value and cached_value.get("blob_id") and self.blob_store:
+            return await self.blob_store.open_stream(cached_value["blob_id"])
+        return None
+    
     def generate_cache_key(
         self,
         text: str,
@@ -227,9 +303,10 @@ class VoiceCacheService:
         
         cache_key, settings_hash = self._get_cache_key_with_hash(text, voice_id, format, settings_hash)
         
-        # Build cache value with metadata
+        # Build cache value with metadata (audio goes to the blob store when enabled)
+        blob_id = await self.store_audio(audio_data) if audio_data else None
         cache_value = self._build_cache_value(
-            file_id, voice_id, format, duration, question_id, version, settings_hash, audio_data
+            file_id, voice_id, format, duration, question_id, version, settings_hash, audio_data, blob_id
         )
         
         try:
@@ -252,6 +329,8 @@ class VoiceCacheService:
         
         This method implements the singleflight pattern: if multiple concurrent requests
         ask for the same cache key, they all wait for the first synthesis to complete.
+        With Redis, requests in other workers wait for it as well and read the
+        result from the shared cache.
         
         Args:
             cache_key: Cache key for this request
@@ -267,48 +346,33 @@ class VoiceCacheService:
             logger.debug(f"Voice cache hit (before singleflight) for key: {cache_key[:32]}...")
             return cached
         
-        # Singleflight pattern: check if synthesis is already in progress
-        async with self._in_flight_lock:
-            if cache_key in self._in_flight:
-                # Another request is already synthesizing, wait for it
-                future = self._in_flight[cache_key]
-                logger.debug(f"Singleflight: waiting for in-flight synthesis for key: {cache_key[:32]}...")
-                self.stats["singleflight_hits"] += 1
-                return await future  # Let exceptions propagate naturally
-            
-            # Create a new future for this synthesis
-            future = asyncio.Future()
-            self._in_flight[cache_key] = future
+        def _on_wait():
+            logger.debug(f"Singleflight: waiting for in-flight synthesis for key: {cache_key[:32]}...")
+            self.stats["singleflight_hits"] += 1
         
-        # Perform synthesis
-        try:
-            result = await synthesize_fn()
+        async def _synthesize_and_cache() -> Dict[str, Any]:
+            try:
+                result = await synthesize_fn()
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.error(f"Voice synthesis failed: {e}")
+                raise
             
             # Cache the result
             if result:
                 await self.cache.set(cache_key, result, ttl=self.cache_ttl)
             
-            # Set the future result so waiting requests can proceed
-            future.set_result(result)
-            
             self.stats["misses"] += 1
             logger.debug(f"Voice synthesis completed and cached for key: {cache_key[:32]}...")
             return result
-            
-        except Exception as e:
-            # Set exception on future so waiting requests get the error
-            future.set_exception(e)
-            self.stats["errors"] += 1
-            logger.error(f"Voice synthesis failed: {e}")
-            # Ensure the future's exception is "retrieved" to avoid "Future exception
-            # was never retrieved" when waiters are cancelled (e.g. by gather)
-            future.add_done_callback(lambda f: f.exception())
-            raise
-
-        finally:
-            # Clean up in-flight tracking
-            async with self._in_flight_lock:
-                self._in_flight.pop(cache_key, None)  # Safer than del
+        
+        # Waiting requests receive the same result or exception
+        return await self._singleflight.do(
+            cache_key,
+            _synthesize_and_cache,
+            on_wait=_on_wait,
+            fetch_result=lambda: self.cache.get(cache_key)
+        )
     
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -327,7 +391,9 @@ class VoiceCacheService:
             "singleflight_hits": self.stats["singleflight_hits"],
             "hit_rate": round(hit_rate, 2),
             "total_requests": total_requests,
-            "in_flight_count": len(self._in_flight)
+            "in_flight_count": self._singleflight.in_flight_count,
+            "singleflight": self._singleflight.get_stats(),
+            "blob_store": self.blob_store.get_stats() if self.blob_store else None
         }
     
     def reset_stats(self):
@@ -1,43 +1,313 @@
+import asyncio
+import fnmatch
 import hashlib
+import heapq
 import json
+import math
+import random
 import redis
+import redis.asyncio as aioredis
+import sys
+import threading
 import time
-from typing import Any, Optional, Dict, Union
+import uuid
+from collections import OrderedDict
+from typing import Any, Optional, Dict, List, Tuple, Union
 from functools import wraps
 from app.config import get_settings
+from app.utils.cache_codec import CacheCodec
 from app.utils.logger import get_logger
+from app.utils.singleflight import SingleFlight
 
 logger = get_logger(__name__)
 settings = get_settings()
 
+_MISSING = object()
+
+# Redis key prefix for namespace generation counters
+NAMESPACE_GENERATION_PREFIX = "cache_ns:"
+
+
+def estimate_size(key: str, value: Any) -> int:
+    """Approximate resident size in bytes of a cache entry (serialized form)."""
+    if isinstance(value, (bytes, bytearray)):
+        value_size = len(value)
+    elif isinstance(value, str):
+        value_size = len(value.encode("utf-8", errors="ignore"))
+    else:
+        try:
+            value_size = len(json.dumps(value, default=str))
+        except (TypeError, ValueError):
+            value_size = sys.getsizeof(value)
+    return len(key) + value_size
+
+
+class BoundedMemoryCache:
+    """
+    In-memory LRU cache with per-entry TTL and entry/byte limits.
+    
+    Entries live in an OrderedDict kept in recency order; inserting past
+    ``max_entries`` or ``max_bytes`` evicts least recently used entries.
+    Expiry times are tracked in a min-heap that is drained on every access,
+    so expired entries are reclaimed even if their keys are never read again.
+    Operations are guarded by a lock so sync callers in worker threads can
+    share the cache with the event loop.
+    """
+    
+    def __init__(self, max_entries: int = 10000, max_bytes: int = 100 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # key -> (value, expires_at, size)
+        self._data: "OrderedDict[str, Tuple[Any, float, int]]" = OrderedDict()
+        # (expires_at, key); stale after overwrite/delete and skipped when popped
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self.current_bytes = 0
+        self.stats = {"evictions": 0, "expirations": 0, "rejected": 0}
+        self._lock = threading.RLock()
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+    
+    def keys(self) -> List[str]:
+        """Keys of live entries."""
+        with self._lock:
+            self.purge_expired()
+            return list(self._data.keys())
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a live value and mark it most recently used."""
+        with self._lock:
+            self.purge_expired()
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            if time.time() >= entry[1]:
+                self._remove(key)
+                self.stats["expirations"] += 1
+                return default
+            self._data.move_to_end(key)
+            return entry[0]
+    
+    def set(self, key: str, value: Any, ttl: float) -> bool:
+        """
+        Store a value, evicting least recently used entries to stay within limits.
+        
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Time to live in seconds
+            
+        Returns:
+            bool: False if the value alone exceeds ``max_bytes``
+        """
+        size = estimate_size(key, value)
+        if size > self.max_bytes:
+            self.stats["rejected"] += 1
+            return False
+        
+        with self._lock:
+            self.purge_expired()
+            if key in self._data:
+                self._remove(key)
+            
+            expires_at = time.time() + ttl
+            self._data[key] = (value, expires_at, size)
+            self.current_bytes += size
+            heapq.heappush(self._expiry_heap, (expires_at, key))
+            
+            while len(self._data) > self.max_entries or self.current_bytes > self.max_bytes:
+                _, (_, _, evicted_size) = self._data.popitem(last=False)
+                self.current_bytes -= evicted_size
+                self.stats["evictions"] += 1
+            
+            self._compact_heap()
+            return True
+    
+    def delete(self, key: str) -> bool:
+        """Remove a key; returns True if it was present."""
+        with self._lock:
+            if key not in self._data:
+                return False
+            self._remove(key)
+            return True
+    
+    def clear(self):
+        """Remove every entry."""
+        with self._lock:
+            self._data.clear()
+            self._expiry_heap.clear()
+            self.current_bytes = 0
+    
+    def purge_expired(self) -> int:
+        """
+        Drop every entry whose TTL has elapsed.
+        
+        Returns:
+            int: Number of entries removed
+        """
+        with self._lock:
+            now = time.time()
+            removed = 0
+            heap = self._expiry_heap
+            while heap and heap[0][0] <= now:
+                expires_at, key = heapq.heappop(heap)
+                entry = self._data.get(key)
+                if entry is not None and entry[1] == expires_at:
+                    self._remove(key)
+                    removed += 1
+            self.stats["expirations"] += removed
+            return removed
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get size and eviction statistics."""
+        return {
+            "entries": len(self._data),
+            "resident_bytes": self.current_bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            **self.stats
+        }
+    
+    def _remove(self, key: str):
+        _, _, size = self._data.pop(key)
+        self.current_bytes -= size
+    
+    def _compact_heap(self):
+        """Rebuild the expiry heap when stale entries dominate it."""
+        if len(self._expiry_heap) > 2 * len(self._data) + 64:
+            self._expiry_heap = [(entry[1], key) for key, entry in self._data.items()]
+            heapq.heapify(self._expiry_heap)
+
+
 class CacheManager:
-    """Unified cache manager supporting both Redis and in-memory backends."""
+    """Unified cache manager supporting both Redis and in-memory backends.
+    
+    The Redis backend uses ``redis.asyncio`` with a shared connection pool so
+    cache round trips yield to other requests instead of blocking the event loop.
+    Values are stored in binary form by ``CacheCodec`` (msgpack, compressed
+    above CACHE_COMPRESSION_THRESHOLD).
+    
+    With Redis, a small per-process L1 (short TTL) sits in front of it so hot
+    keys are served without a network round trip. Deletes and pattern clears
+    are broadcast over Redis pub/sub so every worker drops its L1 copies;
+    overwrites of existing keys become visible elsewhere within CACHE_L1_TTL.
+    """
     
     def __init__(self):
         self.redis_client = None
-        self.memory_cache = {}
+        self.redis_pool = None
+        # Blocking client for sync callers (see get_sync/set_sync)
+        self.sync_redis_client = None
+        self.memory_cache = BoundedMemoryCache(
+            max_entries=settings.CACHE_MEMORY_MAX_ENTRIES,
+            max_bytes=settings.CACHE_MEMORY_MAX_BYTES
+        )
+        self.codec = CacheCodec(
+            serializer=settings.CACHE_SERIALIZER,
+            compression=settings.CACHE_COMPRESSION,
+            compression_threshold=settings.CACHE_COMPRESSION_THRESHOLD,
+            compression_level=settings.CACHE_COMPRESSION_LEVEL
+        )
+        # L1 holds encoded values so callers never share mutable objects
+        self.l1_enabled = settings.CACHE_L1_ENABLED
+        self.l1_ttl = settings.CACHE_L1_TTL
+        self.l1_cache = BoundedMemoryCache(
+            max_entries=settings.CACHE_L1_MAX_ENTRIES,
+            max_bytes=settings.CACHE_L1_MAX_BYTES
+        )
+        self.invalidation_channel = settings.CACHE_INVALIDATION_CHANNEL
+        # namespace -> (generation, fetched_at); see invalidate_namespace()
+        self._namespace_generations: Dict[str, Tuple[int, float]] = {}
+        self.namespace_refresh_interval = settings.CACHE_NAMESPACE_REFRESH_INTERVAL
+        self.scan_batch_size = settings.CACHE_SCAN_BATCH_SIZE
+        self.instance_id = uuid.uuid4().hex
+        self._invalidation_task: Optional[asyncio.Task] = None
         self.cache_stats = {
             "hits": 0,
             "misses": 0,
-            "errors": 0
+            "errors": 0,
+            "l1_hits": 0,
+            "invalidations_sent": 0,
+            "invalidations_received": 0
         }
         
-        # Initialize Redis if configured
+        # Initialize Redis if configured (connections are opened lazily by the pool)
         if settings.CACHE_BACKEND == "redis":
             try:
-                self.redis_client = redis.from_url(
+                self.redis_pool = aioredis.ConnectionPool.from_url(
                     settings.REDIS_URL,
-                    decode_responses=True,
-                    socket_connect_timeout=5,
-                    socket_timeout=5,
+                    decode_responses=False,  # values are codec-encoded bytes
+                    max_connections=settings.REDIS_MAX_CONNECTIONS,
+                    socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+                    socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
                     retry_on_timeout=True
                 )
-                # Test connection
-                self.redis_client.ping()
-                logger.info("✅ Redis cache connected successfully")
+                self.redis_client = aioredis.Redis(connection_pool=self.redis_pool)
+                self.sync_redis_client = redis.Redis.from_url(
+                    settings.REDIS_URL,
+                    decode_responses=False,
+                    max_connections=settings.REDIS_MAX_CONNECTIONS,
+                    socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+                    socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+                    retry_on_timeout=True
+                )
+                logger.info(f"✅ Redis cache configured (pool size: {settings.REDIS_MAX_CONNECTIONS})")
             except Exception as e:
                 logger.warning(f"⚠️ Redis cache not available, falling back to memory: {e}")
                 self.redis_client = None
+                self.redis_pool = None
+                self.sync_redis_client = None
+    
+    async def connect(self) -> bool:
+        """
+        Verify the Redis connection, falling back to memory if it is unreachable.
+        
+        Returns:
+            bool: True if Redis is in use
+        """
+        if not self.redis_client:
+            return False
+        try:
+            await self.redis_client.ping()
+            logger.info("✅ Redis cache connected successfully")
+        except Exception as e:
+            logger.warning(f"⚠️ Redis cache not available, falling back to memory: {e}")
+            await self.close()
+            return False
+        
+        if self.l1_enabled and self._invalidation_task is None:
+            self._invalidation_task = asyncio.create_task(self._listen_for_invalidations())
+        return True
+    
+    async def close(self):
+        """Stop the invalidation listener and close the Redis client and its connection pool."""
+        if self._invalidation_task:
+            self._invalidation_task.cancel()
+            try:
+                await self._invalidation_task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._invalidation_task = None
+        self.l1_cache.clear()
+        
+        if self.redis_client:
+            try:
+                await self.redis_client.aclose()
+                if self.redis_pool:
+                    await self.redis_pool.disconnect()
+            except Exception as e:
+                logger.warning(f"Error closing Redis cache connections: {e}")
+        if self.sync_redis_client:
+            try:
+                self.sync_redis_client.close()
+            except Exception as e:
+                logger.warning(f"Error closing sync Redis cache connections: {e}")
+        self.redis_client = None
+        self.redis_pool = None
+        self.sync_redis_client = None
     
     def get_cache_key(self, service: str, operation: str, **kwargs) -> str:
         """Generate cache key from parameters."""
@@ -54,9 +324,104 @@ class CacheManager:
         
         return f"ai_cache:{service}:{operation}:{key_hash}"
     
+    @staticmethod
+    def namespace_of(key: str) -> Optional[str]:
+        """Namespace (operation) of an ``ai_cache:{service}:{operation}:...`` key, else None."""
+        parts = key.split(":", 3)
+        if len(parts) == 4 and parts[0] == "ai_cache":
+            return parts[2]
+        return None
+    
+    async def get_namespace_generation(self, namespace: str) -> int:
+        """
+        Current generation of a namespace.
+        
+        With Redis the counter is shared by all workers and re-read at most every
+        CACHE_NAMESPACE_REFRESH_INTERVAL seconds (bumps are also broadcast).
+        
+        Args:
+            namespace: Cache namespace
+            
+        Returns:
+            int: Generation (0 until the namespace is first invalidated)
+        """
+        generation = self._known_generation(namespace)
+        if generation is None:
+            value = await self.redis_client.get(f"{NAMESPACE_GENERATION_PREFIX}{namespace}")
+            generation = self._store_generation(namespace, value)
+        return generation
+    
+    def get_namespace_generation_sync(self, namespace: str) -> int:
+        """Blocking variant of get_namespace_generation() for sync callers."""
+        generation = self._known_generation(namespace)
+        if generation is None:
+            value = self.sync_redis_client.get(f"{NAMESPACE_GENERATION_PREFIX}{namespace}")
+            generation = self._store_generation(namespace, value)
+        return generation
+    
+    def _known_generation(self, namespace: str) -> Optional[int]:
+        """Locally known generation, or None if it must be re-read from Redis."""
+        cached = self._namespace_generations.get(namespace)
+        if not self.redis_client:
+            return cached[0] if cached else 0
+        if cached and time.time() - cached[1] < self.namespace_refresh_interval:
+            return cached[0]
+        return None
+    
+    def _store_generation(self, namespace: str, value: Optional[Union[bytes, str]]) -> int:
+        generation = int(value) if value else 0
+        self._namespace_generations[namespace] = (generation, time.time())
+        return generation
+    
+    @staticmethod
+    def _generation_key(key: str, generation: int) -> str:
+        if generation == 0:
+            # Generation 0 keeps pre-existing keys valid
+            return key
+        prefix, rest = key.rsplit(":", 1)
+        return f"{prefix}:g{generation}:{rest}"
+    
+    async def _resolve_key(self, key: str) -> str:
+        """Map a logical key to its physical key in the namespace's current generation."""
+        namespace = self.namespace_of(key)
+        if namespace is None:
+            return key
+        return self._generation_key(key, await self.get_namespace_generation(namespace))
+    
+    def _resolve_key_sync(self, key: str) -> str:
+        """Blocking variant of _resolve_key()."""
+        namespace = self.namespace_of(key)
+        if namespace is None:
+            return key
+        return self._generation_key(key, self.get_namespace_generation_sync(namespace))
+    
+    async def invalidate_namespace(self, namespace: str) -> int:
+        """
+        Invalidate every key in a namespace by bumping its generation.
+        
+        This is a single INCR; entries from older generations are no longer
+        read and expire by TTL. Use clear_pattern() to reclaim memory right away.
+        
+        Args:
+            namespace: Cache namespace (the ``operation`` part of the key)
+            
+        Returns:
+            int: New generation
+        """
+        if self.redis_client:
+            generation = await self.redis_client.incr(f"{NAMESPACE_GENERATION_PREFIX}{namespace}")
+            self._namespace_generations[namespace] = (generation, time.time())
+            await self._publish_invalidation({"namespace": namespace, "generation": generation})
+        else:
+            generation = (self._namespace_generations.get(namespace, (0, 0.0))[0]) + 1
+            self._namespace_generations[namespace] = (generation, time.time())
+        logger.info(f"Invalidated cache namespace '{namespace}' (generation {generation})")
+        return generation
+    
     async def get(self, key: str) -> Optional[Any]:
         """Get value from cache."""
         try:
+            key = await self._resolve_key(key)
             if self.redis_client:
                 return await self._get_from_redis(key)
             else:
@@ -66,13 +431,58 @@ class CacheManager:
             logger.error(f"Cache get error for key {key}: {e}")
             return None
     
+    def get_sync(self, key: str) -> Optional[Any]:
+        """
+        Get value from cache without awaiting.
+        
+        For sync callers, whether or not an event loop is running in the
+        current thread. The Redis backend uses a separate blocking client.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Cached value or None
+        """
+        try:
+            key = self._resolve_key_sync(key)
+            if self.redis_client:
+                value = self._get_from_l1(key)
+                if value is not _MISSING:
+                    return value
+                return self._decode_redis_value(key, self.sync_redis_client.get(key))
+            else:
+                return self._get_from_memory(key)
+        except Exception as e:
+            self.cache_stats["errors"] += 1
+            logger.error(f"Cache get error for key {key}: {e}")
+            return None
+    
     async def _get_from_redis(self, key: str) -> Optional[Any]:
-        """Get value from Redis cache."""
-        value = self.redis_client.get(key)
+        """Get value from the L1 cache, then Redis."""
+        value = self._get_from_l1(key)
+        if value is not _MISSING:
+            return value
+        return self._decode_redis_value(key, await self.redis_client.get(key))
+    
+    def _get_from_l1(self, key: str) -> Any:
+        """Get a decoded value from L1, or _MISSING."""
+        if self.l1_enabled:
+            value = self.l1_cache.get(key)
+            if value is not None:
+                self.cache_stats["hits"] += 1
+                self.cache_stats["l1_hits"] += 1
+                logger.debug(f"L1 cache hit for key: {key}")
+                return self.codec.decode(value)
+        return _MISSING
+    
+    def _decode_redis_value(self, key: str, value: Optional[bytes]) -> Optional[Any]:
+        """Record a Redis hit or miss and decode the value."""
         if value:
             self.cache_stats["hits"] += 1
             logger.debug(f"Cache hit for key: {key}")
-            return json.loads(value)
+            self._set_in_l1(key, value)
+            return self.codec.decode(value)
         else:
             self.cache_stats["misses"] += 1
             logger.debug(f"Cache miss for key: {key}")
@@ -80,16 +490,11 @@ class CacheManager:
     
     def _get_from_memory(self, key: str) -> Optional[Any]:
         """Get value from memory cache."""
-        if key in self.memory_cache:
-            cached_item = self.memory_cache[key]
-            # Check if expired
-            if time.time() < cached_item["expires_at"]:
-                self.cache_stats["hits"] += 1
-                logger.debug(f"Memory cache hit for key: {key}")
-                return cached_item["value"]
-            else:
-                # Remove expired item
-                del self.memory_cache[key]
+        value = self.memory_cache.get(key, _MISSING)
+        if value is not _MISSING:
+            self.cache_stats["hits"] += 1
+            logger.debug(f"Memory cache hit for key: {key}")
+            return value
         
         self.cache_stats["misses"] += 1
         logger.debug(f"Memory cache miss for key: {key}")
@@ -98,6 +503,7 @@ class CacheManager:
     async def set(self, key: str, value: Any, ttl: int = 3600) -> bool:
         """Set value in cache."""
         try:
+            key = await self._resolve_key(key)
             if self.redis_client:
                 return await self._set_in_redis(key, value, ttl)
             else:
@@ -107,33 +513,156 @@ class CacheManager:
             logger.error(f"Cache set error for key {key}: {e}")
             return False
     
+    def set_sync(self, key: str, value: Any, ttl: int = 3600) -> bool:
+        """
+        Set value in cache without awaiting (see get_sync).
+        
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Time to live in seconds
+            
+        Returns:
+            bool: True if stored
+        """
+        try:
+            key = self._resolve_key_sync(key)
+            if self.redis_client:
+                serialized_value = self.codec.encode(value)
+                success = self.sync_redis_client.setex(key, ttl, serialized_value)
+                if success:
+                    self._set_in_l1(key, serialized_value, ttl)
+                    logger.debug(f"Cached value in Redis for key: {key} (TTL: {ttl}s)")
+                return bool(success)
+            else:
+                return self._set_in_memory(key, value, ttl)
+        except Exception as e:
+            self.cache_stats["errors"] += 1
+            logger.error(f"Cache set error for key {key}: {e}")
+            return False
+    
     async def _set_in_redis(self, key: str, value: Any, ttl: int) -> bool:
         """Set value in Redis cache."""
-        serialized_value = json.dumps(value, default=str)
-        success = self.redis_client.setex(key, ttl, serialized_value)
+        serialized_value = self.codec.encode(value)
+        success = await self.redis_client.setex(key, ttl, serialized_value)
         if success:
+            self._set_in_l1(key, serialized_value, ttl)
             logger.debug(f"Cached value in Redis for key: {key} (TTL: {ttl}s)")
         return bool(success)
     
+    def _set_in_l1(self, key: str, serialized_value: bytes, ttl: Optional[int] = None):
+        """Store a serialized Redis value in the per-process L1 cache."""
+        if self.l1_enabled:
+            l1_ttl = min(ttl, self.l1_ttl) if ttl else self.l1_ttl
+            self.l1_cache.set(key, serialized_value, l1_ttl)
+    
     def _set_in_memory(self, key: str, value: Any, ttl: int) -> bool:
         """Set value in memory cache."""
-        self.memory_cache[key] = {
-            "value": value,
-            "expires_at": time.time() + ttl
-        }
+        if not self.memory_cache.set(key, value, ttl):
+            logger.warning(f"Value for key {key} exceeds CACHE_MEMORY_MAX_BYTES, not cached")
+            return False
         logger.debug(f"Cached value in memory for key: {key} (TTL: {ttl}s)")
         return True
     
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        Get multiple values in one round trip.
+        
+        Args:
+            keys: Cache keys
+            
+        Returns:
+            Dict mapping each key that was found to its value (misses are omitted)
+        """
+        if not keys:
+            return {}
+        try:
+            physical_keys = {await self._resolve_key(key): key for key in keys}
+            found = await self._get_many_physical(list(physical_keys))
+            return {physical_keys[key]: value for key, value in found.items()}
+        except Exception as e:
+            self.cache_stats["errors"] += 1
+            logger.error(f"Cache get_many error for {len(keys)} keys: {e}")
+            return {}
+    
+    async def _get_many_physical(self, keys: List[str]) -> Dict[str, Any]:
+        """Multi-get for already-resolved keys."""
+        if self.redis_client:
+            found = {}
+            remaining = keys
+            if self.l1_enabled:
+                remaining = []
+                for key in keys:
+                    value = self.l1_cache.get(key)
+                    if value is not None:
+                        found[key] = self.codec.decode(value)
+                    else:
+                        remaining.append(key)
+                self.cache_stats["l1_hits"] += len(found)
+            
+            if remaining:
+                values = await self.redis_client.mget(remaining)
+                for key, value in zip(remaining, values):
+                    if value is not None:
+                        found[key] = self.codec.decode(value)
+                        self._set_in_l1(key, value)
+            self.cache_stats["hits"] += len(found)
+            self.cache_stats["misses"] += len(keys) - len(found)
+            return found
+        else:
+            found = {}
+            for key in keys:
+                value = self._get_from_memory(key)
+                if value is not None:
+                    found[key] = value
+            return found
+    
+    async def set_many(self, items: Dict[str, Any], ttl: int = 3600) -> bool:
+        """
+        Set multiple values with the same TTL in one pipelined round trip.
+        
+        Args:
+            items: Mapping of cache key to value
+            ttl: Time to live in seconds
+            
+        Returns:
+            bool: True if all values were stored
+        """
+        if not items:
+            return True
+        try:
+            items = {await self._resolve_key(key): value for key, value in items.items()}
+            if self.redis_client:
+                serialized = {key: self.codec.encode(value) for key, value in items.items()}
+                async with self.redis_client.pipeline(transaction=False) as pipe:
+                    for key, value in serialized.items():
+                        pipe.setex(key, ttl, value)
+                    results = await pipe.execute()
+                for (key, value), success in zip(serialized.items(), results):
+                    if success:
+                        self._set_in_l1(key, value, ttl)
+                logger.debug(f"Cached {len(items)} values in Redis (TTL: {ttl}s)")
+                return all(results)
+            else:
+                results = [self._set_in_memory(key, value, ttl) for key, value in items.items()]
+                return all(results)
+        except Exception as e:
+            self.cache_stats["errors"] += 1
+            logger.error(f"Cache set_many error for {len(items)} keys: {e}")
+            return False
+    
     async def delete(self, key: str) -> bool:
         """Delete value from cache."""
         try:
+            key = await self._resolve_key(key)
             if self.redis_client:
-                result = self.redis_client.delete(key)
+                result = await self.redis_client.delete(key)
+                self.l1_cache.delete(key)
+                await self._publish_invalidation({"keys": [key]})
                 logger.debug(f"Deleted from Redis cache: {key}")
                 return bool(result)
             else:
-                if key in self.memory_cache:
-                    del self.memory_cache[key]
+                if self.memory_cache.delete(key):
                     logger.debug(f"Deleted from memory cache: {key}")
                 return True
                 
@@ -142,20 +671,44 @@ class CacheManager:
             return False
     
     async def clear_pattern(self, pattern: str) -> int:
-        """Clear cache entries matching pattern."""
+        """
+        Delete cache entries matching a glob pattern.
+        
+        Redis keys are found with incremental SCAN and removed with UNLINK in
+        batches of CACHE_SCAN_BATCH_SIZE, so Redis is never blocked walking the
+        whole keyspace. Prefer invalidate_namespace() when entries only need to
+        stop being served; use this to reclaim memory immediately.
+        
+        Args:
+            pattern: Glob pattern (e.g. ``ai_cache:*:answer_analysis:*``)
+            
+        Returns:
+            int: Number of entries deleted
+        """
         try:
             if self.redis_client:
-                keys = self.redis_client.keys(pattern)
-                if keys:
-                    deleted = self.redis_client.delete(*keys)
-                    logger.info(f"Cleared {deleted} Redis cache entries matching: {pattern}")
-                    return deleted
-                return 0
+                self._invalidate_l1_pattern(pattern)
+                await self._publish_invalidation({"pattern": pattern})
+                deleted = 0
+                batch = []
+                async for key in self.redis_client.scan_iter(match=pattern, count=self.scan_batch_size):
+                    if isinstance(key, bytes):
+                        key = key.decode("utf-8")
+                    if key.startswith(NAMESPACE_GENERATION_PREFIX):
+                        continue
+                    batch.append(key)
+                    if len(batch) >= self.scan_batch_size:
+                        deleted += await self.redis_client.unlink(*batch)
+                        batch = []
+                if batch:
+                    deleted += await self.redis_client.unlink(*batch)
+                logger.info(f"Cleared {deleted} Redis cache entries matching: {pattern}")
+                return deleted
             else:
                 # Memory cache pattern matching
-                keys_to_delete = [k for k in self.memory_cache.keys() if pattern.replace("*", "") in k]
+                keys_to_delete = [k for k in self.memory_cache.keys() if fnmatch.fnmatchcase(k, pattern)]
                 for key in keys_to_delete:
-                    del self.memory_cache[key]
+                    self.memory_cache.delete(key)
                 logger.info(f"Cleared {len(keys_to_delete)} memory cache entries matching: {pattern}")
                 return len(keys_to_delete)
                 
@@ -163,29 +716,131 @@ class CacheManager:
             logger.error(f"Cache clear pattern error for {pattern}: {e}")
             return 0
     
+    async def _publish_invalidation(self, message: Dict[str, Any]):
+        """Tell other workers to drop L1 entries (best effort)."""
+        if not self.l1_enabled:
+            return
+        try:
+            await self.redis_client.publish(
+                self.invalidation_channel,
+                json.dumps({"origin": self.instance_id, **message})
+            )
+            self.cache_stats["invalidations_sent"] += 1
+        except Exception as e:
+            logger.warning(f"Failed to publish cache invalidation: {e}")
+    
+    def _invalidate_l1_pattern(self, pattern: str) -> int:
+        """Drop L1 entries whose keys match a glob pattern."""
+        matching = [k for k in self.l1_cache.keys() if fnmatch.fnmatchcase(k, pattern)]
+        for key in matching:
+            self.l1_cache.delete(key)
+        return len(matching)
+    
+    def _apply_invalidation(self, data: str):
+        """Apply an invalidation message received from another worker."""
+        try:
+            message = json.loads(data)
+        except (TypeError, ValueError):
+            logger.warning(f"Ignoring malformed cache invalidation message: {data!r}")
+            return
+        if message.get("origin") == self.instance_id:
+            return
+        self.cache_stats["invalidations_received"] += 1
+        for key in message.get("keys", []):
+            self.l1_cache.delete(key)
+        if message.get("namespace"):
+            namespace = message["namespace"]
+            current = self._namespace_generations.get(namespace, (0, 0.0))[0]
+            self._namespace_generations[namespace] = (max(current, message.get("generation", 0)), time.time())
+        if message.get("pattern"):
+            self._invalidate_l1_pattern(message["pattern"])
+    
+    async def _listen_for_invalidations(self):
+        """Subscribe to the invalidation channel until cancelled, resubscribing after errors."""
+        while self.redis_client:
+            pubsub = None
+            try:
+                pubsub = self.redis_client.pubsub()
+                await pubsub.subscribe(self.invalidation_channel)
+                logger.info(f"✅ Listening for cache invalidations on '{self.invalidation_channel}'")
+                while True:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message and message.get("type") == "message":
+                        self._apply_invalidation(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Messages may have been missed while disconnected
+                logger.warning(f"Cache invalidation listener error, clearing L1: {e}")
+                self.l1_cache.clear()
+                await asyncio.sleep(1.0)
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.aclose()
+                    except Exception:
+                        pass
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
         total_requests = self.cache_stats["hits"] + self.cache_stats["misses"]
         hit_rate = (self.cache_stats["hits"] / total_requests * 100) if total_requests > 0 else 0
         
-        return {
+        stats = {
             "backend": "redis" if self.redis_client else "memory",
             "hits": self.cache_stats["hits"],
             "misses": self.cache_stats["misses"],
             "errors": self.cache_stats["errors"],
             "hit_rate": round(hit_rate, 2),
             "total_requests": total_requests,
-            "memory_cache_size": len(self.memory_cache) if not self.redis_client else 0
+            "memory_cache_size": len(self.memory_cache) if not self.redis_client else 0,
+            "namespace_generations": {
+                namespace: generation for namespace, (generation, _) in self._namespace_generations.items()
+            }
         }
+        if self.redis_client:
+            l1_stats = self.l1_cache.get_stats()
+            stats.update({
+                "l1_enabled": self.l1_enabled,
+                "l1_hits": self.cache_stats["l1_hits"],
+                "l1_size": l1_stats["entries"],
+                "l1_bytes": l1_stats["resident_bytes"],
+                "invalidations_sent": self.cache_stats["invalidations_sent"],
+                "invalidations_received": self.cache_stats["invalidations_received"],
+                "codec": self.codec.get_stats()
+            })
+        else:
+            memory_stats = self.memory_cache.get_stats()
+            stats.update({
+                "memory_cache_bytes": memory_stats["resident_bytes"],
+                "memory_cache_max_entries": memory_stats["max_entries"],
+                "memory_cache_max_bytes": memory_stats["max_bytes"],
+                "evictions": memory_stats["evictions"],
+                "expirations": memory_stats["expirations"],
+                "rejected": memory_stats["rejected"]
+            })
+        return stats
     
     def reset_stats(self):
         """Reset cache statistics."""
-        self.cache_stats = {"hits": 0, "misses": 0, "errors": 0}
+        self.cache_stats = {
+            "hits": 0,
+            "misses": 0,
+            "errors": 0,
+            "l1_hits": 0,
+            "invalidations_sent": 0,
+            "invalidations_received": 0
+        }
+        self.codec.reset_stats()
         logger.info("Cache statistics reset")
 
 # Global cache manager instance
 cache_manager = CacheManager()
 
+def normalize_cache_text(value: Optional[str]) -> str:
+    """Normalize text for content-addressed cache keys (case-folded, whitespace collapsed)."""
+    return " ".join((value or "").split()).casefold()
+
 def _generate_cache_key(operation: str, cache_key_params: Optional[list], args: tuple, kwargs: dict) -> str:
     """Extract cache key generation logic to avoid duplication."""
     cache_key_kwargs = {}
@@ -209,17 +864,91 @@ def _generate_cache_key(operation: str, cache_key_params: Optional[list], args:
         **cache_key_kwargs
     )
 
-def cached(operation: str, ttl: int = 3600, cache_key_params: Optional[list] = None):
+# Marker key for values stored with stale-while-revalidate metadata
+_SWR_MARKER = "__cached_swr__"
+
+# Coalesces concurrent misses for the same key in @cached functions
+_miss_flight = SingleFlight("cached")
+
+# cache key -> background refresh task (one refresh per key at a time)
+_refresh_tasks: Dict[str, asyncio.Task] = {}
+
+
+def _wrap_swr(value: Any, ttl: int, compute_time: float) -> Dict[str, Any]:
+    """Wrap a value with its freshness deadline and recompute cost."""
+    return {
+        _SWR_MARKER: 1,
+        "value": value,
+        "fresh_until": time.time() + ttl,
+        "compute_time": compute_time
+    }
+
+
+def _should_refresh(entry: Dict[str, Any], early_refresh_beta: float) -> bool:
+    """
+    Decide whether a cached entry should be recomputed.
+    
+    Stale entries always refresh. Fresh entries refresh early with a probability
+    that rises as expiry approaches and with the cost of recomputing (XFetch:
+    ``now - compute_time * beta * ln(rand) >= fresh_until``), which spreads
+    refreshes of hot keys out instead of having them all expire at once.
+    """
+    now = time.time()
+    if now >= entry["fresh_until"]:
+        return True
+    if early_refresh_beta <= 0:
+        return False
+    gap = -entry.get("compute_time", 0.0) * early_refresh_beta * math.log(1.0 - random.random())
+    return now + gap >= entry["fresh_until"]
+
+
+def cached(
+    operation: str,
+    ttl: int = 3600,
+    cache_key_params: Optional[list] = None,
+    stale_ttl: int = 0,
+    early_refresh_beta: float = 0.0
+):
     """
     Cache decorator for AI service methods.
     
+    With ``stale_ttl`` or ``early_refresh_beta`` set (async functions only),
+    entries are kept for ``ttl + stale_ttl`` seconds. Once an entry is past
+    ``ttl``, or is chosen for probabilistic early refresh, callers still get the
+    cached value immediately and a single background task recomputes it. Only a
+    hard miss makes the caller wait, and concurrent misses for the same key
+    share one computation.
+    
     Args:
         operation: Operation name for cache key generation
         ttl: Time to live in seconds
         cache_key_params: List of parameter names to include in cache key
+        stale_ttl: Grace window in seconds during which stale values are served while refreshing
+        early_refresh_beta: Early refresh aggressiveness (0 disables, 1 is typical)
     """
+    swr_enabled = stale_ttl > 0 or early_refresh_beta > 0
+    
     def decorator(func):
-        import asyncio
+        
+        async def compute_and_store(cache_key: str, args: tuple, kwargs: dict) -> Any:
+            start = time.monotonic()
+            result = await func(*args, **kwargs)
+            if swr_enabled:
+                entry = _wrap_swr(result, ttl, time.monotonic() - start)
+                await cache_manager.set(cache_key, entry, ttl + stale_ttl)
+            else:
+                await cache_manager.set(cache_key, result, ttl)
+            return result
+        
+        async def refresh_in_background(cache_key: str, args: tuple, kwargs: dict):
+            try:
+                await compute_and_store(cache_key, args, kwargs)
+                logger.info(f"Background refresh completed for {operation}")
+            except Exception as e:
+                # Keep serving the stale value until it expires
+                logger.warning(f"Background refresh failed for {operation}: {e}")
+            finally:
+                _refresh_tasks.pop(cache_key, None)
         
         @wraps(func)
         async def async_wrapper(*args, **kwargs):
@@ -227,13 +956,23 @@ def cached(operation: str, ttl: int = 3600, cache_key_params: Optional[list] = N
             
             # Try to get from cache
             cached_result = await cache_manager.get(cache_key)
+            if isinstance(cached_result, dict) and _SWR_MARKER in cached_result:
+                if _should_refresh(cached_result, early_refresh_beta) and cache_key not in _refresh_tasks:
+                    stale = time.time() >= cached_result["fresh_until"]
+                    logger.info(f"Cache {'stale' if stale else 'early refresh'} for {operation}, refreshing in background")
+                    _refresh_tasks[cache_key] = asyncio.create_task(
+                        refresh_in_background(cache_key, args, kwargs)
+                    )
+                cache_metrics.record_request(operation, hit=True)
+                return cached_result["value"]
             if cached_result is not None:
                 logger.info(f"Cache hit for {operation}")
+                cache_metrics.record_request(operation, hit=True)
                 return cached_result
             
             # Execute function and cache result
-            result = await func(*args, **kwargs)
-            await cache_manager.set(cache_key, result, ttl)
+            cache_metrics.record_request(operation, hit=False)
+            result = await _miss_flight.do(cache_key, lambda: compute_and_store(cache_key, args, kwargs))
             logger.info(f"Cache miss for {operation}, result cached (TTL: {ttl}s)")
             return result
         
@@ -241,24 +980,18 @@ def cached(operation: str, ttl: int = 3600, cache_key_params: Optional[list] = N
         def sync_wrapper(*args, **kwargs):
             cache_key = _generate_cache_key(operation, cache_key_params, args, kwargs)
             
-            # Try to get from cache
-            try:
-                loop = asyncio.get_event_loop()
-                cached_result = loop.run_until_complete(cache_manager.get(cache_key))
-                if cached_result is not None:
-                    logger.info(f"Cache hit for {operation}")
-                    return cached_result
-            except Exception as e:
-                logger.warning(f"Cache get error in sync wrapper: {e}")
+            # Blocking cache calls work both inside and outside a running event loop
+            cached_result = cache_manager.get_sync(cache_key)
+            if cached_result is not None:
+                logger.info(f"Cache hit for {operation}")
+                cache_metrics.record_request(operation, hit=True)
+                return cached_result
             
             # Execute function and cache result
+            cache_metrics.record_request(operation, hit=False)
             result = func(*args, **kwargs)
-            try:
-                loop = asyncio.get_event_loop()
-                loop.run_until_complete(cache_manager.set(cache_key, result, ttl))
+            if cache_manager.set_sync(cache_key, result, ttl):
                 logger.info(f"Cache miss for {operation}, result cached (TTL: {ttl}s)")
-            except Exception as e:
-                logger.warning(f"Cache set error in sync wrapper: {e}")
             
             return result
         
@@ -310,7 +1043,13 @@ class CacheMetrics:
                 "cache_errors": self.metrics["cache_errors"],
                 "hit_rate": round(hit_rate, 2)
             },
-            "by_operation": self.metrics["operation_stats"],
+            "by_operation": {
+                operation: {
+                    **op_stats,
+                    "hit_rate": round(op_stats["hits"] / op_stats["requests"] * 100, 2) if op_stats["requests"] else 0
+                }
+                for operation, op_stats in self.metrics["operation_stats"].items()
+            },
             "cache_backend": cache_manager.get_stats()
         }
     
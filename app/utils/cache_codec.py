@@ -0,0 +1,191 @@
+"""
+Cache value codecs.
+
+Encodes cache values for the Redis backend as a one-byte header followed by
+the payload. The header records the serializer (msgpack or JSON) and the
+compression (none, zlib or zstd) used, so codecs can change without
+invalidating the cache. Entries written before codecs existed are plain JSON
+text, which never starts with a header byte, and still decode.
+"""
+import json
+import time
+import zlib
+from typing import Any, Dict, Tuple, Union
+
+# Optional codec imports - fall back to JSON / zlib if not installed
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    msgpack = None
+    MSGPACK_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+SERIALIZERS = ("json", "msgpack")
+COMPRESSIONS = ("none", "zlib", "zstd")
+
+# (serializer, compression) <-> header byte. JSON text never starts with 0x01-0x06.
+_HEADERS: Dict[Tuple[str, str], int] = {
+    (serializer, compression): 1 + i * len(COMPRESSIONS) + j
+    for i, serializer in enumerate(SERIALIZERS)
+    for j, compression in enumerate(COMPRESSIONS)
+}
+_CODECS_BY_HEADER: Dict[int, Tuple[str, str]] = {header: codec for codec, header in _HEADERS.items()}
+
+
+class CacheCodec:
+    """
+    Serializes cache values, compressing payloads above a size threshold.
+
+    Compression is only kept when it makes the payload smaller. Unavailable
+    optional libraries degrade gracefully: msgpack falls back to JSON and zstd
+    to zlib.
+    """
+
+    def __init__(
+        self,
+        serializer: str = "msgpack",
+        compression: str = "zstd",
+        compression_threshold: int = 1024,
+        compression_level: int = 3
+    ):
+        if serializer not in SERIALIZERS:
+            raise ValueError(f"Unknown cache serializer: {serializer}")
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unknown cache compression: {compression}")
+
+        if serializer == "msgpack" and not MSGPACK_AVAILABLE:
+            logger.warning("msgpack not installed, cache values will be serialized as JSON")
+            serializer = "json"
+        if compression == "zstd" and not ZSTD_AVAILABLE:
+            logger.warning("zstandard not installed, cache values will be compressed with zlib")
+            compression = "zlib"
+
+        self.serializer = serializer
+        self.compression = compression
+        self.compression_threshold = compression_threshold
+        self.compression_level = compression_level
+        self._zstd_compressor = zstandard.ZstdCompressor(level=compression_level) if compression == "zstd" else None
+        self._zstd_decompressor = zstandard.ZstdDecompressor() if ZSTD_AVAILABLE else None
+        self.stats: Dict[str, Dict[str, float]] = {}
+
+    def encode(self, value: Any) -> bytes:
+        """
+        Encode a value for storage.
+
+        Args:
+            value: JSON/msgpack-serializable value (other objects are stored as ``str``)
+
+        Returns:
+            bytes: Header byte followed by the (possibly compressed) payload
+        """
+        start = time.perf_counter()
+        payload = self._serialize(value)
+        raw_size = len(payload)
+
+        compression = "none"
+        if self.compression != "none" and raw_size >= self.compression_threshold:
+            compressed = self._compress(payload)
+            if len(compressed) < raw_size:
+                payload = compressed
+                compression = self.compression
+
+        data = bytes([_HEADERS[(self.serializer, compression)]]) + payload
+        self._record(self.serializer, compression, "encode", time.perf_counter() - start, raw_size, len(data))
+        return data
+
+    def decode(self, data: Union[bytes, str]) -> Any:
+        """
+        Decode a stored value, including legacy plain-JSON entries.
+
+        Args:
+            data: Stored bytes (or text)
+
+        Returns:
+            Decoded value
+        """
+        start = time.perf_counter()
+        if isinstance(data, str) or not data or data[0] not in _CODECS_BY_HEADER:
+            value = json.loads(data)
+            self._record("json", "legacy", "decode", time.perf_counter() - start, len(data), len(data))
+            return value
+
+        serializer, compression = _CODECS_BY_HEADER[data[0]]
+        payload = self._decompress(data[1:], compression)
+        value = self._deserialize(payload, serializer)
+        self._record(serializer, compression, "decode", time.perf_counter() - start, len(payload), len(data))
+        return value
+
+    def _serialize(self, value: Any) -> bytes:
+        if self.serializer == "msgpack":
+            return msgpack.packb(value, default=str, use_bin_type=True)
+        return json.dumps(value, default=str).encode("utf-8")
+
+    def _deserialize(self, payload: bytes, serializer: str) -> Any:
+        if serializer == "msgpack":
+            if not MSGPACK_AVAILABLE:
+                raise ValueError("Cache entry is msgpack-encoded but msgpack is not installed")
+            return msgpack.unpackb(payload, raw=False, strict_map_key=False)
+        return json.loads(payload)
+
+    def _compress(self, payload: bytes) -> bytes:
+        if self.compression == "zstd":
+            return self._zstd_compressor.compress(payload)
+        return zlib.compress(payload, self.compression_level)
+
+    def _decompress(self, payload: bytes, compression: str) -> bytes:
+        if compression == "zstd":
+            if self._zstd_decompressor is None:
+                raise ValueError("Cache entry is zstd-compressed but zstandard is not installed")
+            return self._zstd_decompressor.decompress(payload)
+        if compression == "zlib":
+            return zlib.decompress(payload)
+        return payload
+
+    def _record(self, serializer: str, compression: str, op: str, elapsed: float, raw_size: int, stored_size: int):
+        """Record per-codec sizes and latency."""
+        name = serializer if compression == "none" else f"{serializer}+{compression}"
+        stats = self.stats.setdefault(name, {
+            "encoded": 0, "decoded": 0,
+            "encode_time": 0.0, "decode_time": 0.0,
+            "raw_bytes": 0, "stored_bytes": 0
+        })
+        stats[f"{op}d"] += 1
+        stats[f"{op}_time"] += elapsed
+        if op == "encode":
+            stats["raw_bytes"] += raw_size
+            stats["stored_bytes"] += stored_size
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-codec size and latency statistics."""
+        codecs = {}
+        for name, stats in self.stats.items():
+            codecs[name] = {
+                "encoded": stats["encoded"],
+                "decoded": stats["decoded"],
+                "raw_bytes": stats["raw_bytes"],
+                "stored_bytes": stats["stored_bytes"],
+                "compression_ratio": round(stats["raw_bytes"] / stats["stored_bytes"], 2) if stats["stored_bytes"] else None,
+                "avg_encode_ms": round(stats["encode_time"] / stats["encoded"] * 1000, 3) if stats["encoded"] else None,
+                "avg_decode_ms": round(stats["decode_time"] / stats["decoded"] * 1000, 3) if stats["decoded"] else None
+            }
+        return {
+            "serializer": self.serializer,
+            "compression": self.compression,
+            "compression_threshold": self.compression_threshold,
+            "codecs": codecs
+        }
+
+    def reset_stats(self):
+        """Reset codec statistics."""
+        self.stats = {}
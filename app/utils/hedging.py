@@ -0,0 +1,255 @@
+"""
+Request hedging for latency-sensitive AI service calls.
+
+A hedged call starts the primary request and, if it has not completed after a
+delay derived from recent latency (a configurable percentile), fires a duplicate
+request and returns whichever succeeds first. A global token-bucket budget caps
+how many hedges are sent relative to primary traffic so load cannot double.
+"""
+import asyncio
+import bisect
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, Optional
+from app.config import get_settings
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Histogram bucket upper bounds in seconds (mirrors ai_service_duration_seconds)
+LATENCY_BUCKETS = [0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0, float("inf")]
+
+
+class LatencyHistogram:
+    """
+    Latency histogram for a single operation.
+
+    Keeps cumulative bucket counts for reporting plus a sliding window of
+    recent samples used to compute percentiles for the hedge delay.
+    """
+
+    def __init__(self, window_size: int = 500):
+        self.window: deque = deque(maxlen=window_size)
+        self.bucket_counts = [0] * len(LATENCY_BUCKETS)
+        self.count = 0
+        self.total = 0.0
+
+    def record(self, duration: float):
+        """Record a completed request duration in seconds."""
+        self.window.append(duration)
+        self.bucket_counts[bisect.bisect_left(LATENCY_BUCKETS, duration)] += 1
+        self.count += 1
+        self.total += duration
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Get the given percentile (0-100) of the recent window, or None if empty."""
+        if not self.window:
+            return None
+        ordered = sorted(self.window)
+        index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+        return ordered[index]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get histogram snapshot with recent percentiles."""
+        def _round(value: Optional[float]) -> Optional[float]:
+            return round(value, 4) if value is not None else None
+
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count, 4) if self.count else 0.0,
+            "p50": _round(self.percentile(50)),
+            "p95": _round(self.percentile(95)),
+            "p99": _round(self.percentile(99)),
+            "window_size": len(self.window),
+            "buckets": {
+                ("+Inf" if bound == float("inf") else str(bound)): count
+                for bound, count in zip(LATENCY_BUCKETS, self.bucket_counts)
+            }
+        }
+
+
+class HedgeBudget:
+    """
+    Token bucket limiting hedged requests to a fraction of primary requests.
+
+    Every primary request deposits ``ratio`` tokens (capped at ``max_tokens``);
+    each hedge spends one token.
+    """
+
+    def __init__(self, ratio: float = 0.1, max_tokens: float = 10.0):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self.tokens = max_tokens
+
+    def deposit(self):
+        """Credit the budget for one primary request."""
+        self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        """Spend one token for a hedge. Returns False if the budget is exhausted."""
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True
+        return False
+
+
+class RequestHedger:
+    """
+    Runs async calls with optional hedging and records per-operation latency.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        min_samples: int = 20,
+        min_delay: float = 0.05,
+        budget_ratio: float = 0.1,
+        budget_max_tokens: float = 10.0,
+        window_size: int = 500
+    ):
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.window_size = window_size
+        self.budget = HedgeBudget(ratio=budget_ratio, max_tokens=budget_max_tokens)
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self.stats = {
+            "requests": 0,
+            "hedged": 0,
+            "hedge_wins": 0,
+            "budget_exhausted": 0
+        }
+
+    def _get_histogram(self, operation: str) -> LatencyHistogram:
+        if operation not in self.histograms:
+            self.histograms[operation] = LatencyHistogram(self.window_size)
+        return self.histograms[operation]
+
+    def record_latency(self, operation: str, duration: float):
+        """Record a successful request duration for an operation."""
+        self._get_histogram(operation).record(duration)
+
+    def get_hedge_delay(self, operation: str) -> Optional[float]:
+        """
+        Get the delay before sending a hedge for an operation.
+
+        Returns None until enough samples have been collected to tune the delay.
+        """
+        histogram = self.histograms.get(operation)
+        if not histogram or len(histogram.window) < self.min_samples:
+            return None
+        return max(self.min_delay, histogram.percentile(self.percentile))
+
+    async def _timed(self, operation: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Run a single attempt and record its latency on success."""
+        start_time = time.monotonic()
+        result = await call()
+        self.record_latency(operation, time.monotonic() - start_time)
+        return result
+
+    async def run(
+        self,
+        operation: str,
+        call: Callable[[], Awaitable[Any]],
+        hedge: bool = True
+    ) -> Any:
+        """
+        Run ``call`` with hedging.
+
+        Args:
+            operation: Operation name used for latency tracking
+            call: Zero-argument coroutine factory; invoked again for the hedge
+            hedge: If False, only record latency (no duplicate request is sent)
+
+        Returns:
+            Result of the first successful attempt
+        """
+        self.stats["requests"] += 1
+        delay = None
+        if hedge:
+            self.budget.deposit()
+            delay = self.get_hedge_delay(operation)
+
+        primary = asyncio.ensure_future(self._timed(operation, call))
+        tasks = [primary]
+        pending = {primary}
+        try:
+            if delay is None:
+                return await primary
+
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if done:
+                return primary.result()
+
+            if not self.budget.try_spend():
+                self.stats["budget_exhausted"] += 1
+                return await primary
+
+            self.stats["hedged"] += 1
+            logger.debug(f"Hedging {operation} after {delay:.3f}s")
+            hedge_task = asyncio.ensure_future(self._timed(operation, call))
+            tasks.append(hedge_task)
+            pending.add(hedge_task)
+
+            last_error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge_task:
+                            self.stats["hedge_wins"] += 1
+                        return task.result()
+                    last_error = task.exception()
+            raise last_error
+        finally:
+            for task in pending:
+                if not task.done():
+                    task.cancel()
+            # Wait for cancelled losers and retrieve every attempt's outcome so a
+            # failed loser does not log "Task exception was never retrieved"
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hedging statistics and per-operation latency histograms."""
+        return {
+            **self.stats,
+            "budget_tokens": round(self.budget.tokens, 2),
+            "percentile": self.percentile,
+            "hedge_delays": {
+                operation: self.get_hedge_delay(operation)
+                for operation in self.histograms
+            },
+            "latency": {
+                operation: histogram.get_stats()
+                for operation, histogram in self.histograms.items()
+            }
+        }
+
+    def reset_stats(self):
+        """Reset statistics and latency histograms."""
+        self.histograms = {}
+        self.stats = {"requests": 0, "hedged": 0, "hedge_wins": 0, "budget_exhausted": 0}
+
+
+# Global hedger instance (the hedge budget is shared across all callers)
+_request_hedger: Optional[RequestHedger] = None
+
+
+def get_request_hedger() -> RequestHedger:
+    """
+    Get the global request hedger configured from settings.
+
+    Returns:
+        RequestHedger: Request hedger instance
+    """
+    global _request_hedger
+    if _request_hedger is None:
+        settings = get_settings()
+        _request_hedger = RequestHedger(
+            percentile=settings.AI_SERVICE_HEDGE_PERCENTILE,
+            min_samples=settings.AI_SERVICE_HEDGE_MIN_SAMPLES,
+            min_delay=settings.AI_SERVICE_HEDGE_MIN_DELAY,
+            budget_ratio=settings.AI_SERVICE_HEDGE_BUDGET_RATIO,
+            budget_max_tokens=settings.AI_SERVICE_HEDGE_BUDGET_MAX_TOKENS
+        )
+    return _request_hedger
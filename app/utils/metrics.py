@@ -100,6 +100,29 @@ class MetricsCollector:
             ['operation'],
             buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, float('inf')]
         )
+        
+        # File cleanup metrics
+        self.file_cleanup_files = Counter(
+            'file_cleanup_files_total',
+            'Expired upload files processed by the cleanup worker',
+            ['result']
+        )
+        
+        self.file_cleanup_bytes = Counter(
+            'file_cleanup_bytes_freed_total',
+            'Bytes freed by deleting expired upload files'
+        )
+        
+        self.file_cleanup_batch_duration = Histogram(
+            'file_cleanup_batch_duration_seconds',
+            'Duration of one file cleanup batch in seconds',
+            buckets=[0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float('inf')]
+        )
+        
+        self.file_cleanup_last_run = Gauge(
+            'file_cleanup_last_run_timestamp_seconds',
+            'Unix time the last file cleanup run finished'
+        )
     
     def record_request(self, method: str, endpoint: str, status_code: int, duration: float):
         """Record API request metrics."""
@@ -165,6 +188,17 @@ class MetricsCollector:
             operation=operation
         ).observe(duration)
     
+    def record_file_cleanup_batch(self, deleted: int, failed: int, bytes_freed: int, duration: float):
+        """Record one batch of expired file cleanup."""
+        self.file_cleanup_files.labels(result="deleted").inc(deleted)
+        self.file_cleanup_files.labels(result="failed").inc(failed)
+        self.file_cleanup_bytes.inc(bytes_freed)
+        self.file_cleanup_batch_duration.observe(duration)
+    
+    def record_file_cleanup_run(self):
+        """Record the end of a file cleanup run."""
+        self.file_cleanup_last_run.set_to_current_time()
+    
     def set_active_connections(self, count: int):
         """Set active connections count."""
         self.active_connections.set(count)
@@ -0,0 +1,393 @@
+"""
+Singleflight request coalescing.
+
+Concurrent callers asking for the same key share a single in-flight execution:
+the first caller runs the work and every duplicate that arrives before it
+finishes awaits the same result (or exception). DistributedSingleFlight extends
+this across worker processes with a Redis lock.
+"""
+import asyncio
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class _LeaderCancelled(Exception):
+    """Raised to waiters when the leading call was cancelled before finishing."""
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent async calls that share a key.
+
+    Only calls that overlap in time are coalesced; once the leading call
+    completes the key is released and the next caller executes again. Pair with
+    a result cache to absorb near-simultaneous repeats.
+    """
+
+    def __init__(self, name: str = "default"):
+        self.name = name
+        # Maps key -> future resolved by the leading caller
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._lock = asyncio.Lock()
+        self.stats = {
+            "executions": 0,
+            "shared": 0,  # Calls that waited on an in-flight execution
+            "errors": 0,
+            "leader_cancelled": 0  # Leaders cancelled before finishing; waiters retry
+        }
+
+    async def do(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[Any]],
+        on_wait: Optional[Callable[[], None]] = None
+    ) -> Any:
+        """
+        Run ``fn`` for ``key`` unless an identical call is already in flight.
+
+        If the leading caller is cancelled (e.g. its client disconnected), its
+        work is cancelled with it and the waiting callers retry: one of them
+        becomes the new leader and runs its own ``fn``.
+
+        Args:
+            key: Coalescing key
+            fn: Zero-argument coroutine factory performing the work
+            on_wait: Optional callback invoked when this call joins an in-flight execution
+
+        Returns:
+            Result of the shared execution (exceptions propagate to every waiter)
+        """
+        joined = False
+        while True:
+            async with self._lock:
+                future = self._in_flight.get(key)
+                if future is not None and not future.done():
+                    if not joined:
+                        joined = True
+                        self.stats["shared"] += 1
+                        if on_wait:
+                            on_wait()
+                    logger.debug(f"Singleflight[{self.name}]: waiting for in-flight key {key[:32]}...")
+                    leader = False
+                else:
+                    future = asyncio.get_running_loop().create_future()
+                    self._in_flight[key] = future
+                    leader = True
+
+            if leader:
+                return await self._lead(key, future, fn)
+            try:
+                # Shield so a cancelled waiter does not cancel the shared future
+                return await asyncio.shield(future)
+            except _LeaderCancelled:
+                logger.debug(f"Singleflight[{self.name}]: leader cancelled, retrying key {key[:32]}...")
+
+    async def _lead(self, key: str, future: asyncio.Future, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Run the work for ``key`` and resolve the shared future with its outcome."""
+        self.stats["executions"] += 1
+        try:
+            result = await fn()
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            # Waiters were not cancelled themselves; hand them a retryable error
+            self.stats["leader_cancelled"] += 1
+            future.set_exception(_LeaderCancelled())
+            future.exception()
+            raise
+        except Exception as e:
+            self.stats["errors"] += 1
+            future.set_exception(e)
+            # Mark the exception retrieved so an unawaited future does not log
+            # "Future exception was never retrieved" when there are no waiters
+            future.exception()
+            raise
+        finally:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+
+    @property
+    def in_flight_count(self) -> int:
+        """Number of keys currently executing."""
+        return len(self._in_flight)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get singleflight statistics."""
+        return {
+            **self.stats,
+            "in_flight_count": self.in_flight_count
+        }
+
+    def reset_stats(self):
+        """Reset singleflight statistics."""
+        self.stats = {"executions": 0, "shared": 0, "errors": 0, "leader_cancelled": 0}
+
+
+# Deletes the lock only if it is still held by the caller's token
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+class DistributedSingleFlight(SingleFlight):
+    """
+    Singleflight that also coalesces calls across worker processes via Redis.
+
+    Calls are first coalesced in-process. The local leader then takes a Redis
+    lock (``SET NX`` with a short lease): the worker that gets it runs the work,
+    while other workers wait for a completion notice on a pub/sub channel and
+    poll ``fetch_result`` (typically a shared cache read) until the result
+    appears. Each process holds a single subscription to the completion channel
+    while it has waiters, and wakes the waiters for the completed key, so a
+    burst of waiters does not take one pooled connection each. If the lock is
+    released without a result (the leader failed) a waiter takes over; if
+    nothing arrives within ``wait_timeout`` the waiter runs the work itself.
+    The lease only bounds how long a crashed leader blocks others - work that
+    outlives it may run twice, never zero times.
+
+    Without a Redis client (or a ``fetch_result`` callback) it behaves exactly
+    like SingleFlight, so the memory cache backend and tests need no Redis.
+    """
+
+    def __init__(
+        self,
+        name: str = "default",
+        get_redis: Optional[Callable[[], Any]] = None,
+        lease: float = 45.0,
+        wait_timeout: float = 60.0,
+        poll_interval: float = 0.25
+    ):
+        """
+        Initialize distributed singleflight.
+
+        Args:
+            name: Name used in lock keys, channels and logs
+            get_redis: Callable returning the shared ``redis.asyncio`` client, or None
+            lease: Lock expiry in seconds
+            wait_timeout: Maximum seconds a worker waits for another worker's result
+            poll_interval: Seconds between result checks while waiting
+        """
+        super().__init__(name)
+        self.get_redis = get_redis
+        self.lease = lease
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+        self.distributed_stats = self._empty_distributed_stats()
+        # Waiters for other workers' results, woken by the shared completion listener
+        self._remote_waiters: Dict[str, Set[asyncio.Event]] = {}
+        self._listener: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def _empty_distributed_stats() -> Dict[str, int]:
+        return {
+            "locks_acquired": 0,
+            "remote_waits": 0,  # Calls that waited on another worker
+            "remote_hits": 0,  # Calls served by another worker's result
+            "takeovers": 0,  # Lock released without a result; this worker ran the work
+            "wait_timeouts": 0,
+            "lock_errors": 0
+        }
+
+    async def do(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[Any]],
+        on_wait: Optional[Callable[[], None]] = None,
+        fetch_result: Optional[Callable[[], Awaitable[Any]]] = None
+    ) -> Any:
+        """
+        Run ``fn`` for ``key`` unless an identical call is in flight in any worker.
+
+        Args:
+            key: Coalescing key
+            fn: Zero-argument coroutine factory performing the work (and publishing
+                its result where ``fetch_result`` can read it)
+            on_wait: Optional callback invoked when this call joins an in-process execution
+            fetch_result: Coroutine factory returning another worker's result, or None
+                if it is not available yet
+
+        Returns:
+            Result of the shared execution
+        """
+        redis_client = self.get_redis() if self.get_redis else None
+        if redis_client is None or fetch_result is None:
+            return await super().do(key, fn, on_wait=on_wait)
+        return await super().do(
+            key,
+            lambda: self._do_distributed(redis_client, key, fn, fetch_result),
+            on_wait=on_wait
+        )
+
+    def _lock_key(self, key: str) -> str:
+        return f"singleflight:{self.name}:lock:{key}"
+
+    def _channel(self) -> str:
+        return f"singleflight:{self.name}:done"
+
+    async def _do_distributed(
+        self,
+        redis_client: Any,
+        key: str,
+        fn: Callable[[], Awaitable[Any]],
+        fetch_result: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Run ``fn`` under the Redis lock, or wait for the worker holding it."""
+        lock_key = self._lock_key(key)
+        token = uuid.uuid4().hex
+        deadline = time.monotonic() + self.wait_timeout
+        event = None
+        try:
+            while True:
+                try:
+                    acquired = await redis_client.set(lock_key, token, nx=True, ex=max(1, int(self.lease)))
+                except Exception as e:
+                    # Redis trouble must not block synthesis; fall back to local-only coalescing
+                    self.distributed_stats["lock_errors"] += 1
+                    logger.warning(f"Singleflight[{self.name}]: lock unavailable, running locally: {e}")
+                    return await fn()
+
+                if acquired:
+                    self.distributed_stats["locks_acquired"] += 1
+                    return await self._run_as_leader(redis_client, key, lock_key, token, fn)
+
+                if event is None:
+                    self.distributed_stats["remote_waits"] += 1
+                    logger.debug(f"Singleflight[{self.name}]: waiting for another worker on key {key[:32]}...")
+                    event = self._add_remote_waiter(redis_client, key)
+
+                result = await self._wait_for_remote(redis_client, lock_key, event, fetch_result, deadline)
+                if result is not None:
+                    self.distributed_stats["remote_hits"] += 1
+                    return result
+                if time.monotonic() >= deadline:
+                    self.distributed_stats["wait_timeouts"] += 1
+                    logger.warning(
+                        f"Singleflight[{self.name}]: no result from another worker after "
+                        f"{self.wait_timeout}s, running locally"
+                    )
+                    return await fn()
+                # Lock released without a result - try to take over
+                self.distributed_stats["takeovers"] += 1
+        finally:
+            if event is not None:
+                await self._remove_remote_waiter(key, event)
+
+    async def _run_as_leader(
+        self,
+        redis_client: Any,
+        key: str,
+        lock_key: str,
+        token: str,
+        fn: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Run the work while holding the lock, then release it and notify waiters."""
+        try:
+            return await fn()
+        finally:
+            try:
+                await redis_client.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+                await redis_client.publish(self._channel(), key)
+            except Exception as e:
+                # Waiters fall back to polling and the lease expiry
+                logger.warning(f"Singleflight[{self.name}]: failed to release lock: {e}")
+
+    def _add_remote_waiter(self, redis_client: Any, key: str) -> asyncio.Event:
+        """Register a waiter for ``key``, starting the completion listener if needed."""
+        event = asyncio.Event()
+        self._remote_waiters.setdefault(key, set()).add(event)
+        listener = self._listener
+        if listener is None or listener.done() or listener.get_loop() is not asyncio.get_running_loop():
+            self._listener = asyncio.create_task(self._listen_for_completions(redis_client))
+        return event
+
+    async def _remove_remote_waiter(self, key: str, event: asyncio.Event):
+        """Unregister a waiter; the listener is stopped once nobody waits."""
+        waiters = self._remote_waiters.get(key)
+        if waiters is not None:
+            waiters.discard(event)
+            if not waiters:
+                del self._remote_waiters[key]
+        if not self._remote_waiters and self._listener is not None:
+            # Give the pub/sub connection back to the pool while idle
+            listener, self._listener = self._listener, None
+            listener.cancel()
+            await asyncio.gather(listener, return_exceptions=True)
+
+    async def _listen_for_completions(self, redis_client: Any):
+        """Subscribe to the completion channel and wake the waiters of completed keys until cancelled."""
+        pubsub = None
+        try:
+            pubsub = redis_client.pubsub()
+            await pubsub.subscribe(self._channel())
+            # Also checked between reads: a cancel racing a delivered message can be lost in wait_for
+            while self._listener is asyncio.current_task():
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                if message and message.get("type") == "message":
+                    key = message["data"]
+                    if isinstance(key, bytes):
+                        key = key.decode()
+                    for event in self._remote_waiters.get(key, ()):
+                        event.set()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Waiters keep polling; the next new waiter restarts the listener
+            logger.debug(f"Singleflight[{self.name}]: pub/sub unavailable, polling only: {e}")
+        finally:
+            if pubsub is not None:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+
+    async def _wait_for_remote(
+        self,
+        redis_client: Any,
+        lock_key: str,
+        event: asyncio.Event,
+        fetch_result: Callable[[], Awaitable[Any]],
+        deadline: float
+    ) -> Any:
+        """
+        Wait until another worker's result is available or its lock is gone.
+
+        Returns:
+            The result, or None if the lock was released without one or the deadline passed
+        """
+        while True:
+            result = await fetch_result()
+            if result is not None:
+                return result
+            if not await redis_client.exists(lock_key):
+                # Leader finished; its result may have landed just before the release
+                return await fetch_result()
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            try:
+                # Returns early when the leader publishes its completion notice
+                await asyncio.wait_for(event.wait(), timeout=min(self.poll_interval, remaining))
+            except asyncio.TimeoutError:
+                pass
+            event.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get local and cross-worker singleflight statistics."""
+        return {
+            **super().get_stats(),
+            **self.distributed_stats,
+            "remote_waiting": sum(len(waiters) for waiters in self._remote_waiters.values()),
+            "distributed": self.get_redis is not None and self.get_redis() is not None
+        }
+
+    def reset_stats(self):
+        """Reset singleflight statistics."""
+        super().reset_stats()
+        self.distributed_stats = self._empty_distributed_stats()
@@ -0,0 +1,86 @@
+"""
+Streaming helpers for request bodies.
+
+Builds ``multipart/form-data`` bodies as async byte iterators so large uploads
+(e.g. audio recordings) can be forwarded to downstream services with chunked
+transfer encoding instead of being buffered in memory.
+"""
+import asyncio
+import mimetypes
+import uuid
+from typing import AsyncIterator, Dict, Optional, Tuple
+from app.config import get_settings
+
+settings = get_settings()
+
+
+def _quote_header_value(value: str) -> str:
+    """Escape a value for use inside a quoted Content-Disposition parameter."""
+    return value.replace("\\", "\\\\").replace('"', "%22").replace("\r", "").replace("\n", "")
+
+
+async def iter_file_chunks(file_path: str, chunk_size: Optional[int] = None) -> AsyncIterator[bytes]:
+    """
+    Read a file in chunks without blocking the event loop.
+
+    Args:
+        file_path: Path to the file
+        chunk_size: Chunk size in bytes (defaults to FILE_STREAM_CHUNK_SIZE)
+
+    Yields:
+        File content chunks
+    """
+    chunk_size = chunk_size or settings.FILE_STREAM_CHUNK_SIZE
+    f = await asyncio.to_thread(open, file_path, "rb")
+    try:
+        while True:
+            chunk = await asyncio.to_thread(f.read, chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        await asyncio.to_thread(f.close)
+
+
+def stream_multipart(
+    fields: Dict[str, str],
+    file_field: str,
+    filename: str,
+    chunks: AsyncIterator[bytes],
+    content_type: Optional[str] = None
+) -> Tuple[AsyncIterator[bytes], str]:
+    """
+    Build a streaming multipart/form-data body with one file part.
+
+    Args:
+        fields: Plain form fields sent before the file part
+        file_field: Form field name for the file
+        filename: Filename reported for the file part
+        chunks: Async iterator producing the file content
+        content_type: File MIME type (guessed from filename if not given)
+
+    Returns:
+        Tuple of (body iterator, Content-Type header value)
+    """
+    boundary = uuid.uuid4().hex
+    content_type = content_type or mimetypes.guess_type(filename)[0] or "application/octet-stream"
+
+    async def body() -> AsyncIterator[bytes]:
+        for name, value in fields.items():
+            yield (
+                f"--{boundary}\r\n"
+                f'Content-Disposition: form-data; name="{_quote_header_value(name)}"\r\n\r\n'
+                f"{value}\r\n"
+            ).encode()
+        yield (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="{_quote_header_value(file_field)}"; '
+            f'filename="{_quote_header_value(filename)}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        ).encode()
+        async for chunk in chunks:
+            if chunk:
+                yield chunk
+        yield f"\r\n--{boundary}--\r\n".encode()
+
+    return body(), f"multipart/form-data; boundary={boundary}"
@@ -4,17 +4,18 @@ TTS Helper Utility for Voice Synthesis Integration
 This module provides a helper interface for TTS services, with graceful
 degradation when TTS services are not available.
 """
+import asyncio
 import hashlib
 import json
 from pathlib import Path
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, List, Tuple
 
 from app.utils.logger import get_logger
 from app.config import get_settings
 
 # Conditional imports (only if services exist)
 try:
-    from app.services.tts.service import TTSService
+    from app.services.tts.service import get_tts_service
     from app.services.voice_cache import VoiceCacheService
     TTS_AVAILABLE = True
 except ImportError:
@@ -23,6 +24,9 @@ except ImportError:
 logger = get_logger(__name__)
 settings = get_settings()
 
+# Syntheses a caller stopped waiting for; referenced here so they run to completion
+_detached_syntheses: set = set()
+
 
 def _generate_settings_hash(voice_id: str, format: str, version: int) -> str:
     """Generate deterministic settings hash for cache key."""
@@ -33,7 +37,10 @@ def _generate_settings_hash(voice_id: str, format: str, version: int) -> str:
 
 
 def _read_cached_audio_file(file_id: str) -> Optional[bytes]:
-    """Read audio file from storage by file_id. Returns None if not found."""
+    """Read audio file from storage by file_id. Returns None if not found.
+    
+    Blocking (database lookup and file read); call it with asyncio.to_thread.
+    """
     from app.services.file_service import FileService
     from app.services.database_service import get_db
     
@@ -71,7 +78,7 @@ async def synthesize_voice(
         return None
     
     try:
-        tts_service = TTSService()
+        tts_service = get_tts_service()  # Shared instance keeps provider connections pooled
         voice_cache = VoiceCacheService()
         
         # Check cache first
@@ -84,7 +91,9 @@ async def synthesize_voice(
         
         if cached_result and cached_result.get("file_id"):
             logger.info(f"Voice cache hit for question {question_id}")
-            audio_bytes = _read_cached_audio_file(cached_result["file_id"])
+            audio_bytes = await asyncio.to_thread(_read_cached_audio_file, cached_result["file_id"])
+            if not audio_bytes:
+                audio_bytes = await voice_cache.load_audio(cached_result)
             if audio_bytes:
                 return (
                     audio_bytes,
@@ -99,12 +108,11 @@ async def synthesize_voice(
         
         # Cache miss - synthesize
         logger.info(f"Synthesizing voice for question {question_id} (cache miss)")
-        audio_bytes, duration, metadata = await tts_service.synthesize(
-            text=text, voice_id=voice_id, format=format
+        audio_bytes = await tts_service.synthesize(
+            text=text, voice_id=voice_id, audio_format=format
         )
         
-        return (audio_bytes, duration, {
-            **metadata,
+        return (audio_bytes, 0.0, {
             "cached": False,
             "voice_id": voice_id,
             "version": settings.TTS_VOICE_VERSION
@@ -144,80 +152,202 @@ async def cache_voice_result(
         return False
 
 
+def _detach(task: asyncio.Future) -> None:
+    """Keep a task running after its caller stopped waiting for it."""
+    _detached_syntheses.add(task)
+    task.add_done_callback(_detached_syntheses.discard)
+
+
 async def synthesize_and_save_voice(
     question_text: str,
     question_id: str,
     voice_id: str,
     audio_format: str,
     file_service: Any,
-    settings: Any
+    settings: Any,
+    timeout: Optional[float] = None
 ) -> Optional[Any]:
     """
     Synthesize voice, save file, cache result, and return payload.
     Returns None on failure (graceful degradation).
+    
+    Synthesis may be shared with concurrent requests for the same text, so
+    ``timeout`` only stops this caller waiting: the synthesis itself is
+    shielded and runs on in the background, still filling the voice cache.
     """
-    from app.models.schemas import VoicePayload, VoiceFile
-    from app.models.schemas import FileType
+    synthesis = asyncio.ensure_future(synthesize_voice(
+        text=question_text,
+        voice_id=voice_id,
+        format=audio_format,
+        question_id=question_id
+    ))
+    try:
+        synthesis_result = await asyncio.wait_for(asyncio.shield(synthesis), timeout=timeout)
+    except asyncio.TimeoutError:
+        _detach(synthesis)
+        logger.warning(f"Voice synthesis timed out after {timeout}s for question {question_id}")
+        return None
+    except asyncio.CancelledError:
+        _detach(synthesis)
+        raise
     
     try:
-        # Synthesize voice
-        synthesis_result = await synthesize_voice(
-            text=question_text,
-            voice_id=voice_id,
-            format=audio_format,
-            question_id=question_id
-        )
-        
         if not synthesis_result:
             return None
         
         audio_bytes, duration, metadata = synthesis_result
-        version = metadata.get("version", settings.TTS_VOICE_VERSION)
-        
-        # Save file
-        from app.services.file_service import FileService
-        file_id = FileService.generate_file_id()
-        filename = f"question_{question_id}_voice.{audio_format}"
-        
-        file_service.save_file_from_bytes(
-            content=audio_bytes,
-            file_type=FileType.AUDIO,
-            file_id=file_id,
-            filename=filename,
-            metadata={
-                "question_id": question_id,
-                "voice_id": voice_id,
-                "version": version,
-                "format": audio_format
-            }
-        )
-        
-        # Cache if not already cached
-        if not metadata.get("cached", False):
-            await cache_voice_result(
-                text=question_text,
-                voice_id=voice_id,
-                format=audio_format,
-                file_id=file_id,
-                duration=duration,
-                question_id=question_id,
-                version=version
-            )
-        
-        # Build and return payload
-        mime_type = "audio/mpeg" if audio_format == "mp3" else "audio/wav"
-        return VoicePayload(
+        return await save_and_cache_voice(
+            question_text=question_text,
+            question_id=question_id,
             voice_id=voice_id,
-            version=version,
+            audio_format=audio_format,
+            audio_bytes=audio_bytes,
             duration=duration,
-            files=[VoiceFile(
-                file_id=file_id,
-                mime_type=mime_type,
-                download_url=f"/api/v1/files/{file_id}/download"
-            )]
+            metadata=metadata,
+            file_service=file_service,
+            settings=settings
         )
         
     except Exception as e:
         logger.error(f"Error synthesizing voice for question {question_id}: {e}")
         return None
 
+
+async def save_and_cache_voice(
+    question_text: str,
+    question_id: str,
+    voice_id: str,
+    audio_format: str,
+    audio_bytes: bytes,
+    duration: float,
+    metadata: Dict[str, Any],
+    file_service: Any,
+    settings: Any
+) -> Any:
+    """
+    Save synthesized question audio, cache its file reference, and build the payload.
+    
+    Args:
+        question_text: Question text that was synthesized
+        question_id: Question ID
+        voice_id: Voice identifier
+        audio_format: Audio format
+        audio_bytes: Synthesized audio
+        duration: Audio duration in seconds
+        metadata: Synthesis metadata (``cached`` entries are not re-cached)
+        file_service: FileService used to save the audio file
+        settings: Application settings
+        
+    Returns:
+        VoicePayload: Voice payload referencing the saved file
+    """
+    from app.models.schemas import VoicePayload, VoiceFile
+    from app.models.schemas import FileType
+    from app.services.file_service import FileService
+    
+    version = metadata.get("version", settings.TTS_VOICE_VERSION)
+    
+    # Save file (write, fsync and index commit) off the event loop
+    file_id = FileService.generate_file_id()
+    filename = f"question_{question_id}_voice.{audio_format}"
+    
+    await asyncio.to_thread(
+        file_service.save_file_from_bytes,
+        content=audio_bytes,
+        file_type=FileType.AUDIO,
+        file_id=file_id,
+        filename=filename,
+        metadata={
+            "question_id": question_id,
+            "voice_id": voice_id,
+            "version": version,
+            "format": audio_format
+        }
+    )
+    
+    # Cache if not already cached
+    if not metadata.get("cached", False):
+        await cache_voice_result(
+            text=question_text,
+            voice_id=voice_id,
+            format=audio_format,
+            file_id=file_id,
+            duration=duration,
+            question_id=question_id,
+            version=version
+        )
+    
+    # Build and return payload
+    mime_type = "audio/mpeg" if audio_format == "mp3" else "audio/wav"
+    return VoicePayload(
+        voice_id=voice_id,
+        version=version,
+        duration=duration,
+        files=[VoiceFile(
+            file_id=file_id,
+            mime_type=mime_type,
+            download_url=f"/api/v1/files/{file_id}/download"
+        )]
+    )
+
+
+async def get_cached_voice_file_id(text: str, voice_id: str, format: str, version: int) -> Optional[str]:
+    """Get the file ID of an already synthesized and saved voice, if cached."""
+    if not TTS_AVAILABLE:
+        return None
+    
+    voice_cache = VoiceCacheService()
+    cached_result = await voice_cache.get_cached_voice(
+        text=text, voice_id=voice_id, format=format,
+        settings_hash=_generate_settings_hash(voice_id, format, version)
+    )
+    return cached_result.get("file_id") if cached_result else None
+
+
+async def synthesize_and_save_voices(
+    questions: List[Tuple[str, str]],
+    voice_id: str,
+    audio_format: str,
+    file_service: Any,
+    settings: Any,
+    timeout: Optional[float] = None
+) -> List[Optional[Any]]:
+    """
+    Synthesize and save voices for several questions concurrently.
+    
+    Provider calls are bounded by the per-provider TTS_MAX_CONCURRENT limit in
+    TTSService, so all questions can be started at once.
+    
+    Args:
+        questions: (question_text, question_id) pairs
+        voice_id: Voice identifier
+        audio_format: Audio format
+        file_service: FileService used to save the audio files
+        settings: Application settings
+        timeout: Per-question timeout in seconds (defaults to TTS_QUESTION_TIMEOUT)
+        
+    Returns:
+        List of VoicePayload or None (failed or timed out), in the order of ``questions``
+    """
+    timeout = timeout or settings.TTS_QUESTION_TIMEOUT
+    
+    async def _synthesize_one(question_text: str, question_id: str) -> Optional[Any]:
+        voice_payload = await synthesize_and_save_voice(
+            question_text=question_text,
+            question_id=question_id,
+            voice_id=voice_id,
+            audio_format=audio_format,
+            file_service=file_service,
+            settings=settings,
+            timeout=timeout
+        )
+        
+        if voice_payload:
+            logger.info(f"Voice synthesized for question {question_id}")
+        else:
+            logger.warning(f"Voice synthesis failed for question {question_id}, returning text-only")
+        return voice_payload
+    
+    return await asyncio.gather(*(
+        _synthesize_one(question_text, question_id) for question_text, question_id in questions
+    ))
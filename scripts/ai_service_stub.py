@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Local AI service stand-in for load and performance testing.
+
+Implements the AI service endpoints the backend calls, returning responses that
+satisfy the contracts AIServiceClient and QuestionStoreService validate:
+
+- POST /api/v1/ai/questions/generate   (structured question generation)
+- POST /api/v1/score/                  (answer analysis)
+- POST /api/v1/transcribe/             (multipart audio transcription)
+- POST /api/v1/embeddings/generate     (also served at /embeddings/generate)
+- GET  /api/v1/health
+
+Latency distributions, error rates and embedding dimensions are configurable,
+and all randomness is seeded, so benchmarks of the full FastAPI app can run
+offline and reproducibly.
+
+Usage (run from project root):
+    python scripts/ai_service_stub.py --port 8001 --latency lognormal:0.4:0.5 \\
+        --endpoint-latency score=normal:0.8:0.2 --error-rate 0.01 --seed 42
+    AI_SERVICE_URL=http://localhost:8001 uvicorn app.main:app
+
+Latency specs (seconds):
+    fixed:<value>
+    uniform:<low>:<high>
+    normal:<mean>:<stddev>
+    lognormal:<median>:<sigma>
+    exponential:<mean>
+"""
+import argparse
+import asyncio
+import hashlib
+import math
+import os
+import random
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+ENDPOINTS = ("questions", "score", "transcribe", "embeddings")
+
+
+@dataclass
+class LatencyModel:
+    """A latency distribution parsed from a spec string."""
+    distribution: str = "fixed"
+    params: List[float] = field(default_factory=lambda: [0.0])
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyModel":
+        """Parse a spec such as ``lognormal:0.3:0.5``."""
+        name, *raw_params = spec.strip().split(":")
+        expected = {"fixed": 1, "uniform": 2, "normal": 2, "lognormal": 2, "exponential": 1}
+        if name not in expected:
+            raise ValueError(f"Unknown latency distribution: {name}")
+        if len(raw_params) != expected[name]:
+            raise ValueError(f"Latency distribution '{name}' expects {expected[name]} parameter(s)")
+        return cls(distribution=name, params=[float(p) for p in raw_params])
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw a non-negative latency in seconds."""
+        p = self.params
+        if self.distribution == "fixed":
+            value = p[0]
+        elif self.distribution == "uniform":
+            value = rng.uniform(p[0], p[1])
+        elif self.distribution == "normal":
+            value = rng.gauss(p[0], p[1])
+        elif self.distribution == "lognormal":
+            value = rng.lognormvariate(math.log(p[0]), p[1]) if p[0] > 0 else 0.0
+        else:
+            value = rng.expovariate(1.0 / p[0]) if p[0] > 0 else 0.0
+        return max(0.0, value)
+
+
+@dataclass
+class StubConfig:
+    """Configuration for the AI service stub."""
+    latency: LatencyModel = field(default_factory=LatencyModel)
+    endpoint_latency: Dict[str, LatencyModel] = field(default_factory=dict)
+    error_rate: float = 0.0
+    endpoint_error_rate: Dict[str, float] = field(default_factory=dict)
+    error_status: int = 503
+    embedding_dim: int = 1536
+    questions_per_request: int = 10
+    seed: Optional[int] = None
+
+    def latency_for(self, endpoint: str) -> LatencyModel:
+        return self.endpoint_latency.get(endpoint, self.latency)
+
+    def error_rate_for(self, endpoint: str) -> float:
+        return self.endpoint_error_rate.get(endpoint, self.error_rate)
+
+
+def _parse_endpoint_overrides(values: List[str], parse) -> Dict:
+    """Parse ``endpoint=value`` overrides."""
+    overrides = {}
+    for value in values or []:
+        endpoint, _, raw = value.partition("=")
+        if endpoint not in ENDPOINTS or not raw:
+            raise ValueError(f"Invalid override '{value}', expected <{'|'.join(ENDPOINTS)}>=<value>")
+        overrides[endpoint] = parse(raw)
+    return overrides
+
+
+def _stable_hash(*parts: str) -> str:
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()
+
+
+def deterministic_embedding(text: str, dim: int) -> List[float]:
+    """Unit-length embedding derived from the text, identical across runs."""
+    rng = random.Random(_stable_hash(" ".join(text.split()).lower()))
+    vector = [rng.gauss(0.0, 1.0) for _ in range(dim)]
+    norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+    return [v / norm for v in vector]
+
+
+def create_stub_app(config: Optional[StubConfig] = None) -> FastAPI:
+    """
+    Create the AI service stub application.
+
+    Args:
+        config: Stub configuration (defaults: no latency, no errors, 1536-dim embeddings)
+
+    Returns:
+        FastAPI: Stub application; request counts are exposed at GET /stub/stats
+    """
+    config = config or StubConfig()
+    rng = random.Random(config.seed)
+    stats = {endpoint: {"requests": 0, "errors": 0} for endpoint in ENDPOINTS}
+
+    app = FastAPI(title="AI Service Stub")
+    app.state.config = config
+    app.state.stats = stats
+
+    async def _simulate(endpoint: str) -> Optional[JSONResponse]:
+        """Apply latency and error injection; returns an error response if injected."""
+        stats[endpoint]["requests"] += 1
+        await asyncio.sleep(config.latency_for(endpoint).sample(rng))
+        if rng.random() < config.error_rate_for(endpoint):
+            stats[endpoint]["errors"] += 1
+            return JSONResponse(
+                status_code=config.error_status,
+                content={"detail": f"Injected {endpoint} failure"}
+            )
+        return None
+
+    @app.get("/api/v1/health")
+    async def health():
+        return {"status": "healthy", "service": "ai-service-stub"}
+
+    @app.get("/stub/stats")
+    async def get_stats():
+        return stats
+
+    @app.post("/api/v1/ai/questions/generate")
+    async def generate_questions(request: Request):
+        error = await _simulate("questions")
+        if error:
+            return error
+
+        body = await request.json()
+        role = body.get("role_name", "")
+        job_description = body.get("job_description", "")
+        request_hash = _stable_hash(role, job_description, body.get("resume") or "")[:12]
+
+        identifiers = {
+            "skills": ["communication", "problem solving"],
+            "focus_areas": ["experience", "technical depth"],
+            "difficulty": "medium",
+            "tone": "professional",
+            "role": role
+        }
+        questions = []
+        embedding_vectors = {}
+        for i in range(config.questions_per_request):
+            question_id = f"stub-{request_hash}-{i}"
+            text = f"Question {i + 1} for the {role or 'candidate'} role: describe a relevant challenge you solved."
+            questions.append({
+                "question_id": question_id,
+                "text": text,
+                "source": "newly_generated",
+                "metadata": {"generator": "ai-service-stub"},
+                "identifiers": {
+                    "question_id": question_id,
+                    "category": "general",
+                    "difficulty": "medium",
+                    "role": role,
+                    "tags": ["stub"]
+                }
+            })
+            embedding_vectors[question_id] = deterministic_embedding(text, config.embedding_dim)
+
+        return {
+            "identifiers": identifiers,
+            "questions": questions,
+            "embedding_vectors": embedding_vectors
+        }
+
+    @app.post("/api/v1/score/")
+    async def score_answer(request: Request):
+        error = await _simulate("score")
+        if error:
+            return error
+
+        body = await request.json()
+        answer = body.get("answer", "")
+        # Deterministic scores derived from the content
+        seed = int(_stable_hash(body.get("question", ""), answer)[:8], 16)
+        clarity = 4 + seed % 7
+        confidence = 4 + (seed // 7) % 7
+        return {
+            "score": {"clarity": clarity, "confidence": confidence},
+            "analysis": f"Stub analysis of a {len(answer.split())}-word answer.",
+            "suggestions": ["Add a concrete example", "Quantify the impact"]
+        }
+
+    @app.post("/api/v1/transcribe/")
+    async def transcribe(request: Request):
+        # Consume the (possibly chunked) upload before responding
+        form = await request.form()
+        audio = form.get("audio_file")
+        size = len(await audio.read()) if audio is not None and hasattr(audio, "read") else 0
+
+        error = await _simulate("transcribe")
+        if error:
+            return error
+
+        return {
+            "transcript": f"Stub transcript of {size} bytes of audio.",
+            "confidence": 0.95,
+            "language": form.get("language", "en"),
+            "session_id": form.get("session_id")
+        }
+
+    async def generate_embedding(request: Request):
+        error = await _simulate("embeddings")
+        if error:
+            return error
+
+        body = await request.json()
+        embedding = deterministic_embedding(body.get("text", ""), config.embedding_dim)
+        return {"embedding": embedding, "dimensions": config.embedding_dim}
+
+    # AIServiceClient uses the /api/v1 prefix; QuestionStoreService posts to the bare path
+    app.add_api_route("/api/v1/embeddings/generate", generate_embedding, methods=["POST"])
+    app.add_api_route("/embeddings/generate", generate_embedding, methods=["POST"])
+
+    return app
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Run a local AI service stub for load and perf testing")
+    parser.add_argument("--host", default=os.getenv("STUB_AI_HOST", "127.0.0.1"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("STUB_AI_PORT", "8001")))
+    parser.add_argument("--latency", default=os.getenv("STUB_AI_LATENCY", "fixed:0"),
+                        help="Default latency spec, e.g. lognormal:0.3:0.5")
+    parser.add_argument("--endpoint-latency", action="append", default=[],
+                        help=f"Per-endpoint latency override, e.g. score=normal:0.8:0.2 ({', '.join(ENDPOINTS)})")
+    parser.add_argument("--error-rate", type=float, default=float(os.getenv("STUB_AI_ERROR_RATE", "0")),
+                        help="Probability (0-1) of returning an error")
+    parser.add_argument("--endpoint-error-rate", action="append", default=[],
+                        help="Per-endpoint error rate override, e.g. transcribe=0.05")
+    parser.add_argument("--error-status", type=int, default=int(os.getenv("STUB_AI_ERROR_STATUS", "503")))
+    parser.add_argument("--embedding-dim", type=int, default=int(os.getenv("STUB_AI_EMBEDDING_DIM", "1536")))
+    parser.add_argument("--questions", type=int, default=int(os.getenv("STUB_AI_QUESTIONS", "10")),
+                        help="Questions returned per generation request")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for reproducible runs")
+    return parser
+
+
+def config_from_args(args: argparse.Namespace) -> StubConfig:
+    """Build a StubConfig from parsed command-line arguments."""
+    return StubConfig(
+        latency=LatencyModel.parse(args.latency),
+        endpoint_latency=_parse_endpoint_overrides(args.endpoint_latency, LatencyModel.parse),
+        error_rate=args.error_rate,
+        endpoint_error_rate=_parse_endpoint_overrides(args.endpoint_error_rate, float),
+        error_status=args.error_status,
+        embedding_dim=args.embedding_dim,
+        questions_per_request=args.questions,
+        seed=args.seed
+    )
+
+
+def main():
+    import uvicorn
+
+    args = _build_parser().parse_args()
+    config = config_from_args(args)
+    print(f"🤖 AI service stub on http://{args.host}:{args.port} "
+          f"(latency={args.latency}, error_rate={args.error_rate}, embedding_dim={args.embedding_dim})")
+    uvicorn.run(create_stub_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
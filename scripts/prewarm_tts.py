@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Pre-warm TTS voices for the most used question-bank questions.
+
+Synthesizes the top-N questions by usage_count per role, category or scenario
+for the default voice and format, saves the audio files and populates the
+voice cache, so voice-enabled sessions start with cache hits.
+
+Usage (run from project root):
+    python scripts/prewarm_tts.py --top-n 20 --group-by role
+    python scripts/prewarm_tts.py --group-by scenario --rate 0.5
+"""
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    from app.services.tts.prewarm import GROUP_BY_OPTIONS
+
+    parser = argparse.ArgumentParser(description="Pre-warm TTS voices for popular questions")
+    parser.add_argument("--top-n", type=int, default=None, help="Questions per group (default: TTS_PREWARM_TOP_N)")
+    parser.add_argument("--group-by", choices=GROUP_BY_OPTIONS, default=None,
+                        help="Grouping (default: TTS_PREWARM_GROUP_BY)")
+    parser.add_argument("--voice-id", default=None, help="Voice identifier (default: TTS_DEFAULT_VOICE_ID)")
+    parser.add_argument("--format", dest="audio_format", default=None,
+                        help="Audio format (default: TTS_DEFAULT_FORMAT)")
+    parser.add_argument("--rate", type=float, default=None,
+                        help="Synthesis requests per second (default: TTS_PREWARM_RATE)")
+    return parser
+
+
+def main():
+    args = _build_parser().parse_args()
+
+    from app.services.tts.prewarm import run_tts_prewarm
+
+    stats = asyncio.run(run_tts_prewarm(
+        rate=args.rate,
+        top_n=args.top_n,
+        group_by=args.group_by,
+        voice_id=args.voice_id,
+        audio_format=args.audio_format
+    ))
+    if stats is None:
+        print("❌ TTS pre-warm failed, see logs for details")
+        sys.exit(1)
+    print(json.dumps(stats, indent=2))
+
+
+if __name__ == "__main__":
+    main()
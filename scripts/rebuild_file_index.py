@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Rebuild the persistent file index (stored_files table) from upload storage.
+
+Walks FILE_UPLOAD_DIR, records every stored file's path, type, size, MIME
+type and SHA-256 checksum by file_id, and removes entries whose files no
+longer exist. Run once after deploying the index (then FILE_INDEX_SCAN_ON_MISS
+can be disabled), or after files were copied or removed outside the service.
+
+Usage (run from project root):
+    python scripts/rebuild_file_index.py
+    python scripts/rebuild_file_index.py --no-prune --batch-size 1000
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Rebuild the file_id index of upload storage")
+    parser.add_argument("--no-prune", dest="prune", action="store_false",
+                        help="Keep entries of files missing from this host's upload directory")
+    parser.add_argument("--batch-size", type=int, default=500, help="Entries written per commit (default: 500)")
+    return parser
+
+
+def main():
+    args = _build_parser().parse_args()
+
+    from app.services.database_service import database_service
+    from app.services.file_service import FileService
+
+    db = database_service.get_sync_session()
+    try:
+        stats = FileService(db).rebuild_index(prune=args.prune, batch_size=args.batch_size)
+    except Exception as e:
+        print(f"❌ File index rebuild failed: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+    print(json.dumps(stats, indent=2))
+
+
+if __name__ == "__main__":
+    main()
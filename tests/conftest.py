@@ -7,6 +7,7 @@ import pytest
 import os
 import uuid
 import inspect
+import tempfile
 from pathlib import Path
 import httpx
 
@@ -26,6 +27,9 @@ os.environ["RATE_LIMIT_ENABLED"] = "false"
 os.environ["MONITORING_ENABLED"] = "false"
 os.environ["ASYNC_DATABASE_ENABLED"] = "false"
 os.environ["ASYNC_DATABASE_MONITORING_ENABLED"] = "false"
+os.environ["FILE_CLEANUP_ENABLED"] = "false"
+# Keep synthesized test audio out of the working tree
+os.environ.setdefault("TTS_BLOB_STORE_DIR", os.path.join(tempfile.mkdtemp(prefix="confida-test-"), "tts_blobs"))
 
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine, event
@@ -60,6 +64,208 @@ def setup_test_environment():
     if test_db_path.exists():
         test_db_path.unlink()
 
+class FakeAsyncRedis:
+    """Minimal in-process stand-in for ``redis.asyncio.Redis`` (decode_responses=True)."""
+    
+    def __init__(self):
+        self.store = {}
+        self.expiry = {}
+        self.commands = []
+        self.subscribers = {}  # channel -> list of FakeAsyncRedisPubSub
+    
+    def _alive(self, key):
+        import time
+        expires_at = self.expiry.get(key)
+        if expires_at is not None and time.time() >= expires_at:
+            self.store.pop(key, None)
+            self.expiry.pop(key, None)
+        return key in self.store
+    
+    async def ping(self):
+        return True
+    
+    async def get(self, key):
+        self.commands.append(("get", key))
+        return self.store[key] if self._alive(key) else None
+    
+    async def mget(self, keys):
+        self.commands.append(("mget", tuple(keys)))
+        return [self.store[k] if self._alive(k) else None for k in keys]
+    
+    async def setex(self, key, ttl, value):
+        import time
+        self.commands.append(("setex", key))
+        self.store[key] = value
+        self.expiry[key] = time.time() + ttl
+        return True
+    
+    async def set(self, key, value, nx=False, ex=None):
+        import time
+        self.commands.append(("set", key))
+        if nx and self._alive(key):
+            return None
+        self.store[key] = value
+        if ex is not None:
+            self.expiry[key] = time.time() + ex
+        else:
+            self.expiry.pop(key, None)
+        return True
+    
+    async def exists(self, *keys):
+        self.commands.append(("exists", keys))
+        return sum(1 for key in keys if self._alive(key))
+    
+    async def eval(self, script, numkeys, *keys_and_args):
+        """Only supports the compare-and-delete lock release script."""
+        self.commands.append(("eval", keys_and_args[:numkeys]))
+        key, token = keys_and_args[0], keys_and_args[numkeys]
+        if self._alive(key) and self.store[key] == token:
+            return await self.delete(key)
+        return 0
+    
+    async def delete(self, *keys):
+        self.commands.append(("delete", keys))
+        removed = 0
+        for key in keys:
+            if self._alive(key):
+                removed += 1
+            self.store.pop(key, None)
+            self.expiry.pop(key, None)
+        return removed
+    
+    async def keys(self, pattern="*"):
+        import fnmatch
+        self.commands.append(("keys", pattern))
+        return [k for k in list(self.store) if self._alive(k) and fnmatch.fnmatchcase(k, pattern)]
+    
+    async def incr(self, key):
+        self.commands.append(("incr", key))
+        value = int(self.store[key]) + 1 if self._alive(key) else 1
+        self.store[key] = str(value)
+        return value
+    
+    async def scan_iter(self, match="*", count=None):
+        import fnmatch
+        self.commands.append(("scan", match))
+        for key in list(self.store):
+            if self._alive(key) and fnmatch.fnmatchcase(key, match):
+                yield key
+    
+    async def unlink(self, *keys):
+        self.commands.append(("unlink", len(keys)))
+        return await self.delete(*keys)
+    
+    def pipeline(self, transaction=True):
+        return FakeAsyncRedisPipeline(self)
+    
+    async def publish(self, channel, message):
+        self.commands.append(("publish", channel))
+        subscribers = self.subscribers.get(channel, [])
+        for pubsub in subscribers:
+            pubsub.queue.put_nowait({"type": "message", "channel": channel, "data": message})
+        return len(subscribers)
+    
+    def pubsub(self):
+        return FakeAsyncRedisPubSub(self)
+    
+    async def aclose(self):
+        pass
+
+
+class FakeAsyncRedisPipeline:
+    """Pipeline for FakeAsyncRedis: queues commands and runs them on execute()."""
+    
+    def __init__(self, redis_client):
+        self.redis_client = redis_client
+        self.queued = []
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc):
+        return False
+    
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.queued.append((name, args, kwargs))
+            return self
+        return queue
+    
+    async def execute(self):
+        self.redis_client.commands.append(("pipeline", len(self.queued)))
+        results = []
+        for name, args, kwargs in self.queued:
+            results.append(await getattr(self.redis_client, name)(*args, **kwargs))
+        self.queued = []
+        return results
+
+
+class FakeAsyncRedisPubSub:
+    """Pub/sub handle for FakeAsyncRedis."""
+    
+    def __init__(self, redis_client):
+        import asyncio
+        self.redis_client = redis_client
+        self.queue = asyncio.Queue()
+        self.channels = []
+    
+    async def subscribe(self, *channels):
+        for channel in channels:
+            self.redis_client.subscribers.setdefault(channel, []).append(self)
+            self.channels.append(channel)
+    
+    async def get_message(self, ignore_subscribe_messages=False, timeout=0.0):
+        import asyncio
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+    
+    async def aclose(self):
+        for channel in self.channels:
+            self.redis_client.subscribers.get(channel, []).remove(self)
+        self.channels = []
+
+
+class FakeSyncRedis:
+    """Blocking client view of a FakeAsyncRedis server (shares its data)."""
+    
+    def __init__(self, server):
+        self.server = server
+    
+    def get(self, key):
+        self.server.commands.append(("sync_get", key))
+        return self.server.store[key] if self.server._alive(key) else None
+    
+    def setex(self, key, ttl, value):
+        import time
+        self.server.commands.append(("sync_setex", key))
+        self.server.store[key] = value
+        self.server.expiry[key] = time.time() + ttl
+        return True
+    
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def fake_async_redis():
+    """In-process async Redis stand-in."""
+    return FakeAsyncRedis()
+
+
+@pytest.fixture
+def fake_sync_redis(fake_async_redis):
+    """Blocking client for the same in-process Redis stand-in."""
+    return FakeSyncRedis(fake_async_redis)
+
+@pytest.fixture(autouse=True)
+def clear_memory_cache():
+    """Clear the global in-memory cache so cached results do not leak between tests."""
+    from app.utils.cache import cache_manager
+    cache_manager.memory_cache.clear()
+    yield
+
 @pytest.fixture
 def sample_data():
     """Sample data for testing."""
@@ -491,6 +697,19 @@ def mock_tts_settings():
         settings.CACHE_ENABLED = False
         settings.TTS_CACHE_TTL = 604800
         settings.TTS_TIMEOUT = 30
+        settings.TTS_MAX_CONCURRENT = 5
+        settings.TTS_CHUNKING_ENABLED = True
+        settings.TTS_CHUNK_THRESHOLD = 500
+        settings.TTS_CHUNK_MAX_CHARS = 500
+        settings.TTS_ROUTING_STRATEGY = "adaptive"
+        settings.TTS_ROUTING_EWMA_ALPHA = 0.2
+        settings.TTS_ROUTING_ERROR_PENALTY = 5.0
+        settings.TTS_ROUTING_MIN_SAMPLES = 5
+        settings.TTS_ROUTING_EXPLORE_RATIO = 0.0
+        settings.TTS_HEDGE_ENABLED = False
+        settings.TTS_HEDGE_DELAY = 2.0
+        settings.TTS_HEDGE_BUDGET_RATIO = 0.1
+        settings.TTS_HEDGE_BUDGET_MAX_TOKENS = 10.0
         settings.TTS_VOICE_VERSION = 1
         settings.ELEVENLABS_API_KEY = ""
         settings.PLAYHT_API_KEY = ""
@@ -41,6 +41,7 @@ class TestFilesAPIEndpoints:
         mock_settings = Mock()
         mock_settings.FILE_UPLOAD_DIR = str(temp_upload_dir)
         mock_settings.FILE_EXPIRATION_HOURS = 24
+        mock_settings.FILE_STREAM_CHUNK_SIZE = 65536
         
         monkeypatch.setattr("app.services.file_service.settings", mock_settings)
         monkeypatch.setattr("app.config.get_settings", lambda: mock_settings)
@@ -229,6 +230,7 @@ class TestFilesAPIVoicePersistence:
         mock_settings = Mock()
         mock_settings.FILE_UPLOAD_DIR = str(temp_upload_dir)
         mock_settings.FILE_EXPIRATION_HOURS = 24
+        mock_settings.FILE_STREAM_CHUNK_SIZE = 65536
         
         monkeypatch.setattr("app.services.file_service.settings", mock_settings)
         monkeypatch.setattr("app.config.get_settings", lambda: mock_settings)
@@ -415,3 +415,187 @@ class TestInterviewEndpoints:
         assert "detail" in data
 
     # Note: list_models error test removed - endpoint doesn't exist in pure microservice architecture
+
+
+class TestBatchAnalyzeAnswers:
+    """Test cases for the batch answer analysis endpoint."""
+
+    @pytest.mark.integration
+    def test_batch_analyze_partial_failure(
+        self, client, mock_ai_client, override_auth, override_ai_client,
+        sample_user, sample_interview_session, sample_session_question, sample_question, db_session
+    ):
+        """Valid items are analyzed and stored; unknown or invalid IDs fail per item."""
+        import uuid
+        from app.database.models import Answer
+
+        override_auth({"id": sample_user.id, "email": sample_user.email, "is_admin": False})
+        override_ai_client(mock_ai_client)
+        unknown_id = str(uuid.uuid4())
+
+        response = client.post("/api/v1/analyze-answers/batch", json={
+            "session_id": str(sample_interview_session.id),
+            "jobDescription": "Looking for a Python developer with 5+ years of experience.",
+            "answers": [
+                {"question_id": str(sample_question.id), "answer": "Python is a language."},
+                {"question_id": unknown_id, "answer": "Unknown question."},
+                {"question_id": "not-a-uuid", "answer": "Invalid ID."},
+            ]
+        })
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 3
+        assert data["succeeded"] == 1
+        assert data["failed"] == 2
+        assert [r["question_id"] for r in data["results"]] == [str(sample_question.id), unknown_id, "not-a-uuid"]
+        assert data["results"][0]["success"] is True
+        assert data["results"][0]["result"]["analysis"] == "Good answer"
+        assert data["results"][1]["status_code"] == 404
+        assert data["results"][2]["status_code"] == 422
+        assert mock_ai_client.analyze_answer.await_count == 1
+        assert db_session.query(Answer).filter(Answer.question_id == sample_question.id).count() == 1
+
+    @pytest.mark.integration
+    def test_batch_analyze_ai_error_reported_per_item(
+        self, client, override_auth, override_ai_client,
+        sample_user, sample_interview_session, sample_session_question, sample_question
+    ):
+        """An AI failure on one item does not fail the whole batch."""
+        mock_ai_client = AsyncMock()
+        mock_ai_client.analyze_answer = AsyncMock(side_effect=[
+            {"score": {"clarity": 8, "confidence": 7}, "analysis": "Good", "suggestions": []},
+            Exception("AI service error"),
+        ])
+        override_auth({"id": sample_user.id, "email": sample_user.email, "is_admin": False})
+        override_ai_client(mock_ai_client)
+
+        response = client.post("/api/v1/analyze-answers/batch?service=openai", json={
+            "session_id": str(sample_interview_session.id),
+            "jobDescription": "Looking for a Python developer with 5+ years of experience.",
+            "answers": [
+                {"question_id": str(sample_question.id), "answer": "First answer."},
+                {"question_id": str(sample_session_question.id), "answer": "Second answer."},
+            ]
+        })
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["succeeded"] == 1
+        assert data["failed"] == 1
+        failed = [r for r in data["results"] if not r["success"]][0]
+        assert failed["status_code"] == 500
+        assert "AI service error" in failed["error"]
+
+    @pytest.mark.integration
+    def test_batch_analyze_rejects_questions_from_other_sessions(
+        self, client, mock_ai_client, override_auth, override_ai_client,
+        sample_user, sample_interview_session, sample_session_question, sample_question, db_session
+    ):
+        """Questions outside the given session fail per item and nothing is stored for them."""
+        from app.database.models import Answer, DataAccessLog, InterviewSession, Question, SessionQuestion
+
+        other_session = InterviewSession(
+            user_id=sample_user.id, role="Python Developer", job_description="Other session",
+            status="active", total_questions=1, completed_questions=0
+        )
+        other_question = Question(
+            question_text="What is a decorator?", question_metadata={"source": "test"},
+            difficulty_level="medium", category="python"
+        )
+        db_session.add_all([other_session, other_question])
+        db_session.flush()
+        db_session.add(SessionQuestion(
+            session_id=other_session.id, question_id=other_question.id, question_order=1
+        ))
+        db_session.commit()
+
+        override_auth({"id": sample_user.id, "email": sample_user.email, "is_admin": False})
+        override_ai_client(mock_ai_client)
+
+        response = client.post("/api/v1/analyze-answers/batch", json={
+            "session_id": str(sample_interview_session.id),
+            "jobDescription": "Looking for a Python developer with 5+ years of experience.",
+            "answers": [
+                {"question_id": str(sample_question.id), "answer": "Python is a language."},
+                {"question_id": str(other_question.id), "answer": "A function wrapper."},
+            ]
+        })
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["succeeded"] == 1
+        assert data["results"][1]["success"] is False
+        assert data["results"][1]["status_code"] == 404
+        assert mock_ai_client.analyze_answer.await_count == 1
+        assert db_session.query(Answer).filter(Answer.question_id == other_question.id).count() == 0
+        assert db_session.query(DataAccessLog).filter(DataAccessLog.resource_id == str(other_question.id)).count() == 0
+
+    @pytest.mark.integration
+    def test_batch_analyze_requires_owned_session(
+        self, client, mock_ai_client, override_auth, override_ai_client, sample_question
+    ):
+        """A missing, invalid or foreign session rejects the whole batch."""
+        import uuid
+
+        override_auth({"id": 999, "email": "other@example.com", "is_admin": False})
+        override_ai_client(mock_ai_client)
+        payload = {
+            "jobDescription": "Looking for a Python developer with 5+ years of experience.",
+            "answers": [{"question_id": str(sample_question.id), "answer": "Python is a language."}]
+        }
+
+        assert client.post("/api/v1/analyze-answers/batch", json=payload).status_code == 422
+        response = client.post("/api/v1/analyze-answers/batch", json={**payload, "session_id": "not-a-uuid"})
+        assert response.status_code == 422
+        response = client.post("/api/v1/analyze-answers/batch", json={**payload, "session_id": str(uuid.uuid4())})
+        assert response.status_code == 404
+        mock_ai_client.analyze_answer.assert_not_awaited()
+
+    @pytest.mark.integration
+    def test_batch_analyze_empty_answers(self, client, override_auth):
+        """An empty batch is rejected."""
+        override_auth({"id": 1, "email": "test@example.com", "is_admin": False})
+        response = client.post("/api/v1/analyze-answers/batch", json={
+            "session_id": "00000000-0000-0000-0000-000000000000",
+            "jobDescription": "Looking for a Python developer with 5+ years of experience.",
+            "answers": []
+        })
+        assert response.status_code == 422
+
+
+class TestAnswerAnalysisCache:
+    """Test the answer-analysis result cache through the analyze endpoint."""
+
+    @pytest.mark.integration
+    def test_cache_hit_still_stores_answer(
+        self, client, sample_analyze_request, override_auth, override_ai_client,
+        sample_user, sample_interview_session, sample_session_question, sample_question, db_session
+    ):
+        """A resubmitted answer skips the AI call but still writes an Answer row."""
+        from unittest.mock import MagicMock, patch
+        from app.database.models import Answer
+        from app.services.ai_client import AIServiceClient
+
+        with patch("app.services.ai_client.httpx.AsyncClient") as mock_class:
+            http_client = MagicMock()
+            response = MagicMock(status_code=200)
+            response.json.return_value = {"score": {"clarity": 8, "confidence": 7}, "analysis": "Good answer"}
+            http_client.post = AsyncMock(return_value=response)
+            mock_class.return_value = http_client
+            ai_client = AIServiceClient(base_url="http://test-ai:8000")
+        ai_client.analysis_cache_enabled = True
+
+        override_auth({"id": sample_user.id, "email": sample_user.email, "is_admin": False})
+        override_ai_client(ai_client)
+
+        for _ in range(2):
+            result = client.post(
+                f"/api/v1/analyze-answer?question_id={sample_question.id}",
+                json=sample_analyze_request
+            )
+            assert result.status_code == 200
+            assert result.json()["analysis"] == "Good answer"
+
+        assert http_client.post.await_count == 1
+        assert db_session.query(Answer).filter(Answer.question_id == sample_question.id).count() == 2
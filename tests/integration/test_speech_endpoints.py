@@ -86,3 +86,62 @@ def test_synthesize_speech_requires_admin(client: TestClient):
 
     assert response.status_code == 401
 
+
+
+def test_synthesize_speech_stream_success(client: TestClient, override_admin_auth, mock_admin_user):
+    """The streaming variant returns raw audio bytes instead of base64 JSON."""
+    override_admin_auth(mock_admin_user)
+
+    async def fake_stream(**kwargs):
+        for chunk in (b"chunk-1", b"chunk-2", b"chunk-3"):
+            yield chunk
+
+    mock_instance = MagicMock()
+    mock_instance.settings.TTS_DEFAULT_VOICE_ID = "test-voice"
+    mock_instance.settings.TTS_DEFAULT_FORMAT = "mp3"
+    mock_instance.synthesize_stream = MagicMock(side_effect=fake_stream)
+
+    app.dependency_overrides[get_tts_service] = lambda: mock_instance
+
+    try:
+        response = client.post(
+            "/api/v1/speech/synthesize/stream",
+            json={"text": "Hello world", "audio_format": "mp3"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "audio/mpeg"
+        assert response.content == b"chunk-1chunk-2chunk-3"
+        mock_instance.synthesize_stream.assert_called_once_with(
+            text="Hello world",
+            voice_id=None,
+            audio_format="mp3",
+            use_cache=True,
+        )
+    finally:
+        app.dependency_overrides.pop(get_tts_service, None)
+
+
+def test_synthesize_speech_stream_rate_limit_error(client: TestClient, override_admin_auth, mock_admin_user):
+    """Failures before the first chunk are still reported as HTTP errors."""
+    override_admin_auth(mock_admin_user)
+
+    async def failing_stream(**kwargs):
+        raise TTSProviderRateLimitError("Rate limit exceeded")
+        yield b""
+
+    mock_instance = MagicMock()
+    mock_instance.settings.TTS_DEFAULT_FORMAT = "mp3"
+    mock_instance.synthesize_stream = MagicMock(side_effect=failing_stream)
+
+    app.dependency_overrides[get_tts_service] = lambda: mock_instance
+
+    try:
+        response = client.post(
+            "/api/v1/speech/synthesize/stream",
+            json={"text": "Hello world"},
+        )
+
+        assert response.status_code == 429
+    finally:
+        app.dependency_overrides.pop(get_tts_service, None)
@@ -4,6 +4,8 @@ Integration tests for TTS fallback behavior.
 Tests the complete TTS service with fallback chain, circuit breaker,
 and retry logic in realistic scenarios.
 """
+import asyncio
+import itertools
 import pytest
 from unittest.mock import AsyncMock, patch
 from app.services.tts.base import TTSProviderError
@@ -208,3 +210,366 @@ class TestTTSRetryAndFallbackIntegration:
         # Fallback should not have been called
         assert fallback_provider.synthesize.call_count == 0
 
+
+
+# mock_tts_settings patches asyncio.sleep; keep a real one for slow providers
+_real_sleep = asyncio.sleep
+
+
+class TestTTSAdaptiveRouting:
+    """Tests for latency-aware routing and hedging in TTSService."""
+    
+    @pytest.mark.integration
+    @pytest.mark.asyncio
+    async def test_routes_to_faster_provider(self, mock_tts_settings, tts_service_with_providers):
+        """Once both providers have samples, the one with lower EWMA latency goes first."""
+        mock_tts_settings.TTS_FALLBACK_PROVIDER = "elevenlabs"
+        mock_tts_settings.TTS_ROUTING_MIN_SAMPLES = 2
+        
+        primary_provider = AsyncMock()
+        primary_provider.synthesize = AsyncMock(return_value=b"primary_audio")
+        fallback_provider = AsyncMock()
+        fallback_provider.synthesize = AsyncMock(return_value=b"fallback_audio")
+        service = tts_service_with_providers(primary_provider, fallback_provider)
+        
+        for _ in range(2):
+            service.router.record("coqui", 3.0, success=True)
+            service.router.record("elevenlabs", 0.2, success=True)
+        
+        audio_data = await service.synthesize("Hello world", use_cache=False)
+        
+        assert audio_data == b"fallback_audio"
+        assert primary_provider.synthesize.call_count == 0
+        assert service.get_stats()["routing"]["providers"]["elevenlabs"]["samples"] == 3
+    
+    @pytest.mark.integration
+    @pytest.mark.asyncio
+    async def test_ordered_strategy_keeps_primary_first(self, mock_tts_settings, tts_service_with_providers):
+        """TTS_ROUTING_STRATEGY=ordered always tries the primary provider first."""
+        mock_tts_settings.TTS_FALLBACK_PROVIDER = "elevenlabs"
+        mock_tts_settings.TTS_ROUTING_STRATEGY = "ordered"
+        mock_tts_settings.TTS_ROUTING_MIN_SAMPLES = 1
+        
+        primary_provider = AsyncMock()
+        primary_provider.synthesize = AsyncMock(return_value=b"primary_audio")
+        fallback_provider = AsyncMock()
+        fallback_provider.synthesize = AsyncMock(return_value=b"fallback_audio")
+        service = tts_service_with_providers(primary_provider, fallback_provider)
+        service.router.record("coqui", 3.0, success=True)
+        service.router.record("elevenlabs", 0.2, success=True)
+        
+        assert await service.synthesize("Hello world", use_cache=False) == b"primary_audio"
+    
+    @pytest.mark.integration
+    @pytest.mark.asyncio
+    async def test_hedge_to_second_provider_when_slow(self, mock_tts_settings, tts_service_with_providers):
+        """A slow best provider is raced against the next one; the first result wins."""
+        mock_tts_settings.TTS_FALLBACK_PROVIDER = "elevenlabs"
+        mock_tts_settings.TTS_HEDGE_ENABLED = True
+        mock_tts_settings.TTS_HEDGE_DELAY = 0.01
+        primary_cancelled = asyncio.Event()
+        
+        async def slow_synthesize(text, voice_id, audio_format, **kwargs):
+            try:
+                await _real_sleep(5)
+            except asyncio.CancelledError:
+                primary_cancelled.set()
+                raise
+            return b"primary_audio"
+        
+        primary_provider = AsyncMock()
+        primary_provider.synthesize = AsyncMock(side_effect=slow_synthesize)
+        fallback_provider = AsyncMock()
+        fallback_provider.synthesize = AsyncMock(return_value=b"fallback_audio")
+        service = tts_service_with_providers(primary_provider, fallback_provider)
+        
+        audio_data = await asyncio.wait_for(service.synthesize("Hello world", use_cache=False), timeout=2)
+        await asyncio.wait_for(primary_cancelled.wait(), timeout=1)
+        
+        assert audio_data == b"fallback_audio"
+        routing = service.get_stats()["routing"]
+        assert routing["hedged_requests"] == 1
+        assert routing["hedge_wins"] == 1
+    
+    @pytest.mark.integration
+    @pytest.mark.asyncio
+    async def test_hedge_skipped_when_budget_exhausted(self, mock_tts_settings, tts_service_with_providers):
+        """Without hedge budget the slow provider is awaited instead of duplicated."""
+        mock_tts_settings.TTS_FALLBACK_PROVIDER = "elevenlabs"
+        mock_tts_settings.TTS_HEDGE_ENABLED = True
+        mock_tts_settings.TTS_HEDGE_DELAY = 0.01
+        mock_tts_settings.TTS_HEDGE_BUDGET_RATIO = 0.0
+        mock_tts_settings.TTS_HEDGE_BUDGET_MAX_TOKENS = 0.0
+        
+        async def slow_synthesize(text, voice_id, audio_format, **kwargs):
+            await _real_sleep(0.05)
+            return b"primary_audio"
+        
+        primary_provider = AsyncMock()
+        primary_provider.synthesize = AsyncMock(side_effect=slow_synthesize)
+        fallback_provider = AsyncMock()
+        fallback_provider.synthesize = AsyncMock(return_value=b"fallback_audio")
+        service = tts_service_with_providers(primary_provider, fallback_provider)
+        
+        audio_data = await asyncio.wait_for(service.synthesize("Hello world", use_cache=False), timeout=2)
+        
+        assert audio_data == b"primary_audio"
+        assert fallback_provider.synthesize.call_count == 0
+        routing = service.get_stats()["routing"]
+        assert routing["hedged_requests"] == 0
+        assert routing["hedge_budget_exhausted"] == 1
+    
+    @pytest.mark.integration
+    @pytest.mark.asyncio
+    async def test_no_hedge_when_best_provider_is_fast(self, mock_tts_settings, tts_service_with_providers):
+        """The second provider is not called when the best one answers within the delay."""
+        mock_tts_settings.TTS_FALLBACK_PROVIDER = "elevenlabs"
+        mock_tts_settings.TTS_HEDGE_ENABLED = True
+        mock_tts_settings.TTS_HEDGE_DELAY = 1.0
+        
+        primary_provider = AsyncMock()
+        primary_provider.synthesize = AsyncMock(return_value=b"primary_audio")
+        fallback_provider = AsyncMock()
+        fallback_provider.synthesize = AsyncMock(return_value=b"fallback_audio")
+        service = tts_service_with_providers(primary_provider, fallback_provider)
+        
+        assert await service.synthesize("Hello world", use_cache=False) == b"primary_audio"
+        assert fallback_provider.synthesize.call_count == 0
+        assert service.get_stats()["routing"]["hedged_requests"] == 0
+    
+    @pytest.mark.integration
+    @pytest.mark.asyncio
+    async def test_hedging_falls_back_immediately_on_failure(self, mock_tts_settings, tts_service_with_providers):
+        """A provider failing before the hedge delay is followed by the next one right away."""
+        mock_tts_settings.TTS_FALLBACK_PROVIDER = "elevenlabs"
+        mock_tts_settings.TTS_RETRY_ATTEMPTS = 0
+        mock_tts_settings.TTS_HEDGE_ENABLED = True
+        mock_tts_settings.TTS_HEDGE_DELAY = 30.0
+        
+        primary_provider = AsyncMock()
+        primary_provider.synthesize = AsyncMock(side_effect=TTSProviderError("Primary provider failed"))
+        fallback_provider = AsyncMock()
+        fallback_provider.synthesize = AsyncMock(return_value=b"fallback_audio")
+        service = tts_service_with_providers(primary_provider, fallback_provider)
+        
+        audio_data = await asyncio.wait_for(service.synthesize("Hello world", use_cache=False), timeout=2)
+        
+        assert audio_data == b"fallback_audio"
+        assert service.get_stats()["routing"]["hedged_requests"] == 0
+
+    
+    @pytest.mark.integration
+    @pytest.mark.asyncio
+    async def test_primary_slowdown_demotes_it_through_hedges(self, mock_tts_settings, tts_service_with_providers):
+        """A primary that gets slower without erroring is demoted from its cancelled, hedged calls."""
+        mock_tts_settings.TTS_FALLBACK_PROVIDER = "elevenlabs"
+        mock_tts_settings.TTS_ROUTING_MIN_SAMPLES = 3
+        mock_tts_settings.TTS_HEDGE_ENABLED = True
+        mock_tts_settings.TTS_HEDGE_DELAY = 0.03
+        primary_delay = 0.0
+        
+        async def primary_synthesize(text, voice_id, audio_format, **kwargs):
+            await _real_sleep(primary_delay)
+            return b"primary_audio"
+        
+        async def fallback_synthesize(text, voice_id, audio_format, **kwargs):
+            await _real_sleep(0.005)
+            return b"fallback_audio"
+        
+        primary_provider = AsyncMock()
+        primary_provider.synthesize = AsyncMock(side_effect=primary_synthesize)
+        fallback_provider = AsyncMock()
+        fallback_provider.synthesize = AsyncMock(side_effect=fallback_synthesize)
+        service = tts_service_with_providers(primary_provider, fallback_provider)
+        
+        for i in range(3):
+            assert await service.synthesize(f"fast {i}", use_cache=False) == b"primary_audio"
+        assert [name for _, name in service._ranked_providers()] == ["coqui", "elevenlabs"]
+        
+        primary_delay = 1.0
+        for i in range(6):
+            await asyncio.wait_for(service.synthesize(f"slow {i}", use_cache=False), timeout=2)
+        
+        routing = service.get_stats()["routing"]
+        assert [name for _, name in service._ranked_providers()] == ["elevenlabs", "coqui"]
+        assert routing["providers"]["coqui"]["ewma_error_rate"] == 0.0
+        assert routing["providers"]["coqui"]["ewma_latency"] > routing["providers"]["elevenlabs"]["ewma_latency"]
+        hedged = routing["hedged_requests"]
+        assert await service.synthesize("after", use_cache=False) == b"fallback_audio"
+        assert service.get_stats()["routing"]["hedged_requests"] == hedged
+    
+    @pytest.mark.integration
+    @pytest.mark.asyncio
+    async def test_hedge_loser_finished_before_return(self, mock_tts_settings, tts_service_with_providers):
+        """The cancelled loser has finished, with its censored sample recorded, when synthesize returns."""
+        mock_tts_settings.TTS_FALLBACK_PROVIDER = "elevenlabs"
+        mock_tts_settings.TTS_ROUTING_MIN_SAMPLES = 1
+        mock_tts_settings.TTS_HEDGE_ENABLED = True
+        mock_tts_settings.TTS_HEDGE_DELAY = 0.03
+        slow = False
+
+        async def primary_synthesize(text, voice_id, audio_format, **kwargs):
+            if slow:
+                await _real_sleep(1.0)
+            return b"primary_audio"
+
+        primary_provider = AsyncMock()
+        primary_provider.synthesize = AsyncMock(side_effect=primary_synthesize)
+        fallback_provider = AsyncMock()
+        fallback_provider.synthesize = AsyncMock(return_value=b"fallback_audio")
+        service = tts_service_with_providers(primary_provider, fallback_provider)
+        assert await service.synthesize("fast", use_cache=False) == b"primary_audio"
+        before = service.get_stats()["routing"]["providers"]["coqui"]["ewma_latency"]
+
+        loop = asyncio.get_running_loop()
+        unhandled = []
+        loop.set_exception_handler(lambda _, context: unhandled.append(context))
+        try:
+            slow = True
+            assert await service.synthesize("slow", use_cache=False) == b"fallback_audio"
+            assert service.get_stats()["routing"]["providers"]["coqui"]["ewma_latency"] > before
+            await _real_sleep(0)
+            assert unhandled == []
+        finally:
+            loop.set_exception_handler(None)
+
+    @pytest.mark.integration
+    @pytest.mark.asyncio
+    async def test_exploration_demotes_slow_primary_without_hedging(self, mock_tts_settings, tts_service_with_providers):
+        """Without hedging, explored calls give the fallback samples, so a slowed primary is demoted."""
+        mock_tts_settings.TTS_FALLBACK_PROVIDER = "elevenlabs"
+        mock_tts_settings.TTS_ROUTING_MIN_SAMPLES = 2
+        mock_tts_settings.TTS_ROUTING_EXPLORE_RATIO = 0.25
+        primary_delay = 0.0
+        
+        async def primary_synthesize(text, voice_id, audio_format, **kwargs):
+            await _real_sleep(primary_delay)
+            return b"primary_audio"
+        
+        async def fallback_synthesize(text, voice_id, audio_format, **kwargs):
+            await _real_sleep(0.01)
+            return b"fallback_audio"
+        
+        primary_provider = AsyncMock()
+        primary_provider.synthesize = AsyncMock(side_effect=primary_synthesize)
+        fallback_provider = AsyncMock()
+        fallback_provider.synthesize = AsyncMock(side_effect=fallback_synthesize)
+        service = tts_service_with_providers(primary_provider, fallback_provider)
+        
+        # Every fourth call explores
+        with patch("app.services.tts.service.random.random", side_effect=itertools.cycle([0.0, 0.9, 0.9, 0.9])):
+            for i in range(8):
+                await service.synthesize(f"fast {i}", use_cache=False)
+            assert fallback_provider.synthesize.call_count == 2
+            assert service.router.explored_requests == 2
+            
+            primary_delay = 0.05
+            for i in range(12):
+                await service.synthesize(f"slow {i}", use_cache=False)
+        
+        service.router.explore_ratio = 0.0
+        assert [name for _, name in service._ranked_providers()] == ["elevenlabs", "coqui"]
+
+
+class TestTTSStreaming:
+    """Tests for streaming synthesis in TTSService."""
+    
+    @pytest.mark.integration
+    @pytest.mark.asyncio
+    async def test_stream_forwards_provider_chunks(self, mock_tts_settings, tts_service_with_providers):
+        """Chunks from the provider are yielded as they arrive."""
+        async def stream(text, voice_id, audio_format, **kwargs):
+            for chunk in (b"a", b"b", b"c"):
+                yield chunk
+        
+        provider = AsyncMock()
+        provider.synthesize_stream = stream
+        service = tts_service_with_providers(provider)
+        
+        chunks = [chunk async for chunk in service.synthesize_stream("Hello world", use_cache=False)]
+        
+        assert chunks == [b"a", b"b", b"c"]
+    
+    @pytest.mark.integration
+    @pytest.mark.asyncio
+    async def test_stream_falls_back_before_first_chunk(self, mock_tts_settings, tts_service_with_providers):
+        """A provider failing before sending audio falls back to the next provider."""
+        async def failing_stream(text, voice_id, audio_format, **kwargs):
+            raise TTSProviderError("Primary provider failed")
+            yield b""
+        
+        async def fallback_stream(text, voice_id, audio_format, **kwargs):
+            yield b"fallback"
+        
+        primary_provider = AsyncMock()
+        primary_provider.synthesize_stream = failing_stream
+        fallback_provider = AsyncMock()
+        fallback_provider.synthesize_stream = fallback_stream
+        service = tts_service_with_providers(primary_provider, fallback_provider)
+        
+        chunks = [chunk async for chunk in service.synthesize_stream("Hello world", use_cache=False)]
+        
+        assert chunks == [b"fallback"]
+    
+    @pytest.mark.integration
+    @pytest.mark.asyncio
+    async def test_stream_failure_after_first_chunk_is_raised(self, mock_tts_settings, tts_service_with_providers):
+        """Once audio has been sent, a mid-stream failure is not masked by a fallback."""
+        async def broken_stream(text, voice_id, audio_format, **kwargs):
+            yield b"partial"
+            raise TTSProviderError("Connection dropped")
+        
+        async def fallback_stream(text, voice_id, audio_format, **kwargs):
+            yield b"fallback"
+        
+        primary_provider = AsyncMock()
+        primary_provider.synthesize_stream = broken_stream
+        fallback_provider = AsyncMock()
+        fallback_provider.synthesize_stream = fallback_stream
+        service = tts_service_with_providers(primary_provider, fallback_provider)
+        
+        chunks = []
+        with pytest.raises(TTSProviderError, match="Connection dropped"):
+            async for chunk in service.synthesize_stream("Hello world", use_cache=False):
+                chunks.append(chunk)
+        
+        assert chunks == [b"partial"]
+    
+    @pytest.mark.integration
+    @pytest.mark.asyncio
+    async def test_stream_latency_is_time_to_first_chunk(self, mock_tts_settings, tts_service_with_providers):
+        """A slow client reading the stream does not count as provider latency."""
+        async def stream(text, voice_id, audio_format, **kwargs):
+            for chunk in (b"a", b"b", b"c"):
+                yield chunk
+        
+        provider = AsyncMock()
+        provider.synthesize_stream = stream
+        service = tts_service_with_providers(provider)
+        
+        async for _ in service.synthesize_stream("Hello world", use_cache=False):
+            await _real_sleep(0.05)
+        
+        assert service.router.providers["coqui"]["latency"] < 0.05
+    
+    @pytest.mark.integration
+    @pytest.mark.asyncio
+    async def test_stalled_stream_reader_does_not_hold_provider_slot(self, mock_tts_settings, tts_service_with_providers):
+        """A client that stops reading mid-stream leaves the provider's concurrency slots free."""
+        mock_tts_settings.TTS_MAX_CONCURRENT = 1
+        
+        async def stream(text, voice_id, audio_format, **kwargs):
+            for chunk in (b"a", b"b"):
+                yield chunk
+        
+        provider = AsyncMock()
+        provider.synthesize_stream = stream
+        provider.synthesize = AsyncMock(return_value=b"audio")
+        service = tts_service_with_providers(provider)
+        
+        stalled = service.synthesize_stream("Hello world", use_cache=False)
+        assert await stalled.__anext__() == b"a"
+        try:
+            assert await asyncio.wait_for(service.synthesize("Other", use_cache=False), timeout=1) == b"audio"
+        finally:
+            await stalled.aclose()
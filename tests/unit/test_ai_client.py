@@ -171,6 +171,43 @@ class TestAIServiceClient:
                 job_description="JD", question="Q?", answer="A"
             )
 
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_analyze_answer_cache_hit(self, mock_httpx_client):
+        """Resubmitting the same (normalized) answer is served from cache."""
+        from app.utils.cache import cache_metrics
+        mock_response = MagicMock(status_code=200)
+        mock_response.json.return_value = {"score": {"clarity": 8}, "analysis": "Good answer"}
+        mock_httpx_client.post.return_value = mock_response
+        cache_metrics.reset_metrics()
+
+        client = AIServiceClient(base_url="http://test-ai:8000")
+        client.analysis_cache_enabled = True
+        first = await client.analyze_answer(
+            job_description="JD", question="What is Python?", answer="A  language", role="dev"
+        )
+        second = await client.analyze_answer(
+            job_description="JD", question="what is python?", answer="A language ", role="dev"
+        )
+
+        assert second == first
+        assert mock_httpx_client.post.await_count == 1
+        op_stats = cache_metrics.get_metrics()["by_operation"]["answer_analysis"]
+        assert op_stats["hits"] == 1
+        assert op_stats["misses"] == 1
+        assert op_stats["hit_rate"] == 50.0
+
+    @pytest.mark.unit
+    def test_analysis_cache_key_includes_scoring_version(self):
+        """Changing the scoring version changes the cache key."""
+        from app.services import ai_client as ai_client_module
+        key_v1 = AIServiceClient.get_analysis_cache_key("JD", "Q?", "A", "dev")
+        with patch.object(ai_client_module.settings, "ANSWER_ANALYSIS_SCORING_VERSION", "2"):
+            key_v2 = AIServiceClient.get_analysis_cache_key("JD", "Q?", "A", "dev")
+
+        assert key_v1 != key_v2
+        assert key_v1.startswith("ai_cache:ai_service:answer_analysis:")
+
     @pytest.mark.unit
     @pytest.mark.asyncio
     async def test_transcribe_audio_success(self, mock_httpx_client, tmp_path):
@@ -206,3 +243,38 @@ class TestAIServiceClient:
                 audio_file_path=str(audio_file),
                 session_id="sess-1",
             )
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_transcribe_audio_stream_sends_multipart_body(self, mock_httpx_client):
+        """Audio chunks are streamed inside a multipart body."""
+        sent = {}
+
+        async def post(url, content=None, headers=None, **kwargs):
+            sent["headers"] = headers
+            sent["body"] = b"".join([chunk async for chunk in content])
+            return MagicMock(status_code=200, json=MagicMock(return_value={"text": "hello"}))
+
+        mock_httpx_client.post = post
+
+        async def chunks():
+            yield b"RIFF"
+            yield b"audio-bytes"
+
+        client = AIServiceClient(base_url="http://test-ai:8000")
+        result = await client.transcribe_audio_stream(
+            chunks=chunks(),
+            filename="answer.wav",
+            session_id="sess-1",
+            language="en-US",
+        )
+
+        assert result["text"] == "hello"
+        boundary = sent["headers"]["Content-Type"].split("boundary=")[1]
+        body = sent["body"]
+        assert body.startswith(f"--{boundary}\r\n".encode())
+        assert body.endswith(f"\r\n--{boundary}--\r\n".encode())
+        assert b'name="session_id"\r\n\r\nsess-1\r\n' in body
+        assert b'name="audio_file"; filename="answer.wav"' in body
+        assert b"Content-Type: audio/x-wav" in body or b"Content-Type: audio/wav" in body
+        assert b"RIFFaudio-bytes" in body
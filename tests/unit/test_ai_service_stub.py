@@ -0,0 +1,140 @@
+"""
+Unit tests for the local AI service stub (scripts/ai_service_stub.py).
+
+Runs AIServiceClient against the stub in-process to verify the stub honours
+the response contracts the client validates.
+"""
+import importlib.util
+import random
+from pathlib import Path
+
+import httpx
+import pytest
+
+from app.services.ai_client import AIServiceClient, AIServiceUnavailableError
+
+_STUB_PATH = Path(__file__).resolve().parents[2] / "scripts" / "ai_service_stub.py"
+_spec = importlib.util.spec_from_file_location("ai_service_stub", _STUB_PATH)
+ai_service_stub = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(ai_service_stub)
+
+
+def _client_for(app) -> AIServiceClient:
+    """Create an AIServiceClient whose HTTP calls are served by the stub app."""
+    client = AIServiceClient(base_url="http://ai-stub")
+    client.client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app))
+    client.analysis_cache_enabled = False
+    return client
+
+
+class TestLatencyModel:
+    """Test cases for latency spec parsing."""
+
+    @pytest.mark.unit
+    def test_parse_and_sample(self):
+        """Specs parse and samples are non-negative."""
+        rng = random.Random(1)
+        assert ai_service_stub.LatencyModel.parse("fixed:0.2").sample(rng) == 0.2
+        uniform = ai_service_stub.LatencyModel.parse("uniform:0.1:0.3")
+        assert all(0.1 <= uniform.sample(rng) <= 0.3 for _ in range(50))
+        normal = ai_service_stub.LatencyModel.parse("normal:0.0:1.0")
+        assert all(normal.sample(rng) >= 0 for _ in range(50))
+
+    @pytest.mark.unit
+    def test_parse_invalid(self):
+        """Unknown distributions and wrong arity are rejected."""
+        with pytest.raises(ValueError):
+            ai_service_stub.LatencyModel.parse("pareto:1")
+        with pytest.raises(ValueError):
+            ai_service_stub.LatencyModel.parse("uniform:0.1")
+
+
+class TestAIServiceStub:
+    """Test the stub against AIServiceClient contracts."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_generate_questions_contract(self):
+        """Structured generation passes client validation with embeddings per question."""
+        config = ai_service_stub.StubConfig(embedding_dim=8, questions_per_request=3)
+        client = _client_for(ai_service_stub.create_stub_app(config))
+
+        result = await client.generate_questions_structured(
+            role_name="Backend Engineer", job_description="Build APIs"
+        )
+
+        assert len(result["questions"]) == 3
+        for question in result["questions"]:
+            assert len(result["embedding_vectors"][question["question_id"]]) == 8
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_score_and_health(self):
+        """Scoring returns deterministic legacy scores."""
+        client = _client_for(ai_service_stub.create_stub_app())
+
+        assert await client.health_check() is True
+        first = await client.analyze_answer(job_description="JD", question="Q?", answer="An answer")
+        second = await client.analyze_answer(job_description="JD", question="Q?", answer="An answer")
+
+        assert first == second
+        assert 1 <= first["score"]["clarity"] <= 10
+        assert "analysis" in first
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_streamed_transcription(self):
+        """The stub parses the client's streamed multipart upload."""
+        client = _client_for(ai_service_stub.create_stub_app())
+
+        async def chunks():
+            for _ in range(4):
+                yield b"x" * 1000
+
+        result = await client.transcribe_audio_stream(
+            chunks=chunks(), filename="answer.wav", session_id="s1", language="en-US"
+        )
+
+        assert result["transcript"] == "Stub transcript of 4000 bytes of audio."
+        assert result["session_id"] == "s1"
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_embeddings_dimensions(self):
+        """Embeddings are deterministic and sized by configuration on both paths."""
+        app = ai_service_stub.create_stub_app(ai_service_stub.StubConfig(embedding_dim=16))
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://ai-stub") as http:
+            first = (await http.post("/embeddings/generate", json={"text": "hello"})).json()
+            second = (await http.post("/api/v1/embeddings/generate", json={"text": "hello"})).json()
+
+        assert len(first["embedding"]) == 16
+        assert first["embedding"] == second["embedding"]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_error_injection(self):
+        """Per-endpoint error rates surface as AIServiceUnavailableError."""
+        config = ai_service_stub.StubConfig(endpoint_error_rate={"score": 1.0}, seed=7)
+        app = ai_service_stub.create_stub_app(config)
+        client = _client_for(app)
+
+        with pytest.raises(AIServiceUnavailableError):
+            await client.analyze_answer(job_description="JD", question="Q?", answer="A")
+        assert app.state.stats["score"] == {"requests": 1, "errors": 1}
+
+    @pytest.mark.unit
+    def test_config_from_args(self):
+        """Command-line overrides are parsed into the config."""
+        args = ai_service_stub._build_parser().parse_args([
+            "--latency", "lognormal:0.3:0.5",
+            "--endpoint-latency", "score=fixed:1",
+            "--endpoint-error-rate", "transcribe=0.5",
+            "--embedding-dim", "32",
+        ])
+        config = ai_service_stub.config_from_args(args)
+
+        assert config.latency.distribution == "lognormal"
+        assert config.latency_for("score").params == [1.0]
+        assert config.error_rate_for("transcribe") == 0.5
+        assert config.error_rate_for("score") == 0.0
+        assert config.embedding_dim == 32
@@ -0,0 +1,124 @@
+"""
+Unit tests for the content-addressed audio blob store.
+"""
+import os
+import pytest
+from app.services.audio_blob_store import AudioBlobStore
+
+
+@pytest.fixture
+def blob_store(tmp_path):
+    """Blob store rooted in a temporary directory."""
+    return AudioBlobStore(str(tmp_path / "blobs"), max_bytes=1024)
+
+
+class TestAudioBlobStore:
+    """Tests for AudioBlobStore."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_put_get_roundtrip(self, blob_store):
+        """Stored audio is read back unchanged under its SHA-256 id."""
+        blob_id = await blob_store.put(b"audio bytes")
+
+        assert blob_id == AudioBlobStore.compute_blob_id(b"audio bytes")
+        assert await blob_store.get(blob_id) == b"audio bytes"
+        assert await blob_store.exists(blob_id)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_sharded_path(self, blob_store):
+        """Blobs are sharded by hash prefix."""
+        blob_id = await blob_store.put(b"sharded")
+        path = blob_store.path_for(blob_id)
+
+        assert path.parent.name == blob_id[2:4]
+        assert path.parent.parent.name == blob_id[:2]
+        assert path.is_file()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_identical_content_stored_once(self, blob_store):
+        """Putting the same content twice writes a single blob."""
+        first = await blob_store.put(b"same audio")
+        second = await blob_store.put(b"same audio")
+
+        assert first == second
+        stats = blob_store.get_stats()
+        assert stats["writes"] == 1
+        assert stats["dedup_writes"] == 1
+        assert stats["blobs"] == 1
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_lru_eviction_by_size(self, blob_store):
+        """Least recently used blobs are evicted once max_bytes is exceeded."""
+        a = await blob_store.put(b"a" * 400)
+        b = await blob_store.put(b"b" * 400)
+        await blob_store.get(a)  # a becomes most recently used
+        c = await blob_store.put(b"c" * 400)
+
+        assert await blob_store.get(b) is None
+        assert await blob_store.get(a) == b"a" * 400
+        assert await blob_store.get(c) == b"c" * 400
+        stats = blob_store.get_stats()
+        assert stats["evictions"] == 1
+        assert stats["total_bytes"] == 800
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_open_stream(self, blob_store):
+        """Blobs can be streamed from disk in chunks."""
+        blob_id = await blob_store.put(b"0123456789")
+
+        stream = await blob_store.open_stream(blob_id, chunk_size=4)
+        chunks = [chunk async for chunk in stream]
+
+        assert chunks == [b"0123", b"4567", b"89"]
+        assert await blob_store.open_stream("f" * 64) is None
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_invalid_blob_id(self, blob_store):
+        """Ids that are not SHA-256 digests never touch the filesystem."""
+        with pytest.raises(ValueError):
+            blob_store.path_for("../../etc/passwd")
+        assert await blob_store.get("../../etc/passwd") is None
+        assert not await blob_store.exists("not-a-blob")
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_index_rebuilt_from_disk(self, blob_store, tmp_path):
+        """A new store instance picks up existing blobs, oldest first."""
+        old = await blob_store.put(b"o" * 400)
+        new = await blob_store.put(b"n" * 400)
+        os.utime(blob_store.path_for(old), (1, 1))
+
+        reopened = AudioBlobStore(str(tmp_path / "blobs"), max_bytes=1024)
+        await reopened.put(b"x" * 400)
+
+        assert await reopened.get(old) is None
+        assert await reopened.get(new) == b"n" * 400
+        assert reopened.get_stats()["blobs"] == 2
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_cap_covers_blobs_of_every_worker(self, tmp_path):
+        """Stores sharing a directory keep its total under max_bytes and evict by shared recency."""
+        root = str(tmp_path / "blobs")
+        worker_a = AudioBlobStore(root, max_bytes=1024, rescan_interval=3600)
+        worker_b = AudioBlobStore(root, max_bytes=1024, rescan_interval=3600)
+        a1 = await worker_a.put(b"1" * 400)
+        a2 = await worker_a.put(b"2" * 400)
+        os.utime(worker_a.path_for(a1), (1, 1))
+        os.utime(worker_a.path_for(a2), (2, 2))
+        assert await worker_b.get(a1) == b"1" * 400  # Read by another worker: most recently used
+
+        b1 = await worker_b.put(b"3" * 400)
+
+        blobs = [path for path in (tmp_path / "blobs").glob("*/*/*")]
+        assert sum(path.stat().st_size for path in blobs) <= 1024
+        assert await worker_b.get(a2) is None
+        assert await worker_a.get(a1) == b"1" * 400
+        assert await worker_a.get(b1) == b"3" * 400
+        assert worker_b.get_stats()["evictions"] == 1
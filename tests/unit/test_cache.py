@@ -0,0 +1,599 @@
+"""
+Unit tests for CacheManager.
+
+Tests the in-memory backend and the async Redis backend (against an
+in-process stand-in).
+"""
+import asyncio
+import json
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.utils.cache import BoundedMemoryCache, CacheManager
+
+
+@pytest.fixture
+def memory_cache():
+    """CacheManager using the in-memory backend."""
+    manager = CacheManager()
+    manager.redis_client = None
+    return manager
+
+
+@pytest.fixture
+def redis_cache(fake_async_redis, fake_sync_redis):
+    """CacheManager using the async Redis backend."""
+    manager = CacheManager()
+    manager.redis_client = fake_async_redis
+    manager.sync_redis_client = fake_sync_redis
+    return manager
+
+
+class TestBoundedMemoryCache:
+    """Test cases for the bounded LRU/TTL memory store."""
+
+    @pytest.mark.unit
+    def test_lru_eviction_by_entries(self):
+        """Least recently used entries are evicted past max_entries."""
+        cache = BoundedMemoryCache(max_entries=2)
+        cache.set("a", 1, ttl=60)
+        cache.set("b", 2, ttl=60)
+        assert cache.get("a") == 1  # "b" is now least recently used
+        cache.set("c", 3, ttl=60)
+
+        assert cache.keys() == ["a", "c"]
+        assert cache.get_stats()["evictions"] == 1
+
+    @pytest.mark.unit
+    def test_eviction_by_bytes(self):
+        """Entries are evicted to keep resident bytes under max_bytes."""
+        cache = BoundedMemoryCache(max_bytes=250)
+        for i in range(5):
+            cache.set(f"k{i}", "x" * 100, ttl=60)
+
+        stats = cache.get_stats()
+        assert stats["resident_bytes"] <= 250
+        assert stats["entries"] == 2
+        assert stats["evictions"] == 3
+        assert cache.keys() == ["k3", "k4"]
+
+    @pytest.mark.unit
+    def test_oversized_value_rejected(self):
+        """A value larger than max_bytes is not stored."""
+        cache = BoundedMemoryCache(max_bytes=50)
+        assert cache.set("big", "x" * 100, ttl=60) is False
+        assert len(cache) == 0
+        assert cache.get_stats()["rejected"] == 1
+
+    @pytest.mark.unit
+    def test_expired_entries_purged_proactively(self):
+        """Expired entries are reclaimed without their keys being read."""
+        cache = BoundedMemoryCache()
+        with patch("app.utils.cache.time.time", return_value=1000.0):
+            cache.set("short", "x" * 10, ttl=5)
+            cache.set("long", "y", ttl=600)
+
+        with patch("app.utils.cache.time.time", return_value=1010.0):
+            cache.set("other", "z", ttl=600)
+            assert cache.keys() == ["long", "other"]
+
+        assert cache.get_stats()["expirations"] == 1
+        assert cache.current_bytes == sum(len(k) + 1 for k in ("long", "other"))
+
+    @pytest.mark.unit
+    def test_overwrite_updates_bytes_and_ttl(self):
+        """Overwriting a key replaces its size and expiry."""
+        cache = BoundedMemoryCache()
+        with patch("app.utils.cache.time.time", return_value=1000.0):
+            cache.set("k", "x" * 50, ttl=5)
+            cache.set("k", "y", ttl=600)
+
+        assert cache.current_bytes == len("k") + 1
+        with patch("app.utils.cache.time.time", return_value=1010.0):
+            assert cache.get("k") == "y"
+
+
+class TestCacheManagerMemory:
+    """Test cases for the in-memory backend."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_set_get_and_stats(self, memory_cache):
+        """Values round-trip and hits/misses are counted."""
+        assert await memory_cache.set("k", {"a": 1}, ttl=60) is True
+        assert await memory_cache.get("k") == {"a": 1}
+        assert await memory_cache.get("missing") is None
+
+        stats = memory_cache.get_stats()
+        assert stats["backend"] == "memory"
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["memory_cache_size"] == 1
+        assert stats["memory_cache_bytes"] > 0
+        assert stats["evictions"] == 0
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_clear_pattern_glob(self, memory_cache):
+        """Memory pattern clears use glob matching."""
+        qg = memory_cache.get_cache_key("interview", "question_generation", request_hash="a")
+        aa = memory_cache.get_cache_key("ai_service", "answer_analysis", content_hash="a")
+        await memory_cache.set_many({qg: 1, aa: 2}, ttl=60)
+
+        assert await memory_cache.clear_pattern("ai_cache:*:question_generation:*") == 1
+        assert await memory_cache.get(aa) == 2
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_invalidate_namespace(self, memory_cache):
+        """Namespace invalidation hides existing entries in the memory backend."""
+        key = memory_cache.get_cache_key("ai_service", "answer_analysis", content_hash="a")
+        await memory_cache.set(key, 1, ttl=60)
+
+        assert await memory_cache.invalidate_namespace("answer_analysis") == 1
+        assert await memory_cache.get(key) is None
+        await memory_cache.set(key, 2, ttl=60)
+        assert await memory_cache.get(key) == 2
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_get_many_set_many(self, memory_cache):
+        """Multi-get returns only found keys."""
+        await memory_cache.set_many({"a": 1, "b": 2}, ttl=60)
+
+        assert await memory_cache.get_many(["a", "b", "c"]) == {"a": 1, "b": 2}
+        assert memory_cache.cache_stats["hits"] == 2
+        assert memory_cache.cache_stats["misses"] == 1
+
+
+class TestCacheManagerRedis:
+    """Test cases for the async Redis backend."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_set_get_delete(self, redis_cache, fake_async_redis):
+        """Values are JSON-serialized in Redis and stats are tracked."""
+        assert await redis_cache.set("k", {"a": 1}, ttl=60) is True
+        assert redis_cache.codec.decode(fake_async_redis.store["k"]) == {"a": 1}
+        assert await redis_cache.get("k") == {"a": 1}
+        assert await redis_cache.get("missing") is None
+        assert await redis_cache.delete("k") is True
+
+        stats = redis_cache.get_stats()
+        assert stats["backend"] == "redis"
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_legacy_json_entries_decode(self, redis_cache, fake_async_redis):
+        """Entries written as plain JSON before the codec layer still decode."""
+        fake_async_redis.store["legacy"] = json.dumps({"a": 1}).encode()
+
+        assert await redis_cache.get("legacy") == {"a": 1}
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_get_many_single_round_trip(self, redis_cache, fake_async_redis):
+        """Multi-get uses one MGET and counts per-key hits and misses."""
+        await redis_cache.set_many({"a": 1, "b": [2]}, ttl=60)
+        redis_cache.l1_cache.clear()
+        fake_async_redis.commands.clear()
+
+        result = await redis_cache.get_many(["a", "b", "c"])
+
+        assert result == {"a": 1, "b": [2]}
+        assert fake_async_redis.commands == [("mget", ("a", "b", "c"))]
+        assert redis_cache.cache_stats["hits"] == 2
+        assert redis_cache.cache_stats["misses"] == 1
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_set_many_pipelined(self, redis_cache, fake_async_redis):
+        """Multi-set sends all writes in one pipeline."""
+        assert await redis_cache.set_many({"a": 1, "b": 2, "c": 3}, ttl=60) is True
+        assert ("pipeline", 3) in fake_async_redis.commands
+        assert set(fake_async_redis.store) == {"a", "b", "c"}
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_clear_pattern(self, redis_cache, fake_async_redis):
+        """Pattern clears only matching keys, using SCAN instead of KEYS."""
+        await redis_cache.set_many({"ai_cache:x:1": 1, "ai_cache:x:2": 2, "other": 3}, ttl=60)
+
+        assert await redis_cache.clear_pattern("ai_cache:x:*") == 2
+        assert await redis_cache.get("other") == 3
+        assert not any(command[0] == "keys" for command in fake_async_redis.commands)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_clear_pattern_unlinks_in_batches(self, redis_cache, fake_async_redis):
+        """Matching keys are unlinked in batches and generation counters are kept."""
+        redis_cache.scan_batch_size = 2
+        await redis_cache.invalidate_namespace("op")
+        await redis_cache.set_many({f"ai_cache:svc:op:{i}": i for i in range(5)}, ttl=60)
+
+        assert await redis_cache.clear_pattern("*") == 5
+        assert [c for c in fake_async_redis.commands if c[0] == "unlink"] == [
+            ("unlink", 2), ("unlink", 2), ("unlink", 1)
+        ]
+        assert fake_async_redis.store == {"cache_ns:op": "1"}
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_invalidate_namespace_is_single_incr(self, redis_cache, fake_async_redis):
+        """Invalidating a namespace bumps its counter and hides old entries."""
+        key = redis_cache.get_cache_key("ai_service", "answer_analysis", content_hash="abc")
+        other = redis_cache.get_cache_key("ai_service", "embeddings", content_hash="abc")
+        await redis_cache.set(key, {"score": 1}, ttl=60)
+        await redis_cache.set(other, [0.1], ttl=60)
+        fake_async_redis.commands.clear()
+
+        assert await redis_cache.invalidate_namespace("answer_analysis") == 1
+
+        assert [c for c in fake_async_redis.commands if c[0] != "publish"] == [
+            ("incr", "cache_ns:answer_analysis")
+        ]
+        assert await redis_cache.get(key) is None
+        assert await redis_cache.get(other) == [0.1]
+
+        await redis_cache.set(key, {"score": 2}, ttl=60)
+        assert await redis_cache.get(key) == {"score": 2}
+        assert f"{key.rsplit(':', 1)[0]}:g1:{key.rsplit(':', 1)[1]}" in fake_async_redis.store
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_generation_refreshed_from_redis(self, redis_cache, fake_async_redis):
+        """Generations bumped by another worker are picked up after the refresh interval."""
+        key = redis_cache.get_cache_key("interview", "question_generation", request_hash="h")
+        await redis_cache.set(key, "old", ttl=60)
+        assert await redis_cache.get(key) == "old"
+
+        await fake_async_redis.incr("cache_ns:question_generation")
+        redis_cache.l1_cache.clear()
+        redis_cache._namespace_generations["question_generation"] = (0, 0.0)  # stale
+
+        assert await redis_cache.get(key) is None
+        assert redis_cache.get_stats()["namespace_generations"] == {"question_generation": 1}
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_errors_are_counted(self, redis_cache):
+        """Backend errors return None/False and increment the error counter."""
+        redis_cache.redis_client.get = AsyncMock(side_effect=ConnectionError("down"))
+
+        assert await redis_cache.get("k") is None
+        assert await redis_cache.get_many([]) == {}
+        assert redis_cache.cache_stats["errors"] == 1
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_connect_falls_back_to_memory(self, redis_cache):
+        """An unreachable Redis falls back to the memory backend."""
+        redis_cache.redis_client.ping = AsyncMock(side_effect=ConnectionError("down"))
+
+        assert await redis_cache.connect() is False
+        assert redis_cache.redis_client is None
+        assert await redis_cache.set("k", 1) is True
+        assert await redis_cache.get("k") == 1
+
+
+class TestCacheManagerL1:
+    """Test cases for the per-process L1 cache in front of Redis."""
+
+    @pytest.fixture
+    async def make_worker(self, fake_async_redis):
+        """Create CacheManagers that share one (fake) Redis server, like separate workers."""
+        workers = []
+
+        def _make():
+            manager = CacheManager()
+            manager.redis_client = fake_async_redis
+            manager.l1_enabled = True
+            workers.append(manager)
+            return manager
+
+        yield _make
+        for manager in workers:
+            await manager.close()
+
+    async def _wait_for(self, condition, timeout=1.0):
+        deadline = asyncio.get_running_loop().time() + timeout
+        while not condition():
+            if asyncio.get_running_loop().time() > deadline:
+                raise AssertionError("condition not met in time")
+            await asyncio.sleep(0.01)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_hot_reads_served_from_l1(self, make_worker, fake_async_redis):
+        """After the first read, values come from L1 without touching Redis."""
+        worker = make_worker()
+        await fake_async_redis.setex("hot", 60, json.dumps({"v": 1}))
+
+        assert await worker.get("hot") == {"v": 1}
+        fake_async_redis.commands.clear()
+        assert await worker.get("hot") == {"v": 1}
+        assert await worker.get_many(["hot"]) == {"hot": {"v": 1}}
+
+        assert fake_async_redis.commands == []
+        assert worker.get_stats()["l1_hits"] == 2
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_l1_returns_independent_copies(self, make_worker):
+        """Mutating a returned value does not change the cached one."""
+        worker = make_worker()
+        await worker.set("k", {"items": [1]}, ttl=60)
+
+        (await worker.get("k"))["items"].append(2)
+
+        assert await worker.get("k") == {"items": [1]}
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_l1_ttl_capped(self, make_worker):
+        """L1 entries never outlive the configured L1 TTL."""
+        worker = make_worker()
+        worker.l1_ttl = 5
+        with patch("app.utils.cache.time.time", return_value=1000.0):
+            await worker.set("k", 1, ttl=3600)
+        with patch("app.utils.cache.time.time", return_value=1006.0):
+            assert worker.l1_cache.get("k") is None
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_delete_invalidates_other_workers(self, make_worker):
+        """A delete on one worker evicts the L1 copy on every worker."""
+        worker_a, worker_b = make_worker(), make_worker()
+        assert await worker_a.connect() is True
+        assert await worker_b.connect() is True
+        await asyncio.sleep(0)  # let listeners subscribe
+
+        await worker_a.set("shared", "v1", ttl=60)
+        assert await worker_b.get("shared") == "v1"
+        assert "shared" in worker_b.l1_cache
+
+        await worker_a.delete("shared")
+        await self._wait_for(lambda: "shared" not in worker_b.l1_cache)
+
+        assert await worker_b.get("shared") is None
+        assert worker_b.cache_stats["invalidations_received"] == 1
+        # The sender ignores its own broadcast
+        assert worker_a.cache_stats["invalidations_received"] == 0
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_clear_pattern_invalidates_other_workers(self, make_worker):
+        """Pattern clears are broadcast and applied to every L1."""
+        worker_a, worker_b = make_worker(), make_worker()
+        await worker_a.connect()
+        await worker_b.connect()
+        await asyncio.sleep(0)
+
+        await worker_a.set_many({"scenarios:1": 1, "scenarios:2": 2, "voice:1": 3}, ttl=60)
+        await worker_b.get_many(["scenarios:1", "scenarios:2", "voice:1"])
+
+        assert await worker_a.clear_pattern("scenarios:*") == 2
+        await self._wait_for(lambda: len(worker_b.l1_cache) == 1)
+
+        assert worker_b.l1_cache.keys() == ["voice:1"]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_namespace_generation_broadcast(self, make_worker):
+        """A namespace bump on one worker is applied immediately on the others."""
+        worker_a, worker_b = make_worker(), make_worker()
+        await worker_a.connect()
+        await worker_b.connect()
+        await asyncio.sleep(0)
+        key = worker_a.get_cache_key("ai_service", "answer_analysis", content_hash="x")
+
+        await worker_a.set(key, "v", ttl=60)
+        assert await worker_b.get(key) == "v"
+
+        await worker_a.invalidate_namespace("answer_analysis")
+        await self._wait_for(
+            lambda: worker_b._namespace_generations.get("answer_analysis", (0, 0))[0] == 1
+        )
+
+        assert await worker_b.get(key) is None
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_close_stops_listener(self, make_worker, fake_async_redis):
+        """close() cancels the listener and unsubscribes."""
+        worker = make_worker()
+        await worker.connect()
+        await asyncio.sleep(0)
+
+        await worker.close()
+
+        assert worker._invalidation_task is None
+        assert fake_async_redis.subscribers.get("cache:invalidate", []) == []
+
+
+class TestCachedDecorator:
+    """Test cases for the @cached decorator."""
+
+    async def _drain_refreshes(self):
+        from app.utils import cache
+        await asyncio.gather(*list(cache._refresh_tasks.values()))
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_caches_result(self):
+        """A second call is served from cache."""
+        from app.utils.cache import cached
+        calls = []
+
+        @cached("test_plain", ttl=60)
+        async def compute(role):
+            calls.append(role)
+            return {"role": role}
+
+        assert await compute("dev") == {"role": "dev"}
+        assert await compute("dev") == {"role": "dev"}
+        assert calls == ["dev"]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_compute_once(self):
+        """Concurrent misses for the same key share one computation."""
+        from app.utils.cache import cached
+        calls = []
+
+        @cached("test_stampede", ttl=60)
+        async def compute(role):
+            calls.append(role)
+            await asyncio.sleep(0.05)
+            return role.upper()
+
+        results = await asyncio.gather(*[compute("dev") for _ in range(5)])
+
+        assert results == ["DEV"] * 5
+        assert len(calls) == 1
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_stale_value_served_while_refreshing(self):
+        """Within the grace window the stale value is returned and refreshed once in the background."""
+        from app.utils.cache import cached
+        versions = iter(["v1", "v2", "v3"])
+        calls = []
+
+        @cached("test_swr", ttl=10, stale_ttl=100)
+        async def compute(role):
+            calls.append(role)
+            return next(versions)
+
+        with patch("app.utils.cache.time.time", return_value=1000.0):
+            assert await compute("dev") == "v1"
+        with patch("app.utils.cache.time.time", return_value=1015.0):
+            stale = await asyncio.gather(*[compute("dev") for _ in range(3)])
+            await self._drain_refreshes()
+            refreshed = await compute("dev")
+
+        assert stale == ["v1"] * 3
+        assert refreshed == "v2"
+        assert len(calls) == 2
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_stale_value(self):
+        """A failing background refresh leaves the stale value in place."""
+        from app.utils.cache import cached
+        calls = []
+
+        @cached("test_swr_error", ttl=10, stale_ttl=100)
+        async def compute(role):
+            calls.append(role)
+            if len(calls) > 1:
+                raise RuntimeError("AI service down")
+            return "v1"
+
+        with patch("app.utils.cache.time.time", return_value=1000.0):
+            await compute("dev")
+        with patch("app.utils.cache.time.time", return_value=1015.0):
+            assert await compute("dev") == "v1"
+            await self._drain_refreshes()
+            assert await compute("dev") == "v1"
+
+    @pytest.mark.unit
+    def test_early_refresh_probability(self):
+        """Early refresh depends on beta, recompute cost and the random draw."""
+        from app.utils.cache import _should_refresh
+        with patch("app.utils.cache.time.time", return_value=1000.0):
+            entry = {"fresh_until": 1005.0, "compute_time": 1.0}
+            assert _should_refresh(entry, early_refresh_beta=0.0) is False
+            with patch("app.utils.cache.random.random", return_value=0.0):
+                assert _should_refresh(entry, early_refresh_beta=1.0) is False
+            with patch("app.utils.cache.random.random", return_value=0.999):
+                # -ln(0.001) ~= 6.9s of head start > 5s remaining
+                assert _should_refresh(entry, early_refresh_beta=1.0) is True
+            assert _should_refresh({"fresh_until": 999.0, "compute_time": 0.0}, 0.0) is True
+
+
+class TestSyncCachePath:
+    """Test the blocking cache path used by @cached sync functions."""
+
+    def _decorated(self, operation, calls):
+        from app.utils.cache import cached
+
+        @cached(operation, ttl=60)
+        def compute(role):
+            calls.append(role)
+            return {"role": role}
+
+        return compute
+
+    @pytest.mark.unit
+    def test_sync_hit_outside_event_loop(self):
+        """Sync callers without a running loop get cache hits."""
+        calls = []
+        compute = self._decorated("test_sync_no_loop", calls)
+
+        assert compute("dev") == {"role": "dev"}
+        assert compute("dev") == {"role": "dev"}
+        assert calls == ["dev"]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_sync_hit_inside_event_loop(self):
+        """Sync callers inside a running loop (e.g. async handlers) get cache hits."""
+        calls = []
+        compute = self._decorated("test_sync_in_loop", calls)
+
+        assert compute("dev") == {"role": "dev"}
+        assert compute("dev") == {"role": "dev"}
+        assert calls == ["dev"]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_sync_hit_from_worker_thread(self):
+        """Sync callers in a threadpool share entries with the loop thread."""
+        calls = []
+        compute = self._decorated("test_sync_thread", calls)
+
+        compute("dev")
+        assert await asyncio.to_thread(compute, "dev") == {"role": "dev"}
+        assert calls == ["dev"]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_sync_redis_path(self, redis_cache, fake_async_redis):
+        """get_sync/set_sync use the blocking client and interoperate with the async API."""
+        await redis_cache.set("from_async", {"a": 1}, ttl=60)
+        redis_cache.l1_cache.clear()
+
+        assert redis_cache.get_sync("from_async") == {"a": 1}
+        assert ("sync_get", "from_async") in fake_async_redis.commands
+
+        assert redis_cache.set_sync("from_sync", [1, 2], ttl=60) is True
+        redis_cache.l1_cache.clear()
+        assert await redis_cache.get("from_sync") == [1, 2]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_sync_decorator_with_redis(self, redis_cache):
+        """@cached sync functions hit Redis-backed entries inside a running loop."""
+        from app.utils import cache
+        calls = []
+        with patch.object(cache, "cache_manager", redis_cache):
+            compute = self._decorated("test_sync_redis", calls)
+            compute("dev")
+            redis_cache.l1_cache.clear()
+            assert compute("dev") == {"role": "dev"}
+
+        assert calls == ["dev"]
+        assert redis_cache.get_stats()["hits"] == 1
+
+    @pytest.mark.unit
+    def test_sync_errors_fall_through(self, redis_cache):
+        """Backend errors count as errors and the function still runs."""
+        from unittest.mock import MagicMock
+        redis_cache.sync_redis_client = MagicMock()
+        redis_cache.sync_redis_client.get.side_effect = ConnectionError("down")
+
+        assert redis_cache.get_sync("k") is None
+        assert redis_cache.cache_stats["errors"] == 1
@@ -0,0 +1,115 @@
+"""
+Unit tests for cache value codecs.
+"""
+import json
+import pytest
+from unittest.mock import patch
+
+from app.utils import cache_codec
+from app.utils.cache_codec import CacheCodec
+
+
+LARGE_VALUE = {"audio_data": "UklGRiQAAABXQVZFZm10IBAAAAABAAEA" * 200, "format": "mp3"}
+
+
+class TestCacheCodec:
+    """Test cases for CacheCodec."""
+
+    @pytest.mark.unit
+    def test_small_values_not_compressed(self):
+        """Values under the threshold are stored uncompressed."""
+        codec = CacheCodec(serializer="json", compression="zlib", compression_threshold=1024)
+
+        data = codec.encode({"a": 1})
+
+        assert codec.decode(data) == {"a": 1}
+        assert list(codec.get_stats()["codecs"]) == ["json"]
+
+    @pytest.mark.unit
+    def test_large_values_compressed(self):
+        """Values over the threshold are compressed and round-trip."""
+        codec = CacheCodec(serializer="json", compression="zlib", compression_threshold=1024)
+
+        data = codec.encode(LARGE_VALUE)
+
+        assert len(data) < len(json.dumps(LARGE_VALUE)) / 5
+        assert codec.decode(data) == LARGE_VALUE
+        stats = codec.get_stats()["codecs"]["json+zlib"]
+        assert stats["encoded"] == 1
+        assert stats["decoded"] == 1
+        assert stats["compression_ratio"] > 5
+        assert stats["avg_encode_ms"] is not None
+
+    @pytest.mark.unit
+    def test_incompressible_values_stored_raw(self):
+        """Compression is dropped when it does not shrink the payload."""
+        codec = CacheCodec(serializer="json", compression="zlib", compression_threshold=1)
+
+        data = codec.encode("x")
+
+        assert codec.decode(data) == "x"
+        assert "json" in codec.get_stats()["codecs"]
+
+    @pytest.mark.unit
+    def test_legacy_json_decodes(self):
+        """Plain JSON written before the codec layer decodes as bytes or text."""
+        codec = CacheCodec(serializer="json", compression="none")
+        legacy = json.dumps({"questions": ["Q1"]})
+
+        assert codec.decode(legacy) == {"questions": ["Q1"]}
+        assert codec.decode(legacy.encode()) == {"questions": ["Q1"]}
+        assert codec.get_stats()["codecs"]["json+legacy"]["decoded"] == 2
+
+    @pytest.mark.unit
+    def test_decodes_entries_from_other_settings(self):
+        """The header byte lets a codec read values written with different settings."""
+        writer = CacheCodec(serializer="json", compression="zlib", compression_threshold=10)
+        reader = CacheCodec(serializer="json", compression="none")
+
+        assert reader.decode(writer.encode(LARGE_VALUE)) == LARGE_VALUE
+
+    @pytest.mark.unit
+    def test_non_serializable_values_stored_as_str(self):
+        """Objects such as UUIDs are stored as strings, matching json default=str."""
+        import uuid
+        codec = CacheCodec(serializer="json", compression="none")
+        value = uuid.uuid4()
+
+        assert codec.decode(codec.encode({"id": value})) == {"id": str(value)}
+
+    @pytest.mark.unit
+    def test_falls_back_when_optional_libraries_missing(self):
+        """msgpack/zstd fall back to JSON/zlib when not installed."""
+        with patch.object(cache_codec, "MSGPACK_AVAILABLE", False), \
+                patch.object(cache_codec, "ZSTD_AVAILABLE", False):
+            codec = CacheCodec(serializer="msgpack", compression="zstd")
+
+        assert codec.serializer == "json"
+        assert codec.compression == "zlib"
+        assert codec.decode(codec.encode(LARGE_VALUE)) == LARGE_VALUE
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(not cache_codec.MSGPACK_AVAILABLE, reason="msgpack not installed")
+    def test_msgpack_round_trip(self):
+        """msgpack preserves structure and bytes."""
+        codec = CacheCodec(serializer="msgpack", compression="none")
+        value = {"a": [1, 2.5, None, True], "raw": b"\x00\x01"}
+
+        assert codec.decode(codec.encode(value)) == value
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(not cache_codec.ZSTD_AVAILABLE, reason="zstandard not installed")
+    def test_zstd_round_trip(self):
+        """zstd-compressed values round-trip."""
+        codec = CacheCodec(serializer="json", compression="zstd", compression_threshold=10)
+
+        assert codec.decode(codec.encode(LARGE_VALUE)) == LARGE_VALUE
+        assert "json+zstd" in codec.get_stats()["codecs"]
+
+    @pytest.mark.unit
+    def test_invalid_settings_rejected(self):
+        """Unknown serializers and compressions raise ValueError."""
+        with pytest.raises(ValueError):
+            CacheCodec(serializer="pickle")
+        with pytest.raises(ValueError):
+            CacheCodec(compression="lz4")
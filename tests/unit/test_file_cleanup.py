@@ -0,0 +1,150 @@
+"""
+Unit tests for the background file expiry cleanup worker.
+"""
+import json
+import pytest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+from app.database.models import StoredFile
+from app.models.schemas import FileType
+from app.services.file_cleanup import SWEEP_LOCK_KEY, FileCleanupWorker
+from app.services.file_service import FileService
+
+
+@pytest.fixture
+def file_service(db_session, tmp_path, monkeypatch):
+    """FileService over a temporary upload directory."""
+    mock_settings = Mock()
+    mock_settings.FILE_UPLOAD_DIR = str(tmp_path / "uploads")
+    mock_settings.FILE_EXPIRATION_HOURS = 24
+    mock_settings.FILE_STREAM_CHUNK_SIZE = 65536
+    monkeypatch.setattr("app.services.file_service.settings", mock_settings)
+    return FileService(db_session)
+
+
+def _store(file_service, file_type: FileType, name: str, age_hours: float, metadata=None) -> str:
+    """Save a file and backdate its index entry."""
+    file_id = file_service.generate_file_id()
+    result = file_service.save_file_from_bytes(b"x" * 10, file_type, file_id, name, metadata)
+    file_service.index.add(
+        file_id, file_type.value, Path(result["file_path"]), name, 10, "application/octet-stream",
+        created_at=datetime.now(timezone.utc) - timedelta(hours=age_hours)
+    )
+    return file_id
+
+
+class TestFileCleanupWorker:
+    """Tests for FileCleanupWorker."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_deletes_expired_indexed_files_in_batches(self, file_service, db_session):
+        """Expired uploads are deleted in bounded batches; fresh files and question voices are kept."""
+        expired = [_store(file_service, FileType.AUDIO, f"old{i}.mp3", 48) for i in range(5)]
+        fresh = _store(file_service, FileType.AUDIO, "new.mp3", 1)
+        voice = _store(file_service, FileType.AUDIO, "voice.mp3", 48, {"question_id": "1", "voice_id": "v"})
+        before = file_service.get_storage_stats()["files_by_type"]["audio"]["count"]
+        worker = FileCleanupWorker(batch_size=2, batch_pause=0, expiration_hours=24, file_service=file_service)
+
+        run = await worker.run_once()
+
+        assert run["deleted"] == 5
+        assert run["batches"] == 3
+        assert run["bytes_freed"] == 50
+        assert all(db_session.get(StoredFile, file_id) is None for file_id in expired)
+        assert file_service.get_file_info(fresh) is not None
+        assert file_service.get_file_info(voice) is not None
+        assert file_service.get_storage_stats()["files_by_type"]["audio"]["count"] == before - 5
+        stats = worker.get_stats()
+        assert stats["runs"] == 1
+        assert stats["files_deleted"] == 5
+        assert stats["last_run_deleted"] == 5
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_walks_storage_without_index(self, file_service):
+        """Without the index, type directories are walked; sidecars go with their files."""
+        file_service.index = None
+        upload = file_service.upload_dir / "document" / "report.pdf"
+        upload.write_bytes(b"pdf")
+        (upload.parent / "report.metadata.json").write_text(json.dumps({"file_id": "report"}))
+        voice = file_service.save_file_from_bytes(
+            b"mp3", FileType.AUDIO, file_service.generate_file_id(), "q.mp3", {"question_id": "1", "voice_id": "v"}
+        )
+        # A negative expiry puts the cutoff in the future, so every upload is expired
+        worker = FileCleanupWorker(batch_size=10, batch_pause=0, expiration_hours=-1, file_service=file_service)
+
+        run = await worker.run_once()
+
+        assert run["deleted"] == 1
+        assert list(upload.parent.iterdir()) == []
+        assert Path(voice["file_path"]).exists()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_unindexed_files_expired_by_storage_walk(self, file_service, db_session):
+        """With the index, runs that walk storage also delete expired files the index does not know."""
+        indexed = _store(file_service, FileType.DOCUMENT, "old.pdf", 48)
+        unindexed = file_service.upload_dir / "document" / "legacy_report.pdf"
+        unindexed.write_bytes(b"pdf")
+        # A negative expiry puts the cutoff in the future, so every upload is expired
+        worker = FileCleanupWorker(batch_size=10, batch_pause=0, expiration_hours=-1, scan_every=2,
+                                   file_service=file_service)
+
+        first = await worker.run_once()
+        unindexed.write_bytes(b"pdf")
+        second = await worker.run_once()
+
+        assert first["deleted"] == 2
+        assert db_session.get(StoredFile, indexed) is None
+        # The second run reads only the index, so the re-created file is kept
+        assert second["deleted"] == 0
+        assert unindexed.exists()
+
+    @pytest.mark.unit
+    def test_expired_batch_tolerates_files_already_removed(self, file_service):
+        """Files and index rows removed by a concurrent sweep do not fail the batch."""
+        file_ids = [_store(file_service, FileType.IMAGE, f"gone{i}.png", 48) for i in range(3)]
+        before = file_service.get_storage_stats()["files_by_type"]["image"]["count"]
+        expired = list(file_service.iter_expired_files(datetime.now(timezone.utc) - timedelta(hours=24)))
+        # Another worker deletes the first two files while this sweep is between pages
+        for file_id in file_ids[:2]:
+            assert file_service.delete_file(file_id)
+
+        batch = file_service.delete_expired_batch(iter(expired), 10)
+
+        assert batch["failed"] == 0
+        assert all(file_service.get_file_info(file_id) is None for file_id in file_ids)
+        assert file_service.get_storage_stats()["files_by_type"]["image"]["count"] == before - 3
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_one_worker_sweeps_per_interval(self, file_service, fake_async_redis):
+        """Workers sharing Redis take turns: only the lease holder sweeps."""
+        _store(file_service, FileType.AUDIO, "old.mp3", 48)
+        workers = [
+            FileCleanupWorker(interval=3600, batch_pause=0, expiration_hours=24, file_service=file_service)
+            for _ in range(2)
+        ]
+
+        with patch("app.utils.cache.cache_manager.redis_client", fake_async_redis):
+            runs = [await worker.run_once() for worker in workers]
+
+        assert runs[0]["batches"] == 1
+        assert runs[1] == {"deleted": 0, "failed": 0, "bytes_freed": 0, "batches": 0}
+        assert workers[1].get_stats()["runs_skipped"] == 1
+        assert workers[1].get_stats()["runs"] == 0
+        assert await fake_async_redis.exists(SWEEP_LOCK_KEY)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_start_and_stop(self, file_service):
+        worker = FileCleanupWorker(interval=3600, file_service=file_service)
+        worker.run_once = AsyncMock(return_value={})
+
+        worker.start()
+        assert worker.get_stats()["scheduled"] is True
+        await worker.stop()
+
+        assert worker.get_stats()["scheduled"] is False
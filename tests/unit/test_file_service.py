@@ -38,6 +38,7 @@ class TestFileService:
         mock_settings = Mock()
         mock_settings.FILE_UPLOAD_DIR = str(temp_upload_dir)
         mock_settings.FILE_EXPIRATION_HOURS = 24
+        mock_settings.FILE_STREAM_CHUNK_SIZE = 65536
         
         monkeypatch.setattr("app.services.file_service.settings", mock_settings)
         
@@ -435,6 +436,305 @@ class TestFileService:
                 saved_metadata = json.load(f)
             assert saved_metadata["file_id"] == file_id
 
+    
+    @pytest.mark.unit
+    def test_stream_writer_commit(self, file_service, sample_mp3_bytes):
+        """Test streaming a file to disk chunk by chunk."""
+        import hashlib
+        file_id = file_service.generate_file_id()
+        writer = file_service.open_stream_writer(
+            file_type=FileType.AUDIO,
+            file_id=file_id,
+            filename="stream.mp3",
+            metadata={"uploaded_by": "user-1"}
+        )
+        for i in range(0, len(sample_mp3_bytes), 4):
+            writer.write(sample_mp3_bytes[i:i + 4])
+        result = writer.commit()
+        
+        assert writer.closed
+        assert result["file_size"] == len(sample_mp3_bytes)
+        assert result["file_hash"] == hashlib.sha256(sample_mp3_bytes).hexdigest()
+        assert Path(result["file_path"]).read_bytes() == sample_mp3_bytes
+        
+        file_info = file_service.get_file_info(file_id)
+        assert file_info is not None
+        assert file_info["metadata"]["uploaded_by"] == "user-1"
+    
+    @pytest.mark.unit
+    def test_stream_writer_abort_removes_file(self, file_service):
+        """Test aborting a streamed write removes the partial file."""
+        writer = file_service.open_stream_writer(
+            file_type=FileType.AUDIO,
+            file_id=file_service.generate_file_id(),
+            filename="partial.wav"
+        )
+        writer.write(b"partial")
+        writer.abort()
+
+        assert writer.closed
+        assert not writer.file_path.exists()
+
+    @pytest.mark.unit
+    def test_stream_writer_renames_into_place_on_commit(self, file_service):
+        """Chunks go to a hidden temp file; the storage path only appears once complete."""
+        writer = file_service.open_stream_writer(FileType.AUDIO, file_service.generate_file_id(), "atomic.mp3")
+        writer.write(b"first")
+
+        assert not writer.file_path.exists()
+        assert [p.name.startswith(".") for p in writer.file_path.parent.iterdir()] == [True]
+
+        writer.commit()
+
+        assert writer.file_path.read_bytes() == b"first"
+        assert [p.name for p in writer.file_path.parent.iterdir()] == [writer.file_path.name]
+
+    @pytest.mark.unit
+    def test_save_file_stream_enforces_size_limit_mid_stream(self, file_service):
+        """The limit stops the stream at the offending chunk and leaves nothing behind."""
+        from fastapi import HTTPException
+        file_id = file_service.generate_file_id()
+        consumed = []
+
+        def chunks():
+            for chunk in (b"a" * 6, b"b" * 6, b"c" * 6):
+                consumed.append(chunk)
+                yield chunk
+
+        with pytest.raises(HTTPException) as exc_info:
+            file_service.save_file_stream(chunks(), FileType.DOCUMENT, file_id, "big.pdf", max_size=10)
+
+        assert exc_info.value.status_code == 413
+        assert len(consumed) == 2
+        assert list((file_service.upload_dir / "document").iterdir()) == []
+        assert file_service.get_file_info(file_id) is None
+
+    @pytest.mark.unit
+    def test_save_file_streams_upload_in_chunks(self, file_service, monkeypatch):
+        """Uploads are read chunk by chunk and hashed in the same pass."""
+        import hashlib
+        from io import BytesIO
+        monkeypatch.setattr("app.services.file_service.settings.FILE_STREAM_CHUNK_SIZE", 4)
+        content = b"0123456789"
+        upload = MagicMock(spec=UploadFile)
+        upload.filename = "notes.pdf"
+        upload.file = BytesIO(content)
+        upload.file.read = Mock(wraps=upload.file.read)
+        file_service.validation_service.validate_file = Mock(return_value=(True, []))
+
+        result = file_service.save_file(upload, FileType.DOCUMENT, file_service.generate_file_id())
+
+        assert [c.args for c in upload.file.read.call_args_list] == [(4,)] * 4
+        assert result["file_size"] == len(content)
+        assert result["file_hash"] == hashlib.sha256(content).hexdigest()
+        assert Path(result["file_path"]).read_bytes() == content
+
+    @pytest.mark.unit
+    def test_saved_files_found_via_index(self, file_service, db_session, sample_mp3_bytes, monkeypatch):
+        """Saved files are indexed with size, MIME type and checksum, and resolved without scanning."""
+        import hashlib
+        from app.database.models import StoredFile
+        file_id = file_service.generate_file_id()
+        result = file_service.save_file_from_bytes(
+            content=sample_mp3_bytes,
+            file_type=FileType.AUDIO,
+            file_id=file_id,
+            filename=f"{file_id}.mp3",
+            metadata={"question_id": "42", "voice_id": "voice-index"}
+        )
+
+        entry = db_session.get(StoredFile, file_id)
+        assert entry.file_type == "audio"
+        assert entry.file_path == "audio/questions/42/voices/voice-index/v1.mp3"
+        assert entry.file_size == len(sample_mp3_bytes)
+        assert entry.mime_type == "audio/mpeg"
+        assert entry.checksum == hashlib.sha256(sample_mp3_bytes).hexdigest()
+
+        monkeypatch.setattr(file_service, "_scan_for_file", Mock(side_effect=AssertionError("scanned")))
+        assert file_service._find_file_by_id(file_id) == Path(result["file_path"])
+
+    @pytest.mark.unit
+    def test_stream_writer_commit_indexes_file(self, file_service, db_session):
+        """Streamed files are indexed on commit."""
+        from app.database.models import StoredFile
+        file_id = file_service.generate_file_id()
+        writer = file_service.open_stream_writer(FileType.AUDIO, file_id, "stream.wav")
+        writer.write(b"RIFF")
+        writer.commit()
+
+        assert db_session.get(StoredFile, file_id).file_size == 4
+
+    @pytest.mark.unit
+    def test_delete_removes_index_entry(self, file_service, db_session, sample_mp3_bytes):
+        from app.database.models import StoredFile
+        file_id = file_service.generate_file_id()
+        file_service.save_file_from_bytes(sample_mp3_bytes, FileType.AUDIO, file_id, "voice.mp3")
+
+        assert file_service.delete_file(file_id) is True
+        assert db_session.get(StoredFile, file_id) is None
+        assert file_service.get_file_info(file_id) is None
+
+    @pytest.mark.unit
+    def test_overwritten_voice_file_replaces_index_entry(self, file_service, db_session, sample_mp3_bytes):
+        """Saving a new voice file at the same path drops the entry of the file it replaced."""
+        from app.database.models import StoredFile
+        metadata = {"question_id": "7", "voice_id": "voice-overwrite", "version": "1"}
+        old_id, new_id = file_service.generate_file_id(), file_service.generate_file_id()
+        file_service.save_file_from_bytes(sample_mp3_bytes, FileType.AUDIO, old_id, "a.mp3", metadata)
+        file_service.save_file_from_bytes(sample_mp3_bytes, FileType.AUDIO, new_id, "b.mp3", metadata)
+
+        assert db_session.get(StoredFile, old_id) is None
+        assert db_session.get(StoredFile, new_id) is not None
+
+    @pytest.mark.unit
+    def test_unindexed_file_found_by_scan_and_indexed(self, file_service, db_session, temp_upload_dir):
+        """Files stored before the index existed are found by scanning and then indexed."""
+        from app.database.models import StoredFile
+        file_id = file_service.generate_file_id()
+        (temp_upload_dir / "document" / f"{file_id}_report.pdf").write_bytes(b"%PDF")
+
+        assert file_service.get_file_info(file_id) is not None
+        entry = db_session.get(StoredFile, file_id)
+        assert entry.file_type == "document"
+        assert entry.mime_type == "application/pdf"
+
+    @pytest.mark.unit
+    def test_index_miss_without_scan(self, file_service, temp_upload_dir, monkeypatch):
+        """With FILE_INDEX_SCAN_ON_MISS disabled, unindexed files are not looked for."""
+        monkeypatch.setattr("app.services.file_service.settings.FILE_INDEX_SCAN_ON_MISS", False)
+        file_id = file_service.generate_file_id()
+        (temp_upload_dir / "document" / f"{file_id}_report.pdf").write_bytes(b"%PDF")
+
+        assert file_service._find_file_by_id(file_id) is None
+
+    @pytest.mark.unit
+    def test_rebuild_index(self, file_service, db_session, temp_upload_dir):
+        """Rebuilding indexes flat and nested files and prunes entries of missing files."""
+        from app.database.models import StoredFile
+        flat_id, nested_id, gone_id = (file_service.generate_file_id() for _ in range(3))
+        (temp_upload_dir / "image" / f"{flat_id}_photo.png").write_bytes(b"png")
+        voice_dir = temp_upload_dir / "audio" / "questions" / "5" / "voices" / "voice-a"
+        voice_dir.mkdir(parents=True)
+        (voice_dir / "v1.mp3").write_bytes(b"mp3")
+        (voice_dir / "v1.metadata.json").write_text(json.dumps({"file_id": nested_id}))
+        (voice_dir / "v2.mp3").write_bytes(b"no sidecar")
+        file_service.index.add(gone_id, "audio", temp_upload_dir / "audio" / "gone.mp3", "gone.mp3", 1, "audio/mpeg")
+
+        stats = file_service.rebuild_index()
+
+        assert stats["indexed"] == 2
+        assert stats["skipped"] == 1
+        assert stats["removed"] >= 1
+        assert db_session.get(StoredFile, flat_id).file_path == f"image/{flat_id}_photo.png"
+        assert db_session.get(StoredFile, nested_id).file_path == "audio/questions/5/voices/voice-a/v1.mp3"
+        assert db_session.get(StoredFile, gone_id) is None
+        assert file_service.get_storage_stats()["files_by_type"]["audio"]["count"] == 1
+
+    @pytest.mark.unit
+    def test_list_files_paged_from_index_newest_first(self, file_service, monkeypatch):
+        """Listing pages through the index by creation time without scanning storage."""
+        from datetime import datetime, timedelta
+        base = datetime(2026, 1, 1)
+        ids = [file_service.generate_file_id() for _ in range(5)]
+        for i, file_id in enumerate(ids):
+            path = file_service.upload_dir / "document" / f"{file_id}_doc{i}.pdf"
+            file_service.index.add(file_id, "document", path, f"doc{i}.pdf", 10 + i, "application/pdf",
+                                   created_at=base + timedelta(minutes=i))
+        monkeypatch.setattr(file_service, "_get_file_type_from_path", Mock(side_effect=AssertionError("scanned")))
+
+        first = file_service.list_files(FileType.DOCUMENT, page=1, page_size=2)
+        last = file_service.list_files(FileType.DOCUMENT, page=3, page_size=2)
+
+        assert [f.file_id for f in first.files] == [ids[4], ids[3]]
+        assert [f.file_id for f in last.files] == [ids[0]]
+        assert first.total == 5
+        assert first.per_page == 2
+        assert first.files[0].filename == "doc4.pdf"
+        assert first.files[0].created_at == (base + timedelta(minutes=4)).isoformat()
+
+    @pytest.mark.unit
+    def test_storage_counters_follow_saves_deletes_and_overwrites(self, file_service):
+        """Per-type counters are updated incrementally with each index write."""
+        before = file_service.get_storage_stats()["files_by_type"].get("audio", {"count": 0, "total_size": 0})
+        metadata = {"question_id": "9", "voice_id": "voice-count"}
+        kept, replaced, deleted = (file_service.generate_file_id() for _ in range(3))
+        file_service.save_file_from_bytes(b"x" * 10, FileType.AUDIO, kept, "a.mp3")
+        file_service.save_file_from_bytes(b"x" * 20, FileType.AUDIO, replaced, "b.mp3", metadata)
+        file_service.save_file_from_bytes(b"x" * 30, FileType.AUDIO, deleted, "c.mp3", metadata)
+        file_service.save_file_from_bytes(b"x" * 5, FileType.IMAGE, file_service.generate_file_id(), "d.png")
+        file_service.delete_file(deleted)
+
+        stats = file_service.get_storage_stats()
+
+        audio = stats["files_by_type"]["audio"]
+        assert audio["count"] - before["count"] == 1
+        assert audio["total_size"] - before["total_size"] == 10
+        assert stats["files_by_type"]["image"]["count"] >= 1
+        assert stats["total_files"] == sum(c["count"] for c in stats["files_by_type"].values())
+        assert stats["newest_file"] is not None
+
+    @pytest.mark.unit
+    def test_storage_counter_row_created_by_upsert(self, file_service, db_session, temp_upload_dir):
+        """The first file of an uncounted type creates its counter row in one upsert, not an update-then-insert."""
+        from sqlalchemy import event
+
+        statements = []
+        connection = db_session.connection()
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(connection, "before_cursor_execute", listener)
+        try:
+            for i in range(2):
+                file_service.index.add(
+                    file_service.generate_file_id(), "video", temp_upload_dir / f"clip{i}.mp4",
+                    f"clip{i}.mp4", 100, "video/mp4"
+                )
+        finally:
+            event.remove(connection, "before_cursor_execute", listener)
+
+        assert file_service.index.counts()["video"] == {"count": 2, "total_size": 200}
+        counter_writes = [s for s in statements if "stored_file_stats" in s]
+        assert len(counter_writes) == 2
+        assert all("ON CONFLICT" in s for s in counter_writes)
+
+    @pytest.mark.unit
+    def test_index_writes_leave_caller_session_pending(self, file_service, db_session, monkeypatch):
+        """Index commits and rollbacks never commit or discard the caller's pending changes."""
+        from sqlalchemy.exc import OperationalError
+        from app.database.models import StoredFile, User
+
+        user = User(email="pending-index@example.com", name="Pending", password_hash="x", is_active=True)
+        db_session.add(user)
+
+        def failing_count(*args):
+            raise OperationalError("UPDATE stored_file_stats", {}, Exception("database is locked"))
+
+        with monkeypatch.context() as m:
+            m.setattr(file_service.index, "_count", failing_count)
+            failed_id = file_service.generate_file_id()
+            file_service.save_file_from_bytes(b"x" * 10, FileType.IMAGE, failed_id, "failed.png")
+        assert user in db_session.new
+
+        saved_id = file_service.generate_file_id()
+        file_service.save_file_from_bytes(b"x" * 10, FileType.IMAGE, saved_id, "saved.png")
+        assert user in db_session.new
+
+        db_session.commit()
+        assert user.id is not None
+        assert db_session.get(StoredFile, failed_id) is None
+        assert db_session.get(StoredFile, saved_id) is not None
+
+    @pytest.mark.unit
+    def test_list_files_without_index_scans_storage(self, file_service, temp_upload_dir):
+        file_service.index = None
+        file_id = file_service.generate_file_id()
+        (temp_upload_dir / "image" / f"{file_id}.png").write_bytes(b"png")
+
+        listing = file_service.list_files(FileType.IMAGE)
+
+        assert [f.file_id for f in listing.files] == [file_id]
+        assert listing.total == 1
+        assert file_service.get_storage_stats()["files_by_type"]["image"]["count"] == 1
+
 
 class TestFileServiceIntegration:
     """Integration tests for FileService - save → retrieve → download flow."""
@@ -454,6 +754,7 @@ class TestFileServiceIntegration:
         mock_settings = Mock()
         mock_settings.FILE_UPLOAD_DIR = str(temp_upload_dir)
         mock_settings.FILE_EXPIRATION_HOURS = 24
+        mock_settings.FILE_STREAM_CHUNK_SIZE = 65536
         
         monkeypatch.setattr("app.services.file_service.settings", mock_settings)
         
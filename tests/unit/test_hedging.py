@@ -0,0 +1,257 @@
+"""
+Unit tests for request hedging.
+
+Tests latency histograms, the hedge budget, and hedged execution.
+"""
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.utils.hedging import LatencyHistogram, HedgeBudget, RequestHedger
+
+
+def _warm_hedger(hedger: RequestHedger, operation: str, latency: float, count: int = 20):
+    """Seed a hedger with recorded latencies so hedging is active."""
+    for _ in range(count):
+        hedger.record_latency(operation, latency)
+
+
+class TestLatencyHistogram:
+    """Test cases for LatencyHistogram."""
+
+    @pytest.mark.unit
+    def test_percentile_empty(self):
+        """Empty histogram has no percentile."""
+        assert LatencyHistogram().percentile(95) is None
+
+    @pytest.mark.unit
+    def test_percentile_and_buckets(self):
+        """Percentiles come from the window and buckets count every sample."""
+        histogram = LatencyHistogram()
+        for i in range(1, 101):
+            histogram.record(i / 100)
+
+        assert histogram.percentile(50) == 0.5
+        assert histogram.percentile(95) == 0.95
+        stats = histogram.get_stats()
+        assert stats["count"] == 100
+        assert stats["buckets"]["0.1"] == 10
+        assert sum(stats["buckets"].values()) == 100
+
+    @pytest.mark.unit
+    def test_window_is_bounded(self):
+        """Only the most recent samples are used for percentiles."""
+        histogram = LatencyHistogram(window_size=5)
+        for _ in range(10):
+            histogram.record(10.0)
+        for _ in range(5):
+            histogram.record(0.1)
+
+        assert histogram.percentile(99) == 0.1
+        assert histogram.count == 15
+
+
+class TestHedgeBudget:
+    """Test cases for HedgeBudget."""
+
+    @pytest.mark.unit
+    def test_budget_exhausts_and_refills(self):
+        """Each hedge spends a token; primaries refill at the configured ratio."""
+        budget = HedgeBudget(ratio=0.5, max_tokens=1.0)
+        assert budget.try_spend() is True
+        assert budget.try_spend() is False
+
+        budget.deposit()
+        assert budget.try_spend() is False
+        budget.deposit()
+        assert budget.try_spend() is True
+
+    @pytest.mark.unit
+    def test_budget_capped(self):
+        """Deposits never exceed max tokens."""
+        budget = HedgeBudget(ratio=1.0, max_tokens=2.0)
+        for _ in range(10):
+            budget.deposit()
+        assert budget.tokens == 2.0
+
+
+class TestRequestHedger:
+    """Test cases for RequestHedger."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_no_hedge_before_min_samples(self):
+        """Calls run once until enough latency samples exist."""
+        hedger = RequestHedger(min_samples=5)
+        call = AsyncMock(return_value="ok")
+
+        result = await hedger.run("op", call)
+
+        assert result == "ok"
+        assert call.await_count == 1
+        assert hedger.get_hedge_delay("op") is None
+        assert hedger.histograms["op"].count == 1
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_hedge_wins_when_primary_slow(self):
+        """A slow primary is hedged and the faster duplicate is returned."""
+        hedger = RequestHedger(min_samples=20, min_delay=0.01)
+        _warm_hedger(hedger, "op", 0.01)
+        calls = []
+
+        async def call():
+            calls.append(1)
+            if len(calls) == 1:
+                await asyncio.sleep(5)
+                return "slow"
+            return "fast"
+
+        result = await asyncio.wait_for(hedger.run("op", call), timeout=2)
+
+        assert result == "fast"
+        assert len(calls) == 2
+        assert hedger.stats["hedged"] == 1
+        assert hedger.stats["hedge_wins"] == 1
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_fast_primary_not_hedged(self):
+        """Responses faster than the hedge delay never trigger a duplicate."""
+        hedger = RequestHedger(min_samples=20, min_delay=0.5)
+        _warm_hedger(hedger, "op", 0.5)
+        call = AsyncMock(return_value="ok")
+
+        assert await hedger.run("op", call) == "ok"
+        assert call.await_count == 1
+        assert hedger.stats["hedged"] == 0
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_hedge_disabled_records_latency_only(self):
+        """hedge=False still records latency but never duplicates."""
+        hedger = RequestHedger(min_samples=1, min_delay=0.01)
+        _warm_hedger(hedger, "op", 0.01)
+
+        async def call():
+            await asyncio.sleep(0.05)
+            return "ok"
+
+        assert await hedger.run("op", call, hedge=False) == "ok"
+        assert hedger.stats["hedged"] == 0
+        assert hedger.histograms["op"].count == 21
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_budget_exhausted_waits_for_primary(self):
+        """Without budget the primary result is awaited and no hedge is sent."""
+        hedger = RequestHedger(min_samples=20, min_delay=0.01, budget_ratio=0.0, budget_max_tokens=0.0)
+        _warm_hedger(hedger, "op", 0.01)
+        calls = []
+
+        async def call():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "primary"
+
+        assert await hedger.run("op", call) == "primary"
+        assert len(calls) == 1
+        assert hedger.stats["budget_exhausted"] == 1
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_hedge_survives_primary_failure(self):
+        """If the primary fails after hedging, the hedge result is used."""
+        hedger = RequestHedger(min_samples=20, min_delay=0.01)
+        _warm_hedger(hedger, "op", 0.01)
+        calls = []
+
+        async def call():
+            calls.append(1)
+            if len(calls) == 1:
+                await asyncio.sleep(0.05)
+                raise RuntimeError("replica failed")
+            await asyncio.sleep(0.1)
+            return "hedged"
+
+        assert await hedger.run("op", call) == "hedged"
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_all_attempts_fail_raises(self):
+        """When both attempts fail the last error propagates."""
+        hedger = RequestHedger(min_samples=20, min_delay=0.01)
+        _warm_hedger(hedger, "op", 0.01)
+
+        async def call():
+            await asyncio.sleep(0.03)
+            raise RuntimeError("down")
+
+        with pytest.raises(RuntimeError, match="down"):
+            await hedger.run("op", call)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_losing_attempt_awaited_before_return(self):
+        """The cancelled loser has finished, and its error is retrieved, when run returns."""
+        hedger = RequestHedger(min_samples=20, min_delay=0.01)
+        _warm_hedger(hedger, "op", 0.01)
+        loop = asyncio.get_running_loop()
+        unhandled = []
+        loop.set_exception_handler(lambda _, context: unhandled.append(context))
+        cleaned_up = []
+
+        async def call():
+            if hedger.stats["hedged"] == 0:
+                try:
+                    await asyncio.sleep(5)
+                finally:
+                    cleaned_up.append("primary")
+                    raise RuntimeError("connection reset")
+            return "hedged"
+
+        try:
+            assert await asyncio.wait_for(hedger.run("op", call), timeout=2) == "hedged"
+            assert cleaned_up == ["primary"]
+            await asyncio.sleep(0)
+            assert unhandled == []
+        finally:
+            loop.set_exception_handler(None)
+
+
+class TestAIClientHedging:
+    """Test that AIServiceClient.analyze_answer goes through the hedger."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_analyze_answer_hedged(self):
+        """With hedging enabled a slow scoring call is duplicated."""
+        from app.services.ai_client import AIServiceClient
+
+        with patch("app.services.ai_client.httpx.AsyncClient") as mock_class:
+            mock_client = MagicMock()
+            responses = []
+
+            async def post(*args, **kwargs):
+                responses.append(1)
+                if len(responses) == 1:
+                    await asyncio.sleep(5)
+                response = MagicMock(status_code=200)
+                response.json.return_value = {"score": {"clarity": len(responses)}}
+                return response
+
+            mock_client.post = post
+            mock_class.return_value = mock_client
+
+            client = AIServiceClient(base_url="http://test-ai:8000")
+            client.hedging_enabled = True
+            client.hedger = RequestHedger(min_samples=20, min_delay=0.01)
+            _warm_hedger(client.hedger, "analyze_answer", 0.01)
+
+            result = await asyncio.wait_for(
+                client.analyze_answer(job_description="JD", question="Q?", answer="A"),
+                timeout=2
+            )
+
+        assert result["score"]["clarity"] == 2
+        assert client.hedger.stats["hedge_wins"] == 1
@@ -0,0 +1,330 @@
+"""
+Unit tests for singleflight coalescing and question generation coalescing.
+"""
+import asyncio
+import uuid
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from app.utils.singleflight import DistributedSingleFlight, SingleFlight
+
+
+class TestSingleFlight:
+    """Test cases for SingleFlight."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_execution(self):
+        """Concurrent calls with the same key run the work once."""
+        flight = SingleFlight("test")
+        calls = []
+        waits = []
+
+        async def work():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return {"value": 42}
+
+        results = await asyncio.gather(*[
+            flight.do("key", work, on_wait=lambda: waits.append(1)) for _ in range(5)
+        ])
+
+        assert all(r == {"value": 42} for r in results)
+        assert len(calls) == 1
+        assert len(waits) == 4
+        assert flight.stats["executions"] == 1
+        assert flight.stats["shared"] == 4
+        assert flight.in_flight_count == 0
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_different_keys_run_separately(self):
+        """Different keys are not coalesced."""
+        flight = SingleFlight("test")
+        work = AsyncMock(side_effect=["a", "b"])
+
+        results = await asyncio.gather(flight.do("a", work), flight.do("b", work))
+
+        assert sorted(results) == ["a", "b"]
+        assert work.await_count == 2
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_sequential_calls_execute_again(self):
+        """Once a call completes the key is released."""
+        flight = SingleFlight("test")
+        work = AsyncMock(return_value="ok")
+
+        await flight.do("key", work)
+        await flight.do("key", work)
+
+        assert work.await_count == 2
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_error_propagates_to_waiters(self):
+        """Every coalesced caller receives the leader's exception."""
+        flight = SingleFlight("test")
+
+        async def work():
+            await asyncio.sleep(0.05)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            *[flight.do("key", work) for _ in range(3)],
+            return_exceptions=True
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+        assert flight.stats["errors"] == 1
+        assert flight.in_flight_count == 0
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_waiters(self):
+        """When the leader is cancelled a waiter takes over and every waiter gets a result."""
+        flight = SingleFlight("test")
+        leader_started = asyncio.Event()
+        calls = []
+
+        async def work():
+            calls.append(1)
+            leader_started.set()
+            await asyncio.sleep(0.05)
+            return len(calls)
+
+        leader = asyncio.create_task(flight.do("key", work))
+        await leader_started.wait()
+        followers = [asyncio.create_task(flight.do("key", work)) for _ in range(3)]
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        results = await asyncio.gather(*followers)
+
+        assert leader.cancelled()
+        assert results == [2, 2, 2]
+        assert len(calls) == 2
+        assert flight.stats["leader_cancelled"] == 1
+        assert flight.in_flight_count == 0
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_leader(self):
+        """A waiter giving up leaves the shared execution running for the others."""
+        flight = SingleFlight("test")
+
+        async def work():
+            await asyncio.sleep(0.05)
+            return "ok"
+
+        leader = asyncio.create_task(flight.do("key", work))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(flight.do("key", work))
+        await asyncio.sleep(0)
+        waiter.cancel()
+
+        assert await leader == "ok"
+        assert waiter.cancelled()
+        assert flight.stats["executions"] == 1
+
+
+class TestDistributedSingleFlight:
+    """Test cases for DistributedSingleFlight (workers sharing a fake Redis)."""
+
+    def _workers(self, redis_client, count=3, **kwargs):
+        kwargs.setdefault("poll_interval", 0.01)
+        return [
+            DistributedSingleFlight("test", get_redis=lambda: redis_client, **kwargs)
+            for _ in range(count)
+        ]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_one_execution_across_workers(self, fake_async_redis):
+        """Concurrent calls in different workers run the work once; others read the shared result."""
+        shared_cache = {}
+        calls = []
+
+        async def work():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            shared_cache["key"] = {"value": 42}
+            return {"value": 42}
+
+        async def fetch():
+            return shared_cache.get("key")
+
+        workers = self._workers(fake_async_redis)
+        results = await asyncio.gather(*[w.do("key", work, fetch_result=fetch) for w in workers])
+
+        assert results == [{"value": 42}] * 3
+        assert len(calls) == 1
+        assert sum(w.get_stats()["locks_acquired"] for w in workers) == 1
+        assert sum(w.get_stats()["remote_hits"] for w in workers) == 2
+        assert not await fake_async_redis.exists("singleflight:test:lock:key")
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_waiter_takes_over_when_leader_fails(self, fake_async_redis):
+        """If the lock is released without a result, a waiting worker runs the work."""
+        leader_started = asyncio.Event()
+
+        async def failing_work():
+            leader_started.set()
+            await asyncio.sleep(0.05)
+            raise ValueError("boom")
+
+        follower_work = AsyncMock(return_value="ok")
+        fetch = AsyncMock(return_value=None)
+        leader, follower = self._workers(fake_async_redis, count=2)
+
+        leader_task = asyncio.create_task(leader.do("key", failing_work, fetch_result=fetch))
+        await leader_started.wait()
+        result = await follower.do("key", follower_work, fetch_result=fetch)
+
+        with pytest.raises(ValueError):
+            await leader_task
+        assert result == "ok"
+        assert follower_work.await_count == 1
+        assert follower.get_stats()["takeovers"] == 1
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_wait_timeout_runs_locally(self, fake_async_redis):
+        """A worker stops waiting after wait_timeout and runs the work itself."""
+        await fake_async_redis.set("singleflight:test:lock:key", "other-worker", nx=True, ex=60)
+        work = AsyncMock(return_value="ok")
+        (worker,) = self._workers(fake_async_redis, count=1, wait_timeout=0.05)
+
+        result = await worker.do("key", work, fetch_result=AsyncMock(return_value=None))
+
+        assert result == "ok"
+        assert worker.get_stats()["wait_timeouts"] == 1
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_waiters_share_one_subscription(self, fake_async_redis):
+        """Waiters for different keys in one worker share a single pub/sub subscription."""
+        keys = [f"key{i}" for i in range(5)]
+        for key in keys:
+            await fake_async_redis.set(f"singleflight:test:lock:{key}", "other-worker", nx=True, ex=60)
+        shared_cache = {}
+        work = AsyncMock(return_value="local")
+        (worker,) = self._workers(fake_async_redis, count=1, poll_interval=5.0)
+
+        def fetch(key):
+            async def _fetch():
+                return shared_cache.get(key)
+            return _fetch
+
+        tasks = [asyncio.create_task(worker.do(key, work, fetch_result=fetch(key))) for key in keys]
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert len(fake_async_redis.subscribers["singleflight:test:done"]) == 1
+        assert worker.get_stats()["remote_waiting"] == 5
+
+        # The other worker finishes: results land, locks are released, waiters are notified
+        for key in keys:
+            shared_cache[key] = f"result-{key}"
+            await fake_async_redis.delete(f"singleflight:test:lock:{key}")
+            await fake_async_redis.publish("singleflight:test:done", key)
+        results = await asyncio.wait_for(asyncio.gather(*tasks), timeout=1)
+        await asyncio.sleep(0)
+
+        assert results == [f"result-{key}" for key in keys]
+        assert work.await_count == 0
+        assert worker.get_stats()["remote_hits"] == 5
+        assert fake_async_redis.subscribers["singleflight:test:done"] == []
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_without_redis_behaves_like_singleflight(self):
+        """With no Redis client only in-process calls are coalesced."""
+        flight = DistributedSingleFlight("test", get_redis=lambda: None)
+        work = AsyncMock(return_value="ok")
+
+        assert await flight.do("key", work, fetch_result=AsyncMock()) == "ok"
+        assert flight.get_stats()["distributed"] is False
+        assert flight.get_stats()["locks_acquired"] == 0
+
+
+class TestQuestionGenerationCoalescing:
+    """Test coalescing of identical question generation requests."""
+
+    def _request(self, job_description="Build APIs in Python"):
+        from app.models.schemas import JobRequest
+        return JobRequest(
+            role_name=f"Engineer {uuid.uuid4()}",
+            job_description=job_description
+        )
+
+    @pytest.mark.unit
+    def test_key_normalizes_whitespace_and_case(self):
+        """Pasted copies differing only in whitespace/case share a key."""
+        from app.routers.interview import _question_generation_key
+
+        key_a = _question_generation_key("Backend Engineer", "Build  APIs\nin Python ", None)
+        key_b = _question_generation_key("backend engineer", "build APIs in python", "")
+        key_c = _question_generation_key("Backend Engineer", "Build APIs in Go", None)
+
+        assert key_a == key_b
+        assert key_a != key_c
+        assert ":question_generation:" in key_a
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_generate_once(self):
+        """Concurrent identical requests call the AI service and persist once."""
+        from app.routers import interview
+
+        request = self._request()
+        ai_client = AsyncMock()
+
+        async def generate(**kwargs):
+            await asyncio.sleep(0.05)
+            return {
+                "questions": [{"text": "Tell me about APIs"}],
+                "identifiers": {"role": request.role_name},
+                "embedding_vectors": {}
+            }
+
+        ai_client.generate_questions_structured.side_effect = generate
+        persist = AsyncMock(return_value=[SimpleNamespace(id=uuid.uuid4())])
+
+        with patch.object(interview, "_persist_and_sync_questions", persist):
+            results = await asyncio.gather(*[
+                interview._coalesced_generate_and_persist(request, ai_client, db=None)
+                for _ in range(4)
+            ])
+
+            # A near-simultaneous repeat is served from the short-TTL cache
+            repeat = await interview._coalesced_generate_and_persist(request, ai_client, db=None)
+
+        assert ai_client.generate_questions_structured.await_count == 1
+        assert persist.await_count == 1
+        assert all(r["question_ids"] == results[0]["question_ids"] for r in results)
+        assert repeat["question_ids"] == results[0]["question_ids"]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_coalescing_disabled(self):
+        """With coalescing disabled every request generates independently."""
+        from app.routers import interview
+
+        request = self._request()
+        ai_client = AsyncMock()
+        ai_client.generate_questions_structured.return_value = {
+            "questions": [{"text": "Q"}],
+            "identifiers": {},
+            "embedding_vectors": {}
+        }
+        persist = AsyncMock(return_value=[SimpleNamespace(id=uuid.uuid4())])
+        settings = interview.get_settings()
+
+        with patch.object(interview, "_persist_and_sync_questions", persist), \
+                patch.object(settings, "QUESTION_GENERATION_COALESCING_ENABLED", False):
+            await interview._coalesced_generate_and_persist(request, ai_client, db=None)
+            await interview._coalesced_generate_and_persist(request, ai_client, db=None)
+
+        assert ai_client.generate_questions_structured.await_count == 2
@@ -0,0 +1,55 @@
+"""
+Unit tests for streaming request body helpers.
+"""
+import email
+import pytest
+
+from app.utils.streaming import iter_file_chunks, stream_multipart
+
+
+async def _collect(iterator):
+    return b"".join([chunk async for chunk in iterator])
+
+
+class TestStreaming:
+    """Test cases for streaming helpers."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_iter_file_chunks(self, tmp_path):
+        """Files are read in chunks of the requested size."""
+        path = tmp_path / "audio.wav"
+        path.write_bytes(b"x" * 10)
+
+        chunks = [chunk async for chunk in iter_file_chunks(str(path), chunk_size=4)]
+
+        assert [len(c) for c in chunks] == [4, 4, 2]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_stream_multipart_is_parseable(self):
+        """The streamed body is a valid multipart/form-data document."""
+        async def chunks():
+            yield b"abc"
+            yield b""
+            yield b"def"
+
+        body, content_type = stream_multipart(
+            fields={"session_id": "s1", "language": "en"},
+            file_field="audio_file",
+            filename='my "answer".mp3',
+            chunks=chunks()
+        )
+        raw = await _collect(body)
+
+        message = email.message_from_bytes(
+            f"Content-Type: {content_type}\r\n\r\n".encode() + raw
+        )
+        parts = message.get_payload()
+        assert [p.get_param("name", header="content-disposition") for p in parts] == [
+            "session_id", "language", "audio_file"
+        ]
+        assert parts[0].get_payload() == "s1"
+        assert parts[2].get_content_type() == "audio/mpeg"
+        assert parts[2].get_payload(decode=True) == b"abcdef"
+        assert '"' not in parts[2].get_param("filename", header="content-disposition")
@@ -0,0 +1,183 @@
+"""
+Unit tests for sentence-level chunked TTS synthesis.
+"""
+import asyncio
+import uuid
+import pytest
+from unittest.mock import AsyncMock
+from app.services.audio_blob_store import AudioBlobStore
+from app.services.tts.chunking import chunk_text, concatenate_audio, split_sentences
+from app.services.voice_cache import VoiceCacheService
+
+# mock_tts_settings patches asyncio.sleep; keep a real one for yielding to the loop
+_real_sleep = asyncio.sleep
+
+
+def _wav(pcm: bytes, sample_rate: int = 16000) -> bytes:
+    """Build a minimal 16-bit mono PCM WAV file."""
+    fmt = (
+        (1).to_bytes(2, "little") + (1).to_bytes(2, "little")
+        + sample_rate.to_bytes(4, "little") + (sample_rate * 2).to_bytes(4, "little")
+        + (2).to_bytes(2, "little") + (16).to_bytes(2, "little")
+    )
+    return (
+        b"RIFF" + (4 + 8 + len(fmt) + 8 + len(pcm)).to_bytes(4, "little") + b"WAVE"
+        + b"fmt " + len(fmt).to_bytes(4, "little") + fmt
+        + b"data" + len(pcm).to_bytes(4, "little") + pcm
+    )
+
+
+def _long_text(*sentences: str) -> str:
+    """Join sentences and pad with unique filler so the text exceeds the chunk threshold."""
+    filler = " ".join(f"Filler sentence {i} {uuid.uuid4()}." for i in range(12))
+    return " ".join(sentences) + " " + filler
+
+
+class TestChunkText:
+    """Tests for sentence splitting and chunking."""
+
+    @pytest.mark.unit
+    def test_split_on_sentence_boundaries(self):
+        text = 'Tell me about yourself. Why this role? "Great!" she said.\nNext line'
+
+        assert split_sentences(text) == [
+            "Tell me about yourself.", "Why this role?", '"Great!"', "she said.", "Next line"
+        ]
+
+    @pytest.mark.unit
+    def test_long_sentence_split_within_limit(self):
+        """Sentences over the limit are split at clauses, then between words."""
+        sentence = "First clause here, second clause is a bit longer, " + "word " * 20 + "end."
+        chunks = chunk_text(sentence, max_chars=30)
+
+        assert all(len(chunk) <= 30 for chunk in chunks)
+        assert chunks[0] == "First clause here,"
+        assert " ".join(chunks).split() == sentence.split()
+
+    @pytest.mark.unit
+    def test_word_longer_than_limit_is_cut(self):
+        chunks = chunk_text("a" * 25, max_chars=10)
+
+        assert chunks == ["a" * 10, "a" * 10, "a" * 5]
+
+
+class TestConcatenateAudio:
+    """Tests for joining chunk audio."""
+
+    @pytest.mark.unit
+    def test_wav_merged_under_one_header(self):
+        joined = concatenate_audio([_wav(b"\x01\x00" * 3), _wav(b"\x02\x00" * 2)], "wav")
+
+        assert joined == _wav(b"\x01\x00" * 3 + b"\x02\x00" * 2)
+
+    @pytest.mark.unit
+    def test_wav_with_different_formats_rejected(self):
+        with pytest.raises(ValueError):
+            concatenate_audio([_wav(b"\x00\x00", 16000), _wav(b"\x00\x00", 22050)], "wav")
+
+    @pytest.mark.unit
+    def test_mp3_inner_tags_stripped(self):
+        """Only the first chunk keeps its ID3v2 tag; ID3v1 trailers are dropped."""
+        id3v2 = b"ID3\x04\x00\x00\x00\x00\x00\x02ab"
+        id3v1 = b"TAG" + b"\x00" * 125
+        parts = [id3v2 + b"frames1" + id3v1, id3v2 + b"frames2"]
+
+        assert concatenate_audio(parts, "mp3") == id3v2 + b"frames1frames2"
+
+    @pytest.mark.unit
+    def test_unsupported_format_rejected(self):
+        with pytest.raises(ValueError):
+            concatenate_audio([b"a", b"b"], "m4a")
+
+
+class TestChunkedSynthesis:
+    """Tests for chunked synthesis in TTSService."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_short_text_not_chunked(self, mock_tts_settings, tts_service_with_providers):
+        provider = AsyncMock()
+        provider.synthesize = AsyncMock(return_value=b"audio")
+        service = tts_service_with_providers(provider)
+
+        assert await service.synthesize("Short. Text.", use_cache=False) == b"audio"
+        assert provider.synthesize.call_count == 1
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_chunks_synthesized_concurrently_and_joined_in_order(
+        self, mock_tts_settings, tts_service_with_providers
+    ):
+        """Every sentence is in flight at once; audio is joined in reading order."""
+        text = _long_text("One.", "Two.", "Three.")
+        sentences = split_sentences(text)
+        in_flight = 0
+        peak = 0
+
+        async def synthesize(text, voice_id, audio_format, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await _real_sleep(0.01 * (len(text) % 3))
+            in_flight -= 1
+            return f"[{text}]".encode()
+
+        provider = AsyncMock()
+        provider.synthesize = AsyncMock(side_effect=synthesize)
+        service = tts_service_with_providers(provider)
+
+        audio = await service.synthesize(text, audio_format="ogg", use_cache=False)
+
+        assert audio == b"".join(f"[{s}]".encode() for s in sentences)
+        assert provider.synthesize.call_count == len(sentences)
+        assert peak == mock_tts_settings.TTS_MAX_CONCURRENT
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_shared_sentences_reuse_chunk_cache(
+        self, mock_tts_settings, tts_service_with_providers, tmp_path
+    ):
+        """A sentence already synthesized for another text is served from the cache."""
+        shared = f"Shared opening sentence {uuid.uuid4()}."
+        provider = AsyncMock()
+        provider.synthesize = AsyncMock(side_effect=lambda text, *args, **kwargs: f"[{text}]".encode())
+        service = tts_service_with_providers(provider)
+        service.cache_enabled = True
+        service.voice_cache = VoiceCacheService(
+            blob_store=AudioBlobStore(str(tmp_path / "blobs"), max_bytes=1024 * 1024)
+        )
+        service.voice_cache.cache_enabled = True
+
+        await service.synthesize(_long_text(shared), audio_format="aac")
+        synthesized = [call.args[0] for call in provider.synthesize.call_args_list]
+        provider.synthesize.reset_mock()
+        second = _long_text(shared)
+        audio = await service.synthesize(second, audio_format="aac")
+
+        assert shared in synthesized
+        assert shared not in [call.args[0] for call in provider.synthesize.call_args_list]
+        assert audio.startswith(f"[{shared}]".encode())
+        assert provider.synthesize.call_count == len(split_sentences(second)) - 1
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_stream_yields_chunks_in_order(self, mock_tts_settings, tts_service_with_providers):
+        text = _long_text("Alpha.", "Beta.")
+        provider = AsyncMock()
+        provider.synthesize = AsyncMock(side_effect=lambda text, *args, **kwargs: text.encode())
+        service = tts_service_with_providers(provider)
+
+        chunks = [c async for c in service.synthesize_stream(text, audio_format="mp3", use_cache=False)]
+
+        assert chunks == [s.encode() for s in split_sentences(text)]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_unjoinable_format_not_chunked(self, mock_tts_settings, tts_service_with_providers):
+        provider = AsyncMock()
+        provider.synthesize = AsyncMock(return_value=b"audio")
+        service = tts_service_with_providers(provider)
+
+        await service.synthesize(_long_text("One."), audio_format="m4a", use_cache=False)
+
+        assert provider.synthesize.call_count == 1
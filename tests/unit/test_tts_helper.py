@@ -0,0 +1,201 @@
+"""
+Unit tests for the TTS helper's concurrent voice synthesis.
+"""
+import asyncio
+import threading
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from app.utils import tts_helper
+from app.utils.tts_helper import synthesize_and_save_voices
+
+# mock_tts_settings patches asyncio.sleep; keep a real one for yielding to the loop
+_real_sleep = asyncio.sleep
+
+
+@pytest.fixture
+def helper_settings():
+    return SimpleNamespace(TTS_QUESTION_TIMEOUT=5.0)
+
+
+class TestSynthesizeAndSaveVoices:
+    """Tests for synthesize_and_save_voices."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_runs_concurrently_and_keeps_order(self, helper_settings):
+        """All questions are synthesized at once; results follow question order."""
+        started = 0
+        all_started = asyncio.Event()
+
+        async def fake_synthesize(question_text, question_id, **kwargs):
+            nonlocal started
+            started += 1
+            if started == 3:
+                all_started.set()
+            # Only completes once every question is in flight
+            await asyncio.wait_for(all_started.wait(), timeout=1)
+            await asyncio.sleep(0.01 * (3 - int(question_id)))  # Finish in reverse order
+            return f"voice-{question_id}"
+
+        with patch("app.utils.tts_helper.synthesize_and_save_voice", side_effect=fake_synthesize):
+            payloads = await synthesize_and_save_voices(
+                questions=[("q0", "0"), ("q1", "1"), ("q2", "2")],
+                voice_id="voice",
+                audio_format="mp3",
+                file_service=None,
+                settings=helper_settings
+            )
+
+        assert payloads == ["voice-0", "voice-1", "voice-2"]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_timeout_returns_text_only(self, helper_settings):
+        """A question that exceeds the timeout gets no voice; others are unaffected."""
+        async def fake_synthesize_voice(text, voice_id, format, question_id):
+            if question_id == "slow":
+                await _real_sleep(1)
+            return (b"audio", 0.0, {"cached": False})
+
+        async def fake_save(question_id, **kwargs):
+            return f"voice-{question_id}"
+
+        with patch("app.utils.tts_helper.synthesize_voice", side_effect=fake_synthesize_voice), \
+                patch("app.utils.tts_helper.save_and_cache_voice", side_effect=fake_save), \
+                patch.object(tts_helper, "_detached_syntheses", set()):
+            payloads = await synthesize_and_save_voices(
+                questions=[("a", "fast"), ("b", "slow")],
+                voice_id="voice",
+                audio_format="mp3",
+                file_service=None,
+                settings=helper_settings,
+                timeout=0.05
+            )
+            for task in tts_helper._detached_syntheses:
+                task.cancel()
+
+        assert payloads == ["voice-fast", None]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_timeout_does_not_cancel_shared_synthesis(self, helper_settings):
+        """The synthesis a timed-out caller shares with others runs to completion."""
+        release = asyncio.Event()
+        finished = []
+
+        async def fake_synthesize_voice(text, voice_id, format, question_id):
+            await release.wait()
+            finished.append(question_id)
+            return (b"audio", 0.0, {"cached": False})
+
+        with patch("app.utils.tts_helper.synthesize_voice", side_effect=fake_synthesize_voice), \
+                patch.object(tts_helper, "_detached_syntheses", set()):
+            payloads = await synthesize_and_save_voices(
+                questions=[("a", "slow")],
+                voice_id="voice",
+                audio_format="mp3",
+                file_service=None,
+                settings=helper_settings,
+                timeout=0.01
+            )
+            assert payloads == [None]
+            (synthesis,) = tts_helper._detached_syntheses
+            release.set()
+            await synthesis
+            await _real_sleep(0)
+            assert not tts_helper._detached_syntheses
+
+        assert finished == ["slow"]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_file_work_runs_off_event_loop(self, helper_settings):
+        """Saving synthesized audio and reading cached audio files run in worker threads."""
+        helper_settings.TTS_VOICE_VERSION = 1
+        loop_thread = threading.get_ident()
+        threads = []
+
+        def record_thread(*args, **kwargs):
+            threads.append(threading.get_ident())
+            return b"cached audio"
+
+        file_service = MagicMock()
+        file_service.save_file_from_bytes.side_effect = record_thread
+        voice_cache = MagicMock()
+        voice_cache.get_cached_voice = AsyncMock(side_effect=[None, {"file_id": "cached-file"}])
+        with patch.object(tts_helper, "TTS_AVAILABLE", True), \
+                patch("app.utils.tts_helper.get_tts_service") as get_tts_service, \
+                patch("app.utils.tts_helper.VoiceCacheService", return_value=voice_cache), \
+                patch("app.utils.tts_helper._read_cached_audio_file", side_effect=record_thread), \
+                patch("app.utils.tts_helper.cache_voice_result", new=AsyncMock(return_value=True)):
+            get_tts_service.return_value.synthesize = AsyncMock(return_value=b"audio")
+            payloads = await synthesize_and_save_voices(
+                questions=[("q0", "0"), ("q1", "1")],
+                voice_id="voice",
+                audio_format="mp3",
+                file_service=file_service,
+                settings=helper_settings
+            )
+
+        assert all(payload is not None for payload in payloads)
+        # Two saves and one cached file read
+        assert len(threads) == 3
+        assert loop_thread not in threads
+
+
+class TestProviderConcurrencyLimit:
+    """Tests for the per-provider synthesis limit in TTSService."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_provider_calls_bounded_by_max_concurrent(self, mock_tts_settings, tts_service_with_providers):
+        """No more than TTS_MAX_CONCURRENT synthesis calls reach a provider at once."""
+        mock_tts_settings.TTS_MAX_CONCURRENT = 2
+        in_flight = 0
+        peak = 0
+        release = asyncio.Event()
+
+        async def synthesize(text, voice_id, audio_format, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await release.wait()
+            in_flight -= 1
+            return b"audio"
+
+        provider = AsyncMock()
+        provider.synthesize = AsyncMock(side_effect=synthesize)
+        service = tts_service_with_providers(provider)
+
+        tasks = [
+            asyncio.create_task(service.synthesize(f"text {i}", use_cache=False))
+            for i in range(5)
+        ]
+        for _ in range(10):
+            await _real_sleep(0)
+        assert peak == 2
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert results == [b"audio"] * 5
+        assert peak == 2
+
+    @pytest.mark.unit
+    def test_limit_works_across_event_loops(self, mock_tts_settings, tts_service_with_providers):
+        """One service can be used from several asyncio.run() calls (scripts, tests)."""
+        mock_tts_settings.TTS_MAX_CONCURRENT = 1
+
+        async def synthesize(text, voice_id, audio_format, **kwargs):
+            await _real_sleep(0.01)
+            return b"audio"
+
+        provider = AsyncMock()
+        provider.synthesize = AsyncMock(side_effect=synthesize)
+        service = tts_service_with_providers(provider)
+
+        async def synthesize_batch():
+            return await asyncio.gather(*[service.synthesize(f"text {i}", use_cache=False) for i in range(3)])
+
+        assert asyncio.run(synthesize_batch()) == [b"audio"] * 3
+        assert asyncio.run(synthesize_batch()) == [b"audio"] * 3
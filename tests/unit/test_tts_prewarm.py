@@ -0,0 +1,123 @@
+"""
+Unit tests for TTS pre-warming of popular questions.
+"""
+import uuid
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from app.database.models import Question
+from app.services.tts.base import TTSProviderRateLimitError
+from app.services.tts.prewarm import STARTUP_LOCK_KEY, TTSPrewarmService, run_startup_tts_prewarm
+
+
+def _question(text: str, usage_count: int, roles=None, category: str = "technical") -> Question:
+    return Question(
+        id=uuid.uuid4(),
+        question_text=text,
+        category=category,
+        difficulty_level="medium",
+        compatible_roles=roles,
+        usage_count=usage_count
+    )
+
+
+@pytest.fixture
+def prewarm_service(db_session):
+    """Pre-warm service with mocked TTS and file storage, and no pacing delay."""
+    tts_service = MagicMock()
+    tts_service.synthesize = AsyncMock(return_value=b"audio")
+    service = TTSPrewarmService(db_session, tts_service=tts_service, file_service=MagicMock())
+    service.base_interval = service.interval = 0.0
+    return service
+
+
+class TestTTSPrewarmService:
+    """Tests for TTSPrewarmService."""
+
+    @pytest.mark.unit
+    def test_select_top_n_per_role(self, db_session, prewarm_service):
+        """Each role contributes its most used questions; shared questions appear once."""
+        backend, frontend = f"backend-{uuid.uuid4()}", f"frontend-{uuid.uuid4()}"
+        questions = [
+            _question("shared", 50, [backend, frontend]),
+            _question("backend popular", 40, [backend]),
+            _question("backend rare", 10, [backend]),
+            _question("frontend popular", 30, [frontend]),
+            _question("never used", 0, [frontend])
+        ]
+        db_session.add_all(questions)
+        db_session.commit()
+
+        selected = prewarm_service.select_questions(top_n=2, group_by="role")
+        texts = [q.question_text for q in selected if q.id in {q.id for q in questions}]
+
+        assert texts == ["shared", "backend popular", "frontend popular"]
+
+    @pytest.mark.unit
+    def test_select_rejects_unknown_grouping(self, prewarm_service):
+        with pytest.raises(ValueError):
+            prewarm_service.select_questions(top_n=5, group_by="industry")
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_prewarm_saves_and_caches_voices(self, prewarm_service):
+        """Synthesized voices are saved and cached, so a second pass only sees cache hits."""
+        questions = [_question(f"prewarm question {uuid.uuid4()}", 10 - i) for i in range(3)]
+
+        with patch.object(prewarm_service, "select_questions", return_value=questions):
+            first = await prewarm_service.prewarm(top_n=3)
+            second = await prewarm_service.prewarm(top_n=3)
+
+        assert first["synthesized"] == 3
+        assert first["failed"] == 0
+        assert prewarm_service.file_service.save_file_from_bytes.call_count == 3
+        assert second["already_cached"] == 3
+        assert second["synthesized"] == 0
+        assert prewarm_service.tts_service.synthesize.await_count == 3
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_rate_limit_slows_down_and_retries(self, prewarm_service):
+        """A rate-limited question is retried after backing off the request pace."""
+        prewarm_service.tts_service.synthesize = AsyncMock(
+            side_effect=[TTSProviderRateLimitError("slow down"), b"audio"]
+        )
+        question = _question(f"rate limited {uuid.uuid4()}", 5)
+
+        with patch.object(prewarm_service, "select_questions", return_value=[question]), \
+             patch("app.services.tts.prewarm.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            stats = await prewarm_service.prewarm(top_n=1)
+
+        assert stats["rate_limited"] == 1
+        assert stats["synthesized"] == 1
+        assert mock_sleep.await_count >= 1
+        assert prewarm_service.interval > prewarm_service.base_interval
+
+    @pytest.mark.unit
+    def test_explicit_rate_overrides_setting(self, db_session):
+        """A rate passed in (e.g. the script's --rate) sets the pace instead of TTS_PREWARM_RATE."""
+        service = TTSPrewarmService(db_session, tts_service=MagicMock(), file_service=MagicMock(), rate=0.25)
+
+        assert service.base_interval == 4.0
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_startup_prewarm_runs_in_one_worker(self, fake_async_redis):
+        """Workers starting together share a Redis lock, so only one runs the pass."""
+        run = AsyncMock(return_value={"selected": 0})
+
+        with patch("app.utils.cache.cache_manager.redis_client", fake_async_redis), \
+             patch("app.services.tts.prewarm.run_tts_prewarm", run):
+            results = [await run_startup_tts_prewarm() for _ in range(3)]
+
+        assert results == [{"selected": 0}, None, None]
+        assert run.await_count == 1
+        assert await fake_async_redis.exists(STARTUP_LOCK_KEY)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_startup_prewarm_without_redis_runs_locally(self):
+        run = AsyncMock(return_value={"selected": 0})
+
+        with patch("app.utils.cache.cache_manager.redis_client", None), \
+             patch("app.services.tts.prewarm.run_tts_prewarm", run):
+            assert await run_startup_tts_prewarm() == {"selected": 0}
@@ -9,6 +9,7 @@ import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 import httpx
 from app.services.tts.base import (
+    HTTP2_AVAILABLE,
     BaseTTSProvider,
     TTSProviderError,
     TTSProviderTimeoutError,
@@ -17,7 +18,7 @@ from app.services.tts.base import (
 from app.services.tts.coqui import CoquiTTSProvider
 from app.services.tts.elevenlabs import ElevenLabsTTSProvider
 from app.services.tts.playht import PlayHTTTSProvider
-from app.services.tts.service import TTSService, CircuitBreaker
+from app.services.tts.service import TTSService, CircuitBreaker, AdaptiveProviderRouter
 from app.services.tts.factory import TTSProviderFactory
 
 
@@ -42,7 +43,7 @@ class TestCoquiTTSProvider:
         mock_response.content = b"fake_audio_data"
         
         with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+            mock_client.return_value.post = AsyncMock(
                 return_value=mock_response
             )
             
@@ -61,7 +62,7 @@ class TestCoquiTTSProvider:
         provider = CoquiTTSProvider(config)
         
         with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+            mock_client.return_value.post = AsyncMock(
                 side_effect=httpx.TimeoutException("Request timed out")
             )
             
@@ -99,7 +100,7 @@ class TestCoquiTTSProvider:
         mock_response.status_code = 200
         
         with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
+            mock_client.return_value.get = AsyncMock(
                 return_value=mock_response
             )
             
@@ -114,7 +115,7 @@ class TestCoquiTTSProvider:
         provider = CoquiTTSProvider(config)
         
         with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
+            mock_client.return_value.get = AsyncMock(
                 side_effect=Exception("Connection error")
             )
             
@@ -142,13 +143,48 @@ class TestElevenLabsTTSProvider:
         mock_response.content = b"fake_audio_data"
         
         with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+            mock_client.return_value.post = AsyncMock(
                 return_value=mock_response
             )
             
             audio_data = await provider.synthesize("Hello world", "test-voice", "mp3")
             assert audio_data == b"fake_audio_data"
     
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_synthesize_stream_forwards_chunks(self):
+        """Test streaming synthesis uses the streaming endpoint and yields its chunks."""
+        provider = ElevenLabsTTSProvider({
+            "api_key": "test-api-key",
+            "base_url": "https://api.elevenlabs.io/v1",
+            "timeout": 30
+        })
+        requested_urls = []
+        
+        def handler(request):
+            requested_urls.append(str(request.url))
+            return httpx.Response(200, content=b"streamed_audio_data")
+        
+        real_client = httpx.AsyncClient
+        with patch("httpx.AsyncClient", side_effect=lambda **kw: real_client(transport=httpx.MockTransport(handler), **kw)):
+            chunks = [chunk async for chunk in provider.synthesize_stream("Hello world", "test-voice", "mp3")]
+        
+        assert b"".join(chunks) == b"streamed_audio_data"
+        assert requested_urls[0].startswith("https://api.elevenlabs.io/v1/text-to-speech/test-voice/stream")
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_synthesize_stream_rate_limit(self):
+        """Test streaming synthesis maps 429 to a rate limit error."""
+        provider = ElevenLabsTTSProvider({"api_key": "test-api-key", "timeout": 30})
+        
+        real_client = httpx.AsyncClient
+        transport = httpx.MockTransport(lambda request: httpx.Response(429))
+        with patch("httpx.AsyncClient", side_effect=lambda **kw: real_client(transport=transport, **kw)):
+            with pytest.raises(TTSProviderRateLimitError):
+                async for _ in provider.synthesize_stream("Hello world"):
+                    pass
+    
     @pytest.mark.unit
     @pytest.mark.asyncio
     async def test_synthesize_rate_limit(self):
@@ -164,7 +200,7 @@ class TestElevenLabsTTSProvider:
         mock_response.status_code = 429
         
         with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+            mock_client.return_value.post = AsyncMock(
                 return_value=mock_response
             )
             
@@ -186,7 +222,7 @@ class TestElevenLabsTTSProvider:
         mock_response.status_code = 401
         
         with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+            mock_client.return_value.post = AsyncMock(
                 return_value=mock_response
             )
             
@@ -216,7 +252,7 @@ class TestElevenLabsTTSProvider:
         mock_response.status_code = 200
         
         with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
+            mock_client.return_value.get = AsyncMock(
                 return_value=mock_response
             )
             
@@ -245,7 +281,7 @@ class TestPlayHTTTSProvider:
         mock_response.content = b"fake_audio_data"
         
         with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+            mock_client.return_value.post = AsyncMock(
                 return_value=mock_response
             )
             
@@ -277,6 +313,66 @@ class TestPlayHTTTSProvider:
             PlayHTTTSProvider(config)
 
 
+class TestProviderHTTPClientPool:
+    """Tests for the long-lived HTTP client each provider owns."""
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_client_reused_across_requests(self):
+        """Synthesis and health checks share one pooled client until closed."""
+        provider = CoquiTTSProvider({"base_url": "http://localhost:5002", "timeout": 30})
+        
+        def handler(request):
+            return httpx.Response(200, content=b"audio")
+        
+        real_client = httpx.AsyncClient
+        with patch("httpx.AsyncClient", side_effect=lambda **kw: real_client(transport=httpx.MockTransport(handler), **kw)) as mock_client:
+            await provider.synthesize("Hello world")
+            await provider.synthesize("Hello again")
+            assert await provider.health_check() is True
+            
+            assert mock_client.call_count == 1
+            stats = provider.get_connection_stats()
+            assert stats["requests"] == 3
+            assert stats["clients_created"] == 1
+            
+            await provider.close()
+            assert provider._client is None
+            await provider.synthesize("After close")
+            assert mock_client.call_count == 2
+        
+        await provider.close()
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_connection_reuse_metrics(self):
+        """New TCP connections are traced; other requests count as reused."""
+        provider = CoquiTTSProvider({"base_url": "http://localhost:5002"})
+        provider.connection_stats["requests"] = 4
+        await provider._trace("connection.connect_tcp.complete", {})
+        await provider._trace("connection.start_tls.complete", {})
+        
+        stats = provider.get_connection_stats()
+        
+        assert stats["new_connections"] == 1
+        assert stats["tls_handshakes"] == 1
+        assert stats["reused_connections"] == 3
+        assert stats["reuse_rate"] == 75.0
+    
+    @pytest.mark.unit
+    def test_http2_only_for_supporting_providers(self):
+        """HTTP/2 is requested for ElevenLabs but not for the local Coqui service."""
+        coqui = CoquiTTSProvider({"base_url": "http://localhost:5002"})
+        elevenlabs = ElevenLabsTTSProvider({"api_key": "test-api-key", "http2": True})
+        
+        with patch("httpx.AsyncClient") as mock_client:
+            coqui.get_client()
+            elevenlabs.get_client()
+        
+        assert mock_client.call_args_list[0].kwargs["http2"] is False
+        assert mock_client.call_args_list[1].kwargs["http2"] is HTTP2_AVAILABLE
+
+
 class TestTTSProviderFactory:
     """Tests for TTSProviderFactory."""
     
@@ -430,6 +526,87 @@ class TestTTSServiceRetryLogic:
         mock_sleep.assert_any_call(2.0)   # base_delay * 2^1
 
 
+class TestAdaptiveProviderRouter:
+    """Tests for AdaptiveProviderRouter."""
+    
+    @pytest.mark.unit
+    def test_ewma_tracks_latency_and_errors(self):
+        """Samples are folded into moving averages weighted by alpha."""
+        router = AdaptiveProviderRouter(alpha=0.5, min_samples=1)
+        router.record("coqui", 1.0, success=True)
+        router.record("coqui", 3.0, success=False)
+        
+        stats = router.get_stats()["providers"]["coqui"]
+        assert stats["ewma_latency"] == 2.0
+        assert stats["ewma_error_rate"] == 0.5
+        assert stats["samples"] == 2
+    
+    @pytest.mark.unit
+    def test_rank_keeps_configured_order_until_min_samples(self):
+        """Providers are not reordered before each has enough samples."""
+        router = AdaptiveProviderRouter(min_samples=3)
+        candidates = [("primary", "coqui"), ("fallback", "elevenlabs")]
+        for _ in range(3):
+            router.record("coqui", 2.0, success=True)
+        router.record("elevenlabs", 0.1, success=True)
+        
+        assert router.rank(candidates) == candidates
+        
+        for _ in range(2):
+            router.record("elevenlabs", 0.1, success=True)
+        assert router.rank(candidates) == list(reversed(candidates))
+    
+    @pytest.mark.unit
+    def test_rank_penalizes_errors(self):
+        """A fast provider that keeps failing ranks below a slower reliable one."""
+        router = AdaptiveProviderRouter(alpha=0.5, error_penalty=5.0, min_samples=1)
+        router.record("coqui", 0.1, success=False)
+        router.record("elevenlabs", 1.0, success=True)
+        
+        ranked = router.rank([("primary", "coqui"), ("fallback", "elevenlabs")])
+        assert [name for _, name in ranked] == ["elevenlabs", "coqui"]
+    
+    @pytest.mark.unit
+    def test_ordered_strategy_never_reorders(self):
+        """With routing disabled the configured order is always kept."""
+        router = AdaptiveProviderRouter(min_samples=1, enabled=False)
+        router.record("coqui", 5.0, success=False)
+        router.record("elevenlabs", 0.1, success=True)
+        candidates = [("primary", "coqui"), ("fallback", "elevenlabs")]
+        
+        assert router.rank(candidates) == candidates
+        assert router.get_stats()["strategy"] == "ordered"
+
+    
+    @pytest.mark.unit
+    def test_censored_sample_only_raises_latency(self):
+        """A cancelled call counts as at least its elapsed time and is not an error."""
+        router = AdaptiveProviderRouter(alpha=0.5, min_samples=1)
+        router.record("coqui", 2.0, success=True)
+        router.record_censored("coqui", 1.0)
+        assert router.providers["coqui"]["latency"] == 2.0
+        
+        router.record_censored("coqui", 4.0)
+        stats = router.get_stats()["providers"]["coqui"]
+        assert stats["ewma_latency"] == 3.0
+        assert stats["ewma_error_rate"] == 0.0
+        assert stats["samples"] == 3
+    
+    @pytest.mark.unit
+    def test_explored_call_tries_another_provider_first(self):
+        """An explored call puts a non-best provider first, the best one next."""
+        router = AdaptiveProviderRouter(min_samples=1, explore_ratio=0.1)
+        router.record("coqui", 0.1, success=True)
+        router.record("elevenlabs", 2.0, success=True)
+        candidates = [("primary", "coqui"), ("fallback", "elevenlabs")]
+        
+        with patch("app.services.tts.service.random.random", return_value=0.05):
+            assert router.rank(candidates) == list(reversed(candidates))
+        with patch("app.services.tts.service.random.random", return_value=0.5):
+            assert router.rank(candidates) == candidates
+        assert router.get_stats()["explored_requests"] == 1
+
+
 class TestCircuitBreaker:
     """Tests for CircuitBreaker implementation."""
     
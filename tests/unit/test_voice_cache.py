@@ -12,6 +12,7 @@ import pytest
 import asyncio
 import uuid
 from unittest.mock import AsyncMock, patch, MagicMock
+from app.services.audio_blob_store import AudioBlobStore
 from app.services.voice_cache import VoiceCacheService, get_voice_cache_service
 
 
@@ -19,9 +20,9 @@ class TestVoiceCacheService:
     """Tests for VoiceCacheService."""
     
     @pytest.fixture
-    def voice_cache(self):
+    def voice_cache(self, tmp_path):
         """Create VoiceCacheService instance for testing."""
-        return VoiceCacheService()
+        return VoiceCacheService(blob_store=AudioBlobStore(str(tmp_path / "blobs"), max_bytes=1024 * 1024))
     
     @pytest.mark.unit
     def test_settings_hash_generation(self, voice_cache):
@@ -103,8 +104,31 @@ class TestVoiceCacheService:
         
         cached = await voice_cache.get_cached_voice("test text", "voice1", "mp3")
         assert cached is not None
-        assert "audio_data" in cached
+        # Audio is stored once in the blob store; the entry only references it
+        assert "audio_data" not in cached
+        assert cached["blob_id"] == AudioBlobStore.compute_blob_id(audio_bytes)
+        assert await voice_cache.load_audio(cached) == audio_bytes
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_cache_with_audio_data_without_blob_store(self, voice_cache):
+        """Test audio is embedded as base64 when the blob store is disabled."""
+        voice_cache.blob_store = None
+        audio_bytes = b"legacy audio data"
+        
+        await voice_cache.cache_voice(
+            text="legacy text",
+            voice_id="voice1",
+            format="mp3",
+            file_id="file123",
+            duration=1.0,
+            audio_data=audio_bytes
+        )
+        
+        cached = await voice_cache.get_cached_voice("legacy text", "voice1", "mp3")
+        assert "blob_id" not in cached
         assert cached["audio_data"] is not None
+        assert await voice_cache.load_audio(cached) == audio_bytes
     
     @pytest.mark.unit
     @pytest.mark.asyncio